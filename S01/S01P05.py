@@ -67,7 +67,9 @@ CONCEPTOS DE FÍSICA CUÁNTICA:
    - Ejemplo: algoritmo de Deutsch-Jozsa depende de interferencia de fases
 
 7. EQUIVALENCIA DE CIRCUITOS MÓDULO FASES GLOBALES:
-   - Este circuito es equivalente a S01P04 módulo fase global
+   - Este circuito da las mismas mediciones que S01P04, pero NO es equivalente
+     módulo fase global: Z(0)·Z(1) convierte |Ψ⁺⟩ en -|Ψ⁻⟩, una fase relativa
+     entre |01⟩ y |10⟩ (ver `python -m qnc.demos.equivalencias`)
    - Dos circuitos son equivalentes si difieren solo en fase global
    - Clase de equivalencia importante en diseño de algoritmos cuánticos
 """
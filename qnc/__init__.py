@@ -0,0 +1,69 @@
+"""
+PAQUETE: qnc - Herramientas de simulación y ejecución para las prácticas
+
+RESUMEN:
+Utilidades compartidas por los programas de las sesiones S01-S05 para simular
+circuitos de PyQuil de forma local y vectorizada con NumPy.
+
+MÓDULOS:
+- circuito: conversión de un `Program` de PyQuil a una lista de operaciones
+- puertas: matrices de las puertas soportadas y caché de matrices paramétricas
+- estado: vector de estado por lotes y aplicación de puertas
+- estabilizador: simulador de tableau para circuitos de Clifford (miles de qubits)
+- bloch: trayectorias vectorizadas en la esfera de Bloch
+- barrido: evaluación de circuitos paramétricos para miles de ángulos
+- muestreo: simular una vez y muestrear todos los shots (mediciones terminales)
+- precision: simulación en complex64, deriva de la norma y error frente a complex128
+- resultados: resultado de ejecución con la interfaz de PyQuil
+- cache_compilacion: caché en memoria y disco de las compilaciones de quilc
+- ejecutor_diferido: ejecución diferida que agrupa envíos repetidos
+- analisis: recuentos, histogramas y distribuciones sobre el array de lectura
+- lectura_compacta: lecturas empaquetadas en bits, con volcado a disco (.npy)
+- por_bloques: ejecución de experimentos enormes por bloques con memoria constante
+- hilos: núcleos de puertas repartidos entre varios hilos y medida del escalado
+- vector_disco: vector de estado en disco (np.memmap) procesado por bloques
+- lotes: compilación y ejecución concurrente de varios programas independientes
+- producto: motor de estados producto (un vector de 2 amplitudes por qubit)
+- pauli: álgebra de cadenas de Pauli empaquetadas en bits (producto, conmutación)
+- observables: valores esperados exactos de cadenas de Pauli y sumas ponderadas
+- propagacion: propagación de una matriz de estados iniciales (columnas) por un circuito
+- equivalencia: comprobación de equivalencia de circuitos salvo fase global
+- conexiones: clientes persistentes de quilc y de la QVM y calentamiento de las conexiones
+- carga: generador de carga compile+run y métricas de rendimiento y latencia por fase
+- servidor_local: sustituto local de los servicios qvm y quilc con latencias y errores inyectados
+- trazas: tramos de construcción, compilación, ejecución y lectura exportados como traza de Chrome
+- manifiesto: ejecución del catálogo S01-S04 descrito en un manifiesto JSON en un solo proceso
+- despachador: elección automática del motor (producto, estabilizador, vector o QVM remota)
+"""
+
+from .analisis import (conteo_por_qubit, decidir_ganador, distribucion_conjunta,
+                       distribucion_marginal, empaquetar, histograma, histograma_dict,
+                       recuento_cara_cruz)
+from .barrido import barrido
+from .bloch import trayectoria_bloch, vector_bloch
+from .cache_compilacion import CacheCompilacion, QCConCache, clave_compilacion
+from .carga import CIRCUITOS, InformeCarga, generar_carga
+from .circuito import Circuito, Medicion, Operacion, evaluar_parametro
+from .conexiones import GestorConexiones, InformeCalentamiento, medir_primer_resultado
+from .despachador import AnalisisPrograma, Decision, QVMAutomatica, elegir_motor
+from .ejecutor_diferido import EjecutorDiferido, ResultadoDiferido
+from .equivalencia import InformeEquivalencia, comparar_circuitos
+from .estabilizador import QVMEstabilizador, Tableau, es_clifford, muestrear_estabilizador
+from .estado import aplicar_puerta, deriva_norma, estado_base, evolucionar, probabilidades
+from .hilos import InformeEscalado, SimuladorHilos, medir_escalado
+from .lectura_compacta import LecturaCompacta, compactar_resultado
+from .lotes import InformeLote, ejecutar_lote
+from .manifiesto import InformeManifiesto, cargar_manifiesto, ejecutar_manifiesto
+from .muestreo import QVMMuestreo, mediciones_terminales, muestrear
+from .observables import valor_esperado, valores_esperados
+from .pauli import CadenasPauli
+from .por_bloques import (ejecutar_por_bloques, histograma_por_bloques, recuento_por_bloques,
+                          shots_por_bloque)
+from .precision import InformePrecision, SimuladorFuncionOnda, comparar_precision
+from .propagacion import matriz_unitaria, propagar
+from .producto import QVMProducto, es_producto, muestrear_producto
+from .puertas import CacheMatrices, configurar_cache, matriz_puerta, registrar_puerta
+from .resultados import ResultadoEjecucion
+from .servidor_local import ServidorLocal
+from .trazas import QCTrazado, Trazador, instrumentar, medir_sobrecoste
+from .vector_disco import VectorEstadoDisco
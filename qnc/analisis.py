@@ -0,0 +1,189 @@
+"""
+MÓDULO: qnc/analisis.py - Recuentos e histogramas vectorizados de las mediciones
+
+RESUMEN:
+S02P01A, S02P02A y S02P02B cuentan caras (0) y cruces (1) recorriendo cada
+shot y cada qubit con cadenas de if/else en Python. Este módulo trabaja
+directamente sobre el array de lectura (`readout_data['ro']`, forma
+(shots, bits)) con operaciones de NumPy:
+
+- conteo_por_qubit: caras y cruces de cada columna del registro
+- recuento_cara_cruz: caras y cruces totales (lo que imprimen los programas de S02)
+- empaquetar: convierte cada shot en un entero (bit j = columna j)
+- histograma: número de veces que aparece cada resultado, con `np.bincount`
+- distribucion_conjunta / distribucion_marginal: probabilidades estimadas
+- decidir_ganador: "gana A", "empate" o "gana B"
+
+MEMORIA ACOTADA:
+Todas las funciones recorren el array en bloques de `bloque` shots, así que
+los temporales no dependen del número total de shots. Un array de 10^8 shots
+(o un `np.memmap` en disco) se procesa con unos pocos MB de memoria extra.
+
+USO:
+    from qnc import recuento_cara_cruz, decidir_ganador
+
+    result = qvm.run(qvm.compile(prog)).readout_data['ro']
+    cara, cruz = recuento_cara_cruz(result)
+    print(decidir_ganador(cara, cruz))
+"""
+
+import numpy as np
+
+
+BLOQUE_POR_DEFECTO = 1 << 20
+
+
+def _como_array(lectura):
+    """
+    Convierte listas en arrays. Los arrays, los np.memmap y las
+    `LecturaCompacta` se dejan tal cual: se recorren por bloques.
+    """
+    return lectura if hasattr(lectura, "shape") else np.asarray(lectura)
+
+
+def _bloques(lectura, bloque):
+    """Recorre el array de lectura en trozos de `bloque` filas."""
+    for inicio in range(0, len(lectura), bloque):
+        yield lectura[inicio:inicio + bloque]
+
+
+def conteo_por_qubit(lectura, bloque=BLOQUE_POR_DEFECTO):
+    """
+    Cuenta los ceros y unos de cada columna del registro.
+
+    Args:
+        lectura: Array (shots, bits) con valores 0/1
+        bloque: Número de shots procesados a la vez
+
+    Returns:
+        np.ndarray: Array (bits, 2) con [ceros, unos] de cada columna
+    """
+    lectura = _como_array(lectura)
+    unos = np.zeros(lectura.shape[1], dtype=np.int64)
+    for trozo in _bloques(lectura, bloque):
+        unos += np.ones(len(trozo), dtype=np.int64) @ trozo.astype(np.int64, copy=False)
+    return np.stack([len(lectura) - unos, unos], axis=1)
+
+
+def recuento_cara_cruz(lectura, bloque=BLOQUE_POR_DEFECTO):
+    """
+    Cuenta las caras (0) y cruces (1) de todas las mediciones.
+
+    Equivale a los bucles if/else de S02P01A, S02P02A y S02P02B.
+
+    Args:
+        lectura: Array (shots, bits) con valores 0/1
+        bloque: Número de shots procesados a la vez
+
+    Returns:
+        tuple: (cara, cruz) como enteros de Python
+    """
+    ceros, unos = conteo_por_qubit(lectura, bloque).sum(axis=0)
+    return int(ceros), int(unos)
+
+
+def decidir_ganador(cara, cruz):
+    """
+    Decide el ganador del juego de la moneda: A gana con caras, B con cruces.
+
+    Returns:
+        str: "gana A", "empate" o "gana B"
+    """
+    if cara > cruz:
+        return "gana A"
+    if cara == cruz:
+        return "empate"
+    return "gana B"
+
+
+def empaquetar(lectura, columnas=None):
+    """
+    Convierte cada shot en un entero: el bit j es la columna columnas[j].
+
+    Es el mismo criterio que usa la ruleta de S05 (`sum(bits[i] * 2**i)`).
+
+    Args:
+        lectura: Array (shots, bits) con valores 0/1
+        columnas: Columnas a empaquetar (default: todas, en orden)
+
+    Returns:
+        np.ndarray: Array (shots,) de enteros
+    """
+    lectura = np.asarray(lectura)
+    if columnas is not None:
+        lectura = lectura[:, list(columnas)]
+    k = lectura.shape[1]
+    if k > 62:
+        raise ValueError(f"No se pueden empaquetar {k} bits en un entero de 64 bits")
+    # Un producto matriz-vector con los pesos 2^j es más rápido que sumar por filas
+    pesos = np.left_shift(1, np.arange(k, dtype=np.int64))
+    return lectura.astype(np.int64, copy=False) @ pesos
+
+
+def histograma(lectura, columnas=None, bloque=BLOQUE_POR_DEFECTO):
+    """
+    Cuenta cuántas veces aparece cada resultado del registro.
+
+    Args:
+        lectura: Array (shots, bits) con valores 0/1
+        columnas: Columnas que forman el resultado (default: todas)
+        bloque: Número de shots procesados a la vez
+
+    Returns:
+        np.ndarray: Array (2^k,) donde la posición i es el número de shots
+            cuyo resultado empaquetado (ver `empaquetar`) vale i
+
+    Raises:
+        ValueError: Si se piden más de 24 columnas (el histograma no cabría)
+    """
+    lectura = _como_array(lectura)
+    k = lectura.shape[1] if columnas is None else len(columnas)
+    if k > 24:
+        raise ValueError(f"Histograma de {k} bits demasiado grande; usa menos columnas")
+    total = np.zeros(2 ** k, dtype=np.int64)
+    for trozo in _bloques(lectura, bloque):
+        total += np.bincount(empaquetar(trozo, columnas), minlength=2 ** k)
+    return total
+
+
+def histograma_dict(lectura, columnas=None, bloque=BLOQUE_POR_DEFECTO):
+    """
+    Histograma como diccionario {"b0b1...": conteo} sin los resultados que
+    no aparecen. Cada clave lista los bits en el orden de las columnas, igual
+    que se imprimen las filas de `readout_data['ro']`.
+    """
+    conteos = histograma(lectura, columnas, bloque)
+    k = int(np.log2(conteos.size))
+    return {"".join(str((i >> j) & 1) for j in range(k)): int(c)
+            for i, c in enumerate(conteos) if c}
+
+
+def distribucion_conjunta(lectura, columnas=None, bloque=BLOQUE_POR_DEFECTO):
+    """
+    Distribución de probabilidad conjunta estimada de varias columnas.
+
+    Returns:
+        np.ndarray: Array de forma (2,) * k donde p[b0, b1, ...] es la
+            frecuencia relativa de que columnas[j] valga bj
+    """
+    conteos = histograma(lectura, columnas, bloque)
+    k = int(np.log2(conteos.size))
+    # El índice empaquetado tiene la columna 0 como bit menos significativo:
+    # al darle forma (2,)*k queda al final, así que se invierten los ejes
+    p = conteos.reshape((2,) * k).transpose(tuple(range(k - 1, -1, -1)))
+    return p / max(len(lectura), 1)
+
+
+def distribucion_marginal(lectura, columna, bloque=BLOQUE_POR_DEFECTO):
+    """
+    Distribución de probabilidad estimada de una sola columna.
+
+    Returns:
+        np.ndarray: [P(0), P(1)]
+    """
+    lectura = _como_array(lectura)
+    unos = 0
+    for trozo in _bloques(lectura, bloque):
+        unos += int(np.count_nonzero(trozo[:, columna]))
+    total = max(len(lectura), 1)
+    return np.array([(len(lectura) - unos) / total, unos / total])
@@ -0,0 +1,98 @@
+"""
+MÓDULO: qnc/barrido.py - Barrido vectorizado de ángulos en puertas paramétricas
+
+RESUMEN:
+Los programas S04P00A-S04P05B evalúan PHASE, RX, RY y RZ con un único ángulo
+(π/4 o π/2). Este módulo evalúa un circuito paramétrico para miles de ángulos
+a la vez: en lugar de construir un `Program` y llamar al simulador por cada
+ángulo, todas las matrices se calculan como un lote (B, 2, 2) y el estado
+avanza como un lote (B, 2^n) con una sola operación de NumPy por puerta.
+
+USO:
+    from pyquil import Program
+    from pyquil.gates import RX
+    from qnc import barrido
+
+    prog = Program()
+    theta = prog.declare("theta", "REAL")
+    prog += RX(theta, 0)
+
+    angulos = np.linspace(0, 2 * np.pi, 1000)
+    amplitudes = barrido(prog, angulos)     # forma (1000, 2)
+
+El parámetro se declara igual que en un programa paramétrico de PyQuil
+(`declare("theta", "REAL")`), así que el mismo programa sirve tanto para el
+barrido local como para `qc.run(ejecutable, memory_map={"theta": [x]})`.
+"""
+
+import numpy as np
+
+from .circuito import Circuito
+from .estado import estado_base, evolucionar
+
+
+def barrido(programa, angulos, parametro="theta", estado_inicial=0, memoria=None):
+    """
+    Evalúa un circuito paramétrico para un array de ángulos.
+
+    Args:
+        programa: Program de PyQuil (o Circuito) con el parámetro declarado
+        angulos: Array de forma (A,) con los valores del parámetro
+        parametro: Nombre de la memoria REAL que se barre (default: "theta").
+            Si se declara con varias posiciones (REAL[k]) se barre la
+            posición 0 y el resto se toman de `memoria`
+        estado_inicial: Estado de partida. Puede ser:
+            - int: índice de un estado base (0 = |00...0⟩, 1 = |0...01⟩)
+            - array (2^n,): un vector de estado
+            - array (S, 2^n): S vectores de estado distintos
+        memoria: Valores fijos para el resto de parámetros del programa,
+            con el formato del `memory_map` de PyQuil
+
+    Returns:
+        np.ndarray: Amplitudes finales de forma (A, 2^n), o (S, A, 2^n) si
+            `estado_inicial` contiene S estados
+
+    Raises:
+        ValueError: Si el programa no declara el parámetro, no es REAL, faltan
+            en `memoria` sus otras posiciones, o contiene mediciones o puertas
+            no soportadas
+    """
+    circuito = _como_circuito(programa)
+    if parametro not in circuito.declaraciones:
+        raise ValueError(f"El programa no declara el parámetro '{parametro}'")
+    tipo, tamano = circuito.declaraciones[parametro]
+    if tipo != "REAL":
+        raise ValueError(f"El parámetro '{parametro}' es {tipo}, no REAL")
+    fijos = list((memoria or {}).get(parametro, []))[1:]
+    if len(fijos) < tamano - 1:
+        raise ValueError(f"'{parametro}' se declara como REAL[{tamano}]: se barre {parametro}[0] "
+                         f"y faltan en `memoria` los valores de {parametro}[1:{tamano}]")
+    angulos = np.asarray(angulos, dtype=float).ravel()
+    n_angulos = angulos.size
+
+    if isinstance(estado_inicial, (int, np.integer)):
+        psi0 = estado_base(circuito.num_qubits, int(estado_inicial))
+    else:
+        psi0 = np.atleast_2d(np.asarray(estado_inicial, dtype=complex))
+    n_estados, dim = psi0.shape
+    if dim < 2 ** circuito.num_qubits:
+        raise ValueError(f"El estado inicial tiene {dim} amplitudes y el circuito "
+                         f"necesita {2 ** circuito.num_qubits}")
+
+    # Lote plano de S × A elementos: cada estado inicial se combina con cada ángulo
+    psi = np.repeat(psi0, n_angulos, axis=0)
+    valores = dict(memoria or {})
+    valores[parametro] = [np.tile(angulos, n_estados)] + fijos
+
+    psi = evolucionar(psi, circuito, valores, ignorar_mediciones=False)
+
+    if isinstance(estado_inicial, (int, np.integer)) or np.ndim(estado_inicial) == 1:
+        return psi
+    return psi.reshape(n_estados, n_angulos, dim)
+
+
+def _como_circuito(programa):
+    """Acepta tanto un Program de PyQuil como un Circuito ya convertido."""
+    if isinstance(programa, Circuito):
+        return programa
+    return Circuito.desde_programa(programa)
@@ -0,0 +1,176 @@
+"""
+MÓDULO: qnc/bloch.py - Trayectorias vectorizadas en la esfera de Bloch
+
+RESUMEN:
+Los programas de S03 y S04 describen cada puerta de un qubit como una
+rotación de la esfera de Bloch (X: 180° sobre el eje x, S: 90° sobre z,
+RY(π/2): 90° sobre y...). Este módulo calcula el vector de Bloch después de
+cada puerta de una secuencia, o en `pasos_por_puerta` puntos intermedios del
+giro continuo de cada puerta, para dibujar la trayectoria.
+
+FUNCIONAMIENTO:
+1. Cada puerta U se reduce a SU(2) (U / √det U) y se obtiene su eje n y su
+   ángulo θ: U = e^(iα) · exp(-i θ/2 n·σ). En RX, RY, RZ y PHASE se usa el
+   ángulo del parámetro (para que RX(3π/2) gire 270° y no -90°); en el resto
+   se toma el giro más corto (θ ≤ π)
+2. El vector al inicio de cada puerta se obtiene girando el anterior con la
+   fórmula de Rodrigues:
+
+       v' = v·cos φ + (n × v)·sin φ + n·(n·v)·(1 - cos φ)
+
+3. Todos los puntos intermedios (lote × puertas × pasos) se calculan con una
+   única evaluación de esa fórmula
+
+LOTES:
+Con parámetros por lotes (`memoria={"theta": [array]}`, como en
+`qnc.barrido`) o con una lista de programas de la misma longitud, se obtiene
+una trayectoria por elemento del lote en la misma pasada.
+
+USO:
+    from qnc import trayectoria_bloch
+
+    prog = Program(H(0), S(0), RX(math.pi / 2, 0))
+    puntos = trayectoria_bloch(prog, pasos_por_puerta=20)    # (61, 3)
+"""
+
+import numpy as np
+
+from .circuito import Circuito, evaluar_parametro
+
+
+# Eje de giro de las puertas de rotación (PHASE(θ) = RZ(θ) salvo fase global)
+EJES_ROTACION = {"RX": (1.0, 0.0, 0.0), "RY": (0.0, 1.0, 0.0),
+                 "RZ": (0.0, 0.0, 1.0), "PHASE": (0.0, 0.0, 1.0)}
+
+
+def vector_bloch(psi):
+    """
+    Vector de Bloch (x, y, z) de uno o varios estados de un qubit.
+
+    Args:
+        psi: Array (..., 2) de amplitudes [α, β]
+
+    Returns:
+        np.ndarray: Array (..., 3) con x = 2·Re(α*β), y = 2·Im(α*β), z = |α|² - |β|²
+    """
+    psi = np.asarray(psi, dtype=complex)
+    psi = psi / np.linalg.norm(psi, axis=-1, keepdims=True)
+    a, b = psi[..., 0], psi[..., 1]
+    producto = np.conj(a) * b
+    return np.stack([2 * producto.real, 2 * producto.imag,
+                     np.abs(a) ** 2 - np.abs(b) ** 2], axis=-1)
+
+
+def eje_angulo(u):
+    """
+    Eje y ángulo de giro de una o varias puertas de un qubit.
+
+    Args:
+        u: Array (..., 2, 2) de matrices unitarias
+
+    Returns:
+        tuple: (ejes (..., 3), angulos (...,)) con el ángulo en [0, π]
+    """
+    u = np.asarray(u, dtype=complex)
+    v = u / np.sqrt(np.linalg.det(u))[..., None, None]
+    # v = cos(θ/2)·I - i·sin(θ/2)·(n·σ); se elige el signo con cos(θ/2) ≥ 0
+    signo = np.where(v[..., 0, 0].real < 0, -1.0, 1.0)
+    coseno = signo * (v[..., 0, 0] + v[..., 1, 1]).real / 2
+    seno_n = signo[..., None] * np.stack([-(v[..., 0, 1] + v[..., 1, 0]).imag / 2,
+                                          (v[..., 1, 0] - v[..., 0, 1]).real / 2,
+                                          -(v[..., 0, 0] - v[..., 1, 1]).imag / 2], axis=-1)
+    seno = np.linalg.norm(seno_n, axis=-1)
+    angulos = 2 * np.arctan2(seno, np.clip(coseno, -1, 1))
+    ejes = np.where(seno[..., None] > 1e-12, seno_n / np.maximum(seno, 1e-300)[..., None],
+                    np.array([0.0, 0.0, 1.0]))
+    return ejes, angulos
+
+
+def girar(v, ejes, angulos):
+    """Gira los vectores v (..., 3) un ángulo (...) alrededor de los ejes (..., 3)."""
+    c = np.cos(angulos)[..., None]
+    s = np.sin(angulos)[..., None]
+    proyeccion = np.sum(ejes * v, axis=-1, keepdims=True)
+    return v * c + np.cross(ejes, v) * s + ejes * proyeccion * (1 - c)
+
+
+def trayectoria_bloch(programa, estado_inicial=0, pasos_por_puerta=1, memoria=None):
+    """
+    Vectores de Bloch a lo largo de una secuencia de puertas de un qubit.
+
+    Args:
+        programa: Program de PyQuil o Circuito de un solo qubit, o lista de
+            ellos con el mismo número de puertas (un elemento del lote cada uno)
+        estado_inicial: 0, 1, vector de amplitudes (2,) o lote (B, 2)
+        pasos_por_puerta: Puntos calculados dentro de cada puerta (1: solo el
+            estado después de cada puerta)
+        memoria: Valores de los parámetros (formato `memory_map`); un array
+            como valor genera un lote de trayectorias
+
+    Returns:
+        np.ndarray: Array (puertas · pasos + 1, 3), o (B, puertas · pasos + 1, 3)
+            si hay lote; el primer punto es el estado inicial
+
+    Raises:
+        ValueError: Si el circuito actúa sobre más de un qubit
+    """
+    es_lista = isinstance(programa, (list, tuple))
+    circuitos = [c if isinstance(c, Circuito) else Circuito.desde_programa(c)
+                 for c in (programa if es_lista else [programa])]
+    if len({len(c.operaciones) for c in circuitos}) != 1:
+        raise ValueError("Todos los programas del lote deben tener el mismo número de puertas")
+
+    # Ejes y ángulos de todas las puertas: arrays (B, G, 3) y (B, G)
+    partes = [_ejes_angulos(c, memoria) for c in circuitos]
+    ejes = np.concatenate([e for e, _ in partes])
+    angulos = np.concatenate([a for _, a in partes])
+    inicial = _bloch_inicial(estado_inicial)
+    lote = max(len(ejes), len(inicial))
+    ejes = np.broadcast_to(ejes, (lote,) + ejes.shape[1:])
+    angulos = np.broadcast_to(angulos, (lote,) + angulos.shape[1:])
+    inicial = np.broadcast_to(inicial, (lote, 3))
+    g = ejes.shape[1]
+
+    # Vector al inicio de cada puerta (la dependencia entre puertas es secuencial)
+    inicios = np.empty((lote, g, 3))
+    v = inicial
+    for j in range(g):
+        inicios[:, j] = v
+        v = girar(v, ejes[:, j], angulos[:, j])
+
+    # Todos los puntos intermedios en una sola evaluación: (B, G, pasos, 3)
+    fracciones = np.arange(1, pasos_por_puerta + 1) / pasos_por_puerta
+    puntos = girar(inicios[:, :, None, :], ejes[:, :, None, :],
+                   angulos[:, :, None] * fracciones)
+    trayectoria = np.concatenate([inicial[:, None, :],
+                                  puntos.reshape(lote, g * pasos_por_puerta, 3)], axis=1)
+    return trayectoria if es_lista or lote > 1 or np.ndim(estado_inicial) == 2 else trayectoria[0]
+
+
+def _ejes_angulos(circuito, memoria):
+    """Ejes (B, G, 3) y ángulos (B, G) de las puertas de un circuito de un qubit."""
+    if len(circuito.qubits) > 1 or any(len(op.qubits) != 1 for op in circuito.operaciones):
+        raise ValueError("La trayectoria de Bloch solo admite circuitos de un qubit")
+    if not circuito.operaciones:
+        return np.zeros((1, 0, 3)), np.zeros((1, 0))
+
+    matrices = [op.matriz(memoria) for op in circuito.operaciones]
+    lote = max(m.shape[0] if m.ndim == 3 else 1 for m in matrices)
+    matrices = np.stack([np.broadcast_to(m, (lote, 2, 2)) for m in matrices], axis=1)
+    ejes, angulos = eje_angulo(matrices)
+
+    for j, op in enumerate(circuito.operaciones):
+        if op.nombre in EJES_ROTACION:
+            theta = np.asarray(evaluar_parametro(op.parametros[0], memoria), dtype=float)
+            ejes[:, j] = EJES_ROTACION[op.nombre]
+            angulos[:, j] = -theta if op.daga else theta
+    return ejes, angulos
+
+
+def _bloch_inicial(estado):
+    """Vector de Bloch inicial como array (B, 3)."""
+    if np.ndim(estado) == 0:
+        psi = np.zeros(2, dtype=complex)
+        psi[int(estado)] = 1
+        estado = psi
+    return vector_bloch(np.atleast_2d(estado))
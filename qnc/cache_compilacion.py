@@ -0,0 +1,319 @@
+"""
+MÓDULO: qnc/cache_compilacion.py - Caché persistente de compilaciones de quilc
+
+RESUMEN:
+Los programas de S01/S02 llaman a `qvm.compile(prog)` en cada ejecución y
+envían el mismo Quil al contenedor de quilc una y otra vez. Esta caché guarda
+el resultado de cada compilación identificado por su contenido:
+
+    clave = SHA-256(Quil normalizado + ISA del procesador + opciones del compilador)
+
+NIVELES:
+1. Memoria: diccionario LRU con los `Program` compilados (acierto en microsegundos)
+2. Disco: un fichero `<clave>.quil` por compilación, que sobrevive a reinicios.
+   Los metadatos de quilc (`native_quil_metadata`: reasignación final de
+   qubits, profundidad, volumen...) se guardan en una primera línea de
+   comentario, así que un acierto en disco devuelve el mismo programa que
+   quilc. Cuando el directorio supera `max_bytes_disco` se borran los
+   ficheros usados hace más tiempo.
+
+El número de shots (`wrap_in_numshots_loop`) no forma parte de la clave: quilc
+no lo modifica, así que el mismo programa con 100 o 1000 shots reutiliza la
+misma compilación y solo se ajusta el número de shots de la copia devuelta.
+
+USO:
+    from qnc import QCConCache
+
+    qvm = QCConCache(get_qc('9q-square-qvm'))
+    result = qvm.run(qvm.compile(prog))     # la 2ª compilación sale de la caché
+    print(qvm.cache.estadisticas())
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from pyquil import Program
+from qcs_sdk.compiler.quilc import NativeQuilMetadata
+
+
+DIRECTORIO_POR_DEFECTO = os.path.join(os.path.expanduser("~"), ".cache", "qnc", "compilacion")
+PREFIJO_METADATOS = "# native_quil_metadata: "
+CAMPOS_METADATOS = ("final_rewiring", "gate_depth", "gate_volume", "multiqubit_gate_depth",
+                    "program_duration", "program_fidelity", "qpu_runtime_estimation",
+                    "topological_swaps")
+
+
+def normalizar_quil(programa):
+    """
+    Devuelve el texto Quil del programa sin comentarios, espacios sobrantes ni
+    líneas vacías, para que dos programas equivalentes den la misma clave.
+    """
+    lineas = []
+    for linea in programa.out().splitlines():
+        linea = linea.split("#", 1)[0]
+        linea = " ".join(linea.split())
+        if linea:
+            lineas.append(linea)
+    return "\n".join(lineas)
+
+
+def clave_compilacion(programa, isa="", opciones=None):
+    """
+    Calcula la clave de caché de una compilación.
+
+    Args:
+        programa: Program de PyQuil
+        isa: Texto que identifica el ISA del procesador destino
+        opciones: dict con las opciones del compilador
+
+    Returns:
+        str: Hash SHA-256 en hexadecimal
+    """
+    h = hashlib.sha256()
+    h.update(normalizar_quil(programa).encode())
+    h.update(b"\0")
+    h.update(isa.encode())
+    h.update(b"\0")
+    h.update(json.dumps(opciones or {}, sort_keys=True).encode())
+    return h.hexdigest()
+
+
+# =============================================
+# CLASE CacheCompilacion
+# =============================================
+class CacheCompilacion:
+    """
+    Caché de dos niveles (memoria LRU + disco) de programas compilados.
+
+    Es segura para usarla desde varios hilos a la vez.
+    """
+
+    def __init__(self, directorio=DIRECTORIO_POR_DEFECTO, max_memoria=256,
+                 max_bytes_disco=64 * 1024 * 1024):
+        """
+        Inicializa la caché.
+
+        Args:
+            directorio: Carpeta del nivel de disco (None para usar solo memoria)
+            max_memoria: Número máximo de programas en el nivel de memoria
+            max_bytes_disco: Tamaño máximo del nivel de disco en bytes
+        """
+        self.directorio = directorio
+        self.max_memoria = max_memoria
+        self.max_bytes_disco = max_bytes_disco
+        self._memoria = OrderedDict()
+        self._lock = threading.Lock()
+        self._contadores = {"aciertos_memoria": 0, "aciertos_disco": 0,
+                            "fallos": 0, "desalojos_memoria": 0, "desalojos_disco": 0}
+        self._bytes_disco = 0
+        if directorio is not None:
+            os.makedirs(directorio, exist_ok=True)
+            self._bytes_disco = sum(tamano for _, tamano, _ in self._ficheros_disco())
+
+    def obtener(self, clave):
+        """
+        Busca una compilación en la caché.
+
+        Args:
+            clave: Clave calculada con `clave_compilacion`
+
+        Returns:
+            Program o None: Copia del programa compilado, o None si no está
+        """
+        with self._lock:
+            if clave in self._memoria:
+                self._memoria.move_to_end(clave)
+                self._contadores["aciertos_memoria"] += 1
+                return self._memoria[clave].copy()
+
+        texto = self._leer_disco(clave)
+        if texto is None:
+            with self._lock:
+                self._contadores["fallos"] += 1
+            return None
+
+        compilado = _desde_texto(texto)
+        with self._lock:
+            self._contadores["aciertos_disco"] += 1
+            self._guardar_memoria(clave, compilado)
+        return compilado.copy()
+
+    def guardar(self, clave, compilado):
+        """
+        Guarda un programa compilado en ambos niveles.
+
+        Args:
+            clave: Clave calculada con `clave_compilacion`
+            compilado: Program devuelto por quilc
+        """
+        with self._lock:
+            self._guardar_memoria(clave, compilado.copy())
+        if self.directorio is not None:
+            self._escribir_disco(clave, _a_texto(compilado))
+
+    def limpiar(self):
+        """Vacía los dos niveles de la caché."""
+        with self._lock:
+            self._memoria.clear()
+            if self.directorio is not None:
+                for ruta, _, _ in self._ficheros_disco():
+                    os.remove(ruta)
+                self._bytes_disco = 0
+
+    def estadisticas(self):
+        """
+        Devuelve los contadores de uso de la caché.
+
+        Returns:
+            dict: aciertos por nivel, fallos, desalojos, tasa de aciertos,
+                número de entradas en memoria y bytes ocupados en disco
+        """
+        with self._lock:
+            datos = dict(self._contadores)
+            datos["entradas_memoria"] = len(self._memoria)
+            datos["bytes_disco"] = self._bytes_disco
+        consultas = datos["aciertos_memoria"] + datos["aciertos_disco"] + datos["fallos"]
+        aciertos = datos["aciertos_memoria"] + datos["aciertos_disco"]
+        datos["tasa_aciertos"] = aciertos / consultas if consultas else 0.0
+        return datos
+
+    def _guardar_memoria(self, clave, compilado):
+        """Inserta en el nivel LRU (llamar con el lock adquirido)."""
+        self._memoria[clave] = compilado
+        self._memoria.move_to_end(clave)
+        while len(self._memoria) > self.max_memoria:
+            self._memoria.popitem(last=False)
+            self._contadores["desalojos_memoria"] += 1
+
+    def _ruta(self, clave):
+        return os.path.join(self.directorio, clave + ".quil")
+
+    def _leer_disco(self, clave):
+        """Lee una compilación del disco y marca el fichero como usado."""
+        if self.directorio is None:
+            return None
+        ruta = self._ruta(clave)
+        try:
+            with open(ruta, encoding="utf-8") as f:
+                texto = f.read()
+            os.utime(ruta)
+        except FileNotFoundError:
+            return None
+        return texto
+
+    def _escribir_disco(self, clave, texto):
+        """Escribe de forma atómica y desaloja los ficheros más antiguos."""
+        ruta = self._ruta(clave)
+        temporal = f"{ruta}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporal, "w", encoding="utf-8") as f:
+            f.write(texto)
+        with self._lock:
+            anterior = os.path.getsize(ruta) if os.path.exists(ruta) else 0
+            os.replace(temporal, ruta)
+            self._bytes_disco += os.path.getsize(ruta) - anterior
+            if self._bytes_disco > self.max_bytes_disco:
+                self._desalojar_disco()
+
+    def _desalojar_disco(self):
+        """Borra los ficheros usados hace más tiempo hasta volver al límite."""
+        for ruta, tamano, _ in sorted(self._ficheros_disco(), key=lambda f: f[2]):
+            if self._bytes_disco <= self.max_bytes_disco:
+                break
+            try:
+                os.remove(ruta)
+            except FileNotFoundError:
+                continue
+            self._bytes_disco -= tamano
+            self._contadores["desalojos_disco"] += 1
+
+    def _ficheros_disco(self):
+        """Lista (ruta, tamaño, fecha de último uso) de los ficheros .quil."""
+        ficheros = []
+        for entrada in os.scandir(self.directorio):
+            if entrada.name.endswith(".quil"):
+                info = entrada.stat()
+                ficheros.append((entrada.path, info.st_size, info.st_mtime))
+        return ficheros
+
+
+def _a_texto(compilado):
+    """Quil del programa con sus metadatos de quilc en una primera línea de comentario."""
+    metadatos = getattr(compilado, "native_quil_metadata", None)
+    if metadatos is None:
+        return compilado.out()
+    campos = {campo: getattr(metadatos, campo) for campo in CAMPOS_METADATOS}
+    return PREFIJO_METADATOS + json.dumps(campos) + "\n" + compilado.out()
+
+
+def _desde_texto(texto):
+    """Program (con `native_quil_metadata` si se guardaron) a partir del texto en disco."""
+    metadatos = None
+    if texto.startswith(PREFIJO_METADATOS):
+        linea, texto = texto.split("\n", 1)
+        metadatos = NativeQuilMetadata(**json.loads(linea[len(PREFIJO_METADATOS):]))
+    compilado = Program(texto)
+    compilado.native_quil_metadata = metadatos
+    return compilado
+
+
+# =============================================
+# CLASE QCConCache
+# =============================================
+class QCConCache:
+    """
+    Envoltorio de un `QuantumComputer` cuya compilación pasa por la caché.
+
+    `compile` consulta la caché antes de llamar a quilc; el resto de métodos y
+    atributos (`run`, `name`, `qam`...) se delegan en el QuantumComputer
+    original, así que se puede usar en lugar de `get_qc(...)` sin cambiar
+    nada más en los programas.
+    """
+
+    def __init__(self, qc, cache=None):
+        """
+        Args:
+            qc: QuantumComputer de PyQuil (ej: get_qc('9q-square-qvm'))
+            cache: CacheCompilacion a usar (default: una nueva con la
+                configuración por defecto)
+        """
+        self.qc = qc
+        self.cache = CacheCompilacion() if cache is None else cache
+        self._isa = None
+
+    def compile(self, programa, to_native_gates=True, optimize=True, *, protoquil=None):
+        """
+        Compila un programa reutilizando compilaciones anteriores.
+
+        Acepta los mismos argumentos que `QuantumComputer.compile`.
+        """
+        opciones = {"to_native_gates": to_native_gates, "optimize": optimize,
+                    "protoquil": protoquil}
+        clave = clave_compilacion(programa, self.isa, opciones)
+        compilado = self.cache.obtener(clave)
+        if compilado is None:
+            compilado = self.qc.compile(programa, to_native_gates, optimize,
+                                        protoquil=protoquil)
+            if not isinstance(compilado, Program):
+                # Los ejecutables de QPU (EncryptedProgram) no se guardan
+                return compilado
+            self.cache.guardar(clave, compilado)
+        return compilado.wrap_in_numshots_loop(programa.num_shots)
+
+    @property
+    def isa(self):
+        """Texto canónico del ISA del procesador (se calcula una sola vez)."""
+        if self._isa is None:
+            procesador = getattr(self.qc, "quantum_processor", None)
+            if procesador is None:
+                # Motores locales de qnc: no tienen ISA, basta con el tipo
+                self._isa = type(self.qc).__name__
+            else:
+                isa = procesador.to_compiler_isa()
+                self._isa = self.qc.name + json.dumps(isa.dict(), sort_keys=True, default=str)
+        return self._isa
+
+    def __getattr__(self, nombre):
+        return getattr(self.qc, nombre)
@@ -0,0 +1,330 @@
+"""
+MÓDULO: qnc/carga.py - Generador de carga y medida de rendimiento de qvm/quilc
+
+RESUMEN:
+No sabemos cuántas peticiones compile+run por segundo aguanta el despliegue
+de docker-compose.yml. `generar_carga` repite una mezcla configurable de los
+circuitos del repositorio contra cualquier objeto con compile/run
+(`get_qc(...)`, `GestorConexiones`, motores locales...) y mide, por separado
+para la compilación (quilc) y la ejecución (QVM):
+
+- Rendimiento: peticiones correctas por segundo
+- Latencia: media, p50, p95, p99 y máximo
+- Tasa de error
+
+CIRCUITOS (`CIRCUITOS`):
+- "bell": estado de Bell de 2 qubits (S01P02)
+- "monedas": una moneda cuántica, H y medida (S02)
+- "pauli": X, Y o Z sobre |0⟩ o |1⟩ (S03)
+- "rotaciones": RX, RY, RZ o PHASE con un ángulo aleatorio (S04)
+- "ruleta": H sobre 5 qubits y medida, un número de 0 a 31 (S05)
+`mezcla` da el peso de cada uno: {"bell": 2, "ruleta": 1} manda el doble de
+estados de Bell que de ruletas.
+
+MODOS:
+- Concurrencia fija (`tasa=None`): `concurrencia` hilos lanzan peticiones
+  una detrás de otra lo más rápido posible (bucle cerrado)
+- Tasa fija (`tasa=100`): se lanza una petición cada 1/tasa segundos, con
+  como mucho `concurrencia` en curso (bucle abierto). Si el servicio no da
+  abasto las peticiones esperan turno: ese retraso sobre la hora prevista se
+  mide aparte (`retraso`) para que no quede oculto
+
+INFORME:
+`InformeCarga.a_dict()` da un diccionario con la configuración y las
+métricas; `guardar_json(ruta)` lo escribe en JSON o, si la ruta termina en
+.jsonl, lo añade como una línea más para seguir la evolución entre
+ejecuciones.
+
+USO:
+    from qnc import GestorConexiones, generar_carga
+
+    with GestorConexiones(max_compilacion=8, max_ejecucion=8) as qc:
+        informe = generar_carga(qc, concurrencia=8, duracion=30)
+    print(informe.resumen())
+    informe.guardar_json("carga.jsonl")
+"""
+
+import json
+import math
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from pyquil import Program
+from pyquil.gates import CNOT, MEASURE, PHASE, RX, RY, RZ, H, X, Y, Z
+
+
+PERCENTILES = (50, 95, 99)
+QUBITS_RULETA = 5
+
+
+# =============================================
+# CIRCUITOS DEL REPOSITORIO
+# =============================================
+def _medir(programa, qubits):
+    ro = programa.declare("ro", "BIT", len(qubits))
+    for i, q in enumerate(qubits):
+        programa += MEASURE(q, ro[i])
+    return programa
+
+
+def circuito_bell(aleatorio):
+    return _medir(Program(H(0), CNOT(0, 1)), [0, 1])
+
+
+def circuito_monedas(aleatorio):
+    return _medir(Program(H(0)), [0])
+
+
+def circuito_pauli(aleatorio):
+    programa = Program(X(0)) if aleatorio.random() < 0.5 else Program()
+    programa += aleatorio.choice((X, Y, Z))(0)
+    return _medir(programa, [0])
+
+
+def circuito_rotaciones(aleatorio):
+    puerta = aleatorio.choice((RX, RY, RZ, PHASE))
+    return _medir(Program(H(0), puerta(aleatorio.uniform(0, 2 * math.pi), 0)), [0])
+
+
+def circuito_ruleta(aleatorio):
+    return _medir(Program([H(q) for q in range(QUBITS_RULETA)]), list(range(QUBITS_RULETA)))
+
+
+CIRCUITOS = {
+    "bell": circuito_bell,
+    "monedas": circuito_monedas,
+    "pauli": circuito_pauli,
+    "rotaciones": circuito_rotaciones,
+    "ruleta": circuito_ruleta,
+}
+
+
+# =============================================
+# INFORME
+# =============================================
+class MuestraCarga:
+    """
+    Una petición compile+run del generador.
+
+    Atributos:
+        circuito: Nombre del circuito en `CIRCUITOS`
+        retraso: Segundos entre la hora prevista y la de inicio (modo de tasa fija)
+        t_compilacion, t_ejecucion: Latencia de cada fase (None si no se llegó a ella)
+        error_compilacion, error_ejecucion: Excepción de cada fase (None si fue bien)
+    """
+
+    __slots__ = ("circuito", "retraso", "t_compilacion", "t_ejecucion",
+                 "error_compilacion", "error_ejecucion")
+
+    def __init__(self, circuito, retraso=0.0):
+        self.circuito = circuito
+        self.retraso = retraso
+        self.t_compilacion = None
+        self.t_ejecucion = None
+        self.error_compilacion = None
+        self.error_ejecucion = None
+
+
+def estadisticas_latencia(latencias, errores, duracion):
+    """
+    Métricas de una fase.
+
+    Args:
+        latencias: Segundos de las peticiones correctas
+        errores: Número de peticiones que fallaron
+        duracion: Segundos de la prueba
+
+    Returns:
+        dict: peticiones, errores, tasa_error, rendimiento (correctas/s) y
+            latencias en ms (media, p50, p95, p99, max)
+    """
+    peticiones = len(latencias) + errores
+    metricas = {
+        "peticiones": peticiones,
+        "errores": errores,
+        "tasa_error": errores / peticiones if peticiones else 0.0,
+        "rendimiento": len(latencias) / duracion if duracion > 0 else 0.0,
+    }
+    ms = np.asarray(latencias, dtype=float) * 1000
+    metricas["media_ms"] = float(ms.mean()) if ms.size else None
+    for p in PERCENTILES:
+        metricas[f"p{p}_ms"] = float(np.percentile(ms, p)) if ms.size else None
+    metricas["max_ms"] = float(ms.max()) if ms.size else None
+    return metricas
+
+
+class InformeCarga:
+    """
+    Resultado de una prueba de carga.
+
+    Atributos:
+        muestras: Lista de MuestraCarga
+        duracion: Segundos desde la primera petición hasta que terminó la última
+        configuracion: dict con los parámetros de la prueba
+    """
+
+    def __init__(self, muestras, duracion, configuracion):
+        self.muestras = muestras
+        self.duracion = duracion
+        self.configuracion = configuracion
+
+    def fase(self, nombre):
+        """Métricas de "compilacion" o "ejecucion" (ver `estadisticas_latencia`)."""
+        latencias = [getattr(m, f"t_{nombre}") for m in self.muestras
+                     if getattr(m, f"error_{nombre}") is None and getattr(m, f"t_{nombre}") is not None]
+        errores = sum(getattr(m, f"error_{nombre}") is not None for m in self.muestras)
+        return estadisticas_latencia(latencias, errores, self.duracion)
+
+    def a_dict(self):
+        """Diccionario serializable con la configuración, las métricas y los errores."""
+        completas = [m for m in self.muestras if m.error_compilacion is None
+                     and m.error_ejecucion is None]
+        retrasos = np.asarray([m.retraso for m in self.muestras], dtype=float) * 1000
+        tipos_error = {}
+        for m in self.muestras:
+            for error in (m.error_compilacion, m.error_ejecucion):
+                if error is not None:
+                    nombre = type(error).__name__
+                    tipos_error[nombre] = tipos_error.get(nombre, 0) + 1
+        return {
+            "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "configuracion": self.configuracion,
+            "duracion_s": self.duracion,
+            "peticiones": len(self.muestras),
+            "rendimiento_total": len(completas) / self.duracion if self.duracion > 0 else 0.0,
+            "compilacion": self.fase("compilacion"),
+            "ejecucion": self.fase("ejecucion"),
+            "retraso_p99_ms": float(np.percentile(retrasos, 99)) if retrasos.size else 0.0,
+            "por_circuito": {c: sum(m.circuito == c for m in self.muestras)
+                             for c in sorted({m.circuito for m in self.muestras})},
+            "errores": tipos_error,
+        }
+
+    def resumen(self):
+        """Tabla de texto con las métricas de cada fase."""
+        datos = self.a_dict()
+        lineas = [f"{'Fase':<12} {'Peticiones':>10} {'Errores':>8} {'Pet/s':>9} "
+                  f"{'Media':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'Máx':>8}  (ms)"]
+        for fase in ("compilacion", "ejecucion"):
+            m = datos[fase]
+            valores = [m["media_ms"], m["p50_ms"], m["p95_ms"], m["p99_ms"], m["max_ms"]]
+            lineas.append(f"{fase:<12} {m['peticiones']:>10} {m['errores']:>8} "
+                          f"{m['rendimiento']:>9.1f} "
+                          + " ".join("       -" if v is None else f"{v:>8.2f}" for v in valores))
+        cfg = self.configuracion
+        modo = (f"tasa {cfg['tasa']}/s" if cfg["tasa"] else "concurrencia fija")
+        lineas.append(f"Peticiones: {datos['peticiones']}  Completas/s: {datos['rendimiento_total']:.1f}  "
+                      f"Duración: {self.duracion:.2f} s  Modo: {modo}  "
+                      f"Concurrencia: {cfg['concurrencia']}  Retraso p99: {datos['retraso_p99_ms']:.2f} ms")
+        if datos["errores"]:
+            lineas.append(f"Errores: {datos['errores']}")
+        return "\n".join(lineas)
+
+    def guardar_json(self, ruta):
+        """Escribe el informe en JSON (o lo añade como una línea si la ruta es .jsonl)."""
+        if ruta.endswith(".jsonl"):
+            with open(ruta, "a", encoding="utf-8") as f:
+                f.write(json.dumps(self.a_dict(), ensure_ascii=False) + "\n")
+        else:
+            with open(ruta, "w", encoding="utf-8") as f:
+                json.dump(self.a_dict(), f, ensure_ascii=False, indent=2)
+
+
+# =============================================
+# GENERADOR
+# =============================================
+def generar_carga(qc, mezcla=None, concurrencia=4, tasa=None, duracion=10.0,
+                  peticiones=None, shots=100, semilla=None):
+    """
+    Lanza peticiones compile+run con una mezcla de circuitos y mide latencias.
+
+    Args:
+        qc: QuantumComputer de PyQuil o motor de qnc (objeto con compile/run)
+        mezcla: dict circuito -> peso (default: todos los de `CIRCUITOS` con peso 1)
+        concurrencia: Máximo de peticiones en curso a la vez
+        tasa: Peticiones por segundo (None = tan rápido como permita la concurrencia)
+        duracion: Segundos durante los que se lanzan peticiones
+        peticiones: Máximo de peticiones (None = sin límite, solo la duración)
+        shots: Shots de cada ejecución
+        semilla: Semilla de la elección de circuitos y ángulos
+
+    Returns:
+        InformeCarga
+
+    Raises:
+        ValueError: Si la mezcla tiene circuitos desconocidos o pesos no positivos
+    """
+    mezcla = dict(mezcla or {nombre: 1 for nombre in CIRCUITOS})
+    desconocidos = set(mezcla) - set(CIRCUITOS)
+    if desconocidos or not mezcla or min(mezcla.values()) < 0 or sum(mezcla.values()) <= 0:
+        raise ValueError(f"Mezcla no válida: {mezcla} (circuitos: {', '.join(CIRCUITOS)})")
+    if tasa is not None and tasa <= 0:
+        raise ValueError(f"La tasa debe ser positiva (recibido {tasa})")
+    if concurrencia < 1:
+        raise ValueError("La concurrencia debe ser al menos 1")
+
+    aleatorio = random.Random(semilla)
+    nombres, pesos = list(mezcla), list(mezcla.values())
+    lock = threading.Lock()
+    muestras = []
+
+    def siguiente_programa():
+        with lock:
+            nombre = aleatorio.choices(nombres, pesos)[0]
+            programa = CIRCUITOS[nombre](aleatorio)
+        return nombre, programa.wrap_in_numshots_loop(shots)
+
+    def peticion(prevista=None):
+        nombre, programa = siguiente_programa()
+        inicio = time.perf_counter()
+        muestra = MuestraCarga(nombre, 0.0 if prevista is None else max(inicio - prevista, 0.0))
+        try:
+            ejecutable = qc.compile(programa)
+            muestra.t_compilacion = time.perf_counter() - inicio
+        except Exception as error:
+            muestra.t_compilacion = time.perf_counter() - inicio
+            muestra.error_compilacion = error
+        if muestra.error_compilacion is None:
+            inicio = time.perf_counter()
+            try:
+                qc.run(ejecutable)
+            except Exception as error:
+                muestra.error_ejecucion = error
+            muestra.t_ejecucion = time.perf_counter() - inicio
+        muestras.append(muestra)
+
+    limite = math.inf if peticiones is None else peticiones
+    inicio = time.perf_counter()
+    fin = inicio + duracion
+    with ThreadPoolExecutor(max_workers=concurrencia) as grupo:
+        if tasa is None:
+            lanzadas = [0]
+
+            def trabajador():
+                while time.perf_counter() < fin:
+                    with lock:
+                        if lanzadas[0] >= limite:
+                            return
+                        lanzadas[0] += 1
+                    peticion()
+
+            for _ in range(concurrencia):
+                grupo.submit(trabajador)
+        else:
+            k = 0
+            while k < limite:
+                prevista = inicio + k / tasa
+                if prevista >= fin:
+                    break
+                time.sleep(max(prevista - time.perf_counter(), 0.0))
+                grupo.submit(peticion, prevista)
+                k += 1
+    total = time.perf_counter() - inicio
+
+    configuracion = {"objetivo": type(qc).__name__, "mezcla": mezcla,
+                     "concurrencia": concurrencia, "tasa": tasa, "duracion": duracion,
+                     "peticiones": peticiones, "shots": shots, "semilla": semilla}
+    return InformeCarga(muestras, total, configuracion)
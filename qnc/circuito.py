@@ -0,0 +1,245 @@
+"""
+MÓDULO: qnc/circuito.py - Representación interna de un programa de PyQuil
+
+RESUMEN:
+Convierte un `Program` de PyQuil en una lista normalizada de operaciones que
+los motores locales de `qnc` pueden simular sin pasar por quilc ni por la QVM.
+
+FUNCIONAMIENTO:
+1. Recorre `programa.instructions`
+2. Guarda las declaraciones de memoria (DECLARE ro BIT[2], DECLARE theta REAL)
+3. Convierte cada `Gate` en una `Operacion` (nombre, parámetros, qubits)
+4. Convierte cada `Measurement` en una `Medicion` (qubit, registro, índice)
+5. Ignora las instrucciones sin efecto en la simulación (PRAGMA, NOP)
+
+Los parámetros de las puertas se guardan tal cual (números o expresiones de
+PyQuil como `2*theta[0]`) y se evalúan después con `evaluar_parametro`, que
+admite arrays de NumPy para evaluar muchos valores a la vez.
+"""
+
+import numpy as np
+from pyquil.quilatom import BinaryExp, Function, MemoryReference
+from pyquil.quilbase import Declare, Gate, Halt, Measurement, Nop, Pragma
+
+from .puertas import es_soportada, matriz_puerta
+
+
+class Operacion:
+    """
+    Aplicación de una puerta sobre uno o dos qubits.
+
+    Atributos:
+        nombre: Nombre de la puerta en Quil (ej: "RX")
+        parametros: Tupla de parámetros sin evaluar (números o expresiones)
+        qubits: Tupla de índices de qubit en el orden de la instrucción
+        daga: True si la instrucción lleva el modificador DAGGER
+    """
+
+    __slots__ = ("nombre", "parametros", "qubits", "daga")
+
+    def __init__(self, nombre, parametros, qubits, daga=False):
+        self.nombre = nombre
+        self.parametros = tuple(parametros)
+        self.qubits = tuple(qubits)
+        self.daga = daga
+
+    def matriz(self, memoria=None):
+        """
+        Devuelve la matriz de la puerta con los parámetros evaluados.
+
+        Args:
+            memoria: dict con los valores de la memoria clásica (ver
+                `evaluar_parametro`)
+
+        Returns:
+            np.ndarray: Matriz (d, d) o lote (B, d, d) si algún parámetro es un array
+        """
+        valores = [evaluar_parametro(p, memoria) for p in self.parametros]
+        m = matriz_puerta(self.nombre, valores)
+        if self.daga:
+            m = np.conj(np.swapaxes(m, -1, -2))
+        return m
+
+    def __repr__(self):
+        return f"Operacion({self.nombre}, {self.parametros}, {self.qubits})"
+
+
+class Medicion:
+    """
+    Medición de un qubit en la base computacional.
+
+    Atributos:
+        qubit: Índice del qubit medido
+        registro: Nombre del registro clásico destino (None si se descarta)
+        indice: Posición dentro del registro
+    """
+
+    __slots__ = ("qubit", "registro", "indice")
+
+    def __init__(self, qubit, registro, indice):
+        self.qubit = qubit
+        self.registro = registro
+        self.indice = indice
+
+    def __repr__(self):
+        return f"Medicion({self.qubit} -> {self.registro}[{self.indice}])"
+
+
+class Circuito:
+    """
+    Programa de PyQuil normalizado para los motores locales.
+
+    Atributos:
+        instrucciones: Lista de `Operacion` y `Medicion` en orden de ejecución
+        declaraciones: dict nombre -> (tipo, tamaño) de la memoria declarada
+        num_shots: Número de repeticiones (`wrap_in_numshots_loop`)
+    """
+
+    def __init__(self, instrucciones, declaraciones=None, num_shots=1):
+        self.instrucciones = list(instrucciones)
+        self.declaraciones = dict(declaraciones or {})
+        self.num_shots = num_shots
+
+    @classmethod
+    def desde_programa(cls, programa):
+        """
+        Construye un Circuito a partir de un `Program` de PyQuil.
+
+        Args:
+            programa: Program de PyQuil
+
+        Returns:
+            Circuito: Representación normalizada del programa
+
+        Raises:
+            ValueError: Si el programa contiene instrucciones que no se pueden
+                simular localmente (control de flujo, puertas desconocidas...)
+        """
+        instrucciones = []
+        declaraciones = {}
+
+        for inst in programa.instructions:
+            if isinstance(inst, Declare):
+                declaraciones[inst.name] = (inst.memory_type, inst.memory_size)
+            elif isinstance(inst, Gate):
+                modificadores = list(inst.modifiers)
+                daga = modificadores.count("DAGGER") % 2 == 1
+                if any(m != "DAGGER" for m in modificadores):
+                    raise ValueError(f"Modificador no soportado: {inst}")
+                if not es_soportada(inst.name):
+                    raise ValueError(f"Puerta no soportada: {inst.name}")
+                qubits = [q.index for q in inst.qubits]
+                instrucciones.append(Operacion(inst.name, inst.params, qubits, daga))
+            elif isinstance(inst, Measurement):
+                ref = inst.classical_reg
+                if ref is None:
+                    instrucciones.append(Medicion(inst.qubit.index, None, 0))
+                else:
+                    instrucciones.append(Medicion(inst.qubit.index, ref.name, ref.offset))
+            elif isinstance(inst, Halt):
+                break
+            elif isinstance(inst, (Pragma, Nop)):
+                continue
+            else:
+                raise ValueError(f"Instrucción no soportada: {inst}")
+
+        return cls(instrucciones, declaraciones, programa.num_shots)
+
+    @property
+    def operaciones(self):
+        """Lista de puertas (sin mediciones)."""
+        return [i for i in self.instrucciones if isinstance(i, Operacion)]
+
+    @property
+    def unitarias(self):
+        """
+        Puertas del circuito para la evolución unitaria.
+
+        Las mediciones terminales se pueden omitir (el estado justo antes de
+        medir es el mismo); una puerta sobre un qubit ya medido no, porque el
+        resultado depende del colapso.
+
+        Raises:
+            ValueError: Si el circuito tiene mediciones intermedias
+        """
+        medidos = set()
+        operaciones = []
+        for inst in self.instrucciones:
+            if isinstance(inst, Medicion):
+                medidos.add(inst.qubit)
+                continue
+            if medidos.intersection(inst.qubits):
+                raise ValueError(f"El circuito tiene mediciones intermedias: {inst.nombre} "
+                                 f"actúa sobre un qubit ya medido")
+            operaciones.append(inst)
+        return operaciones
+
+    @property
+    def mediciones(self):
+        """Lista de mediciones."""
+        return [i for i in self.instrucciones if isinstance(i, Medicion)]
+
+    @property
+    def qubits(self):
+        """Conjunto ordenado de qubits usados por el circuito."""
+        usados = set()
+        for inst in self.instrucciones:
+            if isinstance(inst, Operacion):
+                usados.update(inst.qubits)
+            else:
+                usados.add(inst.qubit)
+        return sorted(usados)
+
+    @property
+    def num_qubits(self):
+        """
+        Número de qubits del vector de estado: índice máximo + 1.
+
+        Es el mismo criterio que usa `WavefunctionSimulator`, que devuelve
+        2^(q_max + 1) amplitudes aunque haya qubits intermedios sin usar.
+        """
+        qubits = self.qubits
+        return qubits[-1] + 1 if qubits else 0
+
+
+def evaluar_parametro(expr, memoria=None):
+    """
+    Evalúa un parámetro de puerta de PyQuil.
+
+    Soporta números, referencias a memoria (`theta[0]`), operaciones binarias
+    (+, -, *, /, ^) y las funciones de Quil (SIN, COS, SQRT, EXP, CIS).
+
+    Args:
+        expr: Número o expresión de PyQuil
+        memoria: dict nombre -> secuencia de valores, con el mismo formato que
+            el `memory_map` de PyQuil (ej: {"theta": [np.pi / 4]}). Cada valor
+            puede ser un escalar o un array de NumPy; con arrays el resultado
+            también es un array (evaluación en lote).
+
+    Returns:
+        float, complex o np.ndarray: Valor del parámetro
+
+    Raises:
+        KeyError: Si la expresión usa memoria que no aparece en `memoria`
+    """
+    valor = _evaluar(expr, memoria)
+    if np.iscomplexobj(valor) and not np.any(np.imag(valor)):
+        # PyQuil 4 guarda los literales como complejos (0.785+0j)
+        valor = np.real(valor)
+        if np.ndim(valor) == 0:
+            valor = float(valor)
+    return valor
+
+
+def _evaluar(expr, memoria):
+    """Recorre recursivamente el árbol de la expresión."""
+    if isinstance(expr, MemoryReference):
+        if memoria is None or expr.name not in memoria:
+            raise KeyError(f"Falta el valor de la memoria '{expr.name}'")
+        return memoria[expr.name][expr.offset]
+    if isinstance(expr, BinaryExp):
+        return type(expr).fn(_evaluar(expr.op1, memoria),
+                             _evaluar(expr.op2, memoria))
+    if isinstance(expr, Function):
+        return expr.fn(_evaluar(expr.expression, memoria))
+    return expr
@@ -0,0 +1,360 @@
+"""
+MÓDULO: qnc/conexiones.py - Conexiones persistentes y calentamiento de quilc y la QVM
+
+RESUMEN:
+Cada `get_qc(...)` y cada `WavefunctionSimulator()` de los programas abre sus
+propias conexiones con los servicios de docker-compose.yml (`qvm` en el
+puerto 5000 por HTTP y `quilc` en el 5555 por RPCQ/ZeroMQ), y la primera
+petición paga además el arranque en frío de los servicios. `GestorConexiones`
+mantiene grupos de clientes abiertos y reutilizables:
+
+- Un grupo de compiladores (cada uno con su `QuilcClient` RPCQ) y otro de
+  ejecutores (cada uno con su `QVMClient` HTTP con keep-alive), con tamaños
+  configurables. Cada `compile`/`run` toma un cliente libre y lo devuelve al
+  terminar, así que varios hilos pueden usar el gestor a la vez (por ejemplo
+  con `ejecutar_lote`) sin crear clientes nuevos
+- Los clientes se crean bajo demanda y se reutilizan en orden LIFO: el último
+  devuelto, con la conexión más reciente, es el primero que se vuelve a usar
+- `calentar()` llena los grupos y lanza en cada cliente una compilación y una
+  ejecución triviales, para que la primera petición real no pague el
+  arranque en frío
+
+El gestor tiene `compile`, `run` y `wavefunction`, así que puede sustituir a
+`get_qc(...)` y a `WavefunctionSimulator()` en los programas.
+
+MEDIDA:
+`medir_primer_resultado` compara el tiempo hasta el primer resultado de un
+programa como lo hacen los scripts (`get_qc` nuevo + compile + run) con el
+mismo programa en un gestor ya calentado.
+
+USO:
+    from qnc import GestorConexiones, medir_primer_resultado
+
+    with GestorConexiones(max_compilacion=2, max_ejecucion=4) as qvm:
+        qvm.calentar()
+        result = qvm.run(qvm.compile(prog))
+
+    print(medir_primer_resultado().resumen())
+"""
+
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+
+from pyquil import Program
+from pyquil.gates import CNOT, MEASURE, H, I
+
+
+URL_QVM = "http://127.0.0.1:5000"
+URL_QUILC = "tcp://127.0.0.1:5555"
+
+
+class GrupoClientes:
+    """
+    Grupo acotado de clientes reutilizables.
+
+    Atributos:
+        tamano: Máximo de clientes abiertos
+        creados: Clientes abiertos ahora (libres o prestados)
+        esperas: Veces que se tuvo que esperar a que otro hilo devolviera uno
+    """
+
+    def __init__(self, crear, tamano):
+        """
+        Args:
+            crear: Función sin argumentos que crea un cliente nuevo
+            tamano: Máximo de clientes abiertos
+        """
+        if tamano < 1:
+            raise ValueError("El tamaño del grupo debe ser al menos 1")
+        self.tamano = tamano
+        self.creados = 0
+        self.esperas = 0
+        self._crear = crear
+        self._libres = []
+        # Cada `vaciar` abre una generación nueva: los clientes prestados en
+        # una generación anterior se descartan al devolverse
+        self._generacion = 0
+        self._cambio = threading.Condition()
+
+    @contextmanager
+    def tomar(self):
+        """Presta un cliente (libre, nuevo o el primero que se devuelva)."""
+        cliente, generacion = self._obtener()
+        try:
+            yield cliente
+        finally:
+            with self._cambio:
+                if generacion == self._generacion:
+                    self._libres.append(cliente)
+                else:
+                    self.creados -= 1
+                self._cambio.notify()
+
+    @contextmanager
+    def tomar_todos(self):
+        """Presta a la vez todos los clientes del grupo, creando los que falten."""
+        with ExitStack() as pila:
+            yield [pila.enter_context(self.tomar()) for _ in range(self.tamano)]
+
+    def todos(self):
+        """Lista de los clientes libres en este momento."""
+        with self._cambio:
+            return list(self._libres)
+
+    def vaciar(self):
+        """
+        Suelta los clientes libres. Los prestados siguen contando en `creados`
+        hasta que se devuelven, y entonces se sueltan en lugar de reutilizarse.
+        """
+        with self._cambio:
+            self._generacion += 1
+            self.creados -= len(self._libres)
+            self._libres = []
+            self._cambio.notify_all()
+
+    def _obtener(self):
+        """(cliente, generación): uno libre (LIFO), uno nuevo o el primero que se devuelva."""
+        with self._cambio:
+            if not self._libres and self.creados >= self.tamano:
+                self.esperas += 1
+                self._cambio.wait_for(lambda: self._libres or self.creados < self.tamano)
+            generacion = self._generacion
+            if self._libres:
+                return self._libres.pop(), generacion
+            self.creados += 1
+        return self._nuevo(), generacion
+
+    def _nuevo(self):
+        """Crea un cliente ya contado en `creados` (lo descuenta si falla)."""
+        try:
+            return self._crear()
+        except BaseException:
+            with self._cambio:
+                self.creados -= 1
+                self._cambio.notify()
+            raise
+
+
+class GestorConexiones:
+    """
+    Clientes persistentes de quilc y de la QVM compartidos por todo el proceso.
+
+    Atributos:
+        nombre_qc: Nombre del procesador para `get_qc`
+        compiladores, ejecutores, simuladores: GrupoClientes de cada servicio
+        configuracion: QCSClient con las direcciones de los servicios
+    """
+
+    def __init__(self, nombre_qc="9q-square-qvm", url_qvm=URL_QVM, url_quilc=URL_QUILC,
+                 max_compilacion=2, max_ejecucion=4, max_funcion_onda=2,
+                 timeout_compilacion=30.0, timeout_ejecucion=30.0):
+        """
+        Args:
+            nombre_qc: Nombre del procesador (ej: "9q-square-qvm")
+            url_qvm: Dirección HTTP de la QVM
+            url_quilc: Dirección RPCQ de quilc
+            max_compilacion: Máximo de conexiones abiertas con quilc
+            max_ejecucion: Máximo de conexiones abiertas con la QVM para `run`
+            max_funcion_onda: Máximo de `WavefunctionSimulator` abiertos
+            timeout_compilacion, timeout_ejecucion: Segundos de espera por petición
+        """
+        from qcs_sdk import QCSClient
+
+        self.nombre_qc = nombre_qc
+        self.configuracion = QCSClient(qvm_url=url_qvm, quilc_url=url_quilc)
+        self.timeout_compilacion = timeout_compilacion
+        self.timeout_ejecucion = timeout_ejecucion
+        self._qvm_compartido = None
+        self._quilc_compartido = None
+        self._lock = threading.Lock()
+        self.compiladores = GrupoClientes(self._nuevo_compilador, max_compilacion)
+        self.ejecutores = GrupoClientes(self._nuevo_ejecutor, max_ejecucion)
+        self.simuladores = GrupoClientes(self._nuevo_simulador, max_funcion_onda)
+
+    # ---- creación de clientes ----
+
+    def _nuevo_qc(self, quilc_client, qvm_client):
+        """get_qc con clientes explícitos (sin `qvm_client`, la QVM usaría la configuración global)."""
+        from pyquil import get_qc
+        return get_qc(self.nombre_qc, client_configuration=self.configuracion,
+                      compiler_timeout=self.timeout_compilacion,
+                      execution_timeout=self.timeout_ejecucion,
+                      quilc_client=quilc_client, qvm_client=qvm_client)
+
+    def _nuevo_compilador(self):
+        """QuantumComputer con un QuilcClient propio (la QVM se comparte: no se usa para compilar)."""
+        from qcs_sdk.compiler.quilc import QuilcClient
+        return self._nuevo_qc(QuilcClient.new_rpcq(self.configuracion.quilc_url),
+                              self._compartido("qvm"))
+
+    def _nuevo_ejecutor(self):
+        """QuantumComputer con un QVMClient propio (quilc se comparte: no se usa para ejecutar)."""
+        from qcs_sdk.qvm import QVMClient
+        return self._nuevo_qc(self._compartido("quilc"),
+                              QVMClient.new_http(self.configuracion.qvm_url))
+
+    def _nuevo_simulador(self):
+        from pyquil.api import WavefunctionSimulator
+        return WavefunctionSimulator(client_configuration=self.configuracion,
+                                     timeout=self.timeout_ejecucion)
+
+    def _compartido(self, servicio):
+        """Cliente único del servicio que un grupo no usa (se crea una sola vez)."""
+        from qcs_sdk.compiler.quilc import QuilcClient
+        from qcs_sdk.qvm import QVMClient
+        with self._lock:
+            if servicio == "qvm":
+                if self._qvm_compartido is None:
+                    self._qvm_compartido = QVMClient.new_http(self.configuracion.qvm_url)
+                return self._qvm_compartido
+            if self._quilc_compartido is None:
+                self._quilc_compartido = QuilcClient.new_rpcq(self.configuracion.quilc_url)
+            return self._quilc_compartido
+
+    # ---- interfaz de get_qc / WavefunctionSimulator ----
+
+    def compile(self, programa, to_native_gates=True, optimize=True, *, protoquil=None):
+        """Compila con un cliente de quilc del grupo (mismos argumentos que `QuantumComputer.compile`)."""
+        with self.compiladores.tomar() as qc:
+            return qc.compile(programa, to_native_gates, optimize, protoquil=protoquil)
+
+    def run(self, ejecutable, memory_map=None):
+        """Ejecuta con un cliente de la QVM del grupo."""
+        with self.ejecutores.tomar() as qc:
+            return qc.run(ejecutable, memory_map)
+
+    def wavefunction(self, programa, memory_map=None):
+        """Función de onda con un `WavefunctionSimulator` del grupo."""
+        with self.simuladores.tomar() as simulador:
+            return simulador.wavefunction(programa, memory_map)
+
+    @property
+    def name(self):
+        return self.nombre_qc
+
+    @property
+    def quantum_processor(self):
+        """Procesador del QuantumComputer (lo usa `QCConCache` para la clave)."""
+        with self.compiladores.tomar() as qc:
+            return qc.quantum_processor
+
+    # ---- calentamiento ----
+
+    def calentar(self, funcion_onda=True):
+        """
+        Abre todas las conexiones de los grupos y las prepara con peticiones triviales.
+
+        Cada cliente se toma prestado del grupo mientras se calienta, así que
+        se puede llamar con otros hilos usando el gestor: si hay clientes
+        prestados, se espera a que se devuelvan.
+
+        Args:
+            funcion_onda: Si es True, calienta también los `WavefunctionSimulator`
+
+        Returns:
+            float: Segundos que ha tardado el calentamiento
+        """
+        inicio = time.perf_counter()
+        trivial = programa_trivial()
+        compilado = self.compile(trivial)
+        with self.compiladores.tomar_todos() as compiladores:
+            for qc in compiladores:
+                qc.compile(trivial)
+        with self.ejecutores.tomar_todos() as ejecutores:
+            for qc in ejecutores:
+                qc.run(compilado)
+        if funcion_onda:
+            with self.simuladores.tomar_todos() as simuladores:
+                for simulador in simuladores:
+                    simulador.wavefunction(Program(I(0)))
+        return time.perf_counter() - inicio
+
+    def estadisticas(self):
+        """dict servicio -> (clientes creados, tamaño del grupo, esperas)."""
+        return {nombre: (g.creados, g.tamano, g.esperas) for nombre, g in
+                (("quilc", self.compiladores), ("qvm", self.ejecutores),
+                 ("funcion_onda", self.simuladores))}
+
+    def cerrar(self):
+        """Suelta todos los clientes (sus conexiones se cierran al liberarse)."""
+        for grupo in (self.compiladores, self.ejecutores, self.simuladores):
+            grupo.vaciar()
+        self._qvm_compartido = self._quilc_compartido = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+def programa_trivial():
+    """Programa mínimo de 1 shot para calentar quilc y la QVM."""
+    prog = Program()
+    ro = prog.declare("ro", "BIT", 1)
+    prog += I(0)
+    prog += MEASURE(0, ro[0])
+    return prog.wrap_in_numshots_loop(1)
+
+
+# =============================================
+# TIEMPO HASTA EL PRIMER RESULTADO
+# =============================================
+class InformeCalentamiento:
+    """
+    Tiempo hasta el primer resultado antes y después de calentar.
+
+    Atributos:
+        t_frio: get_qc nuevo + compile + run, como en los scripts
+        t_calentamiento: Duración de `GestorConexiones.calentar()`
+        t_caliente: compile + run con el gestor ya calentado
+    """
+
+    def __init__(self, t_frio, t_calentamiento, t_caliente):
+        self.t_frio = t_frio
+        self.t_calentamiento = t_calentamiento
+        self.t_caliente = t_caliente
+
+    def resumen(self):
+        """Texto con los tres tiempos y la mejora del primer resultado."""
+        mejora = self.t_frio / self.t_caliente if self.t_caliente > 0 else float("inf")
+        return (f"Primer resultado en frío:  {self.t_frio * 1000:9.1f} ms\n"
+                f"Calentamiento:             {self.t_calentamiento * 1000:9.1f} ms\n"
+                f"Primer resultado caliente: {self.t_caliente * 1000:9.1f} ms\n"
+                f"Mejora: {mejora:.1f}x")
+
+
+def medir_primer_resultado(programa=None, gestor=None, **opciones):
+    """
+    Mide el tiempo hasta el primer resultado sin y con conexiones calentadas.
+
+    Args:
+        programa: Program de PyQuil (default: estado de Bell con 100 shots, S01P02)
+        gestor: GestorConexiones a calentar (default: uno nuevo con `opciones`)
+        **opciones: Argumentos de `GestorConexiones`
+
+    Returns:
+        InformeCalentamiento
+    """
+    if programa is None:
+        programa = Program()
+        ro = programa.declare("ro", "BIT", 2)
+        programa += [H(0), CNOT(0, 1), MEASURE(0, ro[0]), MEASURE(1, ro[1])]
+        programa.wrap_in_numshots_loop(100)
+    gestor = GestorConexiones(**opciones) if gestor is None else gestor
+
+    # En frío: lo que hace cada script, con clientes nuevos
+    from qcs_sdk.compiler.quilc import QuilcClient
+    from qcs_sdk.qvm import QVMClient
+    inicio = time.perf_counter()
+    qc = gestor._nuevo_qc(QuilcClient.new_rpcq(gestor.configuracion.quilc_url),
+                          QVMClient.new_http(gestor.configuracion.qvm_url))
+    qc.run(qc.compile(programa))
+    t_frio = time.perf_counter() - inicio
+
+    t_calentamiento = gestor.calentar()
+    inicio = time.perf_counter()
+    gestor.run(gestor.compile(programa))
+    t_caliente = time.perf_counter() - inicio
+    return InformeCalentamiento(t_frio, t_calentamiento, t_caliente)
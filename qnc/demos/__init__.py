@@ -0,0 +1,6 @@
+"""
+PAQUETE: qnc.demos - Demostraciones ejecutables de las herramientas de qnc
+
+Cada módulo se ejecuta desde la raíz del repositorio con:
+    python -m qnc.demos.<nombre>
+"""
@@ -0,0 +1,47 @@
+"""
+PROGRAMA: qnc/demos/bell_por_bloques.py - Estado de Bell con 10^9 shots y memoria constante
+
+RESUMEN:
+Ejecuta el estado de Bell de S01P02.py (el circuito se toma de la entrada
+S01P02 de `catalogo.json`, la misma que comprueba el catálogo) con un número de shots que no cabría en
+una sola respuesta de la QVM, usando `histograma_por_bloques` sobre el motor
+local `QVMMuestreo` (no necesita Docker).
+
+USO:
+    python -m qnc.demos.bell_por_bloques          # 10^8 shots
+    python -m qnc.demos.bell_por_bloques 1e9      # 10^9 shots
+
+SALIDA ESPERADA:
+    Shots: 1000000000  Bloque: 1398101 shots
+    [0 0]: 499993890 (49.9994%)
+    [1 0]: 0 (0.0000%)
+    [0 1]: 0 (0.0000%)
+    [1 1]: 500006110 (50.0006%)
+    Tiempo: 21.27 s (47,023,860 shots/s)
+"""
+
+import sys
+import time
+
+from qnc import QVMMuestreo, histograma_por_bloques, shots_por_bloque
+from qnc.demos.catalogo import programa_del_catalogo
+
+
+MEMORIA = 64 * 1024 * 1024
+
+if __name__ == "__main__":
+    shots = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 8
+
+    prog = programa_del_catalogo("S01P02")
+
+    # barajar=False: el orden de los shots no importa para el histograma
+    qvm = QVMMuestreo(barajar=False)
+    inicio = time.perf_counter()
+    conteos = histograma_por_bloques(qvm, prog, shots, memoria_max=MEMORIA)
+    segundos = time.perf_counter() - inicio
+
+    print(f"Shots: {shots}  Bloque: {shots_por_bloque(prog, MEMORIA)} shots")
+    for indice, conteo in enumerate(conteos):
+        # Cada fila se imprime como [ro[0] ro[1]], igual que en S01P02.py
+        print(f"[{indice & 1} {indice >> 1}]: {conteo} ({conteo / shots:.4%})")
+    print(f"Tiempo: {segundos:.2f} s ({shots / segundos:,.0f} shots/s)")
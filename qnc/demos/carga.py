@@ -0,0 +1,66 @@
+"""
+PROGRAMA: qnc/demos/carga.py - Prueba de carga de compile+run
+
+RESUMEN:
+Lanza durante unos segundos la mezcla de circuitos de `qnc.carga` (Bell,
+monedas, Pauli, rotaciones y ruleta) con `generar_carga` a través de un
+`GestorConexiones` y muestra rendimiento, latencias (p50/p95/p99) y errores
+de la compilación y de la ejecución por separado.
+
+- `local`: contra `ServidorLocal` en puertos libres, con 5 ms de latencia
+  en la QVM, 10 ms en quilc y un 1% de errores (sin Docker)
+- `remoto`: contra la QVM y quilc de docker-compose.yml
+
+Con una tasa (peticiones/s) la carga es de tasa fija; sin ella, de
+concurrencia fija. El informe se puede guardar en JSON o añadir a un .jsonl.
+
+USO:
+    python -m qnc.demos.carga                                 # local, 8 hilos, 5 s
+    python -m qnc.demos.carga remoto 16 200 carga.jsonl       # 16 en curso, 200 pet/s
+
+SALIDA ESPERADA (aproximada, local, 1 núcleo: cliente y servidor en el mismo proceso):
+    Fase         Peticiones  Errores     Pet/s    Media      p50      p95      p99      Máx  (ms)
+    compilacion         236        2      46.7    68.95    66.93   118.31   141.83   172.23
+    ejecucion           234        2      46.3   101.60   103.70   162.36   184.27   201.43
+    Peticiones: 236  Completas/s: 46.3  Duración: 5.01 s  Modo: concurrencia fija  Concurrencia: 8  Retraso p99: 0.00 ms
+    Errores: {'QuilcError': 2, 'QVMError': 2}
+"""
+
+import sys
+import warnings
+
+from qnc import GestorConexiones, ServidorLocal, generar_carga
+
+
+DURACION = 5.0
+
+
+def probar(concurrencia, tasa, **urls):
+    with GestorConexiones(max_compilacion=concurrencia, max_ejecucion=concurrencia,
+                          **urls) as qc:
+        qc.calentar(funcion_onda=False)
+        return generar_carga(qc, concurrencia=concurrencia, tasa=tasa,
+                             duracion=DURACION, semilla=0)
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")         # avisos de obsolescencia de get_qc en PyQuil 4.22
+    motor = sys.argv[1] if len(sys.argv) > 1 else "local"
+    concurrencia = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    tasa = float(sys.argv[3]) if len(sys.argv) > 3 and float(sys.argv[3]) > 0 else None
+
+    if motor == "local":
+        with ServidorLocal(puerto_qvm=0, puerto_quilc=0, latencia_qvm=0.005,
+                           latencia_quilc=0.01, variacion=0.5,
+                           error_qvm=0.01, error_quilc=0.01, semilla=0) as servidor:
+            informe = probar(concurrencia, tasa, url_qvm=servidor.url_qvm,
+                             url_quilc=servidor.url_quilc)
+    elif motor == "remoto":
+        informe = probar(concurrencia, tasa)
+    else:
+        sys.exit(f"Motor desconocido: {motor!r} (usa 'local' o 'remoto')")
+
+    print(informe.resumen())
+    if len(sys.argv) > 4:
+        informe.guardar_json(sys.argv[4])
+        print(f"Informe guardado en {sys.argv[4]}")
@@ -0,0 +1,50 @@
+"""
+PROGRAMA: qnc/demos/catalogo.py - Todo el catálogo S01-S04 en un solo proceso
+
+RESUMEN:
+Ejecuta los experimentos de `qnc/demos/catalogo.json` (los circuitos de
+S01-S04 con sus estados iniciales, shots y salida esperada) con
+`ejecutar_manifiesto`: un solo juego de clientes, cachés de compilación y de
+resultados compartidas y varios experimentos a la vez. Imprime la tabla
+consolidada y el tiempo frente a lanzar un proceso por script.
+
+USO:
+    python -m qnc.demos.catalogo                        # motores locales (sin Docker)
+    python -m qnc.demos.catalogo remoto resultados.csv  # QVM y quilc de docker-compose.yml
+
+SALIDA ESPERADA (aproximada, motores locales):
+    Experimento            Tipo           Shots  Estado  Desviación  Compilar (s)  Ejecutar (s)  Caché
+    first_program          funcion_onda       1      ok    0.00e+00        0.0000        0.0031     no
+    second_program         muestreo         100      ok    1.00e-02        0.0005        0.0005     no
+    ...
+    S01P02                 muestreo         100      ok    1.00e-02        0.0000        0.0000     sí
+    ...
+    Correctos: 37/37  Hilos: 4  Clientes: 0.000 s  Total: 0.033 s
+    Referencia script a script (33 scripts, estimada): 21.179 s  Un proceso: 0.673 s  Aceleración: 31.5x
+"""
+
+import os
+import sys
+
+from qnc import cargar_manifiesto, ejecutar_manifiesto
+
+
+MANIFIESTO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "catalogo.json")
+
+
+def programa_del_catalogo(nombre):
+    """Program de PyQuil del experimento `nombre` del catálogo (p. ej. "S01P02")."""
+    _, experimentos = cargar_manifiesto(MANIFIESTO)
+    for experimento in experimentos:
+        if experimento.nombre == nombre:
+            return experimento.programa()
+    raise KeyError(f"El catálogo no tiene el experimento '{nombre}'")
+
+
+if __name__ == "__main__":
+    motor = sys.argv[1] if len(sys.argv) > 1 else "local"
+    informe = ejecutar_manifiesto(MANIFIESTO, motor=motor)
+    print(informe.resumen())
+    if len(sys.argv) > 2:
+        informe.guardar_csv(sys.argv[2])
+        print(f"Tabla guardada en {sys.argv[2]}")
@@ -0,0 +1,102 @@
+"""
+PROGRAMA: qnc/demos/equivalencias.py - Equivalencias entre circuitos del repositorio
+
+RESUMEN:
+Toma los circuitos de los programas de S01, S03 y S04 de `catalogo.json` (los
+mismos que el catálogo comprueba frente a los scripts) y verifica con
+`comparar_circuitos` las equivalencias que afirma su documentación, tanto
+como unitarias completas como desde el estado inicial que usa cada programa.
+Para los programas con mediciones comparados desde |00⟩ indica además si la
+distribución de los resultados es la misma. Cada comparación lleva el
+resultado esperado y tests/test_equivalencia.py las ejecuta como prueba de
+regresión: todas tardan milisegundos y no necesitan Docker.
+
+USO:
+    python -m qnc.demos.equivalencias
+
+SALIDA ESPERADA (aproximada):
+    Comparación                                      Método     Equiv.  Medida   Fidelidad  Fase global
+    S01P04 vs S01P05 desde |00⟩                      estado     no      igual     0.000000  -
+    S01P02 vs S01P03 desde |00⟩                      estado     no      igual     0.000000  -
+    S01P03 vs S01P04 (unitaria)                      unitaria   no      -         0.000000  -
+    S03P03A vs S03P01A: ZX vs Y                      unitaria   sí      -         1.000000  +0.5000π
+    S04P00A vs S04P05A: PHASE(π/4)|0⟩ vs RZ(π/2)|0⟩  estado     sí      -         1.000000  -0.2500π
+    S04P00B vs S04P05B: PHASE(π/4)|1⟩ vs RZ(π/2)|1⟩  estado     sí      -         1.000000  +0.0000π
+    S04P00A vs S04P05A (unitaria)                    unitaria   no      -         0.853553  -
+    S04P02A vs S04P00A: T vs PHASE(π/4)              unitaria   sí      -         1.000000  +0.0000π
+    S04P01A vs S04P05A: S vs RZ(π/2)                 unitaria   sí      -         1.000000  -0.2500π
+    GHZ 16 qubits: CNOT en orden inverso             huella     sí      -         1.000000  +0.0000π
+    Tiempo total: 0.3 s
+
+S01P05 produce la misma distribución que S01P04 pero no el mismo estado:
+Z(0)·Z(1) convierte |Ψ⁺⟩ en -|Ψ⁻⟩, una fase RELATIVA entre |01⟩ y |10⟩ que
+las mediciones en la base computacional no ven.
+"""
+
+import math
+import time
+
+import numpy as np
+from pyquil import Program
+from pyquil.gates import CNOT, H
+
+from qnc import Circuito, comparar_circuitos
+from qnc.demos.catalogo import programa_del_catalogo
+from qnc.muestreo import distribucion_medida
+
+
+def ghz_abanico(n, invertido=False):
+    """GHZ con todas las CNOT controladas por el qubit 0 (conmutan entre sí)."""
+    prog = Program(H(0))
+    objetivos = range(n - 1, 0, -1) if invertido else range(1, n)
+    for q in objetivos:
+        prog += CNOT(0, q)
+    return prog
+
+
+# (descripción, circuito A, circuito B, estado inicial o None para la unitaria,
+#  equivalentes esperado, misma distribución de medida esperada o None).
+# Los circuitos se indican por su nombre en el catálogo.
+COMPARACIONES = [
+    ("S01P04 vs S01P05 desde |00⟩", "S01P04", "S01P05", 0, False, True),
+    ("S01P02 vs S01P03 desde |00⟩", "S01P02", "S01P03", 0, False, True),
+    ("S01P03 vs S01P04 (unitaria)", "S01P03", "S01P04", None, False, None),
+    ("S03P03A vs S03P01A: ZX vs Y", "S03P03A", "S03P01A", None, True, None),
+    ("S04P00A vs S04P05A: PHASE(π/4)|0⟩ vs RZ(π/2)|0⟩", "S04P00A", "S04P05A", 0, True, None),
+    ("S04P00B vs S04P05B: PHASE(π/4)|1⟩ vs RZ(π/2)|1⟩", "S04P00B", "S04P05B", 0, True, None),
+    ("S04P00A vs S04P05A (unitaria)", "S04P00A", "S04P05A", None, False, None),
+    ("S04P02A vs S04P00A: T vs PHASE(π/4)", "S04P02A", "S04P00A", None, True, None),
+    ("S04P01A vs S04P05A: S vs RZ(π/2)", "S04P01A", "S04P05A", None, True, None),
+    ("GHZ 16 qubits: CNOT en orden inverso", ghz_abanico(16), ghz_abanico(16, True), None, True, None),
+]
+
+
+def comparar(a, b, estado=None):
+    """
+    Compara dos circuitos del catálogo (por nombre) o dos Program.
+
+    Returns:
+        tuple: (InformeEquivalencia, misma distribución de medida desde |0…0⟩
+            o None si se comparan unitarias o alguno de los circuitos no mide)
+    """
+    a, b = (programa_del_catalogo(x) if isinstance(x, str) else x for x in (a, b))
+    informe = comparar_circuitos(a, b, estado_inicial=estado)
+    circuitos = [Circuito.desde_programa(p) for p in (a, b)]
+    if estado is None or not all(c.mediciones for c in circuitos):
+        return informe, None
+    # Los programas preparan su estado inicial con X, así que se parte de |0…0⟩
+    (medidos_a, p_a), (medidos_b, p_b) = (distribucion_medida(c) for c in circuitos)
+    return informe, medidos_a == medidos_b and np.allclose(p_a, p_b)
+
+
+if __name__ == "__main__":
+    print(f"{'Comparación':<48} {'Método':<10} {'Equiv.':<7} {'Medida':<8} "
+          f"{'Fidelidad':>9}  Fase global")
+    inicio = time.perf_counter()
+    for descripcion, a, b, estado, _, _ in COMPARACIONES:
+        informe, medida = comparar(a, b, estado)
+        fase = "-" if informe.fase_global is None else f"{informe.fase_global / math.pi:+.4f}π"
+        medida = "-" if medida is None else ("igual" if medida else "distinta")
+        print(f"{descripcion:<48} {informe.metodo:<10} {'sí' if informe else 'no':<7} "
+              f"{medida:<8} {informe.fidelidad:>9.6f}  {fase}")
+    print(f"Tiempo total: {time.perf_counter() - inicio:.3f} s")
@@ -0,0 +1,29 @@
+"""
+PROGRAMA: qnc/demos/escalado_hilos.py - Escalado de los núcleos de puertas con el número de hilos
+
+RESUMEN:
+Simula `circuito_referencia` (todas las puertas de S01-S04 sobre cada qubit
+y una cadena de CNOT) con 1, 2, ..., N hilos y muestra el tiempo, la
+aceleración y la eficiencia de cada configuración.
+
+USO:
+    python -m qnc.demos.escalado_hilos              # 22 qubits, tantos hilos como núcleos
+    python -m qnc.demos.escalado_hilos 24 8         # 24 qubits, de 1 a 8 hilos
+
+SALIDA ESPERADA (aproximada, en una máquina de 8 núcleos):
+    22 qubits, 482 puertas
+     Hilos  Tiempo (s)  Aceleración  Eficiencia
+         1     10.8000        1.00x       100%
+         2      5.6000        1.93x        96%
+         ...
+"""
+
+import sys
+
+from qnc import medir_escalado
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 22
+    max_hilos = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    print(medir_escalado(num_qubits=n, max_hilos=max_hilos, repeticiones=1).resumen())
@@ -0,0 +1,47 @@
+"""
+PROGRAMA: qnc/demos/esperanzas_bell.py - Valores esperados exactos en los cuatro estados de Bell
+
+RESUMEN:
+Prepara los cuatro estados de Bell de S01 y calcula ⟨ZI⟩, ⟨IZ⟩, ⟨ZZ⟩, ⟨XX⟩
+y ⟨YY⟩ de los cuatro en una sola llamada a `valores_esperados`, sin cambios
+de base ni shots. Después evalúa el observable (ZZ + XX - YY) / 3, que vale
+1 solo en |Φ⁺⟩.
+
+USO:
+    python -m qnc.demos.esperanzas_bell
+
+SALIDA ESPERADA:
+    Estado      ⟨ZI⟩    ⟨IZ⟩    ⟨ZZ⟩    ⟨XX⟩    ⟨YY⟩   (ZZ+XX-YY)/3
+    |Φ⁺⟩       +0.00   +0.00   +1.00   +1.00   -1.00          +1.00
+    |Φ⁻⟩       +0.00   +0.00   +1.00   -1.00   +1.00          -0.33
+    |Ψ⁺⟩       +0.00   +0.00   -1.00   +1.00   +1.00          -0.33
+    |Ψ⁻⟩       +0.00   +0.00   -1.00   -1.00   -1.00          -0.33
+"""
+
+import numpy as np
+from pyquil import Program
+from pyquil.gates import CNOT, H, X
+
+from qnc import Circuito, estado_base, evolucionar, valor_esperado, valores_esperados
+
+
+BELL = {
+    "|Φ⁺⟩": Program(H(0), CNOT(0, 1)),
+    "|Φ⁻⟩": Program(X(0), H(0), CNOT(0, 1)),
+    "|Ψ⁺⟩": Program(H(0), X(1), CNOT(0, 1)),          # S01P04
+    "|Ψ⁻⟩": Program(X(0), H(0), X(1), CNOT(0, 1)),
+}
+OBSERVABLES = ["ZI", "IZ", "ZZ", "XX", "YY"]
+
+
+if __name__ == "__main__":
+    # Lote (4, 4): una fila de amplitudes por estado de Bell
+    estados = np.concatenate([evolucionar(estado_base(2), Circuito.desde_programa(p))
+                              for p in BELL.values()])
+    valores = valores_esperados(estados, OBSERVABLES)
+    combinado = valor_esperado(estados, {"ZZ": 1 / 3, "XX": 1 / 3, "YY": -1 / 3})
+
+    print(f"{'Estado':<8}" + "".join(f"{'⟨' + o + '⟩':>8}" for o in OBSERVABLES)
+          + f"{'(ZZ+XX-YY)/3':>15}")
+    for nombre, fila, c in zip(BELL, valores, combinado):
+        print(f"{nombre:<8}" + "".join(f"{v:>+8.2f}" for v in fila) + f"{c:>+15.2f}")
@@ -0,0 +1,47 @@
+"""
+PROGRAMA: qnc/demos/monedas_por_bloques.py - Juego de las 4 monedas con 10^9 shots y memoria constante
+
+RESUMEN:
+Juega el juego de las monedas de S02P02A.py (4 qubits con H, A gana con caras
+y B con cruces; el circuito es la entrada S02P02A de `catalogo.json`) con un número de shots que no cabría en una sola respuesta de
+la QVM, usando `recuento_por_bloques` sobre el motor local `QVMProducto` (no
+necesita Docker). Cada bloque se cuenta mientras se genera el siguiente.
+
+USO:
+    python -m qnc.demos.monedas_por_bloques          # 10^8 shots
+    python -m qnc.demos.monedas_por_bloques 1e9      # 10^9 shots
+
+SALIDA ESPERADA (aproximada, 10^8 shots):
+    Shots: 100000000  Mediciones: 400000000  Bloque: 699050 shots
+    Caras: 200003269 (50.0008%)
+    Cruces: 199996731 (49.9992%)
+    gana A
+    Tiempo: 6.07 s (16,468,546 shots/s)
+"""
+
+import sys
+import time
+
+from qnc import QVMProducto, decidir_ganador, recuento_por_bloques, shots_por_bloque
+from qnc.demos.catalogo import programa_del_catalogo
+
+
+MEMORIA = 64 * 1024 * 1024
+
+if __name__ == "__main__":
+    shots = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 8
+
+    prog = programa_del_catalogo("S02P02A")
+
+    qvm = QVMProducto()
+    inicio = time.perf_counter()
+    cara, cruz = recuento_por_bloques(qvm, prog, shots, memoria_max=MEMORIA)
+    segundos = time.perf_counter() - inicio
+
+    mediciones = cara + cruz
+    print(f"Shots: {shots}  Mediciones: {mediciones}  "
+          f"Bloque: {shots_por_bloque(prog, MEMORIA)} shots")
+    print(f"Caras: {cara} ({cara / mediciones:.4%})")
+    print(f"Cruces: {cruz} ({cruz / mediciones:.4%})")
+    print(decidir_ganador(cara, cruz))
+    print(f"Tiempo: {segundos:.2f} s ({shots / segundos:,.0f} shots/s)")
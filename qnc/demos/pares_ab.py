@@ -0,0 +1,84 @@
+"""
+PROGRAMA: qnc/demos/pares_ab.py - Las parejas A/B de S03 y S04 en una sola propagación
+
+RESUMEN:
+Cada pareja A/B de S03 y S04 aplica la misma puerta a |0⟩ (A) y a |1⟩ (B).
+Con `propagar` la puerta se aplica una vez a la matriz de columnas
+[|0⟩ |1⟩] y se obtienen los dos estados finales juntos. Al final se propaga
+un lote de 5000 estados aleatorios de 10 qubits por un circuito con las
+puertas de S01-S04 para comparar con simularlos uno a uno.
+
+USO:
+    python -m qnc.demos.pares_ab
+
+SALIDA ESPERADA (aproximada):
+    Pareja   Puerta        A: desde |0⟩                   B: desde |1⟩
+    S03P01   Y             (1j)|1⟩                        (-1j)|0⟩
+    S03P02   Z             (1)|0⟩                         (-1)|1⟩
+    S03P03   Z, X          (1)|1⟩                         (-1)|0⟩
+    S04P00   PHASE(π/4)    (1)|0⟩                         (0.7071+0.7071j)|1⟩
+    S04P01   S             (1)|0⟩                         (1j)|1⟩
+    S04P02   T             (1)|0⟩                         (0.7071+0.7071j)|1⟩
+    S04P03   RX(π/2)       (0.7071)|0⟩ + (-0.7071j)|1⟩    (-0.7071j)|0⟩ + (0.7071)|1⟩
+    S04P04   RY(π/2)       (0.7071)|0⟩ + (0.7071)|1⟩      (-0.7071)|0⟩ + (0.7071)|1⟩
+    S04P05   RZ(π/2)       (0.7071-0.7071j)|0⟩            (0.7071+0.7071j)|1⟩
+    5000 estados de 10 qubits: 1.3 s en lote, 41.4 s uno a uno
+"""
+
+import math
+import time
+
+import numpy as np
+from pyquil import Program
+from pyquil.gates import PHASE, RX, RY, RZ, S, T, X, Y, Z
+
+from qnc import Circuito, evolucionar, propagar
+from qnc.hilos import circuito_referencia
+
+
+PAREJAS = {
+    "S03P01": ("Y", Program(Y(0))),
+    "S03P02": ("Z", Program(Z(0))),
+    "S03P03": ("Z, X", Program(Z(0), X(0))),
+    "S04P00": ("PHASE(π/4)", Program(PHASE(math.pi / 4, 0))),
+    "S04P01": ("S", Program(S(0))),
+    "S04P02": ("T", Program(T(0))),
+    "S04P03": ("RX(π/2)", Program(RX(math.pi / 2, 0))),
+    "S04P04": ("RY(π/2)", Program(RY(math.pi / 2, 0))),
+    "S04P05": ("RZ(π/2)", Program(RZ(math.pi / 2, 0))),
+}
+
+
+def formatear(psi):
+    """Estado como suma de kets, en el estilo de `Wavefunction` de PyQuil."""
+    terminos = []
+    for k, a in enumerate(np.round(psi, 4) + 0.0):     # + 0.0 quita los -0
+        if a == 0:
+            continue
+        if a.imag == 0:
+            terminos.append(f"({a.real:g})|{k}⟩")
+        elif a.real == 0:
+            terminos.append(f"({a.imag:g}j)|{k}⟩")
+        else:
+            terminos.append(f"({a.real:g}{a.imag:+g}j)|{k}⟩")
+    return " + ".join(terminos)
+
+
+if __name__ == "__main__":
+    print(f"{'Pareja':<8} {'Puerta':<13} {'A: desde |0⟩':<30} {'B: desde |1⟩'}")
+    for nombre, (puerta, prog) in PAREJAS.items():
+        finales = propagar(prog, [0, 1])        # columna 0: A, columna 1: B
+        print(f"{nombre:<8} {puerta:<13} {formatear(finales[:, 0]):<30} "
+              f"{formatear(finales[:, 1])}")
+
+    circuito = Circuito.desde_programa(circuito_referencia(10))
+    estados = np.random.default_rng(0).standard_normal((2 ** 10, 5000)) + 0j
+    inicio = time.perf_counter()
+    propagar(circuito, estados)
+    lote = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    for j in range(estados.shape[1]):
+        evolucionar(estados[:, j][None], circuito)
+    uno_a_uno = time.perf_counter() - inicio
+    print(f"{estados.shape[1]} estados de 10 qubits: {lote:.1f} s en lote, "
+          f"{uno_a_uno:.1f} s uno a uno")
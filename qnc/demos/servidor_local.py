@@ -0,0 +1,51 @@
+"""
+PROGRAMA: qnc/demos/servidor_local.py - QVM y quilc locales sin Docker
+
+RESUMEN:
+Sin argumentos (o con `servir`) levanta `ServidorLocal` en los puertos de
+docker-compose.yml (5000 y 5555) hasta Ctrl+C, así que los scripts de S01-S05
+funcionan sin Docker desde otra terminal. Opcionalmente se le pasan la
+latencia (ms) y la tasa de error de cada petición.
+
+Con `calentamiento` levanta el servidor en puertos libres, con latencias y un
+arranque en frío simulados, y mide el tiempo hasta el primer resultado antes
+y después de calentar un `GestorConexiones`.
+
+USO:
+    python -m qnc.demos.servidor_local                 # servir en 5000/5555
+    python -m qnc.demos.servidor_local servir 5 0.01   # 5 ms por petición, 1% de errores
+    python -m qnc.demos.servidor_local calentamiento
+
+SALIDA ESPERADA (aproximada, calentamiento):
+    QVM en http://127.0.0.1:40453, quilc en tcp://127.0.0.1:38167
+    Primer resultado en frío:       79.5 ms
+    Calentamiento:                 196.7 ms
+    Primer resultado caliente:      27.4 ms
+    Mejora: 2.9x
+    Peticiones (peticiones, errores): {'version': (2, 0), 'get_version_info': (4, 0), ...}
+"""
+
+import sys
+
+from qnc import ServidorLocal, medir_primer_resultado
+
+
+if __name__ == "__main__":
+    modo = sys.argv[1] if len(sys.argv) > 1 else "servir"
+    if modo == "servir":
+        latencia = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.0
+        error = float(sys.argv[3]) if len(sys.argv) > 3 else 0.0
+        servidor = ServidorLocal(latencia_qvm=latencia, latencia_quilc=latencia,
+                                 error_qvm=error, error_quilc=error)
+        print(f"QVM en {servidor.url_qvm}, quilc en {servidor.url_quilc} (Ctrl+C para parar)")
+        servidor.servir()
+    elif modo == "calentamiento":
+        with ServidorLocal(puerto_qvm=0, puerto_quilc=0, latencia_qvm=0.005,
+                           latencia_quilc=0.01, arranque=0.05) as servidor:
+            print(f"QVM en {servidor.url_qvm}, quilc en {servidor.url_quilc}")
+            informe = medir_primer_resultado(url_qvm=servidor.url_qvm,
+                                             url_quilc=servidor.url_quilc, max_ejecucion=2)
+            print(informe.resumen())
+            print(f"Peticiones (peticiones, errores): {servidor.estadisticas()}")
+    else:
+        print(f"Modo desconocido: {modo!r} (usa 'servir' o 'calentamiento')")
@@ -0,0 +1,103 @@
+"""
+PROGRAMA: qnc/demos/trazar.py - Traza de un script de las prácticas
+
+RESUMEN:
+Ejecuta un script sin cambiarlo dentro de `instrumentar` y muestra cuánto
+tiempo se ha ido en construir los `Program` (con `construccion=True`), en
+compilar (quilc), en ejecutar (QVM) y en leer los resultados. La traza se
+guarda en formato de Chrome para verla como línea temporal en
+https://ui.perfetto.dev o chrome://tracing.
+
+Con `local` levanta antes `ServidorLocal` en los puertos de docker-compose.yml
+(no hace falta Docker). Con `sobrecoste` mide lo que añade trazar a un bucle
+construir + compile + run + lectura de un estado de Bell, contra el servidor
+local y contra el motor local en el mismo proceso.
+
+USO:
+    python -m qnc.demos.trazar S01/S01P02.py traza.json local
+    python -m qnc.demos.trazar sobrecoste
+
+SALIDA ESPERADA (aproximada, S01/S01P02.py con `local`):
+    ...salida del script...
+    Tramo                               Veces  Total (ms)  Media (ms)
+    script                                  1      79.210     79.2096
+    run                                     1      45.857     45.8575
+    compile                                 1      14.423     14.4234
+    Program.__init__                        4       0.671      0.1678
+    readout_data                            1       0.621      0.6214
+    get_register_map                        1       0.517      0.5167
+    Program.wrap_in_numshots_loop           2       0.005      0.0027
+    Traza guardada en traza.json
+
+SALIDA ESPERADA (aproximada, sobrecoste):
+    Servidor local (quilc + QVM):       51.179 ms/iteración sin trazas, 51.196 con trazas (+0.08%)
+    Motor local, por defecto:           0.446 ms/iteración sin trazas, 0.463 con trazas (+3.30%)
+    Motor local, con construcción:      0.443 ms/iteración sin trazas, 0.471 con trazas (+5.75%)
+(en una máquina de 1 núcleo las medidas del motor local varían uno o dos puntos de una ejecución a otra)
+"""
+
+import runpy
+import sys
+import warnings
+
+from pyquil import Program, get_qc
+from pyquil.gates import CNOT, MEASURE, H
+
+from qnc import (QCTrazado, QVMAutomatica, ServidorLocal, Trazador, instrumentar,
+                 medir_sobrecoste)
+
+
+def bell(qc, iteraciones):
+    """Bucle construir + compile + run + lectura de un estado de Bell."""
+    def carga(trazador):
+        motor = qc if trazador is None or hasattr(qc, "qam") else QCTrazado(qc, trazador)
+        for _ in range(iteraciones):
+            prog = Program()
+            ro = prog.declare("ro", "BIT", 2)
+            prog += H(0)
+            prog += CNOT(0, 1)
+            prog += MEASURE(0, ro[0])
+            prog += MEASURE(1, ro[1])
+            prog.wrap_in_numshots_loop(100)
+            motor.run(motor.compile(prog)).readout_data["ro"]
+    return carga
+
+
+def mostrar(etiqueta, iteraciones, medida):
+    t_sin, t_con, sobrecoste = medida
+    print(f"{etiqueta:<35} {t_sin * 1000 / iteraciones:.3f} ms/iteración sin trazas, "
+          f"{t_con * 1000 / iteraciones:.3f} con trazas ({sobrecoste:+.2%})")
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")         # avisos de obsolescencia de get_qc en PyQuil 4.22
+    if len(sys.argv) < 2:
+        sys.exit("Uso: python -m qnc.demos.trazar <script.py> [traza.json] [local] | sobrecoste")
+
+    if sys.argv[1] == "sobrecoste":
+        from qcs_sdk.compiler.quilc import QuilcClient
+        from qcs_sdk.qvm import QVMClient
+
+        with ServidorLocal(puerto_qvm=0, puerto_quilc=0, semilla=0) as servidor:
+            qc = get_qc("9q-square-qvm", client_configuration=servidor.configuracion(),
+                        qvm_client=QVMClient.new_http(servidor.url_qvm),
+                        quilc_client=QuilcClient.new_rpcq(servidor.url_quilc))
+            mostrar("Servidor local (quilc + QVM):", 5, medir_sobrecoste(bell(qc, 5), 40))
+        motor = QVMAutomatica(semilla=0)
+        mostrar("Motor local, por defecto:", 10, medir_sobrecoste(bell(motor, 10), 400))
+        mostrar("Motor local, con construcción:", 10,
+                medir_sobrecoste(bell(motor, 10), 400, construccion=True))
+    else:
+        ruta = sys.argv[1]
+        salida = sys.argv[2] if len(sys.argv) > 2 else "traza.json"
+        servidor = ServidorLocal(semilla=0).iniciar() if "local" in sys.argv[3:] else None
+        trazador = Trazador()
+        try:
+            with instrumentar(trazador, construccion=True), trazador.tramo("script", ruta=ruta):
+                runpy.run_path(ruta, run_name="__main__")
+        finally:
+            if servidor is not None:
+                servidor.detener()
+        print(trazador.resumen())
+        trazador.guardar(salida)
+        print(f"Traza guardada en {salida}")
@@ -0,0 +1,53 @@
+"""
+PROGRAMA: qnc/demos/vector_en_disco.py - Estado de Bell entre el primer y el último qubit de un registro grande
+
+RESUMEN:
+Crea un vector de estado en disco (`VectorEstadoDisco`, complex64) y prepara
+un estado de Bell entre el qubit 0 y el qubit n-1, con una fase en un qubit
+intermedio, informando del rendimiento de cada puerta. Con 28 qubits el
+fichero ocupa 2 GB; con 32 qubits, 32 GB.
+
+USO:
+    python -m qnc.demos.vector_en_disco                 # 28 qubits en el directorio temporal
+    python -m qnc.demos.vector_en_disco 30 /datos       # 30 qubits en /datos
+
+SALIDA ESPERADA (aproximada):
+    Fichero: /tmp/qnc_estado_28q.bin (2.0 GB)
+    [1/4] Operacion(H, (), (0,)): 2.10 s, 2.05 GB/s, 127,000,000 amplitudes/s
+    ...
+    Norma: 1.000000
+    P(q0 = 1) = 0.5000   P(q27 = 1) = 0.5000
+    Distribución (q0, q27): [0.5 0.  0.  0.5]
+"""
+
+import math
+import os
+import sys
+import tempfile
+import time
+
+from pyquil import Program
+from pyquil.gates import CNOT, H, RZ, X
+
+from qnc import VectorEstadoDisco
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 28
+    directorio = sys.argv[2] if len(sys.argv) > 2 else tempfile.gettempdir()
+    ruta = os.path.join(directorio, f"qnc_estado_{n}q.bin")
+
+    psi = VectorEstadoDisco.crear(ruta, n)
+    print(f"Fichero: {ruta} ({psi.nbytes / 1e9:.1f} GB)")
+    try:
+        # X·RZ sobre un qubit intermedio en |0⟩ solo añade una fase global
+        prog = Program(H(0), CNOT(0, n - 1), X(n // 2), RZ(math.pi / 3, n // 2))
+        inicio = time.perf_counter()
+        psi.evolucionar(prog, progreso=True)
+        print(f"Tiempo total: {time.perf_counter() - inicio:.2f} s")
+        print(f"Norma: {psi.norma():.6f}")
+        print(f"P(q0 = 1) = {psi.probabilidad_uno(0):.4f}   "
+              f"P(q{n - 1} = 1) = {psi.probabilidad_uno(n - 1):.4f}")
+        print(f"Distribución (q0, q{n - 1}): {psi.distribucion([0, n - 1]).round(4)}")
+    finally:
+        psi.eliminar()
@@ -0,0 +1,273 @@
+"""
+MÓDULO: qnc/despachador.py - Elección automática del motor de simulación
+
+RESUMEN:
+qnc tiene varios motores con los mismos métodos `compile`/`run`, cada uno
+rápido para un tipo de circuito:
+
+- producto: circuitos sin puertas multiqubit y con mediciones terminales,
+  un vector de 2 amplitudes por qubit (`QVMProducto`)
+- estabilizador: circuitos de Clifford (H, X, Y, Z, S, CNOT...), cualquier
+  número de qubits y mediciones intermedias (`QVMEstabilizador`)
+- vector: vector de estado local con mediciones terminales (`QVMMuestreo`)
+- remoto: la QVM de Docker (`get_qc(...)`), para todo lo demás
+
+`QVMAutomatica` analiza cada programa (puertas usadas, número de qubits, si
+hay puertas entrelazantes y dónde están las mediciones), estima el coste de
+cada motor que lo admite y ejecuta el más barato. La decisión y el coste se
+registran con `logging` (logger "qnc.despachador") y quedan en
+`ultima_decision`.
+
+COSTE ESTIMADO:
+Número aproximado de operaciones elementales, solo para comparar motores:
+
+    producto:      puertas · 4 + shots · qubits medidos
+    estabilizador: puertas · 2n + mediciones · 2n · n / 64 + shots · mediciones
+    vector:        puertas · 2^n + shots · mediciones
+
+El motor remoto no tiene coste estimado: solo se usa cuando ningún motor
+local admite el programa (o cuando se fuerza).
+
+USO:
+    import logging
+    from qnc import QVMAutomatica
+
+    logging.basicConfig(level=logging.INFO)
+    qvm = QVMAutomatica(respaldo=get_qc('9q-square-qvm'))
+    result = qvm.run(qvm.compile(prog)).readout_data['ro']
+    print(qvm.ultima_decision)
+
+    qvm.run(prog, motor="vector")       # forzar un motor concreto
+"""
+
+import logging
+
+from .circuito import Circuito
+from .estabilizador import QVMEstabilizador, es_clifford
+from .muestreo import QVMMuestreo, mediciones_terminales
+from .producto import QVMProducto
+
+
+logger = logging.getLogger(__name__)
+
+MAX_QUBITS_VECTOR = 24
+
+
+# =============================================
+# ANÁLISIS DEL PROGRAMA
+# =============================================
+class AnalisisPrograma:
+    """
+    Características de un programa que deciden el motor.
+
+    Atributos:
+        circuito: Circuito de `qnc.circuito` (None si PyQuil usa algo no soportado)
+        puertas: Conjunto de nombres de puertas
+        num_qubits: Índice máximo de qubit + 1
+        num_operaciones: Número de puertas
+        num_mediciones: Número de MEASURE
+        num_medidos: Número de qubits distintos medidos
+        entrelazante: True si hay alguna puerta de dos o más qubits
+        terminales: True si todas las mediciones son terminales
+        clifford: True si todas las puertas son de Clifford
+        shots: Número de shots del programa
+    """
+
+    def __init__(self, programa, memoria=None):
+        try:
+            self.circuito = (programa if isinstance(programa, Circuito)
+                             else Circuito.desde_programa(programa))
+        except ValueError:
+            self.circuito = None
+            self.puertas = set()
+            self.num_qubits = self.num_operaciones = self.num_mediciones = self.num_medidos = 0
+            self.entrelazante = self.terminales = self.clifford = False
+            self.shots = getattr(programa, "num_shots", 1)
+            return
+
+        operaciones = self.circuito.operaciones
+        self.puertas = {op.nombre for op in operaciones}
+        self.num_qubits = self.circuito.num_qubits
+        self.num_operaciones = len(operaciones)
+        self.num_mediciones = len(self.circuito.mediciones)
+        self.num_medidos = len({m.qubit for m in self.circuito.mediciones})
+        self.entrelazante = any(len(op.qubits) > 1 for op in operaciones)
+        self.terminales = mediciones_terminales(self.circuito)
+        self.clifford = es_clifford(self.circuito, memoria)
+        self.shots = self.circuito.num_shots
+
+    @property
+    def soportado(self):
+        """True si el programa se puede convertir a un Circuito de qnc."""
+        return self.circuito is not None
+
+    def __repr__(self):
+        return (f"AnalisisPrograma(qubits={self.num_qubits}, puertas={sorted(self.puertas)}, "
+                f"entrelazante={self.entrelazante}, terminales={self.terminales}, "
+                f"clifford={self.clifford}, shots={self.shots})")
+
+
+class Decision:
+    """
+    Motor elegido para un programa.
+
+    Atributos:
+        motor: Nombre del motor ("producto", "estabilizador", "vector" o "remoto")
+        motivo: Explicación de la elección
+        coste: Coste estimado del motor elegido (None para el remoto)
+        costes: dict motor -> coste estimado de todos los motores locales
+            que admiten el programa
+        forzado: True si el motor lo impuso el usuario
+    """
+
+    def __init__(self, motor, motivo, coste=None, costes=None, forzado=False):
+        self.motor = motor
+        self.motivo = motivo
+        self.coste = coste
+        self.costes = costes or {}
+        self.forzado = forzado
+
+    def __repr__(self):
+        coste = "-" if self.coste is None else f"{self.coste:.3g}"
+        return f"Decision(motor={self.motor!r}, coste={coste}, motivo={self.motivo!r})"
+
+
+def _coste_producto(a):
+    return a.num_operaciones * 4 + a.shots * a.num_medidos
+
+
+def _coste_estabilizador(a):
+    n = max(a.num_qubits, 1)
+    return (a.num_operaciones * 2 * n + a.num_mediciones * 2 * n * max(n / 64, 1)
+            + a.shots * a.num_mediciones)
+
+
+def _coste_vector(a):
+    return a.num_operaciones * 2.0 ** a.num_qubits + a.shots * a.num_mediciones
+
+
+# Motores locales: nombre -> (admite el programa, coste estimado)
+MOTORES_LOCALES = {
+    "producto": (lambda a, max_qubits: not a.entrelazante and a.terminales, _coste_producto),
+    "estabilizador": (lambda a, max_qubits: a.clifford, _coste_estabilizador),
+    "vector": (lambda a, max_qubits: a.terminales and a.num_qubits <= max_qubits, _coste_vector),
+}
+
+
+def elegir_motor(programa, memoria=None, max_qubits_vector=MAX_QUBITS_VECTOR):
+    """
+    Elige el motor más barato que admite el programa.
+
+    Args:
+        programa: Program de PyQuil, Circuito o AnalisisPrograma ya calculado
+        memoria: Valores de los parámetros (formato `memory_map` de PyQuil)
+        max_qubits_vector: Máximo de qubits para el vector de estado local
+
+    Returns:
+        Decision
+    """
+    a = programa if isinstance(programa, AnalisisPrograma) else AnalisisPrograma(programa, memoria)
+    if not a.soportado:
+        return Decision("remoto", "el programa usa instrucciones que qnc no simula")
+
+    costes = {nombre: coste(a) for nombre, (admite, coste) in MOTORES_LOCALES.items()
+              if admite(a, max_qubits_vector)}
+    if not costes:
+        if not a.terminales and not a.clifford:
+            motivo = "mediciones intermedias en un circuito que no es de Clifford"
+        else:
+            motivo = f"{a.num_qubits} qubits superan el límite del vector de estado ({max_qubits_vector})"
+        return Decision("remoto", motivo)
+
+    motor = min(costes, key=costes.get)
+    motivo = (f"{a.num_qubits} qubits, {a.num_operaciones} puertas, "
+              f"{'entrelazante' if a.entrelazante else 'sin entrelazamiento'}, "
+              f"{'Clifford' if a.clifford else 'no Clifford'}, "
+              f"mediciones {'terminales' if a.terminales else 'intermedias'}")
+    return Decision(motor, motivo, costes[motor], costes)
+
+
+# =============================================
+# CLASE QVMAutomatica
+# =============================================
+class QVMAutomatica:
+    """
+    Sustituto de `get_qc(...)` que envía cada programa al motor más barato.
+
+    Atributos:
+        motores: dict nombre -> motor con `compile`/`run`
+        forzar: Nombre del motor impuesto para todos los programas (o None)
+        ultima_decision: Decision del último `compile` o `run`
+    """
+
+    def __init__(self, respaldo=None, forzar=None, semilla=None,
+                 max_qubits_vector=MAX_QUBITS_VECTOR):
+        """
+        Args:
+            respaldo: QuantumComputer de PyQuil (motor "remoto")
+            forzar: Motor que se usa siempre ("producto", "estabilizador",
+                "vector" o "remoto")
+            semilla: Semilla de los motores locales
+            max_qubits_vector: Máximo de qubits para el vector de estado local
+        """
+        self.motores = {
+            "producto": QVMProducto(semilla=semilla),
+            "estabilizador": QVMEstabilizador(semilla=semilla),
+            "vector": QVMMuestreo(semilla=semilla),
+        }
+        if respaldo is not None:
+            self.motores["remoto"] = respaldo
+        self._comprobar_motor(forzar)
+        self.forzar = forzar
+        self.max_qubits_vector = max_qubits_vector
+        self.ultima_decision = None
+
+    def decidir(self, programa, memory_map=None, motor=None):
+        """
+        Decide qué motor ejecuta un programa y registra la decisión.
+
+        Args:
+            programa: Program de PyQuil
+            memory_map: Valores de los parámetros
+            motor: Motor impuesto solo para este programa (tiene prioridad
+                sobre `forzar`)
+
+        Returns:
+            Decision
+        """
+        motor = motor or self.forzar
+        self._comprobar_motor(motor)
+        if motor is not None:
+            decision = Decision(motor, "forzado por el usuario", forzado=True)
+        else:
+            decision = elegir_motor(programa, memory_map or None, self.max_qubits_vector)
+
+        if decision.motor not in self.motores:
+            raise ValueError(f"El programa necesita el motor remoto ({decision.motor}: "
+                             f"{decision.motivo}) pero no se indicó un respaldo")
+        logger.info("Motor %s (coste estimado %s): %s", decision.motor,
+                    "-" if decision.coste is None else f"{decision.coste:.3g}",
+                    decision.motivo)
+        self.ultima_decision = decision
+        return decision
+
+    def compile(self, programa, to_native_gates=True, optimize=True, *, protoquil=None, motor=None):
+        """Compila con el motor elegido (los locales devuelven el mismo programa)."""
+        decision = self.decidir(programa, motor=motor)
+        return self.motores[decision.motor].compile(programa, to_native_gates, optimize,
+                                                    protoquil=protoquil)
+
+    def run(self, ejecutable, memory_map=None, motor=None):
+        """
+        Ejecuta el programa en el motor elegido.
+
+        Returns:
+            Resultado con `readout_data` y `get_register_map()`
+        """
+        decision = self.decidir(ejecutable, memory_map, motor)
+        return self.motores[decision.motor].run(ejecutable, memory_map or None)
+
+    def _comprobar_motor(self, motor):
+        if motor is not None and motor not in set(MOTORES_LOCALES) | {"remoto"}:
+            raise ValueError(f"Motor desconocido: {motor}")
+
@@ -0,0 +1,268 @@
+"""
+MÓDULO: qnc/ejecutor_diferido.py - Ejecución diferida y agrupada de programas repetidos
+
+RESUMEN:
+S02/S02P01B.py compila y ejecuta el mismo programa de 1 shot 50 veces dentro de
+un bucle de Python:
+
+    for number in range(50):
+        result = qvm.run(qvm.compile(prog), 0).get_register_map().get("ro")
+
+Cada vuelta paga una compilación en quilc y una llamada a la QVM. Este módulo
+ofrece un ejecutor con la misma interfaz (`compile` y `run`) que evita ese
+coste sin cambiar el bucle.
+
+FUNCIONAMIENTO:
+1. `compile` memoriza las compilaciones (ver `qnc.cache_compilacion`)
+2. `run` no ejecuta nada: devuelve un `ResultadoDiferido` y apunta el envío
+3. Al leer el resultado (`readout_data` o `get_register_map()`) se resuelven
+   TODOS los envíos pendientes: los envíos idénticos (mismo programa y misma
+   memoria) se agrupan en UNA ejecución con la suma de sus shots y cada
+   llamador recibe sus propias filas. Las ejecuciones se hacen fuera del
+   cerrojo: mientras la QVM responde, otros hilos pueden seguir enviando
+4. Si un mismo programa se envía repetidamente y cada resultado se lee en el
+   momento (como en el bucle de arriba), el ejecutor anticipa shots: cada
+   ejecución pide el doble de shots que la anterior y guarda los sobrantes en
+   una reserva de la que se sirven los envíos siguientes. Los shots son
+   independientes entre sí, así que servirlos desde la reserva no cambia la
+   estadística. Con 50 vueltas se hacen ~6 ejecuciones en lugar de 50.
+5. Si la ejecución de un grupo falla, el error se guarda en cada resultado
+   del grupo y se relanza al leerlo: nunca se devuelve un resultado vacío
+
+USO:
+    from qnc import EjecutorDiferido
+
+    qvm = EjecutorDiferido(get_qc('9q-square-qvm'))
+    for number in range(50):
+        result = qvm.run(qvm.compile(prog), 0).get_register_map().get("ro")
+"""
+
+import json
+import threading
+
+import numpy as np
+
+from .cache_compilacion import CacheCompilacion, QCConCache, normalizar_quil
+
+
+class ResultadoDiferido:
+    """
+    Resultado pendiente de un `run`.
+
+    Se comporta como `QAMExecutionResult`: al acceder a `readout_data` o a
+    `get_register_map()` se fuerza la ejecución de los envíos pendientes.
+    """
+
+    def __init__(self, ejecutor, shots):
+        self._ejecutor = ejecutor
+        self.shots = shots
+        self._registros = None
+        self._error = None
+        self._terminado = threading.Event()
+
+    @property
+    def listo(self):
+        """True si el resultado ya está disponible (o su ejecución falló)."""
+        return self._terminado.is_set()
+
+    @property
+    def readout_data(self):
+        """
+        Raises:
+            Exception: El error de la ejecución del grupo, si falló
+        """
+        if not self._terminado.is_set():
+            self._ejecutor.resolver(lanzar_errores=False)
+            self._terminado.wait()      # otro hilo puede estar ejecutando el grupo
+        if self._error is not None:
+            raise self._error
+        return self._registros
+
+    def get_register_map(self):
+        """Devuelve el dict registro -> array de mediciones (igual que PyQuil)."""
+        return self.readout_data
+
+    def _completar(self, registros):
+        self._registros = registros
+        self._terminado.set()
+
+    def _fallar(self, error):
+        self._error = error
+        self._terminado.set()
+
+
+# =============================================
+# CLASE EjecutorDiferido
+# =============================================
+class EjecutorDiferido:
+    """
+    Envoltorio de un `QuantumComputer` que difiere y agrupa las ejecuciones.
+    """
+
+    def __init__(self, qc, cache=None, anticipar=True, max_anticipados=4096):
+        """
+        Args:
+            qc: QuantumComputer de PyQuil (o cualquier objeto con compile/run)
+            cache: CacheCompilacion para `compile` (default: solo en memoria)
+            anticipar: Si es True, los programas repetidos piden shots de más
+                y los guardan en reserva para los envíos siguientes
+            max_anticipados: Máximo de shots extra por ejecución
+        """
+        if isinstance(qc, QCConCache):
+            self.qc = qc
+        else:
+            self.qc = QCConCache(qc, CacheCompilacion(directorio=None) if cache is None else cache)
+        self.anticipar = anticipar
+        self.max_anticipados = max_anticipados
+        self._pendientes = {}     # clave -> (ejecutable, memory_map, [ResultadoDiferido])
+        self._reservas = {}       # clave -> dict registro -> filas sobrantes
+        self._repeticiones = {}   # clave -> número de envíos vistos
+        self._lock = threading.RLock()
+        self._contadores = {"envios": 0, "ejecuciones": 0, "servidos_reserva": 0,
+                            "shots_ejecutados": 0}
+
+    def compile(self, programa, *args, **kwargs):
+        """Compila a través de la caché de compilaciones."""
+        return self.qc.compile(programa, *args, **kwargs)
+
+    def run(self, ejecutable, memory_map=None):
+        """
+        Apunta una ejecución y devuelve un resultado diferido.
+
+        Args:
+            ejecutable: Programa compilado (el devuelto por `compile`)
+            memory_map: Valores de los parámetros, como en `QuantumComputer.run`
+
+        Returns:
+            ResultadoDiferido: Se ejecuta al leer sus datos
+        """
+        memory_map = memory_map or None
+        shots = ejecutable.num_shots
+        clave = _clave_envio(ejecutable, memory_map)
+        resultado = ResultadoDiferido(self, shots)
+
+        with self._lock:
+            self._contadores["envios"] += 1
+            self._repeticiones[clave] = self._repeticiones.get(clave, 0) + 1
+            reserva = self._reservas.get(clave)
+            if reserva is not None and _filas(reserva) >= shots:
+                # Se sirve desde los shots anticipados sin ejecutar nada
+                resultado._completar({k: v[:shots] for k, v in reserva.items()})
+                self._reservas[clave] = {k: v[shots:] for k, v in reserva.items()}
+                self._contadores["servidos_reserva"] += 1
+                return resultado
+            if clave not in self._pendientes:
+                self._pendientes[clave] = (ejecutable, memory_map, [])
+            self._pendientes[clave][2].append(resultado)
+        return resultado
+
+    def resolver(self, lanzar_errores=True):
+        """
+        Ejecuta todos los envíos pendientes, una ejecución por programa distinto.
+
+        Los grupos se sacan de la cola con el cerrojo y se ejecutan sin él. Si
+        un grupo falla, los demás se ejecutan igualmente y el error queda en
+        los resultados del grupo.
+
+        Args:
+            lanzar_errores: Si es True, se relanza el primer error al terminar
+
+        Raises:
+            Exception: El primer error de ejecución (si `lanzar_errores`)
+        """
+        with self._lock:
+            pendientes, self._pendientes = self._pendientes, {}
+            planes = [self._planificar(clave, *grupo) for clave, grupo in pendientes.items()]
+
+        primer_error = None
+        for plan in planes:
+            try:
+                self._ejecutar_grupo(*plan)
+            except Exception as error:
+                primer_error = primer_error or error
+        if primer_error is not None and lanzar_errores:
+            raise primer_error
+
+    def estadisticas(self):
+        """
+        Returns:
+            dict: envíos recibidos, ejecuciones reales, envíos servidos desde
+                la reserva y shots ejecutados en total
+        """
+        with self._lock:
+            return dict(self._contadores)
+
+    def __getattr__(self, nombre):
+        return getattr(self.qc, nombre)
+
+    def _planificar(self, clave, ejecutable, memory_map, resultados):
+        """Shots que hay que ejecutar para un grupo (con el cerrojo tomado)."""
+        necesarios = sum(r.shots for r in resultados)
+        extra = 0
+        if self.anticipar and self._repeticiones[clave] > len(resultados):
+            # Programa repetido: se dobla lo pedido hasta `max_anticipados`
+            extra = min(self._repeticiones[clave], self.max_anticipados)
+        reserva = self._reservas.pop(clave, None)
+        disponibles = _filas(reserva) if reserva else 0
+        total = max(necesarios + extra - disponibles, 0)
+        return clave, ejecutable, memory_map, resultados, reserva, total
+
+    def _ejecutar_grupo(self, clave, ejecutable, memory_map, resultados, reserva, total):
+        """Ejecuta un grupo de envíos idénticos (sin el cerrojo) y reparte las filas."""
+        registros = {}
+        if total > 0:
+            try:
+                programa = ejecutable.copy().wrap_in_numshots_loop(total)
+                datos = self.qc.run(programa, memory_map).get_register_map()
+            except Exception as error:
+                with self._lock:
+                    if reserva:             # los shots anticipados siguen siendo válidos
+                        self._reservas[clave] = _unir(reserva, self._reservas.get(clave))
+                for r in resultados:
+                    r._fallar(error)
+                raise
+            registros = {k: v for k, v in datos.items() if v is not None}
+        if reserva:
+            registros = _unir(reserva, registros)
+
+        inicio = 0
+        for r in resultados:
+            r._completar({k: v[inicio:inicio + r.shots] for k, v in registros.items()})
+            inicio += r.shots
+        sobrantes = {k: v[inicio:] for k, v in registros.items()}
+        with self._lock:
+            if total > 0:
+                self._contadores["ejecuciones"] += 1
+                self._contadores["shots_ejecutados"] += total
+            if sobrantes and _filas(sobrantes) > 0:
+                self._reservas[clave] = _unir(sobrantes, self._reservas.get(clave))
+
+
+def _clave_envio(ejecutable, memory_map):
+    """Identifica un envío por su Quil normalizado y los valores de memoria."""
+    memoria = json.dumps({k: list(map(float, v)) for k, v in (memory_map or {}).items()},
+                         sort_keys=True)
+    return normalizar_quil(ejecutable) + "\0" + memoria
+
+
+def _filas(registros):
+    """Número de shots disponibles en un dict de registros."""
+    return min((len(v) for v in registros.values()), default=0)
+
+
+def _unir(a, b):
+    """Une dos dicts de registros fila a fila (cualquiera de los dos puede ser None)."""
+    if not b:
+        return a
+    if not a:
+        return b
+    return {k: _concatenar(a.get(k), b.get(k)) for k in set(a) | set(b)}
+
+
+def _concatenar(a, b):
+    """Une las filas de la reserva con las recién ejecutadas."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return np.concatenate([a, b])
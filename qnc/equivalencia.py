@@ -0,0 +1,157 @@
+"""
+MÓDULO: qnc/equivalencia.py - Comprobación de equivalencia de circuitos salvo fase global
+
+RESUMEN:
+Muchos programas del repositorio comparan circuitos: S01P05 añade puertas Z
+a S01P04 y en S04 PHASE(θ) y RZ(θ) solo se diferencian en una fase global. Este módulo lo
+comprueba numéricamente y devuelve la fidelidad y la fase global e^(iφ)
+que relaciona ambos circuitos (B = e^(iφ) · A).
+
+MÉTODOS:
+- "unitaria" (n ≤ `max_qubits_exacto`): se calculan las dos matrices
+  unitarias completas propagando la base computacional como un lote, y
+
+      fidelidad = |Tr(A† B)|² / d²        e^(iφ) = Tr(A† B) / |Tr(A† B)|
+
+- "huella" (n grande): se propagan `num_estados` estados aleatorios por
+  ambos circuitos en un solo lote y se comparan los solapamientos
+  ⟨A ψ_j | B ψ_j⟩. Si los circuitos son distintos, un estado aleatorio lo
+  detecta con probabilidad prácticamente 1. La fidelidad es la mínima
+  |⟨A ψ_j | B ψ_j⟩|² y la fase debe ser la misma para todos los estados.
+- "estado": si se indica `estado_inicial`, se comparan solo los estados
+  finales que se obtienen desde ese estado (como hacen los programas con
+  `wavefunction`)
+
+Las mediciones terminales se ignoran: se compara la parte unitaria de los
+circuitos. Con una medición intermedia la comparación no tiene sentido y se
+lanza ValueError.
+
+USO:
+    from qnc import comparar_circuitos
+
+    informe = comparar_circuitos(Program(PHASE(pi/4, 0)), Program(RZ(pi/4, 0)))
+    print(informe)          # equivalentes, fidelidad 1, fase global -π/8
+
+Demostración con los pares del repositorio:
+    python -m qnc.demos.equivalencias
+"""
+
+import numpy as np
+
+from .circuito import Circuito
+from .estado import evolucionar
+
+
+MAX_QUBITS_EXACTO = 10
+TOLERANCIA = 1e-9
+
+
+class InformeEquivalencia:
+    """
+    Resultado de comparar dos circuitos.
+
+    Atributos:
+        equivalentes: True si B = e^(iφ) · A dentro de la tolerancia
+        fidelidad: Fidelidad entre 0 y 1 (ver el método usado)
+        fase_global: Ángulo φ en radianes (None si no son equivalentes)
+        metodo: "unitaria", "huella" o "estado"
+        num_qubits: Número de qubits comparados
+        error_maximo: Máxima diferencia de amplitud tras corregir la fase
+    """
+
+    def __init__(self, equivalentes, fidelidad, fase_global, metodo, num_qubits, error_maximo):
+        self.equivalentes = equivalentes
+        self.fidelidad = fidelidad
+        self.fase_global = fase_global
+        self.metodo = metodo
+        self.num_qubits = num_qubits
+        self.error_maximo = error_maximo
+
+    def __bool__(self):
+        return self.equivalentes
+
+    def __repr__(self):
+        fase = "-" if self.fase_global is None else f"{self.fase_global / np.pi:+.4f}π"
+        return (f"InformeEquivalencia(equivalentes={self.equivalentes}, "
+                f"fidelidad={self.fidelidad:.6f}, fase_global={fase}, "
+                f"metodo={self.metodo!r}, qubits={self.num_qubits})")
+
+
+def comparar_circuitos(a, b, estado_inicial=None, memoria=None,
+                       max_qubits_exacto=MAX_QUBITS_EXACTO, num_estados=8,
+                       tolerancia=TOLERANCIA, rng=None):
+    """
+    Comprueba si dos circuitos son iguales salvo una fase global.
+
+    Args:
+        a, b: Program de PyQuil o Circuito de qnc
+        estado_inicial: Índice de la base computacional o vector (2^n,) desde
+            el que comparar los estados finales (default: comparar las unitarias)
+        memoria: Valores de los parámetros (formato `memory_map` de PyQuil)
+        max_qubits_exacto: Hasta cuántos qubits se calculan las unitarias completas
+        num_estados: Estados aleatorios del método "huella"
+        tolerancia: Error máximo de amplitud para considerarlos equivalentes
+        rng: np.random.Generator para los estados aleatorios
+
+    Returns:
+        InformeEquivalencia
+
+    Raises:
+        ValueError: Si alguno de los circuitos tiene mediciones intermedias
+    """
+    a, b = _como_circuito(a), _como_circuito(b)
+    for nombre, circuito in (("a", a), ("b", b)):
+        try:
+            circuito.unitarias
+        except ValueError as error:
+            raise ValueError(f"Circuito {nombre}: {error}") from None
+    n = max(a.num_qubits, b.num_qubits, 1)
+
+    if estado_inicial is not None:
+        estados, metodo = _estado_inicial(estado_inicial, n), "estado"
+    elif n <= max_qubits_exacto:
+        estados, metodo = np.eye(2 ** n, dtype=complex), "unitaria"
+    else:
+        rng = np.random.default_rng() if rng is None else rng
+        estados = (rng.standard_normal((num_estados, 2 ** n))
+                   + 1j * rng.standard_normal((num_estados, 2 ** n)))
+        estados /= np.linalg.norm(estados, axis=1, keepdims=True)
+        metodo = "huella"
+
+    # Cada fila es A|ψ_j⟩ (en "unitaria", la fila j es la columna j de A)
+    salida_a = evolucionar(estados, a, memoria)
+    salida_b = evolucionar(estados, b, memoria)
+    solapes = np.einsum("ij,ij->i", salida_a.conj(), salida_b)
+
+    if metodo == "unitaria":
+        traza = solapes.sum()
+        fidelidad = float(abs(traza) ** 2 / 4 ** n)
+        fase = traza
+    else:
+        fidelidad = float(np.min(np.abs(solapes) ** 2))
+        fase = solapes[np.argmax(np.abs(solapes))]
+
+    if abs(fase) < tolerancia:
+        return InformeEquivalencia(False, fidelidad, None, metodo, n, np.inf)
+    fase = fase / abs(fase)
+    error = float(np.max(np.abs(salida_b - fase * salida_a)))
+    equivalentes = error <= tolerancia
+    return InformeEquivalencia(equivalentes, fidelidad,
+                               float(np.angle(fase)) if equivalentes else None,
+                               metodo, n, error)
+
+
+def _como_circuito(programa):
+    return programa if isinstance(programa, Circuito) else Circuito.desde_programa(programa)
+
+
+def _estado_inicial(estado, n):
+    """Convierte un índice o un vector en un lote (1, 2^n)."""
+    if np.ndim(estado) == 0:
+        psi = np.zeros((1, 2 ** n), dtype=complex)
+        psi[0, int(estado)] = 1
+        return psi
+    psi = np.asarray(estado, dtype=complex).reshape(1, -1)
+    if psi.shape[1] != 2 ** n:
+        raise ValueError(f"El estado inicial tiene {psi.shape[1]} amplitudes; se esperaban {2 ** n}")
+    return psi / np.linalg.norm(psi)
@@ -0,0 +1,406 @@
+"""
+MÓDULO: qnc/estabilizador.py - Simulador de tableau de estabilizadores (circuitos Clifford)
+
+RESUMEN:
+Casi todos los circuitos de S01-S03 y la ruleta de S05 usan solo puertas de
+Clifford (H, X, Y, Z, S, CNOT) y mediciones. Para estos circuitos no hace
+falta un vector de estado de 2^n amplitudes: basta con un tableau de
+Aaronson-Gottesman, que ocupa O(n²) bits y aplica cada puerta en O(n).
+
+TABLEAU:
+- 2n+1 filas: n desestabilizadores, n estabilizadores y 1 fila auxiliar
+- Cada fila es un operador de Pauli: bits x y z de cada qubit, empaquetados
+  en palabras uint64 (64 qubits por palabra), más una fase
+- Las puertas actúan sobre una columna (un qubit) de TODAS las filas a la vez
+  con operaciones de bits de NumPy
+
+MEDICIONES Y MUESTREO:
+En un circuito de Clifford sin realimentación clásica, cada resultado de
+medición es una función AFÍN (XOR) de bits aleatorios independientes: una
+medición aleatoria introduce un bit nuevo v_k y una medición determinista es
+un XOR fijo de bits anteriores más una constante. Por eso el circuito se
+simula UNA sola vez llevando las fases como vectores simbólicos sobre GF(2):
+
+    resultado_j = c_j ⊕ (a_j1·v_1) ⊕ (a_j2·v_2) ⊕ ...
+
+y después los shots se generan sorteando los v_k y evaluando esas fórmulas
+con una multiplicación de matrices, por bloques de shots. Esto admite también
+mediciones intermedias (como en third_program.py) y escala a miles de qubits
+y millones de shots.
+
+MEMORIA DE LA LECTURA:
+Como en PyQuil, `readout_data` es un array int64 de (shots, bits): 8 bytes
+por bit medido, así que 10^6 shots de 2000 bits ocupan 16 GB. Con
+`compacta=True` cada registro es una `LecturaCompacta` (`qnc.lectura_compacta`)
+que se rellena bloque a bloque con un bit por medición: los mismos 10^6 × 2000
+ocupan 250 MB y los temporales no pasan de `bloque_bytes`.
+
+PUERTAS SOPORTADAS:
+I, X, Y, Z, H, S, CNOT, CZ, SWAP, y también PHASE/RZ/RX/RY con ángulos
+múltiplos de π/2 (las que produce quilc al compilar circuitos de Clifford).
+
+USO:
+    from qnc import QVMEstabilizador
+
+    qvm = QVMEstabilizador()
+    result = qvm.run(qvm.compile(prog)).readout_data['ro']
+
+    qvm = QVMEstabilizador(compacta=True)  # LecturaCompacta, 1 bit por medición
+"""
+
+import numpy as np
+
+from .circuito import Circuito, Medicion, evaluar_parametro
+from .lectura_compacta import LecturaCompacta, _bytes_por_shot
+from .muestreo import _tamanos_registros
+from .pauli import _suma_g
+from .resultados import ResultadoEjecucion
+
+
+PUERTAS_CLIFFORD = {"I", "X", "Y", "Z", "H", "S", "CNOT", "CZ", "SWAP"}
+ROTACIONES_CLIFFORD = {"PHASE", "RZ", "RX", "RY"}
+
+_UNO = np.uint64(1)
+
+
+# =============================================
+# CLASE Tableau
+# =============================================
+class Tableau:
+    """
+    Tableau de estabilizadores de n qubits con fases simbólicas.
+
+    Atributos:
+        n: Número de qubits
+        x, z: Arrays uint64 (2n+1, palabras) con los bits de cada fila
+        fases: Array uint8 (2n+1, 1 + max_mediciones); la columna 0 es la
+            constante y la columna 1+k el bit aleatorio de la medición k
+        num_aleatorias: Número de bits aleatorios introducidos hasta ahora
+    """
+
+    def __init__(self, n, max_mediciones=0):
+        self.n = n
+        palabras = max((n + 63) // 64, 1)
+        self.x = np.zeros((2 * n + 1, palabras), dtype=np.uint64)
+        self.z = np.zeros((2 * n + 1, palabras), dtype=np.uint64)
+        self.fases = np.zeros((2 * n + 1, 1 + max_mediciones), dtype=np.uint8)
+        self.num_aleatorias = 0
+        for q in range(n):
+            w, b = divmod(q, 64)
+            self.x[q, w] = _UNO << np.uint64(b)          # desestabilizador X_q
+            self.z[n + q, w] = _UNO << np.uint64(b)      # estabilizador Z_q
+
+    # ---- acceso a columnas ----
+
+    @staticmethod
+    def _posicion(q):
+        w, b = divmod(q, 64)
+        return w, np.uint64(b)
+
+    def _columna(self, bits, q):
+        """Bit del qubit q de todas las filas, como array uint8."""
+        w, b = self._posicion(q)
+        return ((bits[:, w] >> b) & _UNO).astype(np.uint8)
+
+    def _invertir(self, bits, q, mascara):
+        """Invierte el bit del qubit q en las filas donde `mascara` vale 1."""
+        w, b = self._posicion(q)
+        bits[:, w] ^= mascara.astype(np.uint64) << b
+
+    # ---- puertas ----
+
+    def h(self, q):
+        xq, zq = self._columna(self.x, q), self._columna(self.z, q)
+        self.fases[:, 0] ^= xq & zq
+        cambio = xq ^ zq
+        self._invertir(self.x, q, cambio)
+        self._invertir(self.z, q, cambio)
+
+    def s(self, q):
+        xq, zq = self._columna(self.x, q), self._columna(self.z, q)
+        self.fases[:, 0] ^= xq & zq
+        self._invertir(self.z, q, xq)
+
+    def pauli_x(self, q):
+        self.fases[:, 0] ^= self._columna(self.z, q)
+
+    def pauli_z(self, q):
+        self.fases[:, 0] ^= self._columna(self.x, q)
+
+    def pauli_y(self, q):
+        self.fases[:, 0] ^= self._columna(self.x, q) ^ self._columna(self.z, q)
+
+    def cnot(self, a, b):
+        xa, za = self._columna(self.x, a), self._columna(self.z, a)
+        xb, zb = self._columna(self.x, b), self._columna(self.z, b)
+        self.fases[:, 0] ^= xa & zb & (xb ^ za ^ 1)
+        self._invertir(self.x, b, xa)
+        self._invertir(self.z, a, zb)
+
+    def cz(self, a, b):
+        self.h(b)
+        self.cnot(a, b)
+        self.h(b)
+
+    def swap(self, a, b):
+        self.cnot(a, b)
+        self.cnot(b, a)
+        self.cnot(a, b)
+
+    # ---- medición ----
+
+    def medir(self, a):
+        """
+        Mide el qubit a en la base Z.
+
+        Returns:
+            np.ndarray: Vector uint8 (1 + max_mediciones,) con la fórmula afín
+                del resultado (columna 0: constante; columna 1+k: bit aleatorio k)
+        """
+        n = self.n
+        xa = self._columna(self.x, a)
+        candidatos = np.flatnonzero(xa[n:2 * n])
+
+        if candidatos.size:
+            # Resultado aleatorio: cada fila que anticonmuta con Z_a se
+            # multiplica por la fila p, que pasa a ser ±Z_a
+            p = n + candidatos[0]
+            filas = np.flatnonzero(xa[:2 * n])
+            filas = filas[filas != p]
+            if filas.size:
+                g = _suma_g(self.x[p], self.z[p], self.x[filas], self.z[filas])
+                constante = ((2 * self.fases[filas, 0].astype(np.int64)
+                              + 2 * int(self.fases[p, 0]) + g) % 4) // 2
+                self.fases[filas] ^= self.fases[p]
+                self.fases[filas, 0] = constante.astype(np.uint8)
+                self.x[filas] ^= self.x[p]
+                self.z[filas] ^= self.z[p]
+
+            self.x[p - n] = self.x[p]
+            self.z[p - n] = self.z[p]
+            self.fases[p - n] = self.fases[p]
+
+            self.x[p] = 0
+            self.z[p] = 0
+            w, b = self._posicion(a)
+            self.z[p, w] = _UNO << b
+            self.fases[p] = 0
+            self.num_aleatorias += 1
+            self.fases[p, self.num_aleatorias] = 1
+            return self.fases[p].copy()
+
+        # Resultado determinista: producto de los estabilizadores cuyos
+        # desestabilizadores anticonmutan con Z_a. La fase del producto se
+        # obtiene de una vez con los prefijos acumulados (XOR) de las filas.
+        filas = n + np.flatnonzero(xa[:n])
+        xs, zs = self.x[filas], self.z[filas]
+        prefijo_x = np.bitwise_xor.accumulate(xs, axis=0)
+        prefijo_z = np.bitwise_xor.accumulate(zs, axis=0)
+        anterior_x = np.vstack([np.zeros_like(xs[:1]), prefijo_x[:-1]])
+        anterior_z = np.vstack([np.zeros_like(zs[:1]), prefijo_z[:-1]])
+        g = int(_suma_g(xs, zs, anterior_x, anterior_z).sum())
+
+        resultado = np.bitwise_xor.reduce(self.fases[filas], axis=0)
+        resultado[0] ^= (g % 4) // 2
+        return resultado
+
+
+# =============================================
+# SIMULACIÓN Y MUESTREO
+# =============================================
+def es_clifford(circuito, memoria=None):
+    """Indica si todas las puertas del circuito se pueden simular con el tableau."""
+    try:
+        for op in circuito.operaciones:
+            _secuencia_clifford(op, memoria)
+    except (ValueError, KeyError):
+        return False
+    return True
+
+
+def formulas_medicion(circuito, memoria=None):
+    """
+    Simula el circuito una vez y devuelve la fórmula afín de cada medición.
+
+    Args:
+        circuito: Circuito de `qnc.circuito` con puertas de Clifford
+        memoria: Valores de los parámetros (formato `memory_map` de PyQuil)
+
+    Returns:
+        tuple: (mediciones, A, m) donde mediciones es la lista de `Medicion`,
+            A es un array uint8 (len(mediciones), 1 + m) con una fórmula por
+            fila y m el número de bits aleatorios usados
+
+    Raises:
+        ValueError: Si el circuito contiene puertas que no son de Clifford
+    """
+    mediciones = circuito.mediciones
+    tableau = Tableau(circuito.num_qubits, len(mediciones))
+    formulas = []
+    for inst in circuito.instrucciones:
+        if isinstance(inst, Medicion):
+            formulas.append(tableau.medir(inst.qubit))
+            continue
+        for nombre, qubits in _secuencia_clifford(inst, memoria):
+            getattr(tableau, nombre)(*qubits)
+
+    m = tableau.num_aleatorias
+    if not formulas:
+        return mediciones, np.zeros((0, 1 + m), dtype=np.uint8), m
+    return mediciones, np.array(formulas, dtype=np.uint8)[:, :1 + m], m
+
+
+def muestrear_estabilizador(circuito, shots=None, memoria=None, rng=None,
+                            bloque_bytes=64 * 1024 * 1024, compacta=False):
+    """
+    Genera todos los shots de un circuito de Clifford.
+
+    Args:
+        circuito: Circuito de `qnc.circuito`
+        shots: Número de shots (default: `circuito.num_shots`)
+        memoria: Valores de los parámetros (formato `memory_map` de PyQuil)
+        rng: np.random.Generator (default: uno nuevo sin semilla)
+        bloque_bytes: Memoria máxima de los temporales de cada bloque de shots
+        compacta: Si es True, cada registro es una `LecturaCompacta` (un bit
+            por medición) en lugar de un array int64
+
+    Returns:
+        dict: registro -> array int64 de forma (shots, tamaño del registro),
+            o `LecturaCompacta` de esa forma con `compacta=True`
+    """
+    shots = circuito.num_shots if shots is None else shots
+    rng = np.random.default_rng() if rng is None else rng
+    tamanos = _tamanos_registros(circuito)
+    if compacta:
+        registros = {nombre: LecturaCompacta(np.zeros((shots, _bytes_por_shot(tamano)),
+                                                      dtype=np.uint8), tamano)
+                     for nombre, tamano in tamanos.items()}
+    else:
+        registros = {nombre: np.zeros((shots, tamano), dtype=np.int64)
+                     for nombre, tamano in tamanos.items()}
+
+    mediciones, formulas, m = formulas_medicion(circuito, memoria)
+    if not mediciones:
+        return registros
+
+    destinos = [(j, med) for j, med in enumerate(mediciones) if med.registro is not None]
+    constantes = formulas[:, 0]
+    # Matriz de coeficientes en float32: BLAS calcula los productos y, como los
+    # valores son 0/1 y las sumas < 2^24, el resultado es exacto
+    coeficientes = formulas[:, 1:].T.astype(np.float32)
+
+    # Temporales por shot: bits aleatorios (uint8 y float32), producto
+    # (float32) y resultados (uint8), más el bloque de cada registro compacto
+    por_shot = 5 * m + 5 * len(mediciones) + (sum(tamanos.values()) if compacta else 0)
+    bloque = max(bloque_bytes // (por_shot + 1), 1)
+    for inicio in range(0, shots, bloque):
+        n = min(bloque, shots - inicio)
+        if m:
+            bits = rng.integers(0, 2, size=(n, m), dtype=np.uint8).astype(np.float32)
+            resultados = np.fmod(bits @ coeficientes, 2).astype(np.uint8)
+            resultados ^= constantes
+        else:
+            resultados = np.broadcast_to(constantes, (n, len(mediciones)))
+        if compacta:
+            bloques = {nombre: np.zeros((n, tamano), dtype=np.uint8)
+                       for nombre, tamano in tamanos.items()}
+            for j, med in destinos:
+                bloques[med.registro][:, med.indice] = resultados[:, j]
+            for nombre, valores in bloques.items():
+                registros[nombre].escribir_bloque(inicio, valores)
+        else:
+            for j, med in destinos:
+                registros[med.registro][inicio:inicio + n, med.indice] = resultados[:, j]
+    return registros
+
+
+def _secuencia_clifford(op, memoria):
+    """
+    Traduce una Operacion a una lista de (método del tableau, qubits).
+
+    Raises:
+        ValueError: Si la puerta no es de Clifford
+    """
+    q = op.qubits
+    if op.nombre in PUERTAS_CLIFFORD:
+        if op.nombre == "I":
+            return []
+        if op.nombre == "S":
+            return [("s", q)] * (3 if op.daga else 1)
+        nombres = {"X": "pauli_x", "Y": "pauli_y", "Z": "pauli_z", "H": "h",
+                   "CNOT": "cnot", "CZ": "cz", "SWAP": "swap"}
+        return [(nombres[op.nombre], q)]
+
+    if op.nombre in ROTACIONES_CLIFFORD:
+        angulo = evaluar_parametro(op.parametros[0], memoria)
+        cuartos = np.asarray(angulo, dtype=float) / (np.pi / 2)
+        k = int(np.round(cuartos))
+        if np.ndim(cuartos) or not np.isclose(cuartos, k):
+            raise ValueError(f"{op.nombre}({angulo}) no es una puerta de Clifford")
+        k = (-k if op.daga else k) % 4
+        # Salvo fase global: PHASE(kπ/2) = RZ(kπ/2) = S^k,
+        # RX(kπ/2) = H S^k H y RY(kπ/2) = S RX(kπ/2) S†
+        if op.nombre in ("PHASE", "RZ"):
+            return [("s", q)] * k
+        rx = [("h", q)] + [("s", q)] * k + [("h", q)]
+        if op.nombre == "RX":
+            return rx
+        return [("s", q)] * 3 + rx + [("s", q)]
+
+    raise ValueError(f"{op.nombre} no es una puerta de Clifford")
+
+
+# =============================================
+# CLASE QVMEstabilizador
+# =============================================
+class QVMEstabilizador:
+    """
+    Sustituto local de `get_qc(...)` para circuitos de Clifford.
+
+    Ofrece los mismos métodos `compile` y `run` que `QuantumComputer` y que
+    `QVMMuestreo`, pero sin límite práctico de qubits. Con muchos shots y
+    muchos bits la lectura int64 es lo que limita: ver `compacta`.
+    """
+
+    def __init__(self, respaldo=None, semilla=None, compacta=False):
+        """
+        Args:
+            respaldo: QuantumComputer de PyQuil para los circuitos que no son de Clifford
+            semilla: Semilla del generador aleatorio (para resultados reproducibles)
+            compacta: Si es True, `readout_data` guarda cada registro como
+                `LecturaCompacta` (1 bit por medición en lugar de 8 bytes)
+        """
+        self.respaldo = respaldo
+        self.rng = np.random.default_rng(semilla)
+        self.compacta = compacta
+
+    def compile(self, programa, to_native_gates=True, optimize=True, *, protoquil=None):
+        """
+        El tableau no necesita compilar a puertas nativas: devuelve el mismo
+        programa. Solo se compila con quilc si hay que usar el respaldo.
+        """
+        if self.respaldo is not None and not self._es_local(programa):
+            return self.respaldo.compile(programa, to_native_gates, optimize,
+                                         protoquil=protoquil)
+        return programa
+
+    def run(self, ejecutable, memory_map=None):
+        """
+        Ejecuta todos los shots del programa.
+
+        Returns:
+            ResultadoEjecucion: Resultado con `readout_data` y `get_register_map()`
+        """
+        if self.respaldo is not None and not self._es_local(ejecutable, memory_map):
+            return self.respaldo.run(ejecutable, memory_map or None)
+        circuito = Circuito.desde_programa(ejecutable)
+        registros = muestrear_estabilizador(circuito, memoria=memory_map or None, rng=self.rng,
+                                            compacta=self.compacta)
+        return ResultadoEjecucion(registros, motor="estabilizador")
+
+    @staticmethod
+    def _es_local(programa, memoria=None):
+        try:
+            return es_clifford(Circuito.desde_programa(programa), memoria or None)
+        except ValueError:
+            return False
@@ -0,0 +1,155 @@
+"""
+MÓDULO: qnc/estado.py - Vector de estado local y aplicación de puertas
+
+RESUMEN:
+Núcleo de simulación por vector de estado. Todas las funciones trabajan con
+un LOTE de estados de forma (B, 2^n), de modo que B ángulos o B estados
+iniciales distintos avanzan juntos con una sola operación de NumPy por puerta.
+
+ORDEN DE LAS AMPLITUDES:
+Se usa el mismo orden que `WavefunctionSimulator` de PyQuil: el qubit 0 es el
+bit MENOS significativo del índice. Para n = 2:
+    índice 0 -> |00⟩, índice 1 -> |01⟩ (q0 = 1), índice 2 -> |10⟩ (q1 = 1)
+que PyQuil imprime como |q1 q0⟩.
+
+APLICACIÓN DE UNA PUERTA DE 1 QUBIT:
+El estado se ve como un tensor (B, 2^(n-1-q), 2, 2^q): el eje central es el
+qubit q, los de la izquierda son los qubits más significativos y los de la
+derecha los menos significativos. Así la puerta se aplica con un único
+`einsum` sin copiar ni reordenar memoria.
+
+PRECISIÓN:
+El tipo del estado lo decide `estado_base(..., dtype=...)`: complex128 por
+defecto, o complex64 para usar la mitad de memoria. Las matrices de las
+puertas se convierten al tipo del estado, así que la evolución no vuelve a
+complex128 por el camino. `deriva_norma` mide cuánto se ha alejado la norma
+de 1 por los errores de redondeo (ver `qnc.precision`).
+"""
+
+import numpy as np
+
+
+def estado_base(num_qubits, indice=0, lote=1, dtype=complex):
+    """
+    Crea un lote de estados de la base computacional |indice⟩.
+
+    Args:
+        num_qubits: Número de qubits
+        indice: Índice del estado base (0 = |00...0⟩)
+        lote: Número de copias (B)
+        dtype: Tipo complejo de las amplitudes (complex128 o complex64)
+
+    Returns:
+        np.ndarray: Array complejo de forma (lote, 2^num_qubits)
+    """
+    psi = np.zeros((lote, 2 ** num_qubits), dtype=dtype)
+    psi[:, indice] = 1
+    return psi
+
+
+def aplicar_1q(psi, u, qubit, num_qubits):
+    """
+    Aplica una puerta de 1 qubit a un lote de estados.
+
+    Args:
+        psi: Estados de forma (B, 2^n)
+        u: Matriz (2, 2) común a todo el lote, o lote de matrices (B, 2, 2)
+        qubit: Qubit sobre el que actúa la puerta
+        num_qubits: Número total de qubits (n)
+
+    Returns:
+        np.ndarray: Nuevos estados de forma (B, 2^n)
+    """
+    psi = _igualar_lote(psi, u)
+    u = u.astype(psi.dtype, copy=False)
+    b = psi.shape[0]
+    t = psi.reshape(b, 2 ** (num_qubits - 1 - qubit), 2, 2 ** qubit)
+    if u.ndim == 2:
+        out = np.einsum("ij,bajc->baic", u, t)
+    else:
+        out = np.einsum("bij,bajc->baic", u, t)
+    return out.reshape(b, -1)
+
+
+def aplicar_puerta(psi, u, qubits, num_qubits):
+    """
+    Aplica una puerta de k qubits a un lote de estados.
+
+    La matriz `u` está en la base |qubits[0] qubits[1] ...⟩ con qubits[0]
+    como bit más significativo (convención de PyQuil).
+
+    Args:
+        psi: Estados de forma (B, 2^n)
+        u: Matriz (2^k, 2^k) o lote de matrices (B, 2^k, 2^k)
+        qubits: Secuencia de qubits sobre los que actúa la puerta
+        num_qubits: Número total de qubits (n)
+
+    Returns:
+        np.ndarray: Nuevos estados de forma (B, 2^n)
+    """
+    k = len(qubits)
+    if k == 1:
+        return aplicar_1q(psi, u, qubits[0], num_qubits)
+
+    psi = _igualar_lote(psi, u)
+    u = u.astype(psi.dtype, copy=False)
+    b = psi.shape[0]
+    t = psi.reshape((b,) + (2,) * num_qubits)
+    # El qubit q ocupa el eje 1 + (n - 1 - q) del tensor
+    ejes = [num_qubits - q for q in qubits]
+    destino = list(range(num_qubits + 1 - k, num_qubits + 1))
+    t = np.moveaxis(t, ejes, destino)
+    forma = t.shape
+    t = t.reshape(b, -1, 2 ** k)
+    if u.ndim == 2:
+        t = t @ u.T
+    else:
+        t = np.einsum("bij,bmj->bmi", u, t)
+    t = np.moveaxis(t.reshape(forma), destino, ejes)
+    return t.reshape(b, -1)
+
+
+def _igualar_lote(psi, u):
+    """Replica un único estado cuando la puerta llega como lote de matrices."""
+    if u.ndim == 3 and psi.shape[0] == 1 and u.shape[0] > 1:
+        return np.repeat(psi, u.shape[0], axis=0)
+    return psi
+
+
+def evolucionar(psi, circuito, memoria=None, ignorar_mediciones=True):
+    """
+    Aplica todas las puertas de un circuito a un lote de estados.
+
+    Solo se omiten las mediciones terminales: con una medición intermedia la
+    evolución unitaria no representa el circuito y se lanza ValueError.
+
+    Args:
+        psi: Estados iniciales de forma (B, 2^n)
+        circuito: Circuito de `qnc.circuito`
+        memoria: Valores de la memoria clásica para los parámetros; cada valor
+            puede ser un array de forma (B,) para evaluar el lote completo
+        ignorar_mediciones: Si es False, lanza ValueError al encontrar
+            cualquier medición, también las terminales
+
+    Returns:
+        np.ndarray: Estados finales de forma (B, 2^n)
+
+    Raises:
+        ValueError: Si el circuito tiene mediciones intermedias
+    """
+    if not ignorar_mediciones and circuito.mediciones:
+        raise ValueError("El circuito contiene mediciones")
+    n = int(np.log2(psi.shape[1]))
+    for op in circuito.unitarias:
+        psi = aplicar_puerta(psi, op.matriz(memoria), op.qubits, n)
+    return psi
+
+
+def probabilidades(psi):
+    """Probabilidades |amplitud|² de cada estado base, con la forma de `psi`."""
+    return psi.real ** 2 + psi.imag ** 2
+
+
+def deriva_norma(psi):
+    """|‖ψ‖ - 1| de cada estado del lote, calculada en float64."""
+    return np.abs(np.sqrt(probabilidades(psi).sum(axis=-1, dtype=np.float64)) - 1)
@@ -0,0 +1,241 @@
+"""
+MÓDULO: qnc/hilos.py - Núcleos de puertas multihilo sobre el vector de estado
+
+RESUMEN:
+`qnc.estado` aplica cada puerta con una sola llamada a `np.einsum`, que usa
+un único núcleo. Con 20-28 qubits el vector tiene millones de amplitudes y
+cada puerta es independiente por bloques: los pares de amplitudes (i, i + 2^t)
+que combina una puerta sobre el qubit t nunca cruzan un bloque alineado a
+2^(t+1). `SimuladorHilos` divide el vector en esos bloques y los reparte
+entre un grupo de hilos; las operaciones de NumPy liberan el GIL, así que
+los bloques se procesan en paralelo de verdad.
+
+FUNCIONAMIENTO:
+- Qubit bajo (2^(t+1) ≤ bloque): cada tarea es un bloque contiguo, visto
+  como (filas, 2, 2^t)
+- Qubit alto: cada tarea son dos trozos separados 2^t posiciones
+- CNOT, CZ y CPHASE solo tocan las amplitudes con el control a 1; SWAP se
+  aplica como tres CNOT
+- El vector se modifica en el sitio (sin copias de 2^n amplitudes)
+
+Los recorridos por bloques son los mismos que usa `qnc.vector_disco`.
+
+ESCALADO:
+`medir_escalado` ejecuta un circuito con las puertas de S01-S04 (H, X, Y,
+Z, S, T, PHASE, RX, RY, RZ, CNOT) con 1, 2, ..., N hilos y devuelve el
+tiempo y la aceleración de cada configuración:
+
+    python -m qnc.demos.escalado_hilos 22
+
+USO:
+    from qnc import SimuladorHilos
+
+    sim = SimuladorHilos(hilos=8)
+    psi = sim.evolucionar(prog)                # array (2^n,)
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from pyquil import Program
+from pyquil.gates import CNOT, H, PHASE, RX, RY, RZ, S, T, X, Y, Z
+
+from .circuito import Circuito
+from .vector_disco import _X, _bloque_con_control, _combinar, _filtrar_control, _mitades
+
+
+BLOQUE_MINIMO = 1 << 12
+BLOQUE_MAXIMO = 1 << 16
+
+
+class SimuladorHilos:
+    """
+    Simulador de vector de estado con las puertas repartidas entre hilos.
+
+    Atributos:
+        hilos: Número de hilos (default: número de núcleos)
+    """
+
+    def __init__(self, hilos=None):
+        self.hilos = hilos or os.cpu_count() or 1
+        self._grupo = ThreadPoolExecutor(max_workers=self.hilos) if self.hilos > 1 else None
+
+    def cerrar(self):
+        """Detiene el grupo de hilos."""
+        if self._grupo is not None:
+            self._grupo.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    def _bloque(self, total):
+        """Bloque potencia de 2: varias tareas por hilo, sin salir de la caché."""
+        bloque = 1 << max((total // (4 * self.hilos)).bit_length() - 1, 0)
+        return min(max(bloque, BLOQUE_MINIMO), BLOQUE_MAXIMO, total)
+
+    def aplicar_1q(self, psi, u, objetivo, control=None):
+        """
+        Aplica una puerta (2, 2) sobre `objetivo` en el sitio, opcionalmente controlada.
+
+        Args:
+            psi: Array (2^n,) complejo contiguo
+            u: Matriz 2×2
+            objetivo: Qubit sobre el que actúa la puerta
+            control: Qubit de control (None: puerta sin control)
+        """
+        u = np.asarray(u, dtype=psi.dtype)
+        paso = 1 << objetivo
+        bloque = self._bloque(psi.size)
+
+        if 2 * paso <= bloque:
+            def tarea(inicio):
+                a, b = _mitades(psi[inicio:inicio + bloque], inicio, objetivo, control)
+                _combinar(a, b, u)
+            inicios = [i for i in range(0, psi.size, bloque)
+                       if _bloque_con_control(i, bloque, control)]
+        else:
+            medio = bloque // 2
+
+            def tarea(inicio):
+                a = _filtrar_control(psi[inicio:inicio + medio], inicio, control)
+                b = _filtrar_control(psi[inicio + paso:inicio + paso + medio], inicio, control)
+                _combinar(a, b, u)
+            inicios = [base + d for base in range(0, psi.size, 2 * paso)
+                       for d in range(0, paso, medio)
+                       if _bloque_con_control(base + d, medio, control)]
+
+        if self._grupo is None:
+            for inicio in inicios:
+                tarea(inicio)
+        else:
+            list(self._grupo.map(tarea, inicios))
+
+    def aplicar(self, psi, operacion, memoria=None):
+        """
+        Aplica una Operacion de `qnc.circuito` en el sitio.
+
+        Raises:
+            ValueError: Si es una puerta de dos qubits distinta de CNOT, CZ,
+                CPHASE o SWAP, o de más qubits
+        """
+        q = operacion.qubits
+        if len(q) == 1:
+            self.aplicar_1q(psi, operacion.matriz(memoria), q[0])
+        elif operacion.nombre == "CNOT":
+            self.aplicar_1q(psi, _X, q[1], q[0])
+        elif operacion.nombre in ("CZ", "CPHASE"):
+            fase = operacion.matriz(memoria)[3, 3]
+            self.aplicar_1q(psi, np.diag([1, fase]), q[1], q[0])
+        elif operacion.nombre == "SWAP":
+            self.aplicar_1q(psi, _X, q[1], q[0])
+            self.aplicar_1q(psi, _X, q[0], q[1])
+            self.aplicar_1q(psi, _X, q[1], q[0])
+        else:
+            raise ValueError(f"Puerta no soportada por el simulador multihilo: {operacion.nombre}")
+
+    def evolucionar(self, programa, psi=None, memoria=None, dtype=complex):
+        """
+        Aplica todas las puertas de un programa (las mediciones terminales se ignoran).
+
+        Args:
+            programa: Program de PyQuil o Circuito
+            psi: Estado inicial (2^n,); se modifica en el sitio (default: |0...0⟩)
+            memoria: Valores de los parámetros (formato `memory_map` de PyQuil)
+            dtype: Tipo del estado inicial cuando no se pasa `psi`
+
+        Returns:
+            np.ndarray: Estado final (2^n,)
+
+        Raises:
+            ValueError: Si el programa tiene mediciones intermedias
+        """
+        circuito = programa if isinstance(programa, Circuito) else Circuito.desde_programa(programa)
+        if psi is None:
+            psi = np.zeros(2 ** max(circuito.num_qubits, 1), dtype=dtype)
+            psi[0] = 1
+        for op in circuito.unitarias:
+            self.aplicar(psi, op, memoria)
+        return psi
+
+
+# =============================================
+# MEDIDA DEL ESCALADO
+# =============================================
+def circuito_referencia(num_qubits, capas=2):
+    """
+    Circuito con todas las puertas de S01-S04: en cada capa, cada qubit recibe
+    H, X, Y, Z, S, T, PHASE, RX, RY y RZ, y después una cadena de CNOT.
+    """
+    prog = Program()
+    for _ in range(capas):
+        for q in range(num_qubits):
+            prog += [H(q), X(q), Y(q), Z(q), S(q), T(q), PHASE(np.pi / 4, q),
+                     RX(np.pi / 2, q), RY(np.pi / 2, q), RZ(np.pi / 2, q)]
+        for q in range(num_qubits - 1):
+            prog += CNOT(q, q + 1)
+    return prog
+
+
+class InformeEscalado:
+    """
+    Tiempos de un mismo circuito con distinto número de hilos.
+
+    Atributos:
+        num_qubits: Qubits del circuito
+        num_puertas: Número de puertas
+        tiempos: dict hilos -> mejor tiempo en segundos
+    """
+
+    def __init__(self, num_qubits, num_puertas, tiempos):
+        self.num_qubits = num_qubits
+        self.num_puertas = num_puertas
+        self.tiempos = tiempos
+
+    @property
+    def aceleraciones(self):
+        """dict hilos -> tiempo con 1 hilo / tiempo con esos hilos."""
+        base = self.tiempos[min(self.tiempos)]
+        return {h: base / t for h, t in self.tiempos.items()}
+
+    def resumen(self):
+        """Tabla de texto con el tiempo, la aceleración y la eficiencia de cada configuración."""
+        lineas = [f"{self.num_qubits} qubits, {self.num_puertas} puertas",
+                  f"{'Hilos':>6} {'Tiempo (s)':>11} {'Aceleración':>12} {'Eficiencia':>11}"]
+        for h, t in sorted(self.tiempos.items()):
+            a = self.aceleraciones[h]
+            lineas.append(f"{h:>6} {t:>11.4f} {a:>11.2f}x {a / h:>10.0%}")
+        return "\n".join(lineas)
+
+
+def medir_escalado(programa=None, num_qubits=22, max_hilos=None, repeticiones=3):
+    """
+    Mide el tiempo de simulación con 1, 2, ..., max_hilos hilos.
+
+    Args:
+        programa: Program de PyQuil (default: `circuito_referencia(num_qubits)`)
+        num_qubits: Qubits del circuito de referencia
+        max_hilos: Máximo de hilos (default: número de núcleos)
+        repeticiones: Se toma el mejor tiempo de estas repeticiones
+
+    Returns:
+        InformeEscalado
+    """
+    programa = circuito_referencia(num_qubits) if programa is None else programa
+    circuito = Circuito.desde_programa(programa)
+    max_hilos = max_hilos or os.cpu_count() or 1
+
+    tiempos = {}
+    for hilos in range(1, max_hilos + 1):
+        with SimuladorHilos(hilos) as sim:
+            mejor = float("inf")
+            for _ in range(repeticiones):
+                inicio = time.perf_counter()
+                sim.evolucionar(circuito)
+                mejor = min(mejor, time.perf_counter() - inicio)
+        tiempos[hilos] = mejor
+    return InformeEscalado(circuito.num_qubits, len(circuito.operaciones), tiempos)
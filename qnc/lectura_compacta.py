@@ -0,0 +1,206 @@
+"""
+MÓDULO: qnc/lectura_compacta.py - Almacenamiento empaquetado en bits de las mediciones
+
+RESUMEN:
+`readout_data['ro']` usa un entero int64 por bit medido: una ejecución de 4
+monedas como S02P02A.py ocupa 32 bytes por shot para guardar 4 bits, y un
+trabajo de 9 qubits ocupa 72 bytes por shot. `LecturaCompacta` guarda cada
+shot con `np.packbits`, es decir, ceil(bits / 8) bytes por shot:
+
+    bits    int64 (bytes/shot)    compacta (bytes/shot)    reducción
+     4            32                      1                  32×
+     9            72                      2                  36×
+
+FUNCIONAMIENTO:
+- Los bits de cada shot se empaquetan con orden "little": la columna j del
+  registro es el bit (j % 8) del byte j // 8
+- Indexar (`lectura[10:20]`, `lectura[5]`) desempaqueta solo las filas pedidas
+  y devuelve un array int64 como el de PyQuil, así que los bucles de los
+  programas (`for res in result: print(res)`) y las funciones de
+  `qnc.analisis` funcionan sin cambios
+- `guardar` escribe un `.npy` con la matriz (shots, bytes por shot) y un
+  `.json` con el número de bits; `cargar` lo abre con `np.memmap`, de modo que
+  solo se leen del disco los bloques que se usan
+
+USO:
+    from qnc import compactar_resultado
+
+    result = compactar_resultado(qvm.run(qvm.compile(prog)))
+    ro = result.readout_data['ro']          # LecturaCompacta
+    print(ro.nbytes, ro[:5])
+"""
+
+import json
+
+import numpy as np
+
+from .resultados import ResultadoEjecucion
+
+
+BLOQUE_POR_DEFECTO = 1 << 20
+
+
+class LecturaCompacta:
+    """
+    Array de mediciones (shots, bits) guardado con un bit por medición.
+
+    Atributos:
+        datos: Array uint8 (shots, ceil(bits / 8)) con los bits empaquetados
+        num_bits: Número de columnas del registro original
+    """
+
+    def __init__(self, datos, num_bits):
+        self.datos = datos
+        self.num_bits = num_bits
+
+    @classmethod
+    def desde_lectura(cls, lectura, bloque=BLOQUE_POR_DEFECTO):
+        """
+        Empaqueta un array de lectura (shots, bits) de valores 0/1.
+
+        Se procesa por bloques para no crear temporales del tamaño del array.
+        """
+        lectura = lectura if hasattr(lectura, "shape") else np.asarray(lectura)
+        shots, num_bits = lectura.shape
+        datos = np.empty((shots, _bytes_por_shot(num_bits)), dtype=np.uint8)
+        compacta = cls(datos, num_bits)
+        for inicio in range(0, shots, bloque):
+            compacta.escribir_bloque(inicio, lectura[inicio:inicio + bloque])
+        return compacta
+
+    @classmethod
+    def crear_en_disco(cls, ruta, shots, num_bits):
+        """
+        Crea una lectura vacía respaldada por un `.npy` en disco (np.memmap).
+
+        Sirve para ir volcando bloques con `escribir_bloque` en experimentos
+        que no caben en memoria.
+        """
+        ruta = _ruta_npy(ruta)
+        datos = np.lib.format.open_memmap(ruta, mode="w+", dtype=np.uint8,
+                                          shape=(shots, _bytes_por_shot(num_bits)))
+        _escribir_metadatos(ruta, num_bits)
+        return cls(datos, num_bits)
+
+    @classmethod
+    def cargar(cls, ruta, mmap=True):
+        """
+        Abre una lectura guardada con `guardar`.
+
+        Args:
+            ruta: Ruta del fichero .npy
+            mmap: Si es True, el fichero se mapea en memoria en solo lectura
+
+        Returns:
+            LecturaCompacta
+        """
+        ruta = _ruta_npy(ruta)
+        with open(_ruta_metadatos(ruta), encoding="utf-8") as f:
+            num_bits = json.load(f)["num_bits"]
+        datos = np.load(ruta, mmap_mode="r" if mmap else None)
+        return cls(datos, num_bits)
+
+    def guardar(self, ruta):
+        """Guarda la matriz empaquetada en `ruta` (.npy) y el número de bits en `ruta`.json."""
+        ruta = _ruta_npy(ruta)
+        np.save(ruta, self.datos)
+        _escribir_metadatos(ruta, self.num_bits)
+
+    def escribir_bloque(self, inicio, lectura):
+        """Empaqueta un bloque de filas (shots, bits) a partir de la fila `inicio`."""
+        lectura = np.asarray(lectura)
+        self.datos[inicio:inicio + len(lectura)] = np.packbits(
+            lectura.astype(np.uint8, copy=False), axis=1, bitorder="little")
+
+    @property
+    def shape(self):
+        """Forma del array desempaquetado: (shots, bits)."""
+        return (len(self.datos), self.num_bits)
+
+    @property
+    def nbytes(self):
+        """Bytes ocupados por los datos empaquetados."""
+        return self.datos.nbytes
+
+    def __len__(self):
+        return len(self.datos)
+
+    def __getitem__(self, indice):
+        """Desempaqueta solo las filas pedidas (int, slice o array de índices)."""
+        if isinstance(indice, tuple):
+            filas, *columnas = indice
+            return self[filas][(Ellipsis, *columnas)]
+        filas = self.datos[indice]
+        unico = filas.ndim == 1
+        bits = np.unpackbits(np.atleast_2d(filas), axis=1, count=self.num_bits,
+                             bitorder="little").astype(np.int64)
+        return bits[0] if unico else bits
+
+    def __iter__(self):
+        for bloque in self.bloques():
+            yield from bloque
+
+    def __array__(self, dtype=None, copy=None):
+        lectura = self.desempaquetar()
+        return lectura if dtype is None else lectura.astype(dtype)
+
+    def bloques(self, bloque=BLOQUE_POR_DEFECTO):
+        """Recorre la lectura desempaquetada en bloques de `bloque` shots."""
+        for inicio in range(0, len(self), bloque):
+            yield self[inicio:inicio + bloque]
+
+    def desempaquetar(self):
+        """Devuelve el array completo (shots, bits) int64, como el de PyQuil."""
+        return self[:]
+
+    def columna(self, j):
+        """Bits de la columna j de todos los shots, sin desempaquetar el resto."""
+        return ((self.datos[:, j // 8] >> (j % 8)) & 1).astype(np.int64)
+
+    def enteros(self):
+        """
+        Cada shot como entero con el bit j igual a la columna j (mismo criterio
+        que `qnc.analisis.empaquetar`), leído directamente de los bytes.
+        """
+        valores = np.zeros(len(self), dtype=np.int64)
+        for b in range(self.datos.shape[1]):
+            valores |= self.datos[:, b].astype(np.int64) << (8 * b)
+        return valores
+
+    def __repr__(self):
+        return f"LecturaCompacta(shots={len(self)}, bits={self.num_bits}, bytes={self.nbytes})"
+
+
+def compactar_resultado(resultado):
+    """
+    Convierte el resultado de un `run` en uno con las lecturas empaquetadas.
+
+    Args:
+        resultado: QAMExecutionResult de PyQuil o ResultadoEjecucion de qnc
+
+    Returns:
+        ResultadoEjecucion: Con una LecturaCompacta por registro
+    """
+    registros = {nombre: LecturaCompacta.desde_lectura(valores)
+                 for nombre, valores in resultado.get_register_map().items()
+                 if valores is not None}
+    return ResultadoEjecucion(registros, motor=getattr(resultado, "motor", "compacto"))
+
+
+def _bytes_por_shot(num_bits):
+    return max((num_bits + 7) // 8, 1)
+
+
+def _ruta_npy(ruta):
+    """np.save añade la extensión .npy si falta; se normaliza para el .json."""
+    ruta = str(ruta)
+    return ruta if ruta.endswith(".npy") else ruta + ".npy"
+
+
+def _ruta_metadatos(ruta):
+    return str(ruta) + ".json"
+
+
+def _escribir_metadatos(ruta, num_bits):
+    with open(_ruta_metadatos(ruta), "w", encoding="utf-8") as f:
+        json.dump({"num_bits": num_bits, "orden_bits": "little"}, f)
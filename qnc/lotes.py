@@ -0,0 +1,160 @@
+"""
+MÓDULO: qnc/lotes.py - Ejecución concurrente de varios programas independientes
+
+RESUMEN:
+S01/third_program.py compila y ejecuta prog1, prog2 y prog3 uno detrás de
+otro: mientras quilc compila prog2 la QVM está parada, y viceversa. Con
+decenas de circuitos independientes casi todo el tiempo se va en esperas de
+red. `ejecutar_lote` reparte los programas entre un grupo acotado de hilos
+que compilan y ejecutan a la vez, y devuelve los resultados en el mismo orden
+en que se recibieron los programas.
+
+INFORME:
+Cada trabajo guarda su tiempo de compilación y de ejecución. La aceleración
+respecto a la ejecución secuencial se estima como:
+
+    aceleración = Σ (tiempo de cada trabajo) / tiempo total del lote
+
+es decir, lo que habría tardado ejecutar los trabajos uno detrás de otro
+dividido entre lo que ha tardado el lote. Con `medir_secuencial=True` se
+ejecuta además el lote de forma secuencial para medirla directamente.
+
+USO:
+    from qnc import ejecutar_lote
+
+    informe = ejecutar_lote(get_qc('9q-square-qvm'), [prog1, prog2, prog3])
+    result1, result2, result3 = informe.resultados
+    print(informe.resumen())
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class TrabajoLote:
+    """
+    Un programa del lote y sus tiempos.
+
+    Atributos:
+        indice: Posición del programa en la lista de entrada
+        resultado: Resultado del `run` (None si falló)
+        error: Excepción producida (None si terminó bien)
+        t_compilacion: Segundos en `compile`
+        t_ejecucion: Segundos en `run`
+    """
+
+    def __init__(self, indice, programa):
+        self.indice = indice
+        self.programa = programa
+        self.resultado = None
+        self.error = None
+        self.t_compilacion = 0.0
+        self.t_ejecucion = 0.0
+
+    @property
+    def t_total(self):
+        return self.t_compilacion + self.t_ejecucion
+
+
+class InformeLote:
+    """
+    Resultados y tiempos de un lote.
+
+    Atributos:
+        trabajos: Lista de TrabajoLote en el orden de entrada
+        t_lote: Segundos desde el inicio hasta el final del lote
+        t_secuencial_medido: Segundos de la ejecución secuencial (si se midió)
+        hilos: Número de hilos usados
+    """
+
+    def __init__(self, trabajos, t_lote, hilos, t_secuencial_medido=None):
+        self.trabajos = trabajos
+        self.t_lote = t_lote
+        self.hilos = hilos
+        self.t_secuencial_medido = t_secuencial_medido
+
+    @property
+    def resultados(self):
+        """Resultados en el orden de entrada (None en los trabajos con error)."""
+        return [t.resultado for t in self.trabajos]
+
+    @property
+    def errores(self):
+        """Lista de (índice, excepción) de los trabajos que fallaron."""
+        return [(t.indice, t.error) for t in self.trabajos if t.error is not None]
+
+    @property
+    def t_secuencial_estimado(self):
+        """Suma de los tiempos de todos los trabajos."""
+        return sum(t.t_total for t in self.trabajos)
+
+    @property
+    def aceleracion(self):
+        """Aceleración respecto a la ejecución secuencial (medida si existe)."""
+        secuencial = self.t_secuencial_medido or self.t_secuencial_estimado
+        return secuencial / self.t_lote if self.t_lote > 0 else 0.0
+
+    def resumen(self):
+        """Tabla de texto con los tiempos de cada trabajo y la aceleración."""
+        lineas = [f"{'Trabajo':>8} {'Compilar (s)':>13} {'Ejecutar (s)':>13} {'Estado':>8}"]
+        for t in self.trabajos:
+            estado = "ok" if t.error is None else "error"
+            lineas.append(f"{t.indice:>8} {t.t_compilacion:>13.4f} {t.t_ejecucion:>13.4f} {estado:>8}")
+        lineas.append(f"Hilos: {self.hilos}  Lote: {self.t_lote:.4f} s  "
+                      f"Secuencial estimado: {self.t_secuencial_estimado:.4f} s")
+        if self.t_secuencial_medido is not None:
+            lineas.append(f"Secuencial medido: {self.t_secuencial_medido:.4f} s")
+        lineas.append(f"Aceleración: {self.aceleracion:.2f}x")
+        return "\n".join(lineas)
+
+
+def ejecutar_lote(qc, programas, max_hilos=4, medir_secuencial=False, lanzar_errores=True):
+    """
+    Compila y ejecuta varios programas a la vez con un grupo acotado de hilos.
+
+    Args:
+        qc: QuantumComputer de PyQuil o motor de qnc (objeto con compile/run)
+        programas: Lista de Program de PyQuil
+        max_hilos: Máximo de trabajos en curso a la vez
+        medir_secuencial: Si es True, después del lote se ejecutan los mismos
+            programas uno detrás de otro para medir la aceleración real
+        lanzar_errores: Si es True, se relanza el primer error al terminar el
+            lote; si es False, los errores quedan en `InformeLote.errores`
+
+    Returns:
+        InformeLote: Resultados en el orden de entrada y tiempos de cada trabajo
+    """
+    trabajos = [TrabajoLote(i, p) for i, p in enumerate(programas)]
+    hilos = max(min(max_hilos, len(trabajos)), 1)
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=hilos) as grupo:
+        list(grupo.map(lambda t: _ejecutar_trabajo(qc, t), trabajos))
+    t_lote = time.perf_counter() - inicio
+
+    t_secuencial = None
+    if medir_secuencial:
+        inicio = time.perf_counter()
+        for t in trabajos:
+            _ejecutar_trabajo(qc, TrabajoLote(t.indice, t.programa))
+        t_secuencial = time.perf_counter() - inicio
+
+    informe = InformeLote(trabajos, t_lote, hilos, t_secuencial)
+    if lanzar_errores and informe.errores:
+        raise informe.errores[0][1]
+    return informe
+
+
+def _ejecutar_trabajo(qc, trabajo):
+    """Compila y ejecuta un trabajo guardando tiempos, resultado o error."""
+    try:
+        inicio = time.perf_counter()
+        ejecutable = qc.compile(trabajo.programa)
+        trabajo.t_compilacion = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        trabajo.resultado = qc.run(ejecutable)
+        trabajo.t_ejecucion = time.perf_counter() - inicio
+    except Exception as error:
+        trabajo.error = error
+    return trabajo
@@ -0,0 +1,430 @@
+"""
+MÓDULO: qnc/manifiesto.py - Ejecución del catálogo de experimentos desde un manifiesto
+
+RESUMEN:
+Ejecutar todo el catálogo S01-S04 supone lanzar unos 30 procesos de Python,
+cada uno importando PyQuil y creando sus propios clientes de la QVM y de
+quilc. Aquí el catálogo se describe en un manifiesto JSON y se ejecuta en un
+único proceso:
+
+- Un solo juego de clientes de la QVM y de quilc (`GestorConexiones`,
+  envuelto en `QCConCache`) y de simuladores de función de onda para todos
+  los experimentos
+- Caché de compilación (`qnc.cache_compilacion`) y caché de resultados: dos
+  experimentos con el mismo programa, shots y repeticiones se ejecutan una
+  vez, aunque se pidan a la vez desde dos hilos
+- Los experimentos son independientes y se reparten entre un grupo de hilos,
+  como en `qnc.lotes`
+- Cada resultado se compara con la salida esperada y todo se resume en una
+  tabla (texto o CSV)
+
+MANIFIESTO:
+    {
+      "qc": "9q-square-qvm",
+      "experimentos": [
+        {"nombre": "S01P02", "script": "S01/S01P02.py", "tipo": "muestreo",
+         "circuito": ["DECLARE ro BIT[2]", "H 0", "CNOT 0 1",
+                      "MEASURE 0 ro[0]", "MEASURE 1 ro[1]"],
+         "shots": 100, "esperado": {"00": 0.5, "11": 0.5}},
+        {"nombre": "S04P03B", "script": "S04/S04P03B.py", "tipo": "funcion_onda",
+         "estado_inicial": "1", "circuito": ["RX(pi/2) 0"],
+         "esperado": ["-0.7071067812j", "0.7071067812"]}
+      ]
+    }
+
+- tipo "muestreo": `esperado` es la distribución de los bits de "ro"
+  (ro[0] primero). Se acepta si la distancia de variación total entre la
+  distribución medida y la esperada no supera `tolerancia` (por defecto
+  √(k / shots), con k el número de resultados posibles). Sin `tolerancia`
+  además todos los resultados medidos tienen que ser posibles (probabilidad
+  esperada > 0): con pocos shots (S02P01B, 1 shot por `run`) la distancia
+  no distingue nada, pero un resultado imposible sí delata un error
+- tipo "funcion_onda": `esperado` son las amplitudes finales; se acepta si
+  el mayor error de amplitud no supera `tolerancia` (por defecto 1e-6)
+- estado_inicial: bits a preparar con X antes del circuito (qubit 0 primero),
+  para las parejas A/B de S03/S04
+- repeticiones: número de `run` del mismo ejecutable (S02P01B hace 50 de 1 shot)
+
+REFERENCIA:
+El tiempo total se compara con lo que costaría lanzar un proceso por script:
+`medir_arranque` mide el arranque de un proceso que importa PyQuil y la
+referencia se estima como scripts × arranque + Σ tiempos de los
+experimentos. Con `referencia="scripts"` se ejecutan los scripts de verdad
+(necesita los contenedores de docker-compose.yml).
+
+USO:
+    from qnc import ejecutar_manifiesto
+
+    informe = ejecutar_manifiesto("qnc/demos/catalogo.json")            # motores locales
+    informe = ejecutar_manifiesto("qnc/demos/catalogo.json", motor="remoto")
+    print(informe.resumen())
+    informe.guardar_csv("catalogo.csv")
+"""
+
+import csv
+import json
+import math
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+from pyquil import Program
+
+from .cache_compilacion import CacheCompilacion, QCConCache, normalizar_quil
+from .conexiones import GestorConexiones
+from .despachador import QVMAutomatica
+from .precision import SimuladorFuncionOnda
+
+
+TIPOS = ("muestreo", "funcion_onda")
+TOLERANCIA_AMPLITUD = 1e-6
+RAIZ_REPOSITORIO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Experimento:
+    """
+    Una entrada del manifiesto.
+
+    Atributos:
+        nombre: Identificador del experimento (ej: "S01P02")
+        script: Ruta del script original, relativa a la raíz del repositorio
+        tipo: "muestreo" o "funcion_onda"
+        circuito: Texto Quil del circuito
+        estado_inicial: Bits preparados con X antes del circuito (qubit 0 primero)
+        shots: Shots de cada `run`
+        repeticiones: Número de `run` del mismo ejecutable
+        esperado: dict bits -> probabilidad, o lista de amplitudes complejas
+        tolerancia: Desviación máxima aceptada (None: la de por defecto)
+    """
+
+    def __init__(self, nombre, circuito, tipo="muestreo", script=None, estado_inicial="",
+                 shots=1, repeticiones=1, esperado=None, tolerancia=None):
+        if tipo not in TIPOS:
+            raise ValueError(f"{nombre}: tipo desconocido {tipo!r} (usa {' o '.join(TIPOS)})")
+        self.nombre = nombre
+        self.script = script
+        self.tipo = tipo
+        self.circuito = circuito if isinstance(circuito, str) else "\n".join(circuito)
+        self.estado_inicial = estado_inicial
+        self.shots = shots
+        self.repeticiones = repeticiones
+        if tipo == "funcion_onda" and esperado is not None:
+            esperado = [complex(str(a).replace(" ", "")) for a in esperado]
+        self.esperado = esperado
+        self.tolerancia = tolerancia
+
+    @classmethod
+    def desde_dict(cls, datos):
+        """Crea el experimento a partir de una entrada del manifiesto."""
+        return cls(**datos)
+
+    def programa(self):
+        """Program de PyQuil con la preparación del estado inicial, el circuito y los shots."""
+        preparacion = "".join(f"X {q}\n" for q, bit in enumerate(self.estado_inicial) if bit == "1")
+        prog = Program(preparacion + self.circuito)
+        return prog.wrap_in_numshots_loop(self.shots)
+
+    def clave(self):
+        """Clave de la caché de resultados (programa normalizado, shots y repeticiones)."""
+        return (self.tipo, normalizar_quil(self.programa()), self.shots, self.repeticiones)
+
+    def __repr__(self):
+        return f"Experimento({self.nombre!r}, tipo={self.tipo!r}, shots={self.shots})"
+
+
+def cargar_manifiesto(manifiesto):
+    """
+    Lee un manifiesto.
+
+    Args:
+        manifiesto: Ruta de un fichero JSON o dict ya cargado
+
+    Returns:
+        tuple: (dict de opciones globales, lista de Experimento)
+    """
+    if not isinstance(manifiesto, dict):
+        with open(manifiesto, encoding="utf-8") as f:
+            manifiesto = json.load(f)
+    opciones = {k: v for k, v in manifiesto.items() if k != "experimentos"}
+    return opciones, [Experimento.desde_dict(e) for e in manifiesto["experimentos"]]
+
+
+# =============================================
+# RESULTADOS
+# =============================================
+class FilaManifiesto:
+    """
+    Resultado de un experimento.
+
+    Atributos:
+        experimento: Experimento ejecutado
+        valor: Array de lecturas (muestreo) o de amplitudes (función de onda)
+        desviacion: Distancia de variación total o error máximo de amplitud
+        correcto: True si la desviación no supera la tolerancia
+        desde_cache: True si el resultado se reutilizó de otro experimento
+        error: Excepción producida (None si terminó bien)
+        t_compilacion: Segundos en `compile`
+        t_ejecucion: Segundos en `run` o `wavefunction`
+    """
+
+    def __init__(self, experimento):
+        self.experimento = experimento
+        self.valor = None
+        self.desviacion = None
+        self.correcto = False
+        self.desde_cache = False
+        self.error = None
+        self.t_compilacion = 0.0
+        self.t_ejecucion = 0.0
+
+    @property
+    def estado(self):
+        if self.error is not None:
+            return "error"
+        return "ok" if self.correcto else "FALLO"
+
+
+class InformeManifiesto:
+    """
+    Resultados de todos los experimentos y tiempos del conjunto.
+
+    Atributos:
+        filas: Lista de FilaManifiesto en el orden del manifiesto
+        t_total: Segundos de todo el manifiesto (sin contar la creación de los clientes)
+        t_clientes: Segundos en crear los clientes de la QVM/quilc
+        hilos: Número de hilos usados
+        t_arranque: Segundos de arranque de un proceso con PyQuil (si se midió)
+        t_scripts: Segundos de la ejecución real de los scripts (si se midió)
+        cache: Estadísticas de la caché de compilación
+    """
+
+    def __init__(self, filas, t_total, t_clientes, hilos, t_arranque=None, t_scripts=None,
+                 cache=None):
+        self.filas = filas
+        self.t_total = t_total
+        self.t_clientes = t_clientes
+        self.hilos = hilos
+        self.t_arranque = t_arranque
+        self.t_scripts = t_scripts
+        self.cache = cache or {}
+
+    @property
+    def correctos(self):
+        return sum(f.estado == "ok" for f in self.filas)
+
+    @property
+    def scripts(self):
+        """Scripts distintos del manifiesto."""
+        return sorted({f.experimento.script for f in self.filas if f.experimento.script})
+
+    @property
+    def t_referencia(self):
+        """
+        Tiempo de la ejecución script a script: medido si existe; si no,
+        estimado como scripts × (arranque + clientes) + Σ tiempos de los experimentos.
+        """
+        if self.t_scripts is not None:
+            return self.t_scripts
+        if self.t_arranque is None:
+            return None
+        return (len(self.scripts) * (self.t_arranque + self.t_clientes)
+                + sum(f.t_compilacion + f.t_ejecucion for f in self.filas))
+
+    def resumen(self):
+        """Tabla de texto con el resultado de cada experimento y los tiempos totales."""
+        lineas = [f"{'Experimento':<22} {'Tipo':<13} {'Shots':>6} {'Estado':>7} "
+                  f"{'Desviación':>11} {'Compilar (s)':>13} {'Ejecutar (s)':>13} {'Caché':>6}"]
+        for f in self.filas:
+            e = f.experimento
+            desviacion = "-" if f.desviacion is None else f"{f.desviacion:.2e}"
+            lineas.append(f"{e.nombre:<22} {e.tipo:<13} {e.shots * e.repeticiones:>6} "
+                          f"{f.estado:>7} {desviacion:>11} {f.t_compilacion:>13.4f} "
+                          f"{f.t_ejecucion:>13.4f} {'sí' if f.desde_cache else 'no':>6}")
+        lineas.append(f"Correctos: {self.correctos}/{len(self.filas)}  Hilos: {self.hilos}  "
+                      f"Clientes: {self.t_clientes:.3f} s  Total: {self.t_total:.3f} s")
+        referencia = self.t_referencia
+        if referencia is not None:
+            origen = "medida" if self.t_scripts is not None else "estimada"
+            # Este proceso también paga un arranque y la creación de los clientes
+            propio = self.t_total + self.t_clientes + (self.t_arranque or 0.0)
+            lineas.append(f"Referencia script a script ({len(self.scripts)} scripts, {origen}): "
+                          f"{referencia:.3f} s  Un proceso: {propio:.3f} s  "
+                          f"Aceleración: {referencia / propio:.1f}x")
+        return "\n".join(lineas)
+
+    def guardar_csv(self, ruta):
+        """Escribe la tabla consolidada en un fichero CSV."""
+        with open(ruta, "w", newline="", encoding="utf-8") as f:
+            escritor = csv.writer(f)
+            escritor.writerow(["nombre", "script", "tipo", "shots", "estado", "desviacion",
+                               "t_compilacion", "t_ejecucion", "desde_cache", "error"])
+            for fila in self.filas:
+                e = fila.experimento
+                escritor.writerow([e.nombre, e.script or "", e.tipo, e.shots * e.repeticiones,
+                                   fila.estado, "" if fila.desviacion is None else fila.desviacion,
+                                   f"{fila.t_compilacion:.6f}", f"{fila.t_ejecucion:.6f}",
+                                   int(fila.desde_cache), "" if fila.error is None else repr(fila.error)])
+
+
+# =============================================
+# EJECUCIÓN
+# =============================================
+class EjecutorManifiesto:
+    """
+    Clientes compartidos y cachés para ejecutar experimentos en un solo proceso.
+
+    Atributos:
+        qc: Objeto con compile/run (envuelto en QCConCache)
+        amplitudes: Función programa -> amplitudes finales (WavefunctionSimulator
+            o SimuladorFuncionOnda)
+        t_clientes: Segundos que costó crear los clientes
+    """
+
+    def __init__(self, motor="local", nombre_qc="9q-square-qvm", semilla=None):
+        """
+        Args:
+            motor: "local" (motores de qnc, sin Docker) o "remoto" (QVM y
+                quilc de docker-compose.yml)
+            nombre_qc: Nombre para `get_qc` en modo remoto (los clientes de
+                `GestorConexiones` se calientan al crearlos)
+            semilla: Semilla de los motores locales
+        """
+        inicio = time.perf_counter()
+        if motor == "remoto":
+            gestor = GestorConexiones(nombre_qc)
+            gestor.calentar()
+            self.qc = QCConCache(gestor)
+            self.amplitudes = lambda programa: gestor.wavefunction(programa).amplitudes
+        elif motor == "local":
+            self.qc = QCConCache(QVMAutomatica(semilla=semilla), CacheCompilacion(directorio=None))
+            self.amplitudes = SimuladorFuncionOnda().amplitudes
+        else:
+            raise ValueError(f"Motor desconocido: {motor!r} (usa 'local' o 'remoto')")
+        self.t_clientes = time.perf_counter() - inicio
+        self._resultados = {}
+        self._cerrojo = threading.Lock()
+
+    def ejecutar(self, experimento):
+        """Ejecuta un experimento (o reutiliza su resultado) y lo compara con lo esperado."""
+        fila = FilaManifiesto(experimento)
+        try:
+            with self._cerrojo:
+                futuro = self._resultados.get(experimento.clave())
+                fila.desde_cache = futuro is not None
+                if futuro is None:
+                    futuro = self._resultados[experimento.clave()] = Future()
+            if not fila.desde_cache:
+                try:
+                    futuro.set_result(self._calcular(experimento))
+                except Exception as error:
+                    futuro.set_exception(error)
+            fila.valor, t_compilacion, t_ejecucion = futuro.result()
+            if not fila.desde_cache:
+                fila.t_compilacion, fila.t_ejecucion = t_compilacion, t_ejecucion
+            fila.desviacion, fila.correcto = _comparar(experimento, fila.valor)
+        except Exception as error:
+            fila.error = error
+        return fila
+
+    def _calcular(self, experimento):
+        """(valor, t_compilacion, t_ejecucion) de un experimento."""
+        programa = experimento.programa()
+        if experimento.tipo == "funcion_onda":
+            inicio = time.perf_counter()
+            amplitudes = np.asarray(self.amplitudes(programa))
+            return amplitudes, 0.0, time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        ejecutable = self.qc.compile(programa)
+        t_compilacion = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        lecturas = [self.qc.run(ejecutable).readout_data["ro"]
+                    for _ in range(experimento.repeticiones)]
+        return np.concatenate(lecturas), t_compilacion, time.perf_counter() - inicio
+
+
+def _comparar(experimento, valor):
+    """(desviación, correcto) del resultado frente a lo esperado."""
+    if experimento.esperado is None:
+        return None, True
+    if experimento.tipo == "funcion_onda":
+        esperado = np.asarray(experimento.esperado)
+        if esperado.shape != valor.shape:
+            return math.inf, False
+        desviacion = float(np.max(np.abs(valor - esperado)))
+        tolerancia = experimento.tolerancia or TOLERANCIA_AMPLITUD
+        return desviacion, desviacion <= tolerancia
+
+    bits, cuentas = np.unique(["".join(map(str, fila)) for fila in valor], return_counts=True)
+    medida = dict(zip(bits, cuentas / cuentas.sum()))
+    resultados = set(medida) | set(experimento.esperado)
+    desviacion = 0.5 * sum(abs(medida.get(r, 0.0) - experimento.esperado.get(r, 0.0))
+                           for r in resultados)
+    posibles = sum(p > 0 for p in experimento.esperado.values())
+    if experimento.tolerancia is not None:
+        return desviacion, desviacion <= experimento.tolerancia
+    # Con k/shots >= 1 la cota por defecto es 1 y solo comprueba el soporte
+    en_soporte = all(experimento.esperado.get(r, 0.0) > 0 for r in medida)
+    return desviacion, en_soporte and desviacion <= math.sqrt(posibles / len(valor))
+
+
+def medir_arranque(repeticiones=3):
+    """
+    Segundos que tarda un proceso nuevo en arrancar e importar PyQuil
+    (lo que paga cada script antes de su primer circuito).
+    """
+    orden = [sys.executable, "-c", "from pyquil import get_qc; from pyquil.api import WavefunctionSimulator"]
+    mejor = math.inf
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        subprocess.run(orden, check=True, capture_output=True)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def medir_scripts(scripts, raiz=RAIZ_REPOSITORIO):
+    """Segundos que tarda ejecutar cada script en su propio proceso, uno detrás de otro."""
+    inicio = time.perf_counter()
+    for script in scripts:
+        subprocess.run([sys.executable, os.path.basename(script)],
+                       cwd=os.path.join(raiz, os.path.dirname(script)), check=True,
+                       capture_output=True)
+    return time.perf_counter() - inicio
+
+
+def ejecutar_manifiesto(manifiesto, motor="local", max_hilos=4, referencia="estimada",
+                        semilla=None):
+    """
+    Ejecuta todos los experimentos de un manifiesto en este proceso.
+
+    Args:
+        manifiesto: Ruta del fichero JSON o dict
+        motor: "local" o "remoto" (ver `EjecutorManifiesto`)
+        max_hilos: Máximo de experimentos en curso a la vez
+        referencia: "estimada" (mide el arranque de un proceso), "scripts"
+            (ejecuta los scripts originales) o None (sin referencia)
+        semilla: Semilla de los motores locales
+
+    Returns:
+        InformeManifiesto
+    """
+    opciones, experimentos = cargar_manifiesto(manifiesto)
+    ejecutor = EjecutorManifiesto(motor, opciones.get("qc", "9q-square-qvm"), semilla)
+    hilos = max(min(max_hilos, len(experimentos)), 1)
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=hilos) as grupo:
+        filas = list(grupo.map(ejecutor.ejecutar, experimentos))
+    t_total = time.perf_counter() - inicio
+
+    informe = InformeManifiesto(filas, t_total, ejecutor.t_clientes, hilos,
+                                cache=ejecutor.qc.cache.estadisticas())
+    if referencia == "estimada":
+        informe.t_arranque = medir_arranque()
+    elif referencia == "scripts":
+        informe.t_scripts = medir_scripts(informe.scripts)
+    return informe
@@ -0,0 +1,249 @@
+"""
+MÓDULO: qnc/muestreo.py - Simular una vez, muestrear muchas veces
+
+RESUMEN:
+Los programas del estado de Bell (second_program.py, S01P02-S01P05) solo miden
+al final del circuito. En ese caso no hace falta ejecutar el circuito una vez
+por shot: el estado final es siempre el mismo, así que basta con calcularlo
+UNA vez y extraer todos los shots de su distribución de probabilidad.
+
+FUNCIONAMIENTO:
+1. Se comprueba que todas las mediciones son terminales: después de medir un
+   qubit ninguna puerta vuelve a actuar sobre él
+2. Se calcula el vector de estado final con `qnc.estado` (una sola vez)
+3. Se obtiene la distribución marginal de los qubits medidos
+4. Se sacan los N shots de esa distribución: con `barajar=True`, uno a uno
+   (independientes, en orden aleatorio); con `barajar=False`, con UNA
+   muestra multinomial y agrupados por resultado
+5. Se reconstruye `readout_data['ro']` con forma (N, tamaño de ro), igual que
+   la QVM
+
+COSTE:
+El cálculo del estado no depende del número de shots. Con `barajar=False` el
+coste por shot es solo el de escribir los bits, pero los shots quedan
+agrupados por resultado. Con `barajar=True` (por defecto) cada fila es un
+shot independiente, como en la QVM: se saca un número aleatorio por shot y
+se busca en la distribución acumulada de los resultados posibles (sin
+permutar un array de N elementos). 10^7 shots de un estado de Bell tardan
+~0.1 s con `barajar=False` y ~0.25 s con `barajar=True`.
+
+USO:
+    from qnc import QVMMuestreo
+
+    qvm = QVMMuestreo()
+    result = qvm.run(qvm.compile(prog)).readout_data['ro']
+"""
+
+import numpy as np
+
+from .circuito import Circuito, Medicion, Operacion
+from .estado import estado_base, evolucionar, probabilidades
+from .precision import PRECISIONES
+from .resultados import ResultadoEjecucion
+
+
+# Tipos de memoria que la QVM devuelve en readout_data
+TIPOS_LECTURA = ("BIT", "OCTET", "INTEGER")
+
+
+def mediciones_terminales(circuito):
+    """
+    Indica si todas las mediciones del circuito son terminales.
+
+    Una medición es terminal si ninguna puerta posterior actúa sobre el qubit
+    medido. Medir dos veces el mismo qubit al final (como en third_program.py)
+    sigue siendo terminal: ambas mediciones dan el mismo resultado.
+
+    Args:
+        circuito: Circuito de `qnc.circuito`
+
+    Returns:
+        bool: True si el circuito se puede muestrear desde su estado final
+    """
+    medidos = set()
+    for inst in circuito.instrucciones:
+        if isinstance(inst, Medicion):
+            medidos.add(inst.qubit)
+        elif isinstance(inst, Operacion) and medidos.intersection(inst.qubits):
+            return False
+    return True
+
+
+def distribucion_medida(circuito, memoria=None, dtype=complex):
+    """
+    Calcula la distribución de probabilidad de los qubits medidos.
+
+    Args:
+        circuito: Circuito con mediciones terminales
+        memoria: Valores de los parámetros (formato `memory_map` de PyQuil)
+        dtype: Tipo complejo del vector de estado (complex128 o complex64)
+
+    Returns:
+        tuple: (qubits_medidos, probs) donde qubits_medidos es la lista ordenada
+            de qubits y probs[k] es la probabilidad del resultado k, con el bit j
+            de k correspondiente a qubits_medidos[j]
+    """
+    n = circuito.num_qubits
+    medidos = sorted({m.qubit for m in circuito.mediciones})
+    psi = evolucionar(estado_base(n, dtype=dtype), circuito, memoria)
+    p = probabilidades(psi[0]).astype(np.float64).reshape((2,) * n)
+
+    # El qubit q ocupa el eje n - 1 - q; se suman los ejes de los qubits no medidos
+    no_medidos = tuple(n - 1 - q for q in range(n) if q not in medidos)
+    p = p.sum(axis=no_medidos).ravel()
+    return medidos, p / p.sum()
+
+
+def muestrear(circuito, shots=None, memoria=None, rng=None, barajar=True, dtype=complex):
+    """
+    Genera todos los shots de un circuito con mediciones terminales.
+
+    Args:
+        circuito: Circuito de `qnc.circuito`
+        shots: Número de shots (default: `circuito.num_shots`)
+        memoria: Valores de los parámetros (formato `memory_map` de PyQuil)
+        rng: np.random.Generator (default: uno nuevo sin semilla)
+        barajar: Si es True, los shots salen en orden aleatorio como en la QVM
+        dtype: Tipo complejo del vector de estado (complex128 o complex64)
+
+    Returns:
+        dict: registro -> array int64 de forma (shots, tamaño del registro)
+
+    Raises:
+        ValueError: Si alguna medición no es terminal
+    """
+    if not mediciones_terminales(circuito):
+        raise ValueError("El circuito tiene mediciones intermedias")
+    shots = circuito.num_shots if shots is None else shots
+    rng = np.random.default_rng() if rng is None else rng
+
+    registros = _registros_vacios(circuito, shots)
+    if not circuito.mediciones:
+        return registros
+
+    medidos, p = distribucion_medida(circuito, memoria, dtype)
+
+    tipo = np.uint8 if len(medidos) <= 8 else np.uint32 if len(medidos) <= 32 else np.uint64
+    if barajar:
+        resultados = _muestras_independientes(p, shots, rng, tipo)
+    else:
+        # Una única muestra multinomial reparte los shots entre los 2^k resultados
+        conteos = rng.multinomial(shots, p)
+        resultados = np.repeat(np.arange(p.size, dtype=tipo), conteos)
+
+    posicion = {q: j for j, q in enumerate(medidos)}
+    for m in circuito.mediciones:
+        if m.registro is None:
+            continue
+        registros[m.registro][:, m.indice] = (resultados >> posicion[m.qubit]) & 1
+    return registros
+
+
+def _muestras_independientes(p, shots, rng, tipo):
+    """
+    Saca `shots` resultados independientes de la distribución `p`.
+
+    Solo se usan los resultados con probabilidad no nula: un número uniforme
+    por shot se compara con la distribución acumulada del soporte (con pocos
+    resultados, como en un estado de Bell, bastan unas comparaciones).
+    """
+    soporte = np.flatnonzero(p)
+    acumulada = np.cumsum(p[soporte])
+    acumulada /= acumulada[-1]
+    u = rng.random(shots)
+    if soporte.size <= 4:
+        indices = np.zeros(shots, dtype=np.uint8)
+        for limite in acumulada[:-1]:
+            indices += u >= limite
+    else:
+        indices = np.searchsorted(acumulada[:-1], u, side="right")
+    return soporte.astype(tipo)[indices]
+
+
+def _tamanos_registros(circuito):
+    """dict registro -> número de columnas de cada registro de lectura."""
+    tamanos = {nombre: tamano for nombre, (tipo, tamano) in circuito.declaraciones.items()
+               if tipo in TIPOS_LECTURA}
+    for m in circuito.mediciones:
+        if m.registro is not None and m.registro not in circuito.declaraciones:
+            tamanos[m.registro] = max(tamanos.get(m.registro, 0), m.indice + 1)
+    return tamanos
+
+
+def _registros_vacios(circuito, shots):
+    """Crea los arrays de lectura a cero para cada registro declarado."""
+    return {nombre: np.zeros((shots, tamano), dtype=np.int64)
+            for nombre, tamano in _tamanos_registros(circuito).items()}
+
+
+# =============================================
+# CLASE QVMMuestreo
+# =============================================
+class QVMMuestreo:
+    """
+    Sustituto local de `get_qc('9q-square-qvm')` para circuitos con mediciones
+    terminales.
+
+    Ofrece los mismos métodos `compile` y `run` que `QuantumComputer`, de modo
+    que los programas existentes funcionan cambiando solo la línea que crea
+    `qvm`. Si se indica un `respaldo` (un QuantumComputer real), los programas
+    que no se pueden muestrear localmente se envían a él.
+    """
+
+    def __init__(self, respaldo=None, semilla=None, barajar=True, precision="complex128"):
+        """
+        Inicializa el motor de muestreo.
+
+        Args:
+            respaldo: QuantumComputer de PyQuil para los circuitos no soportados
+            semilla: Semilla del generador aleatorio (para resultados reproducibles)
+            barajar: Si es True, los shots salen en orden aleatorio
+            precision: "complex128" o "complex64" (mitad de memoria para el
+                vector de estado)
+
+        Raises:
+            ValueError: Si la precisión no es una de `PRECISIONES`
+        """
+        if precision not in PRECISIONES:
+            raise ValueError(f"Precisión no soportada: {precision} (usa {' o '.join(PRECISIONES)})")
+        self.respaldo = respaldo
+        self.rng = np.random.default_rng(semilla)
+        self.barajar = barajar
+        self.dtype = np.dtype(precision)
+
+    def compile(self, programa, to_native_gates=True, optimize=True, *, protoquil=None):
+        """
+        El muestreo local no necesita compilar a puertas nativas: devuelve el
+        mismo programa. Solo se compila con quilc si hay que usar el respaldo.
+        Acepta los mismos argumentos que `QuantumComputer.compile`.
+        """
+        if self.respaldo is not None and not self._es_local(programa):
+            return self.respaldo.compile(programa, to_native_gates, optimize,
+                                         protoquil=protoquil)
+        return programa
+
+    def run(self, ejecutable, memory_map=None):
+        """
+        Ejecuta todos los shots del programa.
+
+        Args:
+            ejecutable: Program de PyQuil (el devuelto por `compile`)
+            memory_map: Valores de los parámetros, como en `QuantumComputer.run`
+
+        Returns:
+            ResultadoEjecucion: Resultado con `readout_data` y `get_register_map()`
+        """
+        if self.respaldo is not None and not self._es_local(ejecutable):
+            return self.respaldo.run(ejecutable, memory_map or None)
+        circuito = Circuito.desde_programa(ejecutable)
+        registros = muestrear(circuito, memoria=memory_map or None,
+                              rng=self.rng, barajar=self.barajar, dtype=self.dtype)
+        return ResultadoEjecucion(registros, motor="muestreo")
+
+    @staticmethod
+    def _es_local(programa):
+        """Comprueba si el programa se puede muestrear desde su estado final."""
+        try:
+            return mediciones_terminales(Circuito.desde_programa(programa))
+        except ValueError:
+            return False
@@ -0,0 +1,168 @@
+"""
+MÓDULO: qnc/observables.py - Valores esperados de cadenas de Pauli sin muestreo
+
+RESUMEN:
+Para obtener ⟨Z⟩, ⟨X⟩ o ⟨ZZ⟩ de un estado de Bell (S01) con la QVM hay que
+añadir cambios de base, ejecutar muchos shots y promediar la lectura. Con las
+amplitudes del estado el valor exacto ⟨ψ|P|ψ⟩ sale directamente, sin
+circuitos extra y sin ruido estadístico.
+
+FUNCIONAMIENTO:
+Con las máscaras de bits x y z de una cadena P (ver `qnc.pauli`):
+
+    P|k⟩ = i^(fase + |x·z|) · (-1)^|k·z| · |k ⊕ x⟩
+
+    ⟨ψ|P|ψ⟩ = i^(fase + |x·z|) · Σ_k conj(ψ[k ⊕ x]) · ψ[k] · (-1)^|k·z|
+
+donde |·| es el número de bits a 1. Todo son operaciones de bits sobre el
+array de índices k, vectorizadas con NumPy:
+
+1. Las cadenas de un lote se agrupan por su máscara x: el producto
+   f[k] = conj(ψ[k ⊕ x]) · ψ[k] se calcula una sola vez por grupo
+2. Dentro de un grupo, cada máscara z es una fila de signos (-1)^|k·z| y
+   todas las cadenas se evalúan con un único producto matricial f @ signos.
+   El coste es O(2^n) por cada máscara x distinta más O(2^n) por cadena
+3. Si un grupo tiene muchas cadenas (más que qubits), se usa la transformada
+   de Walsh-Hadamard de f, que da Σ_k f[k] (-1)^|k·z| para TODAS las z en
+   O(n · 2^n)
+
+Las sumas ponderadas (Σ c_m P_m, por ejemplo un hamiltoniano) se obtienen
+con los valores de todas las cadenas en la misma pasada.
+
+USO:
+    from qnc import valor_esperado, valores_esperados
+
+    bell = Program(H(0), CNOT(0, 1))
+    valores_esperados(bell, ["ZI", "IZ", "ZZ", "XX", "YY"])   # [0, 0, 1, 1, -1]
+    valor_esperado(bell, {"ZZ": 0.5, "XX": 0.5})              # 1.0
+"""
+
+import numpy as np
+
+from .circuito import Circuito
+from .estado import estado_base, evolucionar
+from .pauli import CadenasPauli, _popcount_filas
+
+
+if hasattr(np, "bitwise_count"):
+    def _paridad(v):
+        """Paridad del número de bits a 1 de cada elemento de un array entero."""
+        return np.bitwise_count(v) & 1
+else:
+    def _paridad(v):
+        """Paridad del número de bits a 1 de cada elemento de un array entero."""
+        for desplazamiento in (32, 16, 8, 4, 2, 1):
+            v = v ^ (v >> desplazamiento)
+        return v & 1
+
+
+def valores_esperados(estado, observables, memoria=None, bloque=1 << 22):
+    """
+    ⟨ψ|P_m|ψ⟩ de cada cadena de Pauli de un lote.
+
+    Args:
+        estado: Amplitudes (2^n,) o lote (B, 2^n), `Wavefunction` de PyQuil,
+            o Program/Circuito (se simula desde |0...0⟩)
+        observables: CadenasPauli, texto ("ZZ", "-iXY"...) o lista de textos
+        memoria: Valores de los parámetros si `estado` es un programa
+        bloque: Máximo de elementos de cada matriz de signos (limita la memoria)
+
+    Returns:
+        np.ndarray: (M,) o (B, M) si el estado es un lote. Real si todas las
+            cadenas son hermíticas (fase ±1), complejo si alguna tiene fase ±i
+
+    Raises:
+        ValueError: Si una cadena actúa sobre un qubit que el estado no tiene
+    """
+    cadenas = _como_cadenas(observables)
+    psi, es_lote = _amplitudes(estado, cadenas.num_qubits, memoria)
+    n = psi.shape[1].bit_length() - 1
+
+    if cadenas.x.shape[1] > 1 and (cadenas.x[:, 1:].any() or cadenas.z[:, 1:].any()):
+        raise ValueError(f"Las cadenas actúan sobre más qubits de los {n} del estado")
+    mx = cadenas.x[:, 0].astype(np.int64)
+    mz = cadenas.z[:, 0].astype(np.int64)
+    if ((mx | mz) >> n).any():
+        raise ValueError(f"Las cadenas actúan sobre más qubits de los {n} del estado")
+
+    indices = np.arange(psi.shape[1], dtype=np.int64)
+    sumas = np.empty((len(psi), len(cadenas)), dtype=complex)
+    mascaras_x, grupos = np.unique(mx, return_inverse=True)
+    for g, x in enumerate(mascaras_x):
+        miembros = np.flatnonzero(grupos == g)
+        f = np.conj(np.take(psi, indices ^ x, axis=1)) * psi
+        if len(miembros) > n:
+            sumas[:, miembros] = _walsh_hadamard(f)[:, mz[miembros]]
+            continue
+        filas = max(bloque // psi.shape[1], 1)
+        for inicio in range(0, len(miembros), filas):
+            parte = miembros[inicio:inicio + filas]
+            signos = 1.0 - 2.0 * _paridad(indices[None, :] & mz[parte, None])
+            sumas[:, parte] = f @ signos.T
+
+    # i^|x·z| hace hermítica la parte sin fase (su valor es real); i^fase va aparte
+    y = _popcount_filas(cadenas.x & cadenas.z)
+    valores = (sumas * 1j ** (y % 4)).real
+    if (cadenas.fase % 2).any():
+        valores = valores * 1j ** cadenas.fase
+    elif (cadenas.fase == 2).any():
+        valores = np.where(cadenas.fase == 2, -valores, valores)
+    return valores if es_lote else valores[0]
+
+
+def valor_esperado(estado, observable, coeficientes=None, memoria=None):
+    """
+    Valor esperado de una suma ponderada de cadenas de Pauli.
+
+    Args:
+        estado: Igual que en `valores_esperados`
+        observable: dict texto -> coeficiente ({"ZZ": 1.0, "XX": 0.5}), o
+            cadenas (CadenasPauli, texto o lista) junto con `coeficientes`
+        coeficientes: (M,) para un observable, o (K, M) para K observables
+            sobre las mismas cadenas (default: todos 1)
+        memoria: Valores de los parámetros si `estado` es un programa
+
+    Returns:
+        Escalar, (B,) para un lote de estados, o (..., K) con K observables
+    """
+    if isinstance(observable, dict):
+        observable, coeficientes = list(observable), list(observable.values())
+    valores = valores_esperados(estado, observable, memoria)
+    if coeficientes is None:
+        return valores.sum(axis=-1)
+    return valores @ np.asarray(coeficientes).T
+
+
+def _como_cadenas(observables):
+    """CadenasPauli a partir de un lote, un texto o una lista de textos."""
+    if isinstance(observables, CadenasPauli):
+        return observables
+    return CadenasPauli.desde_texto(observables)
+
+
+def _amplitudes(estado, num_qubits, memoria):
+    """Amplitudes como lote (B, 2^n) e indicación de si la entrada ya era un lote."""
+    if isinstance(estado, Circuito) or hasattr(estado, "instructions"):
+        circuito = estado if isinstance(estado, Circuito) else Circuito.desde_programa(estado)
+        n = max(circuito.num_qubits, num_qubits, 1)
+        psi = evolucionar(estado_base(n), circuito, memoria)
+        return psi, len(psi) > 1
+    amplitudes = getattr(estado, "amplitudes", estado)
+    psi = np.asarray(amplitudes)
+    if psi.shape[-1] & (psi.shape[-1] - 1):
+        raise ValueError(f"El número de amplitudes ({psi.shape[-1]}) no es una potencia de 2")
+    return np.atleast_2d(psi), psi.ndim == 2
+
+
+def _walsh_hadamard(f):
+    """Transformada de Walsh-Hadamard de cada fila: W[z] = Σ_k f[k] · (-1)^|k·z|."""
+    w = np.array(f, dtype=complex)
+    b, d = w.shape
+    paso = 1
+    while paso < d:
+        v = w.reshape(b, -1, 2, paso)
+        a = v[:, :, 0].copy()
+        v[:, :, 0] += v[:, :, 1]
+        v[:, :, 1] = a - v[:, :, 1]
+        paso *= 2
+    return w
@@ -0,0 +1,266 @@
+"""
+MÓDULO: qnc/pauli.py - Álgebra de cadenas de Pauli empaquetadas en bits
+
+RESUMEN:
+Los programas de S03 comprueban con la función de onda relaciones como
+ZX = iY. Con cadenas de Pauli de muchos qubits (XZIY...) no hace falta
+ninguna matriz: cada cadena se guarda como dos vectores de bits y una fase.
+
+REPRESENTACIÓN:
+    P = i^fase · P_0 ⊗ P_1 ⊗ ... ⊗ P_{n-1}
+
+    (x, z) = (0, 0) -> I    (1, 0) -> X    (0, 1) -> Z    (1, 1) -> Y
+
+Los bits x y z de todos los qubits se empaquetan en palabras uint64 (64
+qubits por palabra). `CadenasPauli` guarda un LOTE de N cadenas en arrays
+(N, palabras), así que todas las operaciones son vectorizadas sobre el lote
+y cuestan O(n / 64) por cadena:
+
+- Producto: x = x1 ⊕ x2, z = z1 ⊕ z2 y la fase se suma con la función g de
+  Aaronson-Gottesman, contando bits con máscaras (sin recorrer los qubits)
+- Conmutación: P1 y P2 conmutan si popcount(x1·z2 ⊕ z1·x2) es par
+- Comparación: igualdad de los bits y de la fase
+
+En el texto, el carácter j es el qubit j y se admite un prefijo de fase
+("+", "-", "i", "-i"): "ZX" es Z en el qubit 0 y X en el qubit 1.
+
+USO:
+    from qnc import CadenasPauli
+
+    z, x, y = CadenasPauli.desde_texto(["Z", "X", "Y"])
+    print(z * x == CadenasPauli.desde_texto(["iY"]))     # [ True]
+
+    a = CadenasPauli.aleatorias(5000, 300)
+    print(a.matriz_conmutacion(a).mean())
+"""
+
+import numpy as np
+
+
+if hasattr(np, "bitwise_count"):
+    def _popcount_filas(palabras):
+        """Número de bits a 1 de cada fila de un array (..., palabras) uint64."""
+        return np.bitwise_count(palabras).sum(axis=-1, dtype=np.int64)
+else:
+    _TABLA_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.int64)
+
+    def _popcount_filas(palabras):
+        """Número de bits a 1 de cada fila de un array (..., palabras) uint64."""
+        palabras = np.ascontiguousarray(palabras)
+        bytes_ = palabras.view(np.uint8).reshape(palabras.shape[:-1] + (-1,))
+        return _TABLA_POPCOUNT[bytes_].sum(axis=-1)
+
+
+def _suma_g(x1, z1, x2, z2):
+    """
+    Exponente de i que aparece al multiplicar P1 · P2 (suma sobre los qubits).
+
+    Por qubit, g vale +1 (ZX = iY, XY = iZ, YZ = iX), -1 (orden inverso) o 0.
+    Se separan los casos +1 y -1 en dos máscaras y se cuentan sus bits.
+    """
+    positivos = ((x1 & z1 & z2 & ~x2) | (x1 & ~z1 & z2 & x2) | (~x1 & z1 & x2 & ~z2))
+    negativos = ((x1 & z1 & x2 & ~z2) | (x1 & ~z1 & z2 & ~x2) | (~x1 & z1 & x2 & z2))
+    return _popcount_filas(positivos) - _popcount_filas(negativos)
+
+
+_LETRAS = {"I": (0, 0), "X": (1, 0), "Z": (0, 1), "Y": (1, 1)}
+_PREFIJOS = (("-i", 3), ("+i", 1), ("i", 1), ("-", 2), ("+", 0))
+_TEXTO_FASE = ("", "i", "-", "-i")
+
+
+# =============================================
+# CLASE CadenasPauli
+# =============================================
+class CadenasPauli:
+    """
+    Lote de N cadenas de Pauli de n qubits.
+
+    Atributos:
+        x, z: Arrays uint64 (N, palabras) con los bits de cada cadena
+        fase: Array uint8 (N,) con el exponente de i (0, 1, 2 o 3)
+        num_qubits: Número de qubits n
+    """
+
+    def __init__(self, x, z, fase, num_qubits):
+        self.x = x
+        self.z = z
+        self.fase = np.asarray(fase, dtype=np.uint8) % 4
+        self.num_qubits = num_qubits
+
+    # ---- construcción ----
+
+    @classmethod
+    def desde_bits(cls, x, z, fase=0):
+        """
+        Crea el lote a partir de arrays de bits (N, n) de valores 0/1.
+
+        Args:
+            x, z: Arrays (N, n) con los bits x y z de cada qubit
+            fase: Exponente de i de cada cadena (escalar o (N,))
+        """
+        x = np.atleast_2d(np.asarray(x, dtype=np.uint8))
+        z = np.atleast_2d(np.asarray(z, dtype=np.uint8))
+        n = x.shape[1]
+        fase = np.broadcast_to(np.asarray(fase, dtype=np.uint8), (len(x),))
+        return cls(_empaquetar(x), _empaquetar(z), fase.copy(), n)
+
+    @classmethod
+    def desde_texto(cls, textos, num_qubits=None):
+        """
+        Crea el lote a partir de textos como "XZ", "-iYY" o "IXI".
+
+        Args:
+            textos: Texto o lista de textos
+            num_qubits: Número de qubits (default: la longitud mayor)
+
+        Raises:
+            ValueError: Si aparece una letra que no es I, X, Y o Z
+        """
+        textos = [textos] if isinstance(textos, str) else list(textos)
+        fases, letras = [], []
+        for texto in textos:
+            texto = texto.strip()
+            fase = 0
+            for prefijo, valor in _PREFIJOS:
+                if texto.startswith(prefijo):
+                    texto, fase = texto[len(prefijo):], valor
+                    break
+            fases.append(fase)
+            letras.append(texto.upper())
+        n = max((len(t) for t in letras), default=0) if num_qubits is None else num_qubits
+
+        x = np.zeros((len(textos), n), dtype=np.uint8)
+        z = np.zeros((len(textos), n), dtype=np.uint8)
+        for i, texto in enumerate(letras):
+            for q, letra in enumerate(texto):
+                if letra not in _LETRAS:
+                    raise ValueError(f"Letra de Pauli no válida: {letra!r}")
+                x[i, q], z[i, q] = _LETRAS[letra]
+        return cls.desde_bits(x, z, fases)
+
+    @classmethod
+    def aleatorias(cls, cantidad, num_qubits, rng=None):
+        """Lote de cadenas aleatorias con fase +1 (útil para pruebas y medidas de rendimiento)."""
+        rng = np.random.default_rng() if rng is None else rng
+        bits = rng.integers(0, 2, size=(2, cantidad, num_qubits), dtype=np.uint8)
+        return cls.desde_bits(bits[0], bits[1])
+
+    # ---- álgebra ----
+
+    def __mul__(self, otro):
+        """
+        Producto elemento a elemento (con broadcasting de lotes de tamaño 1).
+
+        Returns:
+            CadenasPauli: self[i] · otro[i] con su fase
+        """
+        self._comprobar(otro)
+        g = _suma_g(self.x, self.z, otro.x, otro.z)
+        fase = (self.fase.astype(np.int64) + otro.fase + g) % 4
+        return CadenasPauli(self.x ^ otro.x, self.z ^ otro.z, fase, self.num_qubits)
+
+    def conmutan(self, otro):
+        """Array bool (N,) que indica si self[i] y otro[i] conmutan."""
+        self._comprobar(otro)
+        return _popcount_filas((self.x & otro.z) ^ (self.z & otro.x)) % 2 == 0
+
+    def matriz_conmutacion(self, otro=None, bloque=256):
+        """
+        Conmutación de todos los pares.
+
+        Args:
+            otro: Segundo lote (default: el propio lote)
+            bloque: Filas de self procesadas a la vez (limita la memoria)
+
+        Returns:
+            np.ndarray: Array bool (N, M) con True si self[i] y otro[j] conmutan
+        """
+        otro = self if otro is None else otro
+        self._comprobar(otro)
+        resultado = np.empty((len(self), len(otro)), dtype=bool)
+        for inicio in range(0, len(self), bloque):
+            x = self.x[inicio:inicio + bloque, None, :]
+            z = self.z[inicio:inicio + bloque, None, :]
+            # Solo importa la paridad: se combinan las palabras con XOR antes de contar
+            simplectico = np.bitwise_xor.reduce((x & otro.z[None]) ^ (z & otro.x[None]), axis=-1)
+            resultado[inicio:inicio + bloque] = _popcount_filas(simplectico[..., None]) % 2 == 0
+        return resultado
+
+    def __eq__(self, otro):
+        """Array bool (N,) con la igualdad exacta (bits y fase) de cada cadena."""
+        if not isinstance(otro, CadenasPauli):
+            return NotImplemented
+        self._comprobar(otro)
+        return ((self.x == otro.x).all(axis=-1) & (self.z == otro.z).all(axis=-1)
+                & (self.fase == otro.fase))
+
+    def iguales_salvo_fase(self, otro):
+        """Array bool (N,) con la igualdad de los operadores sin tener en cuenta la fase."""
+        self._comprobar(otro)
+        return (self.x == otro.x).all(axis=-1) & (self.z == otro.z).all(axis=-1)
+
+    def peso(self):
+        """Número de qubits sin identidad de cada cadena."""
+        return _popcount_filas(self.x | self.z)
+
+    # ---- conversión ----
+
+    def a_texto(self):
+        """Lista de textos con el mismo formato que `desde_texto`."""
+        x, z = self._bits()
+        letras = np.array(["I", "X", "Z", "Y"])[x + 2 * z]
+        return [_TEXTO_FASE[f] + "".join(fila) for f, fila in zip(self.fase, letras)]
+
+    def matriz(self, i=0):
+        """
+        Matriz densa (2^n, 2^n) de la cadena i, con el qubit 0 como bit menos
+        significativo (mismo orden que `qnc.estado`). Solo para n pequeño.
+        """
+        paulis = {(0, 0): np.eye(2), (1, 0): np.array([[0, 1], [1, 0]]),
+                  (0, 1): np.diag([1, -1]), (1, 1): np.array([[0, -1j], [1j, 0]])}
+        x, z = self._bits(i)
+        m = np.ones((1, 1), dtype=complex)
+        for q in range(self.num_qubits):
+            m = np.kron(paulis[(int(x[q]), int(z[q]))], m)
+        return 1j ** int(self.fase[i]) * m
+
+    def _bits(self, i=None):
+        """Bits (N, n) desempaquetados (o (n,) de la cadena i)."""
+        x, z = (self.x, self.z) if i is None else (self.x[i:i + 1], self.z[i:i + 1])
+        x, z = _desempaquetar(x, self.num_qubits), _desempaquetar(z, self.num_qubits)
+        return (x, z) if i is None else (x[0], z[0])
+
+    def _comprobar(self, otro):
+        if self.num_qubits != otro.num_qubits:
+            raise ValueError(f"Cadenas de {self.num_qubits} y {otro.num_qubits} qubits")
+
+    def __len__(self):
+        return len(self.x)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, (int, np.integer)):
+            indice = slice(indice, indice + 1 or None)
+        return CadenasPauli(self.x[indice], self.z[indice], self.fase[indice], self.num_qubits)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self):
+        textos = self.a_texto() if len(self) <= 8 else self[:8].a_texto() + ["..."]
+        return f"CadenasPauli({len(self)} x {self.num_qubits} qubits: {', '.join(textos)})"
+
+
+def _empaquetar(bits):
+    """Bits (N, n) -> palabras uint64 (N, ceil(n / 64)), qubit q en el bit q % 64."""
+    n = bits.shape[1]
+    palabras = max((n + 63) // 64, 1)
+    relleno = np.zeros((len(bits), palabras * 64), dtype=np.uint8)
+    relleno[:, :n] = bits
+    return np.packbits(relleno, axis=1, bitorder="little").view("<u8").astype(np.uint64)
+
+
+def _desempaquetar(palabras, n):
+    """Palabras uint64 (N, W) -> bits (N, n) como enteros."""
+    bytes_ = np.ascontiguousarray(palabras).astype("<u8").view(np.uint8)
+    return np.unpackbits(bytes_, axis=1, count=n, bitorder="little").astype(np.int64)
@@ -0,0 +1,154 @@
+"""
+MÓDULO: qnc/por_bloques.py - Ejecución de experimentos enormes por bloques de shots
+
+RESUMEN:
+Con `wrap_in_numshots_loop(n)` la QVM devuelve los n shots en una única
+respuesta, y el análisis no puede empezar hasta que llega entera. Con 10^9
+shots esa respuesta ni siquiera cabe en memoria. Este módulo divide la
+petición en bloques cuyo tamaño se calcula a partir de un presupuesto de
+memoria y los va entregando a medida que llegan.
+
+FUNCIONAMIENTO:
+1. El programa se compila UNA vez
+2. Se calcula cuántos shots caben en el presupuesto: cada shot ocupa 8 bytes
+   (int64) por bit de los registros de lectura, y hay tres bloques vivos a la
+   vez (dos sin solapamiento)
+3. Mientras el programa que llama analiza el bloque actual, un hilo ya está
+   ejecutando el siguiente (la espera de red o de simulación se solapa con el
+   análisis)
+4. La memoria usada es constante: como mucho están vivos el bloque que el
+   programa que llama aún conserva, el que se le acaba de entregar y el que
+   se está ejecutando (sin solapar, solo los dos primeros)
+
+USO:
+    from qnc import ejecutar_por_bloques, recuento_cara_cruz
+
+    cara = cruz = 0
+    for bloque in ejecutar_por_bloques(qvm, prog, 10**9):
+        c, x = recuento_cara_cruz(bloque["ro"])
+        cara += c
+        cruz += x
+
+    # o directamente:
+    histograma = histograma_por_bloques(qvm, prog, 10**9)
+    cara, cruz = recuento_por_bloques(qvm, prog, 10**9)
+
+Demostraciones (motores locales, sin Docker):
+    python -m qnc.demos.bell_por_bloques 1e9        # S01P02 del catálogo
+    python -m qnc.demos.monedas_por_bloques 1e9     # S02P02A del catálogo
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .analisis import histograma, recuento_cara_cruz
+from .circuito import Circuito
+from .muestreo import TIPOS_LECTURA
+
+
+MEMORIA_POR_DEFECTO = 256 * 1024 * 1024
+
+
+def shots_por_bloque(programa, memoria_max=MEMORIA_POR_DEFECTO, bloques_en_vuelo=3):
+    """
+    Calcula cuántos shots caben en un bloque con el presupuesto de memoria.
+
+    Args:
+        programa: Program de PyQuil
+        memoria_max: Presupuesto de memoria en bytes para los bloques vivos
+        bloques_en_vuelo: Número de bloques que existen a la vez (3 con
+            `ejecutar_por_bloques(..., solapar=True)`, 2 sin solapar)
+
+    Returns:
+        int: Shots por bloque (al menos 1)
+    """
+    bits = sum(tamano for tipo, tamano in _declaraciones(programa).values()
+               if tipo in TIPOS_LECTURA)
+    bytes_por_shot = 8 * max(bits, 1)
+    return max(memoria_max // (bytes_por_shot * bloques_en_vuelo), 1)
+
+
+def ejecutar_por_bloques(qc, programa, shots_totales, memoria_max=MEMORIA_POR_DEFECTO,
+                         memory_map=None, compilar=True, solapar=True):
+    """
+    Ejecuta `shots_totales` shots de un programa entregándolos por bloques.
+
+    Args:
+        qc: QuantumComputer de PyQuil o motor de qnc (cualquier objeto con
+            `compile` y `run`)
+        programa: Program de PyQuil (se ignora su `num_shots`)
+        shots_totales: Número total de shots
+        memoria_max: Presupuesto de memoria en bytes para los bloques vivos
+        memory_map: Valores de los parámetros, como en `QuantumComputer.run`
+        compilar: Si es False, `programa` ya es un ejecutable compilado
+        solapar: Si es True, el bloque siguiente se ejecuta en otro hilo
+            mientras se procesa el actual
+
+    Yields:
+        dict: registro -> array (shots del bloque, tamaño del registro)
+    """
+    ejecutable = qc.compile(programa) if compilar else programa
+    tamano = shots_por_bloque(programa, memoria_max, 3 if solapar else 2)
+    tamanos = [min(tamano, shots_totales - inicio) for inicio in range(0, shots_totales, tamano)]
+
+    def ejecutar(n):
+        bloque = ejecutable.copy().wrap_in_numshots_loop(n)
+        datos = qc.run(bloque, memory_map).get_register_map()
+        return {k: v for k, v in datos.items() if v is not None}
+
+    if not solapar:
+        for n in tamanos:
+            yield ejecutar(n)
+        return
+
+    if not tamanos:
+        return
+    with ThreadPoolExecutor(max_workers=1) as hilo:
+        pendiente = hilo.submit(ejecutar, tamanos[0])
+        for siguiente in tamanos[1:] + [None]:
+            actual = pendiente.result()
+            # Se lanza el bloque siguiente antes de entregar el actual: mientras
+            # se ejecuta, el que llama aún conserva el anterior (tres vivos)
+            pendiente = hilo.submit(ejecutar, siguiente) if siguiente else None
+            yield actual
+
+
+def histograma_por_bloques(qc, programa, shots_totales, registro="ro",
+                           memoria_max=MEMORIA_POR_DEFECTO, memory_map=None):
+    """
+    Histograma de resultados de un experimento ejecutado por bloques.
+
+    Returns:
+        np.ndarray: Array (2^bits,) con el número de shots de cada resultado
+            (ver `qnc.analisis.histograma`)
+    """
+    total = None
+    for bloque in ejecutar_por_bloques(qc, programa, shots_totales, memoria_max, memory_map):
+        parcial = histograma(bloque[registro])
+        total = parcial if total is None else total + parcial
+    return total
+
+
+def recuento_por_bloques(qc, programa, shots_totales, registro="ro",
+                         memoria_max=MEMORIA_POR_DEFECTO, memory_map=None):
+    """
+    Caras (0) y cruces (1) de un experimento de monedas ejecutado por bloques.
+
+    Es el recuento de S02P01A, S02P02A y S02P02B (ver
+    `qnc.analisis.recuento_cara_cruz`) sin tener todos los shots en memoria.
+
+    Returns:
+        tuple: (cara, cruz) como enteros de Python
+    """
+    cara = cruz = 0
+    for bloque in ejecutar_por_bloques(qc, programa, shots_totales, memoria_max, memory_map):
+        c, x = recuento_cara_cruz(bloque[registro])
+        cara += c
+        cruz += x
+    return cara, cruz
+
+
+def _declaraciones(programa):
+    """dict nombre -> (tipo, tamaño) de la memoria declarada en el programa."""
+    if isinstance(programa, Circuito):
+        return programa.declaraciones
+    return {d.name: (d.memory_type, d.memory_size) for d in programa.declarations.values()}
@@ -0,0 +1,153 @@
+"""
+MÓDULO: qnc/precision.py - Simulación en complex64 y control del error numérico
+
+RESUMEN:
+Un vector de estado en complex64 ocupa la mitad de memoria que en complex128
+y se recorre el doble de rápido, a cambio de unos 7 dígitos de precisión en
+lugar de 16. Para los circuitos de las prácticas es más que suficiente, pero
+conviene medirlo. Este módulo ofrece:
+
+- SimuladorFuncionOnda: sustituto local de `WavefunctionSimulator` con
+  `wavefunction(prog)` en la precisión elegida. Guarda la deriva de la norma
+  |‖ψ‖ - 1| de cada llamada y, si se pide, renormaliza el resultado
+- comparar_precision: ejecuta los circuitos de referencia de S03/S04 (y uno
+  de varios qubits con todas las puertas de S01-S04) en complex64 y en
+  complex128, y devuelve el error máximo de amplitud y la deriva de la norma
+
+USO:
+    from qnc import SimuladorFuncionOnda, comparar_precision
+
+    qvm = SimuladorFuncionOnda(precision="complex64")
+    result = qvm.wavefunction(prog)          # igual que en S03/S04
+    print(result, qvm.deriva_maxima)
+
+    print(comparar_precision().resumen())
+"""
+
+import math
+
+import numpy as np
+from pyquil import Program
+from pyquil.gates import I, PHASE, RX, RY, RZ, S, T, X, Y, Z
+
+try:
+    from pyquil._wavefunction import Wavefunction
+except ImportError:         # pyquil 3.x
+    from pyquil.wavefunction import Wavefunction
+
+from .circuito import Circuito
+from .estado import deriva_norma, estado_base, evolucionar
+from .hilos import circuito_referencia
+
+
+PRECISIONES = ("complex128", "complex64")
+
+
+class SimuladorFuncionOnda:
+    """
+    Sustituto local de `WavefunctionSimulator` con precisión configurable.
+
+    Atributos:
+        dtype: Tipo de las amplitudes
+        renormalizar: Si es True, el resultado se divide por su norma
+        ultima_deriva: |‖ψ‖ - 1| de la última llamada (antes de renormalizar)
+        deriva_maxima: Máxima deriva observada desde que se creó el simulador
+    """
+
+    def __init__(self, precision="complex128", renormalizar=False):
+        if precision not in PRECISIONES:
+            raise ValueError(f"Precisión no soportada: {precision} (usa {' o '.join(PRECISIONES)})")
+        self.dtype = np.dtype(precision)
+        self.renormalizar = renormalizar
+        self.ultima_deriva = 0.0
+        self.deriva_maxima = 0.0
+
+    def amplitudes(self, programa, memory_map=None):
+        """Vector de amplitudes (2^n,) del estado final, en la precisión elegida."""
+        circuito = programa if isinstance(programa, Circuito) else Circuito.desde_programa(programa)
+        psi = evolucionar(estado_base(max(circuito.num_qubits, 1), dtype=self.dtype),
+                          circuito, memory_map or None)[0]
+        self.ultima_deriva = float(deriva_norma(psi))
+        self.deriva_maxima = max(self.deriva_maxima, self.ultima_deriva)
+        if self.renormalizar:
+            psi = psi / np.linalg.norm(psi).astype(psi.real.dtype)
+        return psi
+
+    def wavefunction(self, programa, memory_map=None):
+        """
+        Igual que `WavefunctionSimulator.wavefunction`: devuelve un
+        `Wavefunction` de PyQuil que se imprime como (1+0j)|1⟩.
+        """
+        return Wavefunction(self.amplitudes(programa, memory_map))
+
+
+# =============================================
+# CIRCUITOS DE REFERENCIA Y COMPARACIÓN
+# =============================================
+def circuitos_referencia():
+    """
+    dict nombre -> Program con los circuitos de S03 y S04 (cada puerta sobre
+    |0⟩ y sobre |1⟩) y un circuito de 12 qubits con las puertas de S01-S04.
+    """
+    circuitos = {}
+    puertas = {"X": X(0), "Y": Y(0), "Z": Z(0), "PHASE(π/4)": PHASE(math.pi / 4, 0),
+               "S": S(0), "T": T(0), "RX(π/2)": RX(math.pi / 2, 0),
+               "RY(π/2)": RY(math.pi / 2, 0), "RZ(π/2)": RZ(math.pi / 2, 0)}
+    for nombre, puerta in puertas.items():
+        circuitos[f"{nombre}|0⟩"] = Program(I(0), puerta)
+        circuitos[f"{nombre}|1⟩"] = Program(I(0), X(0), puerta)
+    circuitos["ZX = iY"] = Program(I(0), Z(0), X(0))
+    circuitos["S01-S04, 12 qubits × 20 capas"] = circuito_referencia(12, capas=20)
+    return circuitos
+
+
+class InformePrecision:
+    """
+    Errores de complex64 respecto a complex128.
+
+    Atributos:
+        filas: Lista de dicts con nombre, qubits, puertas, error_maximo,
+            deriva64 y deriva128
+    """
+
+    def __init__(self, filas):
+        self.filas = filas
+
+    @property
+    def error_maximo(self):
+        """Mayor error de amplitud de todos los circuitos."""
+        return max((f["error_maximo"] for f in self.filas), default=0.0)
+
+    def resumen(self):
+        """Tabla de texto con los errores de cada circuito."""
+        lineas = [f"{'Circuito':<32} {'Qubits':>6} {'Puertas':>8} {'Error máx.':>11} "
+                  f"{'Deriva c64':>11} {'Deriva c128':>12}"]
+        for f in self.filas:
+            lineas.append(f"{f['nombre']:<32} {f['qubits']:>6} {f['puertas']:>8} "
+                          f"{f['error_maximo']:>11.2e} {f['deriva64']:>11.2e} {f['deriva128']:>12.2e}")
+        lineas.append(f"Error máximo de amplitud: {self.error_maximo:.2e}")
+        return "\n".join(lineas)
+
+
+def comparar_precision(programas=None):
+    """
+    Ejecuta cada programa en complex64 y complex128 y compara los resultados.
+
+    Args:
+        programas: dict nombre -> Program (default: `circuitos_referencia()`)
+
+    Returns:
+        InformePrecision
+    """
+    programas = circuitos_referencia() if programas is None else programas
+    simple, doble = SimuladorFuncionOnda("complex64"), SimuladorFuncionOnda("complex128")
+    filas = []
+    for nombre, programa in programas.items():
+        circuito = Circuito.desde_programa(programa)
+        psi64 = simple.amplitudes(circuito)
+        psi128 = doble.amplitudes(circuito)
+        filas.append({"nombre": nombre, "qubits": circuito.num_qubits,
+                      "puertas": len(circuito.operaciones),
+                      "error_maximo": float(np.max(np.abs(psi64.astype(complex) - psi128))),
+                      "deriva64": simple.ultima_deriva, "deriva128": doble.ultima_deriva})
+    return InformePrecision(filas)
@@ -0,0 +1,146 @@
+"""
+MÓDULO: qnc/producto.py - Motor de estados producto (qubits independientes)
+
+RESUMEN:
+Las monedas de S02 (H en cada qubit) y la ruleta de S05 (6 qubits con H)
+no tienen ninguna puerta de dos qubits: cada qubit evoluciona por separado y
+el estado completo es un producto de estados de un qubit. Para estos
+circuitos no hace falta un vector de 2^n amplitudes ni un tableau:
+
+1. Cada qubit es un vector de 2 amplitudes al que se le aplican sus puertas
+2. P(1) de cada qubit medido = |amplitud de |1⟩|²
+3. Los shots de cada qubit se generan con UNA extracción de Bernoulli
+   vectorizada: `rng.random(shots) < P(1)`
+
+El coste es O(qubits · shots), sin límite en el número de qubits, y el
+resultado tiene la misma forma que `readout_data` de la QVM.
+
+REQUISITOS:
+- Ninguna puerta actúa sobre más de un qubit
+- Mediciones terminales (medir varias veces el mismo qubit al final da
+  siempre el mismo bit)
+
+USO:
+    from qnc import QVMProducto
+
+    qvm = QVMProducto()
+    result = qvm.run(qvm.compile(prog)).readout_data['ro']
+"""
+
+import numpy as np
+
+from .circuito import Circuito
+from .muestreo import _registros_vacios, mediciones_terminales
+from .resultados import ResultadoEjecucion
+
+
+def es_producto(circuito):
+    """Indica si el circuito no tiene puertas multiqubit y sus mediciones son terminales."""
+    return (all(len(op.qubits) == 1 for op in circuito.operaciones)
+            and mediciones_terminales(circuito))
+
+
+def estados_qubits(circuito, memoria=None):
+    """
+    Evoluciona cada qubit por separado.
+
+    Args:
+        circuito: Circuito sin puertas multiqubit
+        memoria: Valores de los parámetros (formato `memory_map` de PyQuil)
+
+    Returns:
+        dict: qubit -> vector (2,) complejo con su estado final
+    """
+    estados = {}
+    for op in circuito.operaciones:
+        q, = op.qubits
+        u = op.matriz(memoria)
+        if u.ndim != 2:
+            raise ValueError("El motor de estados producto no admite parámetros por lotes")
+        estados[q] = u @ estados.get(q, np.array([1, 0], dtype=complex))
+    return estados
+
+
+def muestrear_producto(circuito, shots=None, memoria=None, rng=None):
+    """
+    Genera todos los shots de un circuito de estados producto.
+
+    Args:
+        circuito: Circuito de `qnc.circuito`
+        shots: Número de shots (default: `circuito.num_shots`)
+        memoria: Valores de los parámetros (formato `memory_map` de PyQuil)
+        rng: np.random.Generator (default: uno nuevo sin semilla)
+
+    Returns:
+        dict: registro -> array int64 de forma (shots, tamaño del registro)
+
+    Raises:
+        ValueError: Si el circuito tiene puertas multiqubit o mediciones intermedias
+    """
+    if not es_producto(circuito):
+        raise ValueError("El circuito no es un estado producto con mediciones terminales")
+    shots = circuito.num_shots if shots is None else shots
+    rng = np.random.default_rng() if rng is None else rng
+
+    registros = _registros_vacios(circuito, shots)
+    estados = estados_qubits(circuito, memoria)
+
+    bits = {}
+    for m in circuito.mediciones:
+        if m.qubit not in bits:
+            psi = estados.get(m.qubit)
+            p1 = 0.0 if psi is None else abs(psi[1]) ** 2 / np.vdot(psi, psi).real
+            bits[m.qubit] = rng.random(shots) < p1
+        if m.registro is not None:
+            registros[m.registro][:, m.indice] = bits[m.qubit]
+    return registros
+
+
+# =============================================
+# CLASE QVMProducto
+# =============================================
+class QVMProducto:
+    """
+    Sustituto local de `get_qc(...)` para circuitos sin puertas multiqubit.
+
+    Ofrece los mismos métodos `compile` y `run` que `QuantumComputer`.
+    """
+
+    def __init__(self, respaldo=None, semilla=None):
+        """
+        Args:
+            respaldo: QuantumComputer de PyQuil para los circuitos no soportados
+            semilla: Semilla del generador aleatorio (para resultados reproducibles)
+        """
+        self.respaldo = respaldo
+        self.rng = np.random.default_rng(semilla)
+
+    def compile(self, programa, to_native_gates=True, optimize=True, *, protoquil=None):
+        """
+        No necesita compilar a puertas nativas: devuelve el mismo programa.
+        Solo se compila con quilc si hay que usar el respaldo.
+        """
+        if self.respaldo is not None and not self._es_local(programa):
+            return self.respaldo.compile(programa, to_native_gates, optimize,
+                                         protoquil=protoquil)
+        return programa
+
+    def run(self, ejecutable, memory_map=None):
+        """
+        Ejecuta todos los shots del programa.
+
+        Returns:
+            ResultadoEjecucion: Resultado con `readout_data` y `get_register_map()`
+        """
+        if self.respaldo is not None and not self._es_local(ejecutable):
+            return self.respaldo.run(ejecutable, memory_map or None)
+        circuito = Circuito.desde_programa(ejecutable)
+        registros = muestrear_producto(circuito, memoria=memory_map or None, rng=self.rng)
+        return ResultadoEjecucion(registros, motor="producto")
+
+    @staticmethod
+    def _es_local(programa):
+        try:
+            return es_producto(Circuito.desde_programa(programa))
+        except ValueError:
+            return False
@@ -0,0 +1,179 @@
+"""
+MÓDULO: qnc/propagacion.py - Propagación de muchos estados iniciales a la vez
+
+RESUMEN:
+Los programas de S03 y S04 van por parejas A/B (`S03P01A` / `S03P01B`,
+`S04P03A` / `S04P03B`...) que solo se diferencian en preparar |0⟩ o |1⟩
+antes de la misma puerta, y cada uno construye y simula su circuito. Aquí el
+circuito se recorre UNA vez sobre una matriz de estados iniciales (una
+columna por estado) y se devuelven todos los estados finales juntos:
+
+    finales = propagar(Program(Y(0)), [0, 1])     # columnas Y|0⟩ y Y|1⟩
+
+FUNCIONAMIENTO:
+- Las columnas se guardan como matriz (2^n, K), vista como un tensor
+  (2,)*n + (K,): el último eje, contiguo, abarca todas las columnas, así que
+  con miles de columnas cada puerta son unas pocas operaciones de NumPy
+  sobre arrays largos
+- Las puertas de 1 qubit, CNOT, CZ, CPHASE y SWAP se aplican en el sitio
+  sobre vistas de las mitades con el objetivo a 0 y a 1 (y el control a 1),
+  con los mismos núcleos que `qnc.vector_disco` y `qnc.hilos`; el resto de
+  puertas de varios qubits, con `np.tensordot`
+- Si hay muchas más columnas que amplitudes y el circuito es largo, sale más
+  barato calcular la unitaria U (propagando la identidad) y multiplicar
+  U @ estados. `metodo=None` elige según el número de operaciones
+  (hasta `MAX_QUBITS_UNITARIA` qubits)
+- Las columnas se procesan por bloques de `bloque` columnas: todas las
+  puertas se aplican a un bloque mientras está en la caché
+
+USO:
+    from qnc import propagar
+
+    estados = rng.standard_normal((2 ** 10, 5000)) + 0j   # 5000 columnas
+    finales = propagar(prog, estados)                      # (1024, 5000)
+"""
+
+import numpy as np
+
+from .circuito import Circuito
+from .vector_disco import _X, _combinar
+
+
+ELEMENTOS_POR_BLOQUE = 1 << 16
+MAX_QUBITS_UNITARIA = 12
+# Un producto matricial (BLAS) hace unas 8 veces más operaciones por segundo
+# que los núcleos elemento a elemento
+FACTOR_BLAS = 8
+
+
+def propagar(programa, estados, memoria=None, metodo=None, bloque=None):
+    """
+    Aplica un circuito a cada columna de una matriz de estados.
+
+    Args:
+        programa: Program de PyQuil o Circuito (las mediciones terminales se
+            ignoran)
+        estados: Matriz (2^n, K) con un estado inicial por columna, vector
+            (2^n,), o lista de índices de la base computacional ([0, 1] son
+            |0...0⟩ y |0...1⟩)
+        memoria: Valores de los parámetros (formato `memory_map`, escalares)
+        metodo: "columnas", "unitaria" o None para elegir automáticamente
+        bloque: Columnas procesadas a la vez (default: ~64K amplitudes, 1 MB,
+            por bloque, para que cada bloque quede en la caché)
+
+    Returns:
+        np.ndarray: Estados finales con la misma forma que `estados`
+            ((2^n, K) si se pasaron índices)
+
+    Raises:
+        ValueError: Si los estados tienen menos amplitudes que el circuito,
+            algún parámetro llega como lote o hay mediciones intermedias
+    """
+    circuito = programa if isinstance(programa, Circuito) else Circuito.desde_programa(programa)
+    psi, es_vector = _columnas(estados, max(circuito.num_qubits, 1))
+    dimension, columnas = psi.shape
+    n = dimension.bit_length() - 1
+    if dimension < 2 ** circuito.num_qubits:
+        raise ValueError(f"Los estados tienen {dimension} amplitudes y el circuito "
+                         f"necesita {2 ** circuito.num_qubits}")
+
+    puertas = []
+    for op in circuito.unitarias:
+        if op.nombre == "I":
+            continue
+        u = op.matriz(memoria)
+        if u.ndim != 2:
+            raise ValueError(f"{op.nombre}: los parámetros por lotes no están soportados "
+                             f"(usa qnc.barrido)")
+        puertas.append((op.nombre, u.astype(psi.dtype, copy=False), op.qubits))
+
+    if metodo is None:
+        # Coste aproximado: G·2^n·K por columnas frente a 2^n·(G·2^n + 2^n·K) con la unitaria
+        g = len(puertas)
+        metodo = ("unitaria" if n <= MAX_QUBITS_UNITARIA
+                  and dimension * (g + columnas) < FACTOR_BLAS * g * columnas else "columnas")
+    bloque = bloque or max(ELEMENTOS_POR_BLOQUE // dimension, 1)
+    if metodo == "unitaria":
+        u = _por_bloques(np.eye(dimension, dtype=psi.dtype), puertas, n, bloque)
+        finales = u @ psi
+    elif metodo == "columnas":
+        finales = _por_bloques(psi, puertas, n, bloque)
+    else:
+        raise ValueError(f"Método desconocido: {metodo!r} (usa 'columnas' o 'unitaria')")
+    return finales[:, 0] if es_vector else finales
+
+
+def matriz_unitaria(programa, memoria=None):
+    """Matriz unitaria (2^n, 2^n) del circuito, con el orden de amplitudes de PyQuil."""
+    circuito = programa if isinstance(programa, Circuito) else Circuito.desde_programa(programa)
+    return propagar(circuito, np.eye(2 ** max(circuito.num_qubits, 1), dtype=complex),
+                    memoria, metodo="columnas")
+
+
+def _columnas(estados, num_qubits):
+    """Matriz (2^n, K) compleja contigua e indicación de si la entrada era un vector."""
+    if isinstance(estados, (list, tuple, range)) and all(np.ndim(e) == 0 for e in estados):
+        psi = np.zeros((2 ** num_qubits, len(estados)), dtype=complex)
+        psi[list(estados), np.arange(len(estados))] = 1
+        return psi, False
+    psi = np.asarray(estados)
+    if not np.iscomplexobj(psi):
+        psi = psi.astype(complex)
+    es_vector = psi.ndim == 1
+    psi = np.ascontiguousarray(psi.reshape(len(psi), -1))
+    if len(psi) & (len(psi) - 1):
+        raise ValueError(f"El número de amplitudes ({len(psi)}) no es una potencia de 2")
+    return psi, es_vector
+
+
+def _por_bloques(psi, puertas, n, bloque):
+    """Copia de psi (2^n, K) con las puertas aplicadas, bloque a bloque de columnas."""
+    if bloque >= psi.shape[1]:
+        return _propagar_columnas(psi.copy(), puertas, n)
+    finales = np.empty_like(psi)
+    for inicio in range(0, psi.shape[1], bloque):
+        finales[:, inicio:inicio + bloque] = _propagar_columnas(
+            psi[:, inicio:inicio + bloque].copy(), puertas, n)
+    return finales
+
+
+def _propagar_columnas(psi, puertas, n):
+    """Aplica la lista de (nombre, matriz, qubits) a la matriz de columnas (2^n, K) en el sitio."""
+    for nombre, u, qubits in puertas:
+        if len(qubits) == 1:
+            _combinar(*_mitades_columnas(psi, n, qubits[0]), u)
+        elif nombre == "CNOT":
+            _combinar(*_mitades_columnas(psi, n, qubits[1], qubits[0]), _X)
+        elif nombre in ("CZ", "CPHASE"):
+            _mitades_columnas(psi, n, qubits[1], qubits[0])[1][...] *= u[3, 3]
+        elif nombre == "SWAP":
+            for control, objetivo in ((qubits[0], qubits[1]), (qubits[1], qubits[0]),
+                                      (qubits[0], qubits[1])):
+                _combinar(*_mitades_columnas(psi, n, objetivo, control), _X)
+        else:
+            psi[...] = _aplicar_tensordot(psi, u, qubits, n)
+    return psi
+
+
+def _mitades_columnas(psi, n, objetivo, control=None):
+    """
+    Vistas (a, b) de las amplitudes con el objetivo a 0 y a 1 (y el control
+    a 1, si hay control). El qubit q es el eje n - 1 - q de (2,)*n + (K,).
+    """
+    t = psi.reshape((2,) * n + (-1,))
+    indice = [slice(None)] * (n + 1)
+    if control is not None:
+        indice[n - 1 - control] = 1
+    indice[n - 1 - objetivo] = 0
+    a = t[tuple(indice)]
+    indice[n - 1 - objetivo] = 1
+    return a, t[tuple(indice)]
+
+
+def _aplicar_tensordot(psi, u, qubits, n):
+    """Aplica una puerta (2^k, 2^k) general con `np.tensordot`; qubits[0] es el bit más significativo de u."""
+    k = len(qubits)
+    ejes = [n - 1 - q for q in qubits]
+    t = psi.reshape((2,) * n + (-1,))
+    salida = np.tensordot(u.reshape((2,) * 2 * k), t, axes=(list(range(k, 2 * k)), ejes))
+    return np.moveaxis(salida, list(range(k)), ejes).reshape(psi.shape)
@@ -0,0 +1,285 @@
+"""
+MÓDULO: qnc/puertas.py - Matrices de las puertas cuánticas soportadas
+
+RESUMEN:
+Define las matrices unitarias de las puertas usadas en las sesiones S01-S04
+(I, X, Y, Z, H, S, T, PHASE, RX, RY, RZ, CNOT, CZ, SWAP, CPHASE) siguiendo
+las mismas convenciones que PyQuil.
+
+CONVENCIONES:
+- Las puertas de 2 qubits se expresan en la base |q0 q1⟩, donde q0 es el primer
+  qubit de la instrucción (por ejemplo el control en CNOT) y es el bit más
+  significativo de la matriz 4×4.
+- Las puertas paramétricas aceptan un escalar o un array de ángulos. Con un
+  array de forma (B,) devuelven un lote de matrices de forma (B, d, d), lo que
+  permite evaluar miles de ángulos en una sola operación de NumPy.
+
+CACHÉ DE MATRICES:
+Las matrices se devuelven como arrays de SOLO LECTURA y contiguos, así que se
+pueden compartir sin copiarlas:
+- Las puertas fijas se calculan una vez al importar el módulo
+- Las paramétricas con un ángulo escalar se memorizan en `CACHE_MATRICES`,
+  una caché LRU con clave (nombre, ángulo). Un circuito que repite RX(π/2)
+  miles de veces, o un barrido que vuelve a los mismos ángulos, solo calcula
+  cada matriz una vez
+- Con `configurar_cache(cuantizacion=q)` el ángulo se redondea al múltiplo de
+  q más cercano antes de buscarlo (la matriz se calcula en el ángulo
+  redondeado, con un error de amplitud ≤ q/2). Sirve cuando los ángulos
+  vienen de cálculos en coma flotante que casi nunca coinciden exactamente
+- Los lotes de ángulos (arrays) no pasan por la caché
+
+`registrar_puerta` añade puertas nuevas al registro.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+# =============================================
+# PUERTAS FIJAS
+# =============================================
+# Matrices constantes: se calculan una sola vez al importar el módulo.
+
+_RAIZ_2 = 1 / np.sqrt(2)
+
+PUERTAS_FIJAS = {
+    "I": np.array([[1, 0], [0, 1]], dtype=complex),
+    "X": np.array([[0, 1], [1, 0]], dtype=complex),
+    "Y": np.array([[0, -1j], [1j, 0]], dtype=complex),
+    "Z": np.array([[1, 0], [0, -1]], dtype=complex),
+    "H": np.array([[1, 1], [1, -1]], dtype=complex) * _RAIZ_2,
+    "S": np.array([[1, 0], [0, 1j]], dtype=complex),
+    "T": np.array([[1, 0], [0, np.exp(1j * np.pi / 4)]], dtype=complex),
+    "CNOT": np.array([[1, 0, 0, 0],
+                      [0, 1, 0, 0],
+                      [0, 0, 0, 1],
+                      [0, 0, 1, 0]], dtype=complex),
+    "CZ": np.diag([1, 1, 1, -1]).astype(complex),
+    "SWAP": np.array([[1, 0, 0, 0],
+                      [0, 0, 1, 0],
+                      [0, 1, 0, 0],
+                      [0, 0, 0, 1]], dtype=complex),
+}
+
+
+def _solo_lectura(m):
+    """Copia contigua de la matriz marcada como no modificable."""
+    m = np.ascontiguousarray(m)
+    m.setflags(write=False)
+    return m
+
+
+PUERTAS_FIJAS = {nombre: _solo_lectura(m) for nombre, m in PUERTAS_FIJAS.items()}
+
+
+# =============================================
+# PUERTAS PARAMÉTRICAS
+# =============================================
+# Cada función recibe un ángulo (escalar o array) y devuelve una matriz con
+# forma theta.shape + (d, d).
+
+def phase(theta):
+    """PHASE(θ) = [[1, 0], [0, e^(iθ)]]"""
+    theta = np.asarray(theta, dtype=float)
+    m = np.zeros(theta.shape + (2, 2), dtype=complex)
+    m[..., 0, 0] = 1
+    m[..., 1, 1] = np.exp(1j * theta)
+    return m
+
+
+def rx(theta):
+    """RX(θ) = [[cos(θ/2), -i·sin(θ/2)], [-i·sin(θ/2), cos(θ/2)]]"""
+    theta = np.asarray(theta, dtype=float)
+    c = np.cos(theta / 2)
+    s = np.sin(theta / 2)
+    m = np.empty(theta.shape + (2, 2), dtype=complex)
+    m[..., 0, 0] = c
+    m[..., 0, 1] = -1j * s
+    m[..., 1, 0] = -1j * s
+    m[..., 1, 1] = c
+    return m
+
+
+def ry(theta):
+    """RY(θ) = [[cos(θ/2), -sin(θ/2)], [sin(θ/2), cos(θ/2)]]"""
+    theta = np.asarray(theta, dtype=float)
+    c = np.cos(theta / 2)
+    s = np.sin(theta / 2)
+    m = np.empty(theta.shape + (2, 2), dtype=complex)
+    m[..., 0, 0] = c
+    m[..., 0, 1] = -s
+    m[..., 1, 0] = s
+    m[..., 1, 1] = c
+    return m
+
+
+def rz(theta):
+    """RZ(θ) = [[e^(-iθ/2), 0], [0, e^(iθ/2)]]"""
+    theta = np.asarray(theta, dtype=float)
+    m = np.zeros(theta.shape + (2, 2), dtype=complex)
+    m[..., 0, 0] = np.exp(-0.5j * theta)
+    m[..., 1, 1] = np.exp(0.5j * theta)
+    return m
+
+
+def cphase(theta):
+    """CPHASE(θ) = diag(1, 1, 1, e^(iθ))"""
+    theta = np.asarray(theta, dtype=float)
+    m = np.zeros(theta.shape + (4, 4), dtype=complex)
+    m[..., 0, 0] = 1
+    m[..., 1, 1] = 1
+    m[..., 2, 2] = 1
+    m[..., 3, 3] = np.exp(1j * theta)
+    return m
+
+
+PUERTAS_PARAMETRICAS = {
+    "PHASE": phase,
+    "RX": rx,
+    "RY": ry,
+    "RZ": rz,
+    "CPHASE": cphase,
+}
+
+
+# =============================================
+# CACHÉ DE MATRICES PARAMÉTRICAS
+# =============================================
+class CacheMatrices:
+    """
+    Caché LRU de matrices de puertas paramétricas con clave (nombre, ángulo).
+
+    Atributos:
+        max_entradas: Número máximo de matrices guardadas
+        cuantizacion: Paso de redondeo de los ángulos (None: ángulo exacto)
+    """
+
+    def __init__(self, max_entradas=1024, cuantizacion=None):
+        self.max_entradas = max_entradas
+        self.cuantizacion = cuantizacion
+        self._entradas = OrderedDict()
+        self._cerrojo = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def obtener(self, nombre, theta):
+        """
+        Devuelve la matriz de solo lectura de la puerta `nombre` en el ángulo
+        escalar `theta`, calculándola si no está en la caché.
+        """
+        theta = float(theta)
+        if self.cuantizacion:
+            theta = round(theta / self.cuantizacion) * self.cuantizacion
+        clave = (nombre, theta)
+        with self._cerrojo:
+            m = self._entradas.get(clave)
+            if m is not None:
+                self._entradas.move_to_end(clave)
+                self.aciertos += 1
+                return m
+            self.fallos += 1
+
+        m = _solo_lectura(PUERTAS_PARAMETRICAS[nombre](theta))
+        with self._cerrojo:
+            self._entradas[clave] = m
+            while len(self._entradas) > self.max_entradas:
+                self._entradas.popitem(last=False)
+        return m
+
+    def limpiar(self):
+        """Vacía la caché y los contadores."""
+        with self._cerrojo:
+            self._entradas.clear()
+            self.aciertos = self.fallos = 0
+
+    def estadisticas(self):
+        """dict con aciertos, fallos, entradas y tasa de aciertos."""
+        with self._cerrojo:
+            total = self.aciertos + self.fallos
+            return {"aciertos": self.aciertos, "fallos": self.fallos,
+                    "entradas": len(self._entradas),
+                    "tasa_aciertos": self.aciertos / total if total else 0.0}
+
+
+CACHE_MATRICES = CacheMatrices()
+
+
+def configurar_cache(max_entradas=1024, cuantizacion=None):
+    """
+    Sustituye la caché global de matrices paramétricas.
+
+    Args:
+        max_entradas: Número máximo de matrices guardadas (0 desactiva la caché)
+        cuantizacion: Paso de redondeo de los ángulos en radianes (ej: 1e-9),
+            o None para usar el ángulo exacto como clave
+
+    Returns:
+        CacheMatrices: La caché nueva (o None si se desactiva)
+    """
+    global CACHE_MATRICES
+    CACHE_MATRICES = CacheMatrices(max_entradas, cuantizacion) if max_entradas else None
+    return CACHE_MATRICES
+
+
+# =============================================
+# REGISTRO DE PUERTAS
+# =============================================
+def registrar_puerta(nombre, definicion):
+    """
+    Añade una puerta al registro.
+
+    Args:
+        nombre: Nombre de la puerta en Quil
+        definicion: Matriz (d, d) para una puerta fija, o función
+            theta -> matriz con forma theta.shape + (d, d) para una paramétrica
+
+    Raises:
+        ValueError: Si la matriz no es cuadrada de dimensión potencia de 2
+    """
+    if callable(definicion):
+        PUERTAS_PARAMETRICAS[nombre] = definicion
+        PUERTAS_FIJAS.pop(nombre, None)
+        if CACHE_MATRICES is not None:
+            CACHE_MATRICES.limpiar()
+        return
+    m = np.asarray(definicion, dtype=complex)
+    d = m.shape[0]
+    if m.ndim != 2 or m.shape[1] != d or d < 2 or d & (d - 1):
+        raise ValueError(f"Matriz no válida para la puerta {nombre}: forma {m.shape}")
+    PUERTAS_FIJAS[nombre] = _solo_lectura(m)
+    PUERTAS_PARAMETRICAS.pop(nombre, None)
+
+
+def matriz_puerta(nombre, parametros=()):
+    """
+    Devuelve la matriz de una puerta a partir de su nombre y sus parámetros.
+
+    Args:
+        nombre: Nombre de la puerta en Quil (ej: "H", "RX", "CNOT")
+        parametros: Secuencia de ángulos ya evaluados (escalares o arrays)
+
+    Returns:
+        np.ndarray: Matriz (d, d) de solo lectura o lote de matrices (B, d, d)
+
+    Raises:
+        ValueError: Si la puerta no está soportada o faltan parámetros
+    """
+    if nombre in PUERTAS_FIJAS:
+        if parametros:
+            raise ValueError(f"La puerta {nombre} no admite parámetros")
+        return PUERTAS_FIJAS[nombre]
+    if nombre in PUERTAS_PARAMETRICAS:
+        if len(parametros) != 1:
+            raise ValueError(f"La puerta {nombre} necesita exactamente 1 parámetro")
+        theta = parametros[0]
+        if CACHE_MATRICES is not None and np.ndim(theta) == 0:
+            return CACHE_MATRICES.obtener(nombre, theta)
+        return PUERTAS_PARAMETRICAS[nombre](theta)
+    raise ValueError(f"Puerta no soportada: {nombre}")
+
+
+def es_soportada(nombre):
+    """Indica si una puerta tiene matriz definida en este módulo."""
+    return nombre in PUERTAS_FIJAS or nombre in PUERTAS_PARAMETRICAS
@@ -0,0 +1,33 @@
+"""
+MÓDULO: qnc/resultados.py - Resultado de ejecución compatible con PyQuil
+
+RESUMEN:
+Los programas de las sesiones leen los resultados de dos formas:
+    qvm.run(ejecutable).readout_data['ro']
+    qvm.run(ejecutable).get_register_map().get("ro")
+`ResultadoEjecucion` ofrece esa misma interfaz para que los motores locales
+de `qnc` puedan sustituir a `get_qc(...)` sin cambiar el código que analiza
+las mediciones.
+"""
+
+
+class ResultadoEjecucion:
+    """
+    Resultado de un `run` con la misma interfaz que `QAMExecutionResult`.
+
+    Atributos:
+        readout_data: dict registro -> array (shots, tamaño del registro)
+        motor: Nombre del motor que produjo el resultado (ej: "muestreo")
+    """
+
+    def __init__(self, registros, motor=""):
+        self.readout_data = dict(registros)
+        self.motor = motor
+
+    def get_register_map(self):
+        """Devuelve el dict registro -> array de mediciones (igual que PyQuil)."""
+        return self.readout_data
+
+    def __repr__(self):
+        formas = {k: v.shape for k, v in self.readout_data.items()}
+        return f"ResultadoEjecucion(motor={self.motor!r}, registros={formas})"
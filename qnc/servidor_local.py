@@ -0,0 +1,410 @@
+"""
+MÓDULO: qnc/servidor_local.py - Sustituto local de los servicios qvm y quilc
+
+RESUMEN:
+Para medir el comportamiento de los clientes (lotes, cachés, conexiones
+persistentes) contra la QVM y quilc hace falta Docker con las imágenes
+`rigetti/qvm` y `rigetti/quilc`. `ServidorLocal` levanta en el propio proceso
+dos servidores que hablan lo suficiente de sus protocolos para servir los
+programas de este repositorio:
+
+- QVM (HTTP + JSON, puerto 5000): peticiones `version`, `multishot`,
+  `multishot-measure`, `wavefunction` y `expectation`, resueltas con los
+  motores locales de qnc (`QVMAutomatica` y `SimuladorFuncionOnda`)
+- quilc (RPCQ sobre ZeroMQ, puerto 5555): `get_version_info` y
+  `quil_to_native_quil`. No traduce a puertas nativas: comprueba que el
+  programa se puede simular y lo devuelve tal cual (los motores locales
+  aceptan todas las puertas de `qnc.puertas`)
+
+Como escucha en los mismos puertos que docker-compose.yml, los scripts de
+S01-S05 funcionan sin cambios con el servidor en marcha.
+
+INYECCIÓN DE FALLOS:
+- `latencia_qvm` / `latencia_quilc`: segundos de espera añadidos a cada
+  petición, con una variación uniforme de ±`variacion` (fracción)
+- `error_qvm` / `error_quilc`: probabilidad de que una petición falle (HTTP
+  500 en la QVM, error RPC en quilc)
+- `arranque`: espera extra de la primera petición de cada servicio, como el
+  arranque en frío de los contenedores
+Las consultas de versión que hacen los clientes al conectarse no tienen
+esperas ni fallos. Las esperas no bloquean el servidor: varias peticiones
+esperan a la vez.
+
+LIMITACIONES:
+- El ruido (`gate-noise`, `measurement-noise`) se ignora
+- El `final_rewiring` de quilc es siempre la identidad
+
+USO:
+    from qnc import ServidorLocal
+
+    with ServidorLocal(latencia_qvm=0.005, error_qvm=0.01) as servidor:
+        qc = get_qc("9q-square-qvm")       # o GestorConexiones(url_qvm=servidor.url_qvm, ...)
+        result = qc.run(qc.compile(prog))
+        print(servidor.estadisticas())
+"""
+
+import asyncio
+import json
+import logging
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+from pyquil import Program
+from pyquil.quilbase import ClassicalMove
+
+from .circuito import Circuito
+from .despachador import QVMAutomatica
+from .precision import SimuladorFuncionOnda
+from .propagacion import propagar
+
+
+VERSION_QVM = "1.17.2 [qnc]"
+VERSION_QUILC = {"quilc": "1.23.0", "githash": "qnc"}
+
+
+class ErrorInyectado(RuntimeError):
+    """Fallo provocado a propósito por la tasa de error configurada."""
+
+
+# rpcq registra la traza de cada error de un manejador: los fallos inyectados no
+# son errores del servidor y llenarían la salida en las pruebas de carga
+logging.getLogger("rpcq._spec").addFilter(lambda registro: "ErrorInyectado" not in registro.getMessage())
+
+
+class ServidorLocal:
+    """
+    Servidores HTTP (QVM) y RPCQ (quilc) respaldados por los simuladores de qnc.
+
+    Atributos:
+        url_qvm, url_quilc: Direcciones en las que escuchan
+        peticiones: dict tipo de petición -> [peticiones, errores]
+    """
+
+    def __init__(self, host="127.0.0.1", puerto_qvm=5000, puerto_quilc=5555,
+                 latencia_qvm=0.0, latencia_quilc=0.0, variacion=0.0,
+                 error_qvm=0.0, error_quilc=0.0, arranque=0.0, semilla=None):
+        """
+        Args:
+            host: Dirección en la que escuchar
+            puerto_qvm: Puerto HTTP de la QVM (0 = uno libre cualquiera)
+            puerto_quilc: Puerto RPCQ de quilc (0 = uno libre cualquiera)
+            latencia_qvm, latencia_quilc: Segundos añadidos a cada petición
+            variacion: Variación relativa uniforme de la latencia (0.2 = ±20%)
+            error_qvm, error_quilc: Probabilidad de fallo de cada petición
+            arranque: Segundos extra de la primera petición de cada servicio
+            semilla: Semilla de las latencias, los fallos y los motores
+        """
+        for tasa in (error_qvm, error_quilc):
+            if not 0 <= tasa <= 1:
+                raise ValueError(f"La tasa de error debe estar en [0, 1] (recibido {tasa})")
+        self.host = host
+        self.puerto_qvm = puerto_qvm
+        self.puerto_quilc = puerto_quilc
+        self.latencia = {"qvm": latencia_qvm, "quilc": latencia_quilc}
+        self.tasa_error = {"qvm": error_qvm, "quilc": error_quilc}
+        self.variacion = variacion
+        self.arranque = arranque
+        self.semilla = semilla
+        self.peticiones = {}
+        self._aleatorio = random.Random(semilla)
+        self._frios = {"qvm", "quilc"}
+        self._lock = threading.Lock()
+        self._motores = threading.local()
+        self._hilos_motor = 0
+        self._http = None
+        self._bucle = None
+        self._tarea = None
+        self._hilos = []
+
+    @property
+    def url_qvm(self):
+        return f"http://{self.host}:{self.puerto_qvm}"
+
+    @property
+    def url_quilc(self):
+        return f"tcp://{self.host}:{self.puerto_quilc}"
+
+    def configuracion(self):
+        """QCSClient que apunta a este servidor (para `GestorConexiones` o `get_qc`)."""
+        from qcs_sdk import QCSClient
+        return QCSClient(qvm_url=self.url_qvm, quilc_url=self.url_quilc)
+
+    # ---- arranque y parada ----
+
+    def iniciar(self):
+        """Arranca los dos servidores en hilos en segundo plano."""
+        self._http = ThreadingHTTPServer((self.host, self.puerto_qvm), _manejador_qvm(self))
+        self._http.daemon_threads = True
+        self.puerto_qvm = self._http.server_address[1]
+
+        listo = threading.Event()
+        self._hilos = [threading.Thread(target=self._http.serve_forever, daemon=True),
+                       threading.Thread(target=self._servir_quilc, args=(listo,), daemon=True)]
+        for hilo in self._hilos:
+            hilo.start()
+        listo.wait()
+        if isinstance(self._tarea, BaseException):
+            self.detener()
+            raise self._tarea
+        return self
+
+    def detener(self):
+        """Para los dos servidores y espera a sus hilos."""
+        if self._http is not None:
+            self._http.shutdown()
+            self._http.server_close()
+            self._http = None
+        if self._bucle is not None and isinstance(self._tarea, asyncio.Task):
+            self._bucle.call_soon_threadsafe(self._tarea.cancel)
+        for hilo in self._hilos:
+            hilo.join()
+        self._hilos = []
+
+    def servir(self):
+        """Arranca y bloquea hasta Ctrl+C (para usarlo como los contenedores)."""
+        self.iniciar()
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.detener()
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *excepcion):
+        self.detener()
+
+    def _servir_quilc(self, listo):
+        import zmq
+        from rpcq import Server
+
+        servidor = Server()
+
+        @servidor.rpc_handler
+        def get_version_info():
+            return self._version_quilc()
+
+        @servidor.rpc_handler
+        async def quil_to_native_quil(request, protoquil=None):
+            return await self._quil_a_nativo(request, protoquil)
+
+        self._bucle = asyncio.new_event_loop()
+        extremo = self.url_quilc if self.puerto_quilc else f"tcp://{self.host}:*"
+        self._tarea = self._bucle.create_task(servidor.run_async(extremo))
+        self._bucle.run_until_complete(asyncio.sleep(0))      # run_async abre el socket
+        if self._tarea.done():
+            self._tarea = self._tarea.exception()
+            listo.set()
+            return
+        extremo = servidor._socket.getsockopt_string(zmq.LAST_ENDPOINT)
+        self.puerto_quilc = int(extremo.rsplit(":", 1)[1])
+        listo.set()
+        try:
+            self._bucle.run_until_complete(self._tarea)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            pendientes = asyncio.all_tasks(self._bucle)
+            for tarea in pendientes:
+                tarea.cancel()
+            self._bucle.run_until_complete(asyncio.gather(*pendientes, return_exceptions=True))
+            servidor._shutdown()
+            self._bucle.close()
+            self._bucle = None
+
+    # ---- inyección de fallos ----
+
+    def _perturbar(self, servicio, tipo):
+        """Registra la petición y decide su espera y si falla: devuelve (espera, falla)."""
+        with self._lock:
+            contadores = self.peticiones.setdefault(tipo, [0, 0])
+            contadores[0] += 1
+            espera = self.latencia[servicio] * (1 + self.variacion * (2 * self._aleatorio.random() - 1))
+            if servicio in self._frios:
+                self._frios.discard(servicio)
+                espera += self.arranque
+            falla = self._aleatorio.random() < self.tasa_error[servicio]
+            if falla:
+                contadores[1] += 1
+        return max(espera, 0.0), falla
+
+    def _contar(self, tipo, errores=0):
+        """Registra una petición de control (sin esperas ni fallos) o errores de una ya registrada."""
+        with self._lock:
+            contadores = self.peticiones.setdefault(tipo, [0, 0])
+            contadores[0] += errores == 0
+            contadores[1] += errores
+
+    def estadisticas(self):
+        """dict tipo de petición -> (peticiones, errores)."""
+        with self._lock:
+            return {tipo: tuple(c) for tipo, c in self.peticiones.items()}
+
+    # ---- quilc ----
+
+    def _version_quilc(self):
+        self._contar("get_version_info")
+        return VERSION_QUILC
+
+    async def _quil_a_nativo(self, request, protoquil=None):
+        from rpcq.messages import NativeQuilMetadata, NativeQuilResponse
+
+        espera, falla = self._perturbar("quilc", "quil_to_native_quil")
+        if espera:
+            await asyncio.sleep(espera)
+        if falla:
+            raise ErrorInyectado("Error de compilación inyectado por qnc.servidor_local")
+        try:
+            circuito = Circuito.desde_programa(Program(request.quil))
+        except ValueError:
+            self._contar("quil_to_native_quil", errores=1)
+            raise
+        n = circuito.num_qubits
+        metadatos = NativeQuilMetadata(
+            final_rewiring=list(range(n)), gate_volume=len(circuito.operaciones),
+            multiqubit_gate_depth=sum(len(op.qubits) > 1 for op in circuito.operaciones),
+            topological_swaps=0)
+        return NativeQuilResponse(quil=request.quil, metadata=metadatos)
+
+    # ---- QVM ----
+
+    def atender_qvm(self, peticion):
+        """
+        Resuelve una petición de la QVM ya decodificada.
+
+        Args:
+            peticion: dict del cuerpo JSON (con la clave "type")
+
+        Returns:
+            tuple: (bytes de la respuesta, tipo de contenido)
+        """
+        tipo = peticion.get("type")
+        if tipo == "version":
+            self._contar(tipo)
+            return VERSION_QVM.encode(), "text/plain"
+        atender = {"multishot": self._multishot, "multishot-measure": self._medir,
+                   "wavefunction": self._funcion_onda,
+                   "expectation": self._esperanza}.get(tipo)
+        if atender is None:
+            raise ValueError(f"Tipo de petición desconocido: {tipo!r}")
+
+        espera, falla = self._perturbar("qvm", tipo)
+        if espera:
+            time.sleep(espera)
+        if falla:
+            raise ErrorInyectado("Error de ejecución inyectado por qnc.servidor_local")
+        try:
+            return atender(peticion)
+        except Exception:
+            self._contar(tipo, errores=1)
+            raise
+
+    def _motor(self, semilla=None):
+        """QVMAutomatica propia del hilo (o nueva, si la petición trae semilla)."""
+        if semilla is not None:
+            return QVMAutomatica(semilla=semilla)
+        motor = getattr(self._motores, "motor", None)
+        if motor is None:
+            with self._lock:
+                k = self._hilos_motor
+                self._hilos_motor += 1
+            motor = QVMAutomatica(semilla=None if self.semilla is None else self.semilla + k)
+            self._motores.motor = motor
+        return motor
+
+    def _multishot(self, peticion):
+        programa, memoria = _programa_y_memoria(peticion["compiled-quil"])
+        trials = int(peticion["trials"])
+        result = self._motor(peticion.get("rng-seed")).run(
+            programa.wrap_in_numshots_loop(trials), memoria or None)
+        respuesta = {}
+        for nombre, direcciones in peticion.get("addresses", {}).items():
+            if nombre in result.readout_data:
+                valores = np.asarray(result.readout_data[nombre])
+            else:       # regiones que no se miden (parámetros): su valor en cada shot
+                valores = np.tile(memoria.get(nombre, _region(programa, nombre)), (trials, 1))
+            if direcciones is not True:
+                valores = valores[:, list(direcciones)]
+            respuesta[nombre] = valores.tolist()
+        return json.dumps(respuesta).encode(), "application/json"
+
+    def _medir(self, peticion):
+        programa, memoria = _programa_y_memoria(peticion["compiled-quil"])
+        qubits = list(peticion["qubits"])
+        registro = programa.declare("qnc_medidas", "BIT", max(len(qubits), 1))
+        for i, q in enumerate(qubits):
+            programa.measure(q, registro[i])
+        result = self._motor(peticion.get("rng-seed")).run(
+            programa.wrap_in_numshots_loop(int(peticion["trials"])), memoria or None)
+        lecturas = np.asarray(result.readout_data["qnc_medidas"])[:, :len(qubits)]
+        return json.dumps(lecturas.tolist()).encode(), "application/json"
+
+    def _funcion_onda(self, peticion):
+        programa, memoria = _programa_y_memoria(peticion["compiled-quil"])
+        psi = SimuladorFuncionOnda().amplitudes(programa, memoria)
+        return np.asarray(psi, dtype=">c16").tobytes(), "application/octet-stream"
+
+    def _esperanza(self, peticion):
+        programa, memoria = _programa_y_memoria(peticion["state-preparation"])
+        psi = SimuladorFuncionOnda().amplitudes(programa, memoria)
+        valores = []
+        for operador in peticion.get("operators", []):
+            circuito = Circuito.desde_programa(Program(operador))
+            dimension = max(len(psi), 2 ** circuito.num_qubits)
+            ampliado = np.zeros(dimension, dtype=complex)
+            ampliado[:len(psi)] = psi          # qubits nuevos en |0⟩
+            valores.append(float(np.vdot(ampliado, propagar(circuito, ampliado)).real))
+        return json.dumps(valores).encode(), "application/json"
+
+
+def _programa_y_memoria(texto):
+    """Program sin las instrucciones MOVE y memory_map con los valores que asignaban."""
+    programa = Program(texto)
+    memoria = {}
+    instrucciones = []
+    for inst in programa.instructions:
+        if isinstance(inst, ClassicalMove):
+            ref = inst.left
+            valores = memoria.setdefault(ref.name, list(_region(programa, ref.name)))
+            valores[ref.offset] = inst.right
+        else:
+            instrucciones.append(inst)
+    return Program(instrucciones), memoria
+
+
+def _region(programa, nombre):
+    """Valores iniciales (ceros) de una región de memoria declarada."""
+    declaracion = programa.declarations.get(nombre)
+    return [0] * (declaracion.memory_size if declaracion is not None else 1)
+
+
+def _manejador_qvm(servidor):
+    """Clase manejadora HTTP/1.1 (con keep-alive) ligada a un ServidorLocal."""
+
+    class ManejadorQVM(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            longitud = int(self.headers.get("Content-Length", 0))
+            try:
+                cuerpo, tipo = servidor.atender_qvm(json.loads(self.rfile.read(longitud)))
+                estado = 200
+            except Exception as error:
+                cuerpo = json.dumps({"status": f"{type(error).__name__}: {error}"}).encode()
+                tipo, estado = "application/json", 500
+            self.send_response(estado)
+            self.send_header("Content-Type", tipo)
+            self.send_header("Content-Length", str(len(cuerpo)))
+            self.end_headers()
+            self.wfile.write(cuerpo)
+
+        def log_message(self, formato, *args):
+            pass
+
+    return ManejadorQVM
@@ -0,0 +1,458 @@
+"""
+MÓDULO: qnc/trazas.py - Trazas de latencia de construcción, compilación, ejecución y lectura
+
+RESUMEN:
+En un script no se sabe cuánto tiempo se va en construir el `Program`, en
+`qc.compile` (quilc), en `qc.run` (QVM) y en extraer la lectura
+(`readout_data` / `get_register_map`). `Trazador` registra tramos anidados
+con atributos y los exporta en el formato de trazas de Chrome, que se abre
+como línea temporal o gráfico de llama en https://ui.perfetto.dev o en
+chrome://tracing.
+
+FUNCIONAMIENTO:
+- `trazador.tramo(nombre, **atributos)` mide un bloque de código; los tramos
+  de un mismo hilo se anidan por tiempo
+- `instrumentar(trazador)` sustituye mientras dura el `with`
+  `QuantumComputer.compile` y `run`, `WavefunctionSimulator.wavefunction` y
+  la lectura del resultado, así que un script se traza sin cambiarlo. Con
+  `construccion=True` también los métodos de PyQuil que construyen programas
+  (`Program(...)`, `inst`/`+=`, `declare`, `measure`,
+  `wrap_in_numshots_loop`). Las llamadas que PyQuil hace por dentro (un
+  `inst` dentro de `Program(...)`, los programas que crea `compile`) se
+  descartan al exportar
+- `QCTrazado(qc, trazador)` traza compile/run de cualquier objeto que los
+  tenga (motores de qnc, `GestorConexiones`, `QCConCache`...)
+- Atributos de compile y run: `qubits`, `shots` e `instrucciones` del
+  programa; de la lectura: `registros` y `shots`. Se calculan al registrar
+  el tramo, después de medir su fin, y el trazador no guarda referencias a
+  los programas ni a los resultados. Si `run` recibe el mismo objeto que
+  acaba de pasar por `compile` (los motores locales devuelven el propio
+  programa), reutiliza sus atributos
+
+SOBRECOSTE:
+Durante la ejecución cada tramo son dos lecturas de `time.perf_counter_ns`,
+`threading.get_ident`, los atributos (~2.5 µs por programa, casi todo en
+PyQuil al contar qubits e instrucciones) y una tupla añadida a una lista,
+sin estado por hilo. El descarte de los tramos anidados se hace al exportar.
+Con `activo=False` los métodos instrumentados llaman directamente al
+original.
+Medido con `medir_sobrecoste` sobre un bucle construir + compile + run +
+lectura de un estado de Bell (mediana de 400 parejas, máquina de 1 núcleo,
+con un ruido de uno o dos puntos entre ejecuciones):
+- contra quilc y la QVM (servidor local, ~50 ms por iteración, 40 parejas):
+  entre -0.1% y +0.1%, con y sin tramos de construcción
+- motor local en el mismo proceso (~0.5 ms por iteración), por defecto
+  (2 tramos por iteración): +1.8% a +4.0% según la ejecución. Aislado,
+  el trazado cuesta ~3 µs por iteración (~0.7%); contar qubits e
+  instrucciones del programa es alrededor de la mitad del sobrecoste
+- igual, con `construccion=True` (9 tramos más por iteración):
+  +5.4% a +6.4%. Por eso la construcción no se traza por defecto: en
+  bucles tan cortos como el del motor local supera el 2%
+
+USO:
+    from qnc import Trazador, instrumentar
+
+    trazador = Trazador()
+    with instrumentar(trazador, construccion=True), trazador.tramo("script"):
+        prog = Program(H(0), CNOT(0, 1))
+        result = qc.run(qc.compile(prog))
+        bits = result.readout_data['ro']
+    print(trazador.resumen())
+    trazador.guardar("traza.json")      # abrir en https://ui.perfetto.dev
+"""
+
+import json
+import os
+import statistics
+import threading
+import time
+from contextlib import contextmanager
+
+_reloj = time.perf_counter_ns
+_hilo = threading.get_ident
+
+# Categorías de las llamadas instrumentadas: los tramos de construcción de
+# programas dentro de ellas (en el mismo hilo) se descartan al exportar
+_INSTRUMENTADAS = frozenset(("programa", "quilc", "qvm", "lectura"))
+
+
+class _Tramo:
+    """Tramo en curso (lo devuelve `Trazador.tramo`); se le pueden añadir atributos."""
+
+    __slots__ = ("trazador", "nombre", "categoria", "atributos", "inicio")
+
+    def __init__(self, trazador, nombre, categoria, atributos):
+        self.trazador = trazador
+        self.nombre = nombre
+        self.categoria = categoria
+        self.atributos = atributos
+
+    def __enter__(self):
+        self.inicio = _reloj()
+        return self
+
+    def __exit__(self, tipo, error, traza):
+        fin = _reloj()
+        if tipo is not None:
+            self.atributos["error"] = tipo.__name__
+        self.trazador.registrar(self.nombre, self.categoria, self.inicio, fin, self.atributos)
+
+
+class _TramoNulo:
+    """Tramo que no registra nada (trazador inactivo)."""
+
+    atributos = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        pass
+
+
+_NULO = _TramoNulo()
+
+
+class Trazador:
+    """
+    Registro de tramos con nombre, categoría, inicio, fin, hilo y atributos.
+
+    Atributos:
+        activo: Si es False, `tramo` y los métodos instrumentados no registran nada
+        eventos: Lista de (nombre, categoría, inicio_ns, fin_ns, hilo, atributos)
+            (se construye al leerla a partir de los tramos en bruto)
+    """
+
+    def __init__(self, activo=True):
+        self.activo = activo
+        self.origen = _reloj()
+        # (nombre, categoría, inicio, fin, hilo, atributos)
+        self._crudos = []
+        # Último (programa, atributos) calculado: con los motores locales
+        # `compile` devuelve el mismo programa y `run` no vuelve a calcularlos
+        self._ultimo = (None, None)
+
+    def tramo(self, nombre, categoria="qnc", **atributos):
+        """Context manager que registra el bloque como un tramo."""
+        if not self.activo:
+            return _NULO
+        return _Tramo(self, nombre, categoria, atributos)
+
+    def registrar(self, nombre, categoria, inicio, fin, atributos=None):
+        """Añade un tramo ya medido (tiempos en ns de `time.perf_counter_ns`)."""
+        self._crudos.append((nombre, categoria, inicio, fin, _hilo(), atributos))
+
+    def limpiar(self):
+        """Borra los tramos registrados y reinicia el origen de tiempos."""
+        self._crudos.clear()
+        self._ultimo = (None, None)
+        self.origen = _reloj()
+
+    def atributos_programa(self, programa):
+        """
+        `atributos_programa(programa)`, reutilizando el último cálculo si es el
+        mismo objeto (se usa una sola vez: la siguiente llamada lo recalcula).
+        """
+        ultimo, atributos = self._ultimo
+        if ultimo is programa:
+            self._ultimo = (None, None)
+            return atributos
+        atributos = atributos_programa(programa)
+        self._ultimo = (programa, atributos)
+        return atributos
+
+    @property
+    def eventos(self):
+        """Tramos ordenados y sin las construcciones anidadas en llamadas instrumentadas."""
+        eventos = []
+        limites = {}        # hilo -> fin del último tramo instrumentado que lo contiene
+        for nombre, categoria, inicio, fin, hilo, atributos in sorted(
+                self._crudos, key=lambda e: (e[2], -e[3])):
+            if categoria == "programa" and inicio < limites.get(hilo, 0):
+                continue
+            if categoria in _INSTRUMENTADAS:
+                limites[hilo] = max(fin, limites.get(hilo, 0))
+            eventos.append((nombre, categoria, inicio, fin, hilo, atributos or {}))
+        return eventos
+
+    # ---- exportación ----
+
+    def a_chrome(self):
+        """Traza en el formato JSON de Chrome (eventos completos "X", tiempos en µs)."""
+        hilos = {}
+        eventos = [{"name": "process_name", "ph": "M", "pid": os.getpid(),
+                    "args": {"name": "qnc"}}]
+        for nombre, categoria, inicio, fin, hilo, atributos in self.eventos:
+            tid = hilos.setdefault(hilo, len(hilos))
+            eventos.append({"name": nombre, "cat": categoria, "ph": "X",
+                            "ts": (inicio - self.origen) / 1000, "dur": (fin - inicio) / 1000,
+                            "pid": os.getpid(), "tid": tid, "args": atributos})
+        eventos[1:1] = [{"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid,
+                         "args": {"name": "principal" if tid == 0 else f"hilo {tid}"}}
+                        for tid in hilos.values()]
+        return {"traceEvents": eventos, "displayTimeUnit": "ms"}
+
+    def guardar(self, ruta):
+        """Escribe la traza de Chrome en `ruta` (abrir en ui.perfetto.dev o chrome://tracing)."""
+        with open(ruta, "w", encoding="utf-8") as f:
+            json.dump(self.a_chrome(), f, ensure_ascii=False)
+
+    def totales(self):
+        """dict nombre -> (número de tramos, ns en total)."""
+        totales = {}
+        for nombre, _, inicio, fin, _, _ in self.eventos:
+            n, ns = totales.get(nombre, (0, 0))
+            totales[nombre] = (n + 1, ns + fin - inicio)
+        return totales
+
+    def resumen(self):
+        """Tabla de texto con el número de tramos y el tiempo total y medio de cada nombre."""
+        lineas = [f"{'Tramo':<34} {'Veces':>6} {'Total (ms)':>11} {'Media (ms)':>11}"]
+        for nombre, (n, ns) in sorted(self.totales().items(), key=lambda t: -t[1][1]):
+            lineas.append(f"{nombre:<34} {n:>6} {ns / 1e6:>11.3f} {ns / n / 1e6:>11.4f}")
+        return "\n".join(lineas)
+
+
+# =============================================
+# ATRIBUTOS
+# =============================================
+def atributos_programa(programa):
+    """
+    Qubits, shots e instrucciones de un programa, sin recorrer sus instrucciones.
+
+    Args:
+        programa: Program de PyQuil (u otro ejecutable: se devuelve lo que se pueda)
+
+    Returns:
+        dict: qubits, shots, instrucciones (solo las claves disponibles)
+    """
+    interno = getattr(programa, "_program", None)
+    if interno is not None:
+        # Program de PyQuil 4: se consulta directamente el programa de quil-rs
+        # (las instrucciones se cuentan sin las declaraciones)
+        try:
+            return {"shots": programa.num_shots, "qubits": len(interno.get_used_qubits()),
+                    "instrucciones": len(interno.body_instructions)}
+        except Exception:
+            pass
+    atributos = {}
+    shots = getattr(programa, "num_shots", None)
+    if shots is not None:
+        atributos["shots"] = shots
+    try:
+        if hasattr(programa, "instructions"):
+            atributos["qubits"] = len(programa.get_qubits())
+            atributos["instrucciones"] = len(programa.instructions)
+    except Exception:
+        pass
+    return atributos
+
+
+def atributos_lectura(registros):
+    """Número de registros y shots de un dict registro -> array."""
+    atributos = {"registros": len(registros)}
+    for valores in registros.values():
+        if valores is not None and getattr(valores, "ndim", 0):
+            atributos["shots"] = len(valores)
+            break
+    return atributos
+
+
+# =============================================
+# INSTRUMENTACIÓN
+# =============================================
+class QCTrazado:
+    """
+    Envoltorio que traza compile y run de un QuantumComputer o motor de qnc.
+
+    Los demás atributos se delegan en el objeto envuelto.
+    """
+
+    def __init__(self, qc, trazador):
+        self.qc = qc
+        self.trazador = trazador
+
+    def compile(self, programa, *args, **kwargs):
+        trazador = self.trazador
+        if not trazador.activo:
+            return self.qc.compile(programa, *args, **kwargs)
+        inicio = _reloj()
+        try:
+            valor = self.qc.compile(programa, *args, **kwargs)
+        except BaseException as error:
+            _registrar_error(trazador, "compile", "quilc", inicio, programa, error)
+            raise
+        fin = _reloj()
+        trazador._crudos.append(("compile", "quilc", inicio, fin, _hilo(),
+                                 trazador.atributos_programa(programa)))
+        return valor
+
+    def run(self, ejecutable, *args, **kwargs):
+        trazador = self.trazador
+        if not trazador.activo:
+            return self.qc.run(ejecutable, *args, **kwargs)
+        inicio = _reloj()
+        try:
+            valor = self.qc.run(ejecutable, *args, **kwargs)
+        except BaseException as error:
+            _registrar_error(trazador, "run", "qvm", inicio, ejecutable, error)
+            raise
+        fin = _reloj()
+        trazador._crudos.append(("run", "qvm", inicio, fin, _hilo(),
+                                 trazador.atributos_programa(ejecutable)))
+        return valor
+
+    def __getattr__(self, nombre):
+        return getattr(self.qc, nombre)
+
+
+def _registrar_error(trazador, nombre, categoria, inicio, programa, error):
+    """Registra un tramo que terminó con una excepción."""
+    fin = _reloj()
+    trazador._crudos.append((nombre, categoria, inicio, fin, _hilo(),
+                             _con_error(trazador.atributos_programa(programa), error)))
+
+
+def _con_error(atributos, error):
+    """Copia de los atributos con el tipo de la excepción."""
+    return {**atributos, "error": type(error).__name__}
+
+
+def _envolver(trazador, original, nombre, categoria, atributos=None, resultado=None):
+    """
+    Método que registra un tramo alrededor de `original`.
+
+    `atributos(primer_argumento)` o `resultado(valor_devuelto)` dan los
+    atributos del tramo, que se calculan después de medir el fin del tramo.
+    Las construcciones de programas (categoría "programa") no llevan atributos.
+    """
+    crudos = trazador._crudos
+    if atributos is atributos_programa:
+        atributos = trazador.atributos_programa
+
+    if categoria == "programa":
+        def envoltura(self, *args, **kwargs):
+            if not trazador.activo:
+                return original(self, *args, **kwargs)
+            inicio = _reloj()
+            valor = original(self, *args, **kwargs)
+            crudos.append((nombre, categoria, inicio, _reloj(), _hilo(), None))
+            return valor
+    else:
+        def envoltura(self, *args, **kwargs):
+            if not trazador.activo:
+                return original(self, *args, **kwargs)
+            inicio = _reloj()
+            try:
+                valor = original(self, *args, **kwargs)
+            except BaseException as error:
+                fin = _reloj()
+                datos = atributos(args[0]) if atributos is not None and args else {}
+                crudos.append((nombre, categoria, inicio, fin, _hilo(), _con_error(datos, error)))
+                raise
+            fin = _reloj()
+            if resultado is not None:
+                datos = resultado(valor)
+            else:
+                datos = atributos(args[0]) if args else None
+            crudos.append((nombre, categoria, inicio, fin, _hilo(), datos))
+            return valor
+
+    envoltura.__wrapped__ = original
+    return envoltura
+
+
+@contextmanager
+def instrumentar(trazador, construccion=False):
+    """
+    Traza las llamadas de PyQuil de construcción, compilación, ejecución y lectura.
+
+    Los métodos originales se restauran al salir del `with`, también si hay
+    una excepción.
+
+    Args:
+        trazador: Trazador donde se registran los tramos
+        construccion: Si es True, se trazan también los métodos de `Program`
+            (en bucles de cientos de µs por iteración, como con los motores
+            locales, sus tramos son la mayor parte del sobrecoste)
+
+    Yields:
+        Trazador: el mismo trazador
+    """
+    from pyquil.api import QuantumComputer, WavefunctionSimulator
+    from pyquil.api._qam import QAMExecutionResult
+    from pyquil.quil import Program
+
+    metodos_programa = ("__init__", "inst", "declare", "measure", "wrap_in_numshots_loop")
+    sustituciones = [(Program, metodo, _envolver(trazador, getattr(Program, metodo),
+                                                 f"Program.{metodo}", "programa"))
+                     for metodo in (metodos_programa if construccion else ())]
+    sustituciones += [
+        (QuantumComputer, "compile", _envolver(trazador, QuantumComputer.compile, "compile",
+                                               "quilc", atributos_programa)),
+        (QuantumComputer, "run", _envolver(trazador, QuantumComputer.run, "run", "qvm",
+                                           atributos_programa)),
+        (WavefunctionSimulator, "wavefunction",
+         _envolver(trazador, WavefunctionSimulator.wavefunction, "wavefunction", "qvm",
+                   atributos_programa)),
+        (QAMExecutionResult, "get_register_map",
+         _envolver(trazador, QAMExecutionResult.get_register_map, "get_register_map",
+                   "lectura", resultado=atributos_lectura)),
+        (QAMExecutionResult, "readout_data",
+         property(_envolver(trazador, QAMExecutionResult.readout_data.fget, "readout_data",
+                            "lectura", resultado=atributos_lectura))),
+    ]
+
+    originales = [(clase, nombre, clase.__dict__[nombre]) for clase, nombre, _ in sustituciones]
+    try:
+        for clase, nombre, nuevo in sustituciones:
+            setattr(clase, nombre, nuevo)
+        yield trazador
+    finally:
+        for clase, nombre, original in originales:
+            setattr(clase, nombre, original)
+
+
+def medir_sobrecoste(carga, repeticiones=10, construccion=False):
+    """
+    Sobrecoste de trazar una carga de trabajo.
+
+    La carga se ejecuta alternando sin trazas y con `instrumentar`, en
+    parejas que cambian de orden cada vez; el sobrecoste es la mediana de los
+    cocientes de cada pareja de ejecuciones, que compara tiempos medidos uno
+    junto al otro y descarta las parejas afectadas por otros procesos.
+
+    Args:
+        carga: Función que construye, compila, ejecuta y lee. Recibe None sin
+            trazas y el Trazador con trazas (para usar `QCTrazado` con motores
+            que no son de PyQuil)
+        repeticiones: Veces que se ejecuta la carga de cada forma
+        construccion: Se pasa a `instrumentar`
+
+    Returns:
+        tuple: (mediana de segundos sin trazas, mediana con trazas, sobrecoste relativo)
+    """
+    def sin_trazas():
+        inicio = time.perf_counter()
+        carga(None)
+        return time.perf_counter() - inicio
+
+    def con_trazas():
+        with instrumentar(Trazador(), construccion) as trazador:
+            inicio = time.perf_counter()
+            carga(trazador)
+            return time.perf_counter() - inicio
+
+    sin_trazas()                    # calentamiento: cachés de PyQuil y del motor
+    sin, con = [], []
+    for i in range(repeticiones):
+        # El orden se alterna en cada pareja: la segunda ejecución de una
+        # pareja suele ir algo más rápida o más lenta que la primera
+        if i % 2:
+            con.append(con_trazas())
+            sin.append(sin_trazas())
+        else:
+            sin.append(sin_trazas())
+            con.append(con_trazas())
+    cocientes = [c / s for s, c in zip(sin, con)]
+    return statistics.median(sin), statistics.median(con), statistics.median(cocientes) - 1
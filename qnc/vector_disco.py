@@ -0,0 +1,309 @@
+"""
+MÓDULO: qnc/vector_disco.py - Vector de estado en disco (np.memmap) procesado por bloques
+
+RESUMEN:
+El vector de estado de n qubits tiene 2^n amplitudes: con 30 qubits ocupa
+8 GB en complex64 y con 34 qubits 128 GB, más de lo que cabe en la memoria
+de un portátil. `VectorEstadoDisco` guarda las amplitudes en un fichero
+mapeado con `np.memmap` y aplica cada puerta recorriéndolo por bloques de
+`bloque_bytes` (unas decenas de MB), de modo que la memoria usada no depende
+del número de qubits.
+
+NÚCLEOS:
+Una puerta de un qubit sobre el qubit t combina las amplitudes i e i + 2^t
+(bit t de i a 0). Hay dos casos:
+
+- 2^(t+1) cabe en un bloque: se lee un bloque contiguo, se ve como
+  (filas, 2, 2^t) y se combinan las dos mitades en memoria
+- 2^(t+1) no cabe: se leen dos trozos separados 2^t posiciones y se combinan
+
+Las puertas controladas (CNOT, CZ) usan los mismos recorridos y solo
+modifican las amplitudes con el bit de control a 1; cuando el control es un
+qubit alto, los bloques con el control a 0 ni siquiera se leen. SWAP se
+aplica como tres CNOT.
+
+PROGRESO:
+`evolucionar(..., progreso=True)` imprime, para cada puerta, el tiempo y el
+rendimiento (GB/s y amplitudes/s). También se puede pasar una función que
+recibe un dict con esos datos.
+
+USO:
+    from qnc import VectorEstadoDisco
+
+    psi = VectorEstadoDisco.crear("/datos/estado.bin", 30)
+    psi.evolucionar(Program(H(0), CNOT(0, 29)), progreso=True)
+    print(psi.probabilidad_uno(29))
+
+Demostración:
+    python -m qnc.demos.vector_en_disco 28 /tmp
+"""
+
+import os
+import time
+
+import numpy as np
+
+from .circuito import Circuito
+
+
+BLOQUE_POR_DEFECTO = 32 * 1024 * 1024
+
+
+class VectorEstadoDisco:
+    """
+    Vector de estado de n qubits guardado en un fichero mapeado en memoria.
+
+    El qubit 0 es el bit menos significativo del índice (mismo orden que
+    `qnc.estado` y el WavefunctionSimulator de PyQuil).
+
+    Atributos:
+        amplitudes: np.memmap (2^n,) con las amplitudes
+        num_qubits: Número de qubits
+        bloque: Amplitudes procesadas a la vez (potencia de 2)
+    """
+
+    def __init__(self, amplitudes, num_qubits, bloque_bytes=BLOQUE_POR_DEFECTO):
+        self.amplitudes = amplitudes
+        self.num_qubits = num_qubits
+        bloque = max(bloque_bytes // amplitudes.itemsize, 2)
+        self.bloque = min(1 << (bloque.bit_length() - 1), amplitudes.size)
+
+    @classmethod
+    def crear(cls, ruta, num_qubits, dtype=np.complex64, indice=0,
+              bloque_bytes=BLOQUE_POR_DEFECTO):
+        """
+        Crea el fichero con el estado |indice⟩.
+
+        El fichero se crea disperso (el sistema de ficheros no reserva los
+        ceros), así que crearlo es inmediato aunque ocupe cientos de GB.
+        """
+        amplitudes = np.memmap(ruta, dtype=dtype, mode="w+", shape=(2 ** num_qubits,))
+        amplitudes[indice] = 1
+        return cls(amplitudes, num_qubits, bloque_bytes)
+
+    @classmethod
+    def abrir(cls, ruta, dtype=np.complex64, bloque_bytes=BLOQUE_POR_DEFECTO):
+        """Abre un estado guardado con `crear` (el número de qubits sale del tamaño)."""
+        amplitudes = np.memmap(ruta, dtype=dtype, mode="r+")
+        num_qubits = amplitudes.size.bit_length() - 1
+        if amplitudes.size != 2 ** num_qubits:
+            raise ValueError(f"{ruta} no contiene 2^n amplitudes de tipo {np.dtype(dtype).name}")
+        return cls(amplitudes, num_qubits, bloque_bytes)
+
+    @property
+    def nbytes(self):
+        return self.amplitudes.nbytes
+
+    # ---- puertas ----
+
+    def aplicar_1q(self, u, objetivo, control=None):
+        """
+        Aplica una puerta (2, 2) sobre `objetivo`, opcionalmente controlada.
+
+        Args:
+            u: Matriz 2×2
+            objetivo: Qubit sobre el que actúa la puerta
+            control: Qubit de control (None: puerta sin control)
+        """
+        u = np.asarray(u, dtype=self.amplitudes.dtype)
+        paso = 1 << objetivo
+        total = self.amplitudes.size
+
+        if 2 * paso <= self.bloque:
+            for inicio in range(0, total, self.bloque):
+                if not _bloque_con_control(inicio, self.bloque, control):
+                    continue
+                trozo = np.array(self.amplitudes[inicio:inicio + self.bloque])
+                a, b = _mitades(trozo, inicio, objetivo, control)
+                _combinar(a, b, u)
+                self.amplitudes[inicio:inicio + self.bloque] = trozo
+            return
+
+        # Las dos amplitudes de cada par están en trozos distintos del fichero
+        medio = self.bloque // 2
+        for base in range(0, total, 2 * paso):
+            for desplazamiento in range(0, paso, medio):
+                inicio = base + desplazamiento
+                if not _bloque_con_control(inicio, medio, control):
+                    continue
+                a = np.array(self.amplitudes[inicio:inicio + medio])
+                b = np.array(self.amplitudes[inicio + paso:inicio + paso + medio])
+                va, vb = _filtrar_control(a, inicio, control), _filtrar_control(b, inicio, control)
+                _combinar(va, vb, u)
+                self.amplitudes[inicio:inicio + medio] = a
+                self.amplitudes[inicio + paso:inicio + paso + medio] = b
+
+    def aplicar_cnot(self, control, objetivo):
+        self.aplicar_1q(_X, objetivo, control)
+
+    def aplicar(self, operacion, memoria=None):
+        """
+        Aplica una Operacion de `qnc.circuito`.
+
+        Raises:
+            ValueError: Si es una puerta de dos qubits distinta de CNOT, CZ,
+                CPHASE o SWAP, o de más qubits
+        """
+        q = operacion.qubits
+        if len(q) == 1:
+            self.aplicar_1q(operacion.matriz(memoria), q[0])
+        elif operacion.nombre == "CNOT":
+            self.aplicar_cnot(q[0], q[1])
+        elif operacion.nombre in ("CZ", "CPHASE"):
+            # La matriz es diagonal: es la puerta diag(1, fase) sobre q[1] controlada por q[0]
+            fase = operacion.matriz(memoria)[3, 3]
+            self.aplicar_1q(np.diag([1, fase]), q[1], q[0])
+        elif operacion.nombre == "SWAP":
+            self.aplicar_cnot(q[0], q[1])
+            self.aplicar_cnot(q[1], q[0])
+            self.aplicar_cnot(q[0], q[1])
+        else:
+            raise ValueError(f"Puerta no soportada en el vector en disco: {operacion.nombre}")
+
+    def evolucionar(self, programa, memoria=None, progreso=None):
+        """
+        Aplica todas las puertas de un programa (las mediciones terminales se ignoran).
+
+        Args:
+            programa: Program de PyQuil o Circuito
+            memoria: Valores de los parámetros (formato `memory_map` de PyQuil)
+            progreso: True para imprimir el avance, o función que recibe un
+                dict con puerta, indice, total, segundos, gb_por_segundo y
+                amplitudes_por_segundo
+
+        Returns:
+            float: Segundos totales
+        """
+        circuito = programa if isinstance(programa, Circuito) else Circuito.desde_programa(programa)
+        if circuito.num_qubits > self.num_qubits:
+            raise ValueError(f"El programa usa {circuito.num_qubits} qubits y el vector tiene "
+                             f"{self.num_qubits}")
+        informar = imprimir_progreso if progreso is True else progreso
+        operaciones = circuito.unitarias
+        inicio_total = time.perf_counter()
+        for i, op in enumerate(operaciones):
+            inicio = time.perf_counter()
+            self.aplicar(op, memoria)
+            segundos = time.perf_counter() - inicio
+            if informar:
+                # Cada puerta lee y escribe el vector completo (como máximo)
+                informar({"puerta": op, "indice": i + 1, "total": len(operaciones),
+                          "segundos": segundos,
+                          "gb_por_segundo": 2 * self.nbytes / segundos / 1e9 if segundos else 0.0,
+                          "amplitudes_por_segundo": self.amplitudes.size / segundos if segundos else 0.0})
+        self.amplitudes.flush()
+        return time.perf_counter() - inicio_total
+
+    # ---- lecturas ----
+
+    def bloques(self):
+        """Recorre las amplitudes en bloques: (inicio, array en memoria)."""
+        for inicio in range(0, self.amplitudes.size, self.bloque):
+            yield inicio, np.asarray(self.amplitudes[inicio:inicio + self.bloque])
+
+    def norma(self):
+        """Norma del vector (debe ser 1 salvo errores de redondeo)."""
+        total = 0.0
+        for _, trozo in self.bloques():
+            total += float(np.vdot(trozo, trozo).real)
+        return np.sqrt(total)
+
+    def probabilidad_uno(self, qubit):
+        """Probabilidad de medir 1 en un qubit."""
+        total = 0.0
+        for inicio, trozo in self.bloques():
+            _, b = _mitades_lectura(trozo, inicio, qubit)
+            total += float(np.vdot(b, b).real)
+        return total
+
+    def distribucion(self, qubits):
+        """
+        Distribución de probabilidad de varios qubits (bit j del resultado = qubits[j]).
+
+        Returns:
+            np.ndarray: Array (2^len(qubits),)
+        """
+        conteos = np.zeros(2 ** len(qubits))
+        for inicio, trozo in self.bloques():
+            indices = np.arange(inicio, inicio + trozo.size, dtype=np.int64)
+            resultado = np.zeros(trozo.size, dtype=np.int64)
+            for j, q in enumerate(qubits):
+                resultado |= ((indices >> q) & 1) << j
+            p = trozo.real.astype(np.float64) ** 2 + trozo.imag.astype(np.float64) ** 2
+            conteos += np.bincount(resultado, weights=p, minlength=conteos.size)
+        return conteos
+
+    def cerrar(self):
+        """Vuelca los cambios al disco y libera el mapeo."""
+        self.amplitudes.flush()
+        self.amplitudes._mmap.close()
+
+    def eliminar(self):
+        """Cierra y borra el fichero."""
+        ruta = self.amplitudes.filename
+        self.cerrar()
+        os.remove(ruta)
+
+
+def imprimir_progreso(info):
+    """Imprime una línea de avance por puerta (ver `VectorEstadoDisco.evolucionar`)."""
+    print(f"[{info['indice']}/{info['total']}] {info['puerta']}: {info['segundos']:.2f} s, "
+          f"{info['gb_por_segundo']:.2f} GB/s, {info['amplitudes_por_segundo']:,.0f} amplitudes/s")
+
+
+_X = np.array([[0, 1], [1, 0]])
+
+
+def _combinar(a, b, u):
+    """(a, b) <- (u00·a + u01·b, u10·a + u11·b) sobre vistas del bloque."""
+    if u[0, 0] == 0 and u[1, 1] == 0 and u[0, 1] == 1 and u[1, 0] == 1:
+        a[...], b[...] = b.copy(), a.copy()
+        return
+    if u[0, 1] == 0 and u[1, 0] == 0:
+        if u[0, 0] != 1:
+            a *= u[0, 0]
+        if u[1, 1] != 1:
+            b *= u[1, 1]
+        return
+    nueva_a = u[0, 0] * a + u[0, 1] * b
+    b *= u[1, 1]
+    b += u[1, 0] * a
+    a[...] = nueva_a
+
+
+def _bloque_con_control(inicio, tamano, control):
+    """False si el control es constante a 0 en todo el trozo [inicio, inicio + tamano)."""
+    if control is None or (1 << control) < tamano:
+        return True
+    return bool((inicio >> control) & 1)
+
+
+def _filtrar_control(trozo, inicio, control):
+    """Vista del trozo con solo las amplitudes que tienen el bit de control a 1."""
+    if control is None or (1 << control) >= trozo.size:
+        return trozo      # el control es constante en el trozo (ya comprobado)
+    return trozo.reshape(-1, 2, 1 << control)[:, 1, :]
+
+
+def _mitades(trozo, inicio, objetivo, control):
+    """Vistas (bit objetivo = 0, bit objetivo = 1) de un bloque alineado, con el control a 1."""
+    paso = 1 << objetivo
+    if control is not None and control > objetivo and (2 << control) <= trozo.size:
+        v = trozo.reshape(-1, 2, 1 << control)[:, 1, :].reshape(trozo.size >> (control + 1), -1, 2, paso)
+        return v[:, :, 0, :], v[:, :, 1, :]
+    v = trozo.reshape(-1, 2, paso)
+    a, b = v[:, 0, :], v[:, 1, :]
+    if control is not None and control < objetivo:
+        a = a.reshape(a.shape[0], -1, 2, 1 << control)[:, :, 1, :]
+        b = b.reshape(b.shape[0], -1, 2, 1 << control)[:, :, 1, :]
+    return a, b
+
+
+def _mitades_lectura(trozo, inicio, qubit):
+    """Amplitudes del trozo con el bit `qubit` a 0 y a 1."""
+    if (2 << qubit) <= trozo.size:
+        v = trozo.reshape(-1, 2, 1 << qubit)
+        return v[:, 0, :], v[:, 1, :]
+    if (inicio >> qubit) & 1:
+        return trozo[:0], trozo
+    return trozo, trozo[:0]
@@ -0,0 +1,73 @@
+"""
+MÓDULO: tests/conftest.py - Configuración común de las pruebas de qnc
+
+RESUMEN:
+Añade la raíz del repositorio al path (el paquete `qnc` se importa desde
+ahí, igual que en los programas de las sesiones) y define los generadores
+de circuitos aleatorios que usan las comprobaciones por fuerza bruta.
+
+USO:
+    python -m pytest -q tests
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+from pyquil import Program
+from pyquil.gates import CNOT, CZ, H, MEASURE, PHASE, RX, RY, RZ, S, SWAP, T, X, Y, Z
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PUERTAS_1Q = (H, X, Y, Z, S, T)
+ROTACIONES = (RX, RY, RZ, PHASE)
+PUERTAS_2Q = (CNOT, CZ, SWAP)
+CLIFFORD_1Q = (H, X, Y, Z, S)
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(1234)
+
+
+@pytest.fixture
+def circuito_aleatorio(rng):
+    """Función (num_qubits, puertas) -> Program con puertas de S01-S04 al azar."""
+    def crear(num_qubits, puertas=30):
+        prog = Program()
+        for _ in range(puertas):
+            tipo = rng.integers(3) if num_qubits > 1 else rng.integers(2)
+            if tipo == 0:
+                prog += PUERTAS_1Q[rng.integers(len(PUERTAS_1Q))](int(rng.integers(num_qubits)))
+            elif tipo == 1:
+                puerta = ROTACIONES[rng.integers(len(ROTACIONES))]
+                prog += puerta(float(rng.uniform(-np.pi, np.pi)), int(rng.integers(num_qubits)))
+            else:
+                a, b = rng.choice(num_qubits, size=2, replace=False)
+                prog += PUERTAS_2Q[rng.integers(len(PUERTAS_2Q))](int(a), int(b))
+        return prog
+    return crear
+
+
+@pytest.fixture
+def clifford_aleatorio(rng):
+    """Función (num_qubits, puertas) -> Program de Clifford con todos los qubits medidos al final."""
+    def crear(num_qubits, puertas=30):
+        prog = Program()
+        ro = prog.declare("ro", "BIT", num_qubits)
+        for _ in range(puertas):
+            if num_qubits > 1 and rng.random() < 0.4:
+                a, b = rng.choice(num_qubits, size=2, replace=False)
+                prog += PUERTAS_2Q[rng.integers(len(PUERTAS_2Q))](int(a), int(b))
+            else:
+                prog += CLIFFORD_1Q[rng.integers(len(CLIFFORD_1Q))](int(rng.integers(num_qubits)))
+        for q in range(num_qubits):
+            prog += MEASURE(q, ro[q])
+        return prog
+    return crear
+
+
+def pytest_configure(config):
+    # PyQuil 4 avisa de sus propias APIs obsoletas (get_qubits) en cada programa
+    config.addinivalue_line("filterwarnings", "ignore::DeprecationWarning:pyquil")
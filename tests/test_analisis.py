@@ -0,0 +1,72 @@
+"""
+MÓDULO: tests/test_analisis.py - Recuentos vectorizados frente a los bucles de S02
+
+RESUMEN:
+Compara los recuentos, histogramas y distribuciones de `qnc.analisis` con
+los bucles de Python que usan los programas de S02 y S05, con bloques
+pequeños para que los recorridos por bloques crucen varios trozos.
+"""
+
+import collections
+
+import numpy as np
+import pytest
+
+from qnc import (conteo_por_qubit, decidir_ganador, distribucion_conjunta,
+                 distribucion_marginal, empaquetar, histograma, histograma_dict,
+                 recuento_cara_cruz)
+
+
+@pytest.fixture
+def lectura(rng):
+    return rng.integers(0, 2, size=(1001, 4))
+
+
+def test_recuento_igual_a_bucle_de_s02(lectura):
+    cara = cruz = 0
+    for res in lectura:
+        for bit in res:
+            if bit == 0:
+                cara += 1
+            else:
+                cruz += 1
+    assert recuento_cara_cruz(lectura, bloque=64) == (cara, cruz)
+    assert recuento_cara_cruz(lectura.tolist()) == (cara, cruz)
+    conteos = conteo_por_qubit(lectura, bloque=100)
+    assert (conteos[:, 1] == lectura.sum(axis=0)).all()
+    assert (conteos.sum(axis=1) == len(lectura)).all()
+
+
+def test_ganador():
+    assert decidir_ganador(3, 1) == "gana A"
+    assert decidir_ganador(2, 2) == "empate"
+    assert decidir_ganador(0, 5) == "gana B"
+
+
+def test_empaquetar_como_la_ruleta_de_s05(lectura):
+    esperado = [sum(int(b) * 2 ** i for i, b in enumerate(fila)) for fila in lectura]
+    assert (empaquetar(lectura) == esperado).all()
+    assert (empaquetar(lectura, [2, 0]) == lectura[:, 2] + 2 * lectura[:, 0]).all()
+    with pytest.raises(ValueError):
+        empaquetar(np.zeros((1, 63), dtype=int))
+
+
+def test_histogramas_igual_a_counter(lectura):
+    contador = collections.Counter("".join(map(str, fila)) for fila in lectura)
+    assert histograma_dict(lectura, bloque=37) == dict(contador)
+    conteos = histograma(lectura, columnas=[1, 3], bloque=37)
+    for i in range(4):
+        assert conteos[i] == np.count_nonzero((lectura[:, 1] == (i & 1))
+                                              & (lectura[:, 3] == (i >> 1)))
+    with pytest.raises(ValueError):
+        histograma(np.zeros((1, 25), dtype=int))
+
+
+def test_distribuciones(lectura):
+    p = distribucion_conjunta(lectura, columnas=[0, 2], bloque=50)
+    for b0 in (0, 1):
+        for b2 in (0, 1):
+            esperado = np.mean((lectura[:, 0] == b0) & (lectura[:, 2] == b2))
+            assert p[b0, b2] == pytest.approx(esperado)
+    assert np.allclose(distribucion_marginal(lectura, 3, bloque=10),
+                       [1 - lectura[:, 3].mean(), lectura[:, 3].mean()])
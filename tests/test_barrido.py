@@ -0,0 +1,73 @@
+"""
+MÓDULO: tests/test_barrido.py - Barrido de ángulos y evolución unitaria de referencia
+
+RESUMEN:
+Cada fila de `barrido` debe coincidir con la simulación del mismo programa
+con el ángulo fijado en `memoria`. También comprueba que `evolucionar`
+rechaza las mediciones intermedias y omite las terminales.
+"""
+
+import numpy as np
+import pytest
+from pyquil import Program
+from pyquil.gates import CNOT, H, MEASURE, PHASE, RX, RY, RZ
+
+from qnc import Circuito, barrido, estado_base, evolucionar
+
+
+def _parametrico():
+    prog = Program()
+    theta = prog.declare("theta", "REAL")
+    prog += [H(0), RX(theta, 0), CNOT(0, 1), RY(2 * theta, 1), PHASE(theta, 1), RZ(0.3, 0)]
+    return prog
+
+
+def test_igual_a_cada_angulo_por_separado():
+    prog = _parametrico()
+    angulos = np.linspace(-np.pi, np.pi, 17)
+    amplitudes = barrido(prog, angulos)
+    circuito = Circuito.desde_programa(prog)
+    for fila, angulo in zip(amplitudes, angulos):
+        esperado = evolucionar(estado_base(2), circuito, {"theta": [angulo]})[0]
+        assert np.allclose(fila, esperado)
+
+
+def test_varios_estados_iniciales():
+    prog = _parametrico()
+    angulos = np.array([0.1, 0.7, 2.0])
+    amplitudes = barrido(prog, angulos, estado_inicial=np.eye(4)[[0, 3]])
+    assert amplitudes.shape == (2, 3, 4)
+    assert np.allclose(amplitudes[1], barrido(prog, angulos, estado_inicial=3))
+
+
+def test_memoria_con_varias_posiciones():
+    prog = Program()
+    theta = prog.declare("theta", "REAL", 2)
+    prog += [RX(theta[0], 0), RZ(theta[1], 0)]
+    amplitudes = barrido(prog, [0.0, np.pi], memoria={"theta": [0.0, 0.5]})
+    circuito = Circuito.desde_programa(prog)
+    for fila, angulo in zip(amplitudes, [0.0, np.pi]):
+        esperado = evolucionar(estado_base(1), circuito, {"theta": [angulo, 0.5]})[0]
+        assert np.allclose(fila, esperado)
+    with pytest.raises(ValueError, match="theta\\[1:2\\]"):
+        barrido(prog, [0.0])
+
+
+def test_parametro_no_valido():
+    with pytest.raises(ValueError):
+        barrido(Program(H(0)), [0.0])
+    prog = Program()
+    prog.declare("theta", "BIT")
+    with pytest.raises(ValueError, match="no REAL"):
+        barrido(prog, [0.0])
+
+
+def test_mediciones_intermedias_y_terminales():
+    intermedia = Program("DECLARE ro BIT[1]", H(0), MEASURE(0, ("ro", 0)), H(0))
+    with pytest.raises(ValueError, match="mediciones intermedias"):
+        evolucionar(estado_base(1), Circuito.desde_programa(intermedia))
+    terminal = Program("DECLARE ro BIT[1]", H(0), MEASURE(0, ("ro", 0)))
+    assert np.allclose(evolucionar(estado_base(1), Circuito.desde_programa(terminal))[0],
+                       [2 ** -0.5, 2 ** -0.5])
+    with pytest.raises(ValueError):
+        evolucionar(estado_base(1), Circuito.desde_programa(terminal), ignorar_mediciones=False)
@@ -0,0 +1,56 @@
+"""
+MÓDULO: tests/test_bloch.py - Trayectorias de Bloch frente a ⟨σ⟩ del vector de estado
+
+RESUMEN:
+Cada punto de `trayectoria_bloch` debe coincidir con (⟨X⟩, ⟨Y⟩, ⟨Z⟩) del
+estado obtenido aplicando las puertas una a una con `qnc.estado`.
+"""
+
+import numpy as np
+import pytest
+from pyquil import Program
+from pyquil.gates import RX
+
+from qnc import Circuito, estado_base, evolucionar, trayectoria_bloch, vector_bloch
+
+SIGMAS = (np.array([[0, 1], [1, 0]]), np.array([[0, -1j], [1j, 0]]), np.diag([1, -1]))
+
+
+def _esperanzas(psi):
+    return np.array([np.vdot(psi, s @ psi).real for s in SIGMAS])
+
+
+def test_vector_bloch_igual_a_esperanzas(rng):
+    psi = rng.standard_normal((50, 2)) + 1j * rng.standard_normal((50, 2))
+    psi /= np.linalg.norm(psi, axis=1, keepdims=True)
+    assert np.allclose(vector_bloch(psi), [_esperanzas(p) for p in psi])
+
+
+@pytest.mark.parametrize("estado_inicial", [0, 1])
+def test_trayectoria_igual_a_vector_de_estado(circuito_aleatorio, estado_inicial):
+    prog = circuito_aleatorio(1, puertas=25)
+    trayectoria = trayectoria_bloch(prog, estado_inicial)
+    psi = estado_base(1, estado_inicial)
+    esperada = [_esperanzas(psi[0])]
+    for inst in prog.instructions:
+        psi = evolucionar(psi, Circuito.desde_programa(Program(inst)))
+        esperada.append(_esperanzas(psi[0]))
+    assert np.allclose(trayectoria, esperada)
+
+
+def test_pasos_intermedios_y_lote():
+    prog = Program()
+    theta = prog.declare("theta", "REAL")
+    prog += RX(theta, 0)
+    angulos = np.array([np.pi / 2, np.pi])
+    trayectoria = trayectoria_bloch(prog, pasos_por_puerta=4, memoria={"theta": [angulos]})
+    assert trayectoria.shape == (2, 5, 3)
+    for b, total in enumerate(angulos):
+        for k in range(5):
+            psi = evolucionar(estado_base(1), Circuito.desde_programa(Program(RX(total * k / 4, 0))))
+            assert np.allclose(trayectoria[b, k], _esperanzas(psi[0]))
+
+
+def test_varios_qubits():
+    with pytest.raises(ValueError):
+        trayectoria_bloch(Program("H 0\nH 1"))
@@ -0,0 +1,111 @@
+"""
+MÓDULO: tests/test_cache_compilacion.py - Aciertos, fallos y desalojos de CacheCompilacion
+
+RESUMEN:
+Comprueba los dos niveles de la caché (LRU en memoria y ficheros en disco),
+sus contadores, el desalojo por número de entradas y por bytes, y que los
+metadatos de quilc sobreviven a la ida y vuelta por el disco.
+"""
+
+import os
+
+import pytest
+from pyquil import Program
+from pyquil.gates import CNOT, H, RX
+from qcs_sdk.compiler.quilc import NativeQuilMetadata
+
+from qnc import CacheCompilacion, QCConCache, clave_compilacion
+from qnc.cache_compilacion import CAMPOS_METADATOS
+
+
+def _compilado(angulo):
+    prog = Program(RX(angulo, 0), CNOT(0, 1))
+    prog.native_quil_metadata = NativeQuilMetadata(
+        final_rewiring=[1, 0], gate_depth=2, gate_volume=3, multiqubit_gate_depth=1,
+        program_duration=120.5, program_fidelity=0.97, qpu_runtime_estimation=0.25,
+        topological_swaps=0)
+    return prog
+
+
+class CompiladorContado:
+    """QuantumComputer mínimo que cuenta las llamadas a `compile`."""
+
+    def __init__(self):
+        self.compilaciones = 0
+
+    def compile(self, programa, to_native_gates=True, optimize=True, *, protoquil=None):
+        self.compilaciones += 1
+        return programa.copy()
+
+
+def test_fallo_y_acierto_en_memoria():
+    cache = CacheCompilacion(directorio=None)
+    clave = clave_compilacion(Program(H(0)))
+    assert cache.obtener(clave) is None
+    cache.guardar(clave, _compilado(0.1))
+    primero, segundo = cache.obtener(clave), cache.obtener(clave)
+    assert primero == _compilado(0.1) and primero is not segundo
+    datos = cache.estadisticas()
+    assert (datos["fallos"], datos["aciertos_memoria"], datos["aciertos_disco"]) == (1, 2, 0)
+    assert datos["tasa_aciertos"] == pytest.approx(2 / 3)
+
+
+def test_desalojo_lru_en_memoria():
+    cache = CacheCompilacion(directorio=None, max_memoria=2)
+    claves = [clave_compilacion(_compilado(a)) for a in (0.1, 0.2, 0.3)]
+    cache.guardar(claves[0], _compilado(0.1))
+    cache.guardar(claves[1], _compilado(0.2))
+    cache.obtener(claves[0])                  # la 0 pasa a ser la más reciente
+    cache.guardar(claves[2], _compilado(0.3))
+    assert cache.obtener(claves[1]) is None
+    assert cache.obtener(claves[0]) is not None and cache.obtener(claves[2]) is not None
+    datos = cache.estadisticas()
+    assert datos["desalojos_memoria"] == 1 and datos["entradas_memoria"] == 2
+
+
+def test_acierto_en_disco_y_metadatos(tmp_path):
+    cache = CacheCompilacion(directorio=str(tmp_path), max_memoria=1)
+    claves = [clave_compilacion(_compilado(a)) for a in (0.1, 0.2)]
+    cache.guardar(claves[0], _compilado(0.1))
+    cache.guardar(claves[1], _compilado(0.2))   # desaloja la 0 de la memoria
+    assert cache.obtener(claves[0]) == _compilado(0.1)
+    assert cache.estadisticas()["aciertos_disco"] == 1
+
+    # Otro proceso (otra instancia) encuentra los ficheros y sus metadatos
+    nueva = CacheCompilacion(directorio=str(tmp_path))
+    assert nueva.estadisticas()["bytes_disco"] == cache.estadisticas()["bytes_disco"] > 0
+    leido = nueva.obtener(claves[1])
+    esperado = _compilado(0.2).native_quil_metadata
+    for campo in CAMPOS_METADATOS:
+        assert getattr(leido.native_quil_metadata, campo) == getattr(esperado, campo)
+    sin_metadatos = Program(H(0))
+    nueva.guardar("sin", sin_metadatos)
+    assert CacheCompilacion(directorio=str(tmp_path)).obtener("sin").native_quil_metadata is None
+
+
+def test_desalojo_en_disco_por_antiguedad(tmp_path):
+    cache = CacheCompilacion(directorio=str(tmp_path), max_memoria=1)
+    cache.guardar("a", _compilado(0.1))
+    tamano = cache.estadisticas()["bytes_disco"]
+    cache.max_bytes_disco = int(2.5 * tamano)
+    cache.guardar("b", _compilado(0.2))
+    os.utime(tmp_path / "a.quil", (1000, 1000))
+    os.utime(tmp_path / "b.quil", (2000, 2000))
+    cache.guardar("c", _compilado(0.3))
+    assert not (tmp_path / "a.quil").exists()
+    assert (tmp_path / "b.quil").exists() and (tmp_path / "c.quil").exists()
+    datos = cache.estadisticas()
+    assert datos["desalojos_disco"] == 1 and datos["bytes_disco"] <= cache.max_bytes_disco
+    cache.limpiar()
+    assert cache.obtener("b") is None and not list(tmp_path.iterdir())
+
+
+def test_qc_con_cache_reutiliza_y_ajusta_shots():
+    qc = CompiladorContado()
+    con_cache = QCConCache(qc, CacheCompilacion(directorio=None))
+    prog = Program("# comentario", H(0), CNOT(0, 1))
+    con_cache.compile(prog.wrap_in_numshots_loop(10))
+    compilado = con_cache.compile(Program(H(0), CNOT(0, 1)).wrap_in_numshots_loop(1000))
+    assert qc.compilaciones == 1 and compilado.num_shots == 1000
+    con_cache.compile(Program(H(0), CNOT(0, 1)), optimize=False)
+    assert qc.compilaciones == 2
@@ -0,0 +1,92 @@
+"""
+MÓDULO: tests/test_carga.py - Generador de carga contra ServidorLocal
+
+RESUMEN:
+Pruebas cortas (decenas de peticiones) de `generar_carga` en los dos modos
+contra un `GestorConexiones` conectado a `ServidorLocal`: la mezcla de
+circuitos se respeta, los errores inyectados en la QVM se cuentan en la fase
+de ejecución y el informe se guarda en JSON y JSONL. No necesita Docker.
+"""
+
+import json
+import random
+from contextlib import ExitStack
+
+import numpy as np
+import pytest
+
+from qnc import GestorConexiones, QVMMuestreo, ServidorLocal, generar_carga
+from qnc.carga import CIRCUITOS, estadisticas_latencia
+
+
+@pytest.fixture
+def gestor():
+    """Función (**opciones del servidor) -> GestorConexiones contra un ServidorLocal."""
+    with ExitStack() as pila:
+        def crear(**opciones):
+            servidor = pila.enter_context(
+                ServidorLocal(puerto_qvm=0, puerto_quilc=0, semilla=0, **opciones))
+            return pila.enter_context(
+                GestorConexiones(url_qvm=servidor.url_qvm, url_quilc=servidor.url_quilc,
+                                 max_compilacion=2, max_ejecucion=2))
+        yield crear
+
+
+def test_circuitos_se_pueden_ejecutar():
+    aleatorio = random.Random(0)
+    qvm = QVMMuestreo(semilla=0)
+    for nombre, crear in CIRCUITOS.items():
+        programa = crear(aleatorio).wrap_in_numshots_loop(20)
+        lectura = qvm.run(programa).readout_data["ro"]
+        assert lectura.shape[0] == 20, nombre
+    bell = qvm.run(CIRCUITOS["bell"](aleatorio).wrap_in_numshots_loop(200)).readout_data["ro"]
+    assert (bell[:, 0] == bell[:, 1]).all()
+
+
+def test_concurrencia_fija(gestor, tmp_path):
+    informe = generar_carga(gestor(), mezcla={"bell": 3, "ruleta": 1}, concurrencia=2,
+                            duracion=30, peticiones=24, shots=10, semilla=1)
+    datos = informe.a_dict()
+    assert datos["peticiones"] == 24
+    assert set(datos["por_circuito"]) <= {"bell", "ruleta"}
+    assert datos["por_circuito"]["bell"] > datos["por_circuito"].get("ruleta", 0)
+    for fase in ("compilacion", "ejecucion"):
+        assert datos[fase]["errores"] == 0 and datos[fase]["peticiones"] == 24
+        assert 0 < datos[fase]["p50_ms"] <= datos[fase]["p99_ms"] <= datos[fase]["max_ms"]
+
+    ruta = str(tmp_path / "carga.jsonl")
+    informe.guardar_json(ruta)
+    informe.guardar_json(ruta)
+    lineas = open(ruta, encoding="utf-8").read().splitlines()
+    assert len(lineas) == 2 and json.loads(lineas[0])["configuracion"]["semilla"] == 1
+    informe.guardar_json(str(tmp_path / "carga.json"))
+    assert json.load(open(tmp_path / "carga.json", encoding="utf-8"))["peticiones"] == 24
+
+
+def test_tasa_fija_con_errores(gestor):
+    informe = generar_carga(gestor(error_qvm=1.0), concurrencia=2, tasa=200, duracion=0.1,
+                            shots=5, semilla=2)
+    datos = informe.a_dict()
+    assert 0 < datos["peticiones"] <= 20
+    assert datos["compilacion"]["errores"] == 0
+    assert datos["ejecucion"]["tasa_error"] == 1.0 and datos["rendimiento_total"] == 0
+    assert sum(datos["errores"].values()) == datos["peticiones"]
+    assert "Errores" in informe.resumen() and "tasa 200/s" in informe.resumen()
+
+
+def test_estadisticas_latencia():
+    metricas = estadisticas_latencia([0.001, 0.002, 0.003, 0.004], errores=1, duracion=2.0)
+    assert metricas["peticiones"] == 5 and metricas["tasa_error"] == pytest.approx(0.2)
+    assert metricas["rendimiento"] == 2.0
+    assert metricas["p50_ms"] == pytest.approx(np.percentile([1, 2, 3, 4], 50))
+    assert estadisticas_latencia([], 0, 1.0)["media_ms"] is None
+
+
+def test_parametros_no_validos():
+    qvm = QVMMuestreo()
+    with pytest.raises(ValueError, match="Mezcla"):
+        generar_carga(qvm, mezcla={"grover": 1})
+    with pytest.raises(ValueError, match="tasa"):
+        generar_carga(qvm, tasa=0)
+    with pytest.raises(ValueError, match="concurrencia"):
+        generar_carga(qvm, concurrencia=0)
@@ -0,0 +1,173 @@
+"""
+MÓDULO: tests/test_conexiones.py - Grupos de clientes y GestorConexiones contra ServidorLocal
+
+RESUMEN:
+Comprueba que los clientes prestados vuelven siempre al grupo (también si
+la petición falla), que un fallo al crear un cliente no deja el contador de
+creados inflado, que `vaciar` con clientes prestados no permite superar el
+tamaño del grupo y que `calentar` funciona con clientes prestados a otros
+hilos. Las pruebas del gestor usan `ServidorLocal` en puertos libres, así
+que no necesitan Docker.
+"""
+
+import threading
+import time
+from contextlib import ExitStack
+
+import pytest
+from pyquil import Program
+
+from qnc import GestorConexiones, ServidorLocal
+from qnc.conexiones import GrupoClientes
+
+MONEDA = "DECLARE ro BIT[1]\nH 0\nMEASURE 0 ro[0]"
+
+
+@pytest.fixture
+def gestor_con_servidor():
+    """Función (**opciones del servidor) -> (servidor, gestor), cerrados al terminar."""
+    with ExitStack() as pila:
+        def crear(max_compilacion=1, max_ejecucion=2, **opciones):
+            servidor = pila.enter_context(
+                ServidorLocal(puerto_qvm=0, puerto_quilc=0, semilla=0, **opciones))
+            gestor = pila.enter_context(
+                GestorConexiones(url_qvm=servidor.url_qvm, url_quilc=servidor.url_quilc,
+                                 max_compilacion=max_compilacion, max_ejecucion=max_ejecucion))
+            return servidor, gestor
+        yield crear
+
+
+# =============================================
+# GRUPO DE CLIENTES
+# =============================================
+def test_tamano_invalido():
+    with pytest.raises(ValueError):
+        GrupoClientes(object, 0)
+
+
+def test_cliente_vuelve_al_grupo_tras_un_error():
+    grupo = GrupoClientes(object, 2)
+    with pytest.raises(RuntimeError):
+        with grupo.tomar():
+            raise RuntimeError("petición fallida")
+    assert grupo.creados == 1 and len(grupo.todos()) == 1
+    with grupo.tomar_todos() as clientes:
+        assert len(clientes) == 2 and not grupo.todos()
+    assert grupo.creados == 2 and len(grupo.todos()) == 2
+
+
+def test_fallo_al_crear_no_cuenta_el_cliente():
+    intentos = []
+
+    def crear():
+        intentos.append(1)
+        if len(intentos) == 1:
+            raise ConnectionError("quilc no responde")
+        return object()
+
+    grupo = GrupoClientes(crear, 1)
+    with pytest.raises(ConnectionError):
+        with grupo.tomar():
+            pass
+    assert grupo.creados == 0 and not grupo.todos()
+    with grupo.tomar() as cliente:
+        assert cliente is not None
+    assert grupo.creados == 1
+
+
+def test_espera_a_que_se_devuelva_un_cliente():
+    grupo = GrupoClientes(object, 1)
+    prestado = threading.Event()
+
+    def retener():
+        with grupo.tomar():
+            prestado.set()
+            time.sleep(0.1)
+
+    hilo = threading.Thread(target=retener)
+    hilo.start()
+    prestado.wait()
+    with grupo.tomar():
+        pass
+    hilo.join()
+    assert grupo.esperas == 1 and grupo.creados == 1
+
+
+def test_vaciar_con_un_cliente_prestado():
+    grupo = GrupoClientes(object, 1)
+    with grupo.tomar() as viejo:
+        grupo.vaciar()
+        assert grupo.creados == 1 and not grupo.todos()
+        segundo = []
+
+        def tomar_otro():
+            with grupo.tomar() as cliente:
+                segundo.append(cliente)
+
+        hilo = threading.Thread(target=tomar_otro)
+        hilo.start()
+        hilo.join(0.1)
+        # El cliente prestado sigue contando: no se presta un segundo a la vez
+        assert hilo.is_alive() and not segundo
+    hilo.join()
+    # El cliente viejo se descarta al devolverse y el otro hilo crea uno nuevo
+    assert segundo[0] is not viejo and grupo.todos() == segundo
+    assert grupo.creados == 1 and grupo.esperas == 1
+
+
+def test_vaciar_suelta_los_libres():
+    grupo = GrupoClientes(object, 2)
+    with grupo.tomar_todos() as viejos:
+        pass
+    grupo.vaciar()
+    assert grupo.creados == 0 and not grupo.todos()
+    with grupo.tomar() as cliente:
+        assert cliente not in viejos
+    assert grupo.creados == 1 and len(grupo.todos()) == 1
+
+
+# =============================================
+# GESTOR CONTRA EL SERVIDOR LOCAL
+# =============================================
+def test_compilar_y_ejecutar(gestor_con_servidor):
+    _, gestor = gestor_con_servidor()
+    compilado = gestor.compile(Program(MONEDA).wrap_in_numshots_loop(50))
+    lectura = gestor.run(compilado).readout_data["ro"]
+    assert lectura.shape == (50, 1) and set(lectura.ravel()) <= {0, 1}
+
+
+def test_error_de_la_qvm_devuelve_el_cliente(gestor_con_servidor):
+    servidor, gestor = gestor_con_servidor(error_qvm=1.0)
+    compilado = gestor.compile(Program(MONEDA).wrap_in_numshots_loop(10))
+    for _ in range(3):
+        with pytest.raises(RuntimeError, match="inyectado"):
+            gestor.run(compilado)
+    creados, tamano, esperas = gestor.estadisticas()["qvm"]
+    assert creados == 1 and esperas == 0 and len(gestor.ejecutores.todos()) == 1
+    assert servidor.estadisticas()["multishot"] == (3, 3)
+
+
+def test_error_de_quilc(gestor_con_servidor):
+    _, gestor = gestor_con_servidor(error_quilc=1.0)
+    with pytest.raises(Exception):
+        gestor.compile(Program(MONEDA))
+    assert len(gestor.compiladores.todos()) == gestor.compiladores.creados == 1
+
+
+def test_calentar_con_clientes_prestados(gestor_con_servidor):
+    _, gestor = gestor_con_servidor(max_compilacion=1, max_ejecucion=3)
+    prestado = threading.Event()
+
+    def retener():
+        with gestor.compiladores.tomar():
+            prestado.set()
+            time.sleep(0.2)
+
+    hilo = threading.Thread(target=retener)
+    hilo.start()
+    prestado.wait()
+    assert gestor.calentar(funcion_onda=True) > 0
+    hilo.join()
+    datos = gestor.estadisticas()
+    assert datos["quilc"][0] == 1 and datos["quilc"][2] >= 1
+    assert datos["qvm"][0] == 3 and datos["funcion_onda"][0] == 2
@@ -0,0 +1,82 @@
+"""
+MÓDULO: tests/test_despachador.py - Elección del motor de QVMAutomatica
+
+RESUMEN:
+Cada tipo de circuito debe ir al motor que lo admite (producto sin
+entrelazamiento, estabilizador para Clifford con mediciones intermedias,
+remoto cuando ningún motor local sirve) y `QVMAutomatica` debe ejecutar con
+el motor elegido, respetar el motor forzado y fallar si necesita el remoto
+sin respaldo.
+"""
+
+import logging
+
+import numpy as np
+import pytest
+from pyquil import Program
+
+from qnc import AnalisisPrograma, QVMAutomatica, elegir_motor
+
+MONEDAS = "DECLARE ro BIT[4]\nH 0\nH 1\nH 2\nH 3\n" + "".join(
+    f"MEASURE {q} ro[{q}]\n" for q in range(4))
+BELL = "DECLARE ro BIT[2]\nH 0\nCNOT 0 1\nMEASURE 0 ro[0]\nMEASURE 1 ro[1]"
+
+
+def _ghz(n, extra=""):
+    """GHZ de n qubits medido a mitad de circuito (y `extra` después)."""
+    return Program(f"DECLARE ro BIT[{n}]\nH 0\n"
+                   + "".join(f"CNOT 0 {q}\n" for q in range(1, n))
+                   + "".join(f"MEASURE {q} ro[{q}]\n" for q in range(n)) + extra)
+
+
+def test_analisis():
+    a = AnalisisPrograma(Program(BELL).wrap_in_numshots_loop(7))
+    assert a.soportado and a.entrelazante and a.terminales and a.clifford
+    assert (a.num_qubits, a.num_operaciones, a.num_mediciones, a.num_medidos, a.shots) == (2, 2, 2, 2, 7)
+    assert a.puertas == {"H", "CNOT"}
+    assert not AnalisisPrograma(Program("DECLARE ro BIT[1]\nRESET\nMEASURE 0 ro[0]")).soportado
+
+
+def test_motor_por_tipo_de_circuito():
+    assert elegir_motor(Program(MONEDAS)).motor == "producto"
+    decision = elegir_motor(_ghz(30, "H 0\n"))
+    assert decision.motor == "estabilizador"
+    assert set(decision.costes) == {"estabilizador"}
+
+    remoto = elegir_motor(_ghz(3, "T 0\n"))
+    assert remoto.motor == "remoto" and "intermedias" in remoto.motivo
+    grande = Program("DECLARE ro BIT[1]\nT 0\nCNOT 0 29\nMEASURE 0 ro[0]")
+    assert "superan" in elegir_motor(grande).motivo
+    assert elegir_motor(grande, max_qubits_vector=30).motor == "vector"
+
+
+def test_el_mas_barato_entre_los_que_admiten():
+    decision = elegir_motor(Program(BELL).wrap_in_numshots_loop(1000))
+    assert "producto" not in decision.costes
+    assert decision.coste == min(decision.costes.values())
+
+
+def test_qvm_automatica(caplog):
+    qvm = QVMAutomatica(semilla=0)
+    with caplog.at_level(logging.INFO, logger="qnc.despachador"):
+        ro = qvm.run(qvm.compile(_ghz(30).wrap_in_numshots_loop(50))).readout_data["ro"]
+    assert qvm.ultima_decision.motor == "estabilizador"
+    assert "Motor estabilizador" in caplog.text
+    assert ro.shape == (50, 30) and (ro == ro[:, :1]).all()
+
+    bell = Program(BELL).wrap_in_numshots_loop(200)
+    ro = qvm.run(bell, motor="vector").readout_data["ro"]
+    assert qvm.ultima_decision.forzado and qvm.ultima_decision.motor == "vector"
+    assert (ro[:, 0] == ro[:, 1]).all() and 0 < ro[:, 0].mean() < 1
+
+
+def test_errores_de_motor():
+    with pytest.raises(ValueError, match="desconocido"):
+        QVMAutomatica(forzar="gpu")
+    with pytest.raises(ValueError, match="respaldo"):
+        QVMAutomatica().run(_ghz(3, "T 0\n"))
+    with pytest.raises(ValueError, match="respaldo"):
+        QVMAutomatica(forzar="remoto").run(Program(BELL))
+    assert np.array_equal(QVMAutomatica(forzar="producto", semilla=1).run(
+        Program("DECLARE ro BIT[1]\nX 0\nMEASURE 0 ro[0]").wrap_in_numshots_loop(5)
+    ).readout_data["ro"], np.ones((5, 1)))
@@ -0,0 +1,110 @@
+"""
+MÓDULO: tests/test_ejecutor_diferido.py - Agrupación, reserva y errores de EjecutorDiferido
+
+RESUMEN:
+Usa `QVMEstabilizador` como motor (los circuitos son de Clifford) envuelto
+en un QuantumComputer que puede fallar a voluntad, para comprobar que los
+envíos repetidos se agrupan, que la reserva de shots anticipados se sirve y
+que un fallo de `run` llega a todos los resultados del grupo sin perder la
+reserva ni impedir que los demás grupos terminen.
+"""
+
+import numpy as np
+import pytest
+from pyquil import Program
+
+from qnc import EjecutorDiferido, QVMEstabilizador
+
+MONEDA = "DECLARE ro BIT[1]\nH 0\nMEASURE 0 ro[0]"
+UNO = "DECLARE ro BIT[1]\nX 0\nMEASURE 0 ro[0]"
+
+
+class QCFalible:
+    """QuantumComputer de prueba: falla los programas que contienen `fallar`."""
+
+    def __init__(self):
+        self.motor = QVMEstabilizador(semilla=0)
+        self.fallar = None
+        self.ejecuciones = []
+
+    def compile(self, programa, to_native_gates=True, optimize=True, *, protoquil=None):
+        return programa
+
+    def run(self, ejecutable, memory_map=None):
+        if self.fallar is not None and self.fallar in ejecutable.out():
+            raise ConnectionError("QVM no disponible")
+        self.ejecuciones.append(ejecutable.num_shots)
+        return self.motor.run(ejecutable, memory_map)
+
+
+def _programa(texto, shots):
+    return Program(texto).wrap_in_numshots_loop(shots)
+
+
+def test_envios_identicos_en_una_ejecucion():
+    qc = QCFalible()
+    ejecutor = EjecutorDiferido(qc, anticipar=False)
+    resultados = [ejecutor.run(_programa(UNO, 5)) for _ in range(3)]
+    assert not any(r.listo for r in resultados)
+    assert all((r.readout_data["ro"] == 1).all() and r.readout_data["ro"].shape == (5, 1)
+               for r in resultados)
+    assert qc.ejecuciones == [15]
+    assert ejecutor.estadisticas()["ejecuciones"] == 1
+
+
+def test_reserva_de_shots_anticipados():
+    qc = QCFalible()
+    ejecutor = EjecutorDiferido(qc)
+    lecturas = [ejecutor.run(_programa(MONEDA, 1)).readout_data["ro"] for _ in range(20)]
+    datos = ejecutor.estadisticas()
+    assert datos["envios"] == 20 and datos["servidos_reserva"] > 0
+    assert datos["ejecuciones"] < 20 and len(qc.ejecuciones) == datos["ejecuciones"]
+    assert np.concatenate(lecturas).shape == (20, 1)
+
+
+def test_error_llega_a_todos_los_resultados_del_grupo():
+    qc = QCFalible()
+    qc.fallar = "H 0"
+    ejecutor = EjecutorDiferido(qc)
+    fallidos = [ejecutor.run(_programa(MONEDA, 4)) for _ in range(2)]
+    correcto = ejecutor.run(_programa(UNO, 4))
+    with pytest.raises(ConnectionError):
+        ejecutor.resolver()
+    assert all(r.listo for r in fallidos + [correcto])
+    for r in fallidos:
+        with pytest.raises(ConnectionError):
+            r.readout_data
+    # El otro grupo se ejecutó igualmente
+    assert (correcto.readout_data["ro"] == 1).all()
+    assert ejecutor.estadisticas()["ejecuciones"] == 1
+
+
+def test_error_al_leer_sin_resolver():
+    qc = QCFalible()
+    qc.fallar = "X 0"
+    ejecutor = EjecutorDiferido(qc)
+    resultado = ejecutor.run(_programa(UNO, 3))
+    with pytest.raises(ConnectionError):
+        resultado.readout_data
+    # Tras el fallo, un envío nuevo se vuelve a ejecutar
+    qc.fallar = None
+    assert (ejecutor.run(_programa(UNO, 3)).readout_data["ro"] == 1).all()
+
+
+def test_reserva_se_conserva_si_falla_la_ejecucion():
+    qc = QCFalible()
+    ejecutor = EjecutorDiferido(qc)
+    ejecutor.run(_programa(UNO, 5)).readout_data
+    ejecutor.run(_programa(UNO, 5)).readout_data       # repetido: deja 2 shots de reserva
+    assert ejecutor.estadisticas()["shots_ejecutados"] == 12
+
+    qc.fallar = "X 0"
+    with pytest.raises(ConnectionError):
+        ejecutor.run(_programa(UNO, 5)).readout_data     # no caben en la reserva: falla
+    qc.fallar = None
+    antes = ejecutor.estadisticas()
+    resultado = ejecutor.run(_programa(UNO, 2))
+    assert resultado.listo and (resultado.readout_data["ro"] == 1).all()
+    despues = ejecutor.estadisticas()
+    assert despues["servidos_reserva"] == antes["servidos_reserva"] + 1
+    assert despues["ejecuciones"] == antes["ejecuciones"]
@@ -0,0 +1,58 @@
+"""
+MÓDULO: tests/test_equivalencia.py - Equivalencias de los programas S01-S04
+
+RESUMEN:
+Ejecuta las comparaciones de `qnc.demos.equivalencias`, construidas con los
+circuitos del catálogo, y comprueba el resultado que afirma la documentación
+de cada programa. También comprueba la fase global de PHASE frente a RZ y el
+rechazo de las mediciones intermedias.
+"""
+
+import math
+
+import numpy as np
+import pytest
+from pyquil import Program
+from pyquil.gates import H, MEASURE, PHASE, RZ
+
+from qnc import comparar_circuitos
+from qnc.demos.equivalencias import COMPARACIONES, comparar
+
+
+@pytest.mark.parametrize("descripcion, a, b, estado, equivalentes, misma_medida", COMPARACIONES,
+                         ids=[c[0] for c in COMPARACIONES])
+def test_equivalencias_del_catalogo(descripcion, a, b, estado, equivalentes, misma_medida):
+    informe, medida = comparar(a, b, estado)
+    assert bool(informe) == equivalentes
+    assert medida == misma_medida
+    if equivalentes:
+        assert informe.fidelidad == pytest.approx(1.0)
+
+
+def test_s01p05_misma_medida_otro_estado():
+    # |Ψ⁺⟩ frente a -|Ψ⁻⟩: mismas probabilidades, estados ortogonales
+    informe, medida = comparar("S01P04", "S01P05", 0)
+    assert medida and informe.fidelidad == pytest.approx(0.0)
+
+
+def test_phase_frente_a_rz():
+    # PHASE(θ) = e^(iθ/2) RZ(θ)
+    informe = comparar_circuitos(Program(PHASE(math.pi / 4, 0)), Program(RZ(math.pi / 4, 0)))
+    assert informe and informe.metodo == "unitaria"
+    assert informe.fase_global == pytest.approx(-math.pi / 8)
+    informe, _ = comparar("S04P00B", "S04P05B", 0)
+    assert informe.fase_global == pytest.approx(0.0)
+
+
+def test_huella_detecta_circuitos_distintos(circuito_aleatorio):
+    a = circuito_aleatorio(12, puertas=40)
+    b = a.copy() + H(11)
+    informe = comparar_circuitos(a, b, rng=np.random.default_rng(0))
+    assert informe.metodo == "huella" and not informe
+    assert comparar_circuitos(a, a.copy(), rng=np.random.default_rng(0))
+
+
+def test_mediciones_intermedias():
+    intermedia = Program("DECLARE ro BIT[1]", H(0), MEASURE(0, ("ro", 0)), H(0))
+    with pytest.raises(ValueError, match="Circuito b"):
+        comparar_circuitos(Program(H(0)), intermedia)
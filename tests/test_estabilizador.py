@@ -0,0 +1,73 @@
+"""
+MÓDULO: tests/test_estabilizador.py - Tableau de estabilizadores frente al vector de estado
+
+RESUMEN:
+Las fórmulas afines de `formulas_medicion` dan la distribución EXACTA de
+los resultados (enumerando los 2^m valores de los bits aleatorios), que debe
+coincidir con |ψ|² del vector de estado en circuitos de Clifford al azar.
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+from pyquil import Program
+from pyquil.gates import CNOT, H, MEASURE, RX, T
+
+from qnc import Circuito, QVMEstabilizador, es_clifford, muestrear_estabilizador
+from qnc.estabilizador import formulas_medicion
+from qnc.muestreo import distribucion_medida
+
+
+def _distribucion_formulas(circuito):
+    """Distribución exacta (bit q del resultado = qubit q) a partir de las fórmulas."""
+    mediciones, formulas, m = formulas_medicion(circuito)
+    p = np.zeros(2 ** circuito.num_qubits)
+    for v in itertools.product((0, 1), repeat=m):
+        bits = (formulas[:, 0] + formulas[:, 1:] @ np.array(v, dtype=np.int64)) % 2
+        p[sum(int(b) << med.qubit for b, med in zip(bits, mediciones))] += 2.0 ** -m
+    return p
+
+
+@pytest.mark.parametrize("num_qubits", [1, 2, 4, 6])
+def test_distribucion_exacta_igual_a_vector_de_estado(clifford_aleatorio, num_qubits):
+    for _ in range(5):
+        circuito = Circuito.desde_programa(clifford_aleatorio(num_qubits, puertas=8 * num_qubits))
+        assert es_clifford(circuito)
+        medidos, p = distribucion_medida(circuito)
+        assert medidos == list(range(num_qubits))
+        assert np.allclose(_distribucion_formulas(circuito), p)
+
+
+def test_medicion_intermedia_repetida():
+    # Medir dos veces el mismo qubit da el mismo bit: la segunda fórmula es determinista
+    prog = Program("DECLARE ro BIT[3]\nH 0\nMEASURE 0 ro[0]\nCNOT 0 1\nMEASURE 0 ro[1]\n"
+                   "MEASURE 1 ro[2]").wrap_in_numshots_loop(500)
+    lectura = muestrear_estabilizador(Circuito.desde_programa(prog),
+                                      rng=np.random.default_rng(0))["ro"]
+    assert (lectura[:, 0] == lectura[:, 1]).all() and (lectura[:, 0] == lectura[:, 2]).all()
+    assert 0 < lectura[:, 0].mean() < 1
+
+
+def test_lectura_compacta_igual_a_int64(clifford_aleatorio):
+    circuito = Circuito.desde_programa(clifford_aleatorio(5).wrap_in_numshots_loop(1000))
+    normal = muestrear_estabilizador(circuito, rng=np.random.default_rng(7), bloque_bytes=4096)
+    compacta = muestrear_estabilizador(circuito, rng=np.random.default_rng(7), bloque_bytes=4096,
+                                       compacta=True)
+    assert (np.asarray(compacta["ro"]) == normal["ro"]).all()
+
+
+def test_no_clifford_sin_respaldo():
+    circuito = Circuito.desde_programa(Program(H(0), T(0), RX(0.3, 1), CNOT(0, 1)))
+    assert not es_clifford(circuito)
+    with pytest.raises(ValueError):
+        formulas_medicion(circuito)
+
+
+def test_qvm_estabilizador_bell():
+    prog = Program("DECLARE ro BIT[2]", H(0), CNOT(0, 1),
+                   MEASURE(0, ("ro", 0)), MEASURE(1, ("ro", 1))).wrap_in_numshots_loop(2000)
+    qvm = QVMEstabilizador(semilla=3)
+    lectura = qvm.run(qvm.compile(prog)).readout_data["ro"]
+    assert lectura.shape == (2000, 2) and (lectura[:, 0] == lectura[:, 1]).all()
+    assert abs(lectura[:, 0].mean() - 0.5) < 0.05
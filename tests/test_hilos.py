@@ -0,0 +1,46 @@
+"""
+MÓDULO: tests/test_hilos.py - SimuladorHilos frente a `qnc.estado.evolucionar`
+
+RESUMEN:
+El simulador multihilo reparte cada puerta entre varios hilos sobre el
+mismo vector. Se compara con el simulador de referencia en circuitos
+aleatorios y en el circuito de referencia de las mediciones de tiempo, y se
+comprueba que rechaza las mediciones intermedias.
+"""
+
+import numpy as np
+import pytest
+from pyquil import Program
+from pyquil.gates import CNOT, H, MEASURE
+
+from qnc import Circuito, SimuladorHilos, estado_base, evolucionar
+from qnc.hilos import circuito_referencia
+
+
+def _referencia(prog, num_qubits, psi=None):
+    psi = estado_base(num_qubits) if psi is None else np.atleast_2d(psi).astype(complex)
+    return evolucionar(psi, Circuito.desde_programa(prog))
+
+
+@pytest.mark.parametrize("hilos", [1, 3])
+def test_hilos_igual_a_referencia(circuito_aleatorio, hilos):
+    prog = circuito_aleatorio(14, puertas=60)
+    with SimuladorHilos(hilos=hilos) as sim:
+        psi = sim.evolucionar(prog)
+    assert np.allclose(psi, _referencia(prog, 14)[0])
+
+
+def test_hilos_estado_inicial_y_circuito_referencia(rng):
+    prog = circuito_referencia(13)
+    inicial = rng.standard_normal(2 ** 13) + 1j * rng.standard_normal(2 ** 13)
+    inicial /= np.linalg.norm(inicial)
+    with SimuladorHilos(hilos=2) as sim:
+        psi = sim.evolucionar(prog, inicial.copy())
+    assert np.allclose(psi, _referencia(prog, 13, inicial)[0])
+
+
+def test_medicion_intermedia_lanza_error():
+    prog = Program("DECLARE ro BIT[2]", H(0), MEASURE(0, ("ro", 0)), CNOT(0, 1),
+                   MEASURE(1, ("ro", 1)))
+    with SimuladorHilos(hilos=1) as sim, pytest.raises(ValueError):
+        sim.evolucionar(prog)
@@ -0,0 +1,54 @@
+"""
+MÓDULO: tests/test_lectura_compacta.py - Lecturas empaquetadas en bits
+
+RESUMEN:
+`LecturaCompacta` debe devolver exactamente el array int64 original al
+indexarla o recorrerla, también después de guardarla y cargarla con
+`np.memmap`, y servir tal cual a las funciones de `qnc.analisis`.
+"""
+
+import numpy as np
+import pytest
+
+from qnc import LecturaCompacta, ResultadoEjecucion, compactar_resultado, histograma
+
+
+@pytest.mark.parametrize("bits", [1, 4, 9, 17])
+def test_ida_y_vuelta(rng, bits):
+    lectura = rng.integers(0, 2, size=(333, bits))
+    compacta = LecturaCompacta.desde_lectura(lectura, bloque=50)
+    assert compacta.shape == lectura.shape
+    assert compacta.nbytes == 333 * ((bits + 7) // 8)
+    assert (compacta.desempaquetar() == lectura).all()
+    assert (np.asarray(compacta) == lectura).all()
+    assert (compacta[5] == lectura[5]).all() and (compacta[10:20] == lectura[10:20]).all()
+    assert (compacta[[3, 1, 7]] == lectura[[3, 1, 7]]).all()
+    assert (compacta[:, bits - 1] == lectura[:, bits - 1]).all()
+    assert (compacta.columna(bits - 1) == lectura[:, bits - 1]).all()
+    assert (compacta.enteros() == lectura @ (1 << np.arange(bits))).all()
+    assert (np.array(list(compacta)) == lectura).all()
+
+
+def test_guardar_y_cargar(tmp_path, rng):
+    lectura = rng.integers(0, 2, size=(100, 9))
+    LecturaCompacta.desde_lectura(lectura).guardar(tmp_path / "ro")
+    cargada = LecturaCompacta.cargar(tmp_path / "ro")
+    assert isinstance(cargada.datos, np.memmap)
+    assert (cargada[:] == lectura).all()
+    assert (histograma(cargada, bloque=16) == histograma(lectura)).all()
+
+
+def test_volcado_por_bloques_en_disco(tmp_path, rng):
+    lectura = rng.integers(0, 2, size=(64, 5))
+    en_disco = LecturaCompacta.crear_en_disco(tmp_path / "ro.npy", 64, 5)
+    for inicio in range(0, 64, 16):
+        en_disco.escribir_bloque(inicio, lectura[inicio:inicio + 16])
+    en_disco.datos.flush()
+    assert (LecturaCompacta.cargar(tmp_path / "ro.npy", mmap=False)[:] == lectura).all()
+
+
+def test_compactar_resultado(rng):
+    lectura = rng.integers(0, 2, size=(50, 3))
+    resultado = compactar_resultado(ResultadoEjecucion({"ro": lectura, "vacio": None}))
+    assert set(resultado.get_register_map()) == {"ro"}
+    assert (resultado.readout_data["ro"][:] == lectura).all()
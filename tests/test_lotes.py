@@ -0,0 +1,85 @@
+"""
+MÓDULO: tests/test_lotes.py - Orden, concurrencia y errores de ejecutar_lote
+
+RESUMEN:
+Usa un QuantumComputer de prueba con esperas artificiales (como las de red
+de quilc y la QVM) para comprobar que los resultados salen en el orden de
+entrada aunque terminen desordenados, que nunca hay más de `max_hilos`
+trabajos en curso y que los errores se relanzan o se guardan en el informe.
+"""
+
+import threading
+import time
+
+import pytest
+from pyquil import Program
+
+from qnc import QVMMuestreo, ejecutar_lote
+
+PROGRAMAS = [f"DECLARE ro BIT[1]\n{'X 0' if i % 2 else 'I 0'}\nMEASURE 0 ro[0]" for i in range(8)]
+
+
+class QCLento:
+    """QuantumComputer de prueba: espera en `run` y anota los trabajos simultáneos."""
+
+    def __init__(self, espera=0.01):
+        self.motor = QVMMuestreo(semilla=0)
+        self.espera = espera
+        self.en_curso = 0
+        self.max_en_curso = 0
+        self._cerrojo = threading.Lock()
+
+    def compile(self, programa):
+        if "FALLAR" in programa.out():
+            raise ConnectionError("quilc no disponible")
+        return programa
+
+    def run(self, ejecutable, memory_map=None):
+        with self._cerrojo:
+            self.en_curso += 1
+            self.max_en_curso = max(self.max_en_curso, self.en_curso)
+        try:
+            # Los primeros programas tardan más: terminan los últimos
+            time.sleep(self.espera * (1 + ejecutable.num_shots % 3))
+            return self.motor.run(ejecutable, memory_map)
+        finally:
+            with self._cerrojo:
+                self.en_curso -= 1
+
+
+def _programas(textos):
+    return [Program(t).wrap_in_numshots_loop(3 - i % 3) for i, t in enumerate(textos)]
+
+
+def test_resultados_en_orden_de_entrada():
+    qc = QCLento()
+    informe = ejecutar_lote(qc, _programas(PROGRAMAS), max_hilos=3)
+    for i, resultado in enumerate(informe.resultados):
+        assert (resultado.get_register_map()["ro"] == i % 2).all()
+    assert 1 < qc.max_en_curso <= 3
+    assert informe.hilos == 3
+    assert not informe.errores
+
+
+def test_hilos_acotados_por_programas():
+    informe = ejecutar_lote(QCLento(espera=0), _programas(PROGRAMAS[:2]), max_hilos=16)
+    assert informe.hilos == 2
+    assert ejecutar_lote(QCLento(), [], max_hilos=4).resultados == []
+
+
+def test_errores():
+    programas = _programas(PROGRAMAS[:3] + ["FALLAR 0"])
+    with pytest.raises(ConnectionError):
+        ejecutar_lote(QCLento(espera=0), programas)
+    informe = ejecutar_lote(QCLento(espera=0), programas, lanzar_errores=False)
+    assert [i for i, _ in informe.errores] == [3]
+    assert informe.resultados[3] is None and informe.resultados[0] is not None
+    assert "error" in informe.resumen()
+
+
+def test_informe_y_aceleracion():
+    informe = ejecutar_lote(QCLento(), _programas(PROGRAMAS), max_hilos=4, medir_secuencial=True)
+    assert informe.t_secuencial_medido > informe.t_lote
+    assert informe.t_secuencial_estimado >= sum(t.t_ejecucion for t in informe.trabajos)
+    assert informe.aceleracion > 1
+    assert "Secuencial medido" in informe.resumen()
@@ -0,0 +1,57 @@
+"""
+MÓDULO: tests/test_manifiesto.py - Catálogo S01-S04 en un solo proceso
+
+RESUMEN:
+Todo el catálogo debe pasar con los motores locales, los experimentos con el
+mismo programa deben reutilizar el resultado y `_comparar` debe aceptar las
+muestras compatibles con lo esperado y rechazar los resultados imposibles.
+"""
+
+import numpy as np
+import pytest
+
+from qnc import cargar_manifiesto, ejecutar_manifiesto
+from qnc.demos.catalogo import MANIFIESTO
+from qnc.manifiesto import EjecutorManifiesto, Experimento, _comparar
+
+
+def test_catalogo_local(tmp_path):
+    informe = ejecutar_manifiesto(MANIFIESTO, referencia=None, semilla=0)
+    assert informe.correctos == len(informe.filas), informe.resumen()
+    # S02P02A y S02P02B tienen el mismo programa y shots: uno de los dos se reutiliza
+    filas = {f.experimento.nombre: f for f in informe.filas}
+    assert filas["S02P02A"].desde_cache != filas["S02P02B"].desde_cache
+    assert "S01/S01P02.py" in informe.scripts
+    informe.guardar_csv(str(tmp_path / "catalogo.csv"))
+    assert (tmp_path / "catalogo.csv").read_text(encoding="utf-8").count("\n") > len(informe.filas)
+
+
+def test_cargar_manifiesto():
+    opciones, experimentos = cargar_manifiesto(MANIFIESTO)
+    assert "experimentos" not in opciones
+    s04 = next(e for e in experimentos if e.nombre == "S04P00B")
+    assert s04.programa().out().startswith("X 0\n")
+    assert np.isclose(s04.esperado[1], np.exp(1j * np.pi / 4))
+    with pytest.raises(ValueError, match="tipo desconocido"):
+        Experimento("x", "H 0", tipo="otro")
+    with pytest.raises(ValueError, match="Motor desconocido"):
+        EjecutorManifiesto(motor="docker")
+
+
+def test_comparar_rechaza_resultados_imposibles():
+    experimento = Experimento("bell", "H 0\nCNOT 0 1", shots=1,
+                              esperado={"00": 0.5, "11": 0.5})
+    assert _comparar(experimento, np.array([[1, 1]]))[1]
+    assert not _comparar(experimento, np.array([[0, 1]]))[1]
+    muchos = np.array([[0, 0]] * 500 + [[1, 1]] * 500)
+    assert _comparar(experimento, muchos) == (0.0, True)
+    experimento.tolerancia = 0.1
+    assert not _comparar(experimento, np.array([[0, 0]] * 10))[1]
+
+
+def test_comparar_funcion_onda():
+    experimento = Experimento("S04P00B", "X 0\nPHASE(pi/4) 0", tipo="funcion_onda",
+                              esperado=["0", "0.7071067812+0.7071067812j"])
+    assert _comparar(experimento, np.array([0, np.exp(1j * np.pi / 4)]))[1]
+    assert not _comparar(experimento, np.array([0, 1j]))[1]
+    assert _comparar(experimento, np.array([1, 0, 0, 0]))[1] is False
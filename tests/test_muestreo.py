@@ -0,0 +1,56 @@
+"""
+MÓDULO: tests/test_muestreo.py - Muestreo local frente a la distribución exacta
+
+RESUMEN:
+Frecuencias de `muestrear` y de `QVMMuestreo` frente a la distribución
+del vector de estado, independencia de los shots barajados y rechazo de
+las mediciones intermedias.
+"""
+
+import numpy as np
+import pytest
+from pyquil import Program
+from pyquil.gates import CNOT, H, MEASURE, RY
+
+from qnc import Circuito, QVMMuestreo, muestrear
+from qnc.muestreo import distribucion_medida, mediciones_terminales
+
+
+@pytest.mark.parametrize("barajar", [True, False])
+def test_frecuencias_igual_a_distribucion(circuito_aleatorio, barajar):
+    prog = circuito_aleatorio(3, puertas=20)
+    ro = prog.declare("ro", "BIT", 3)
+    prog += [MEASURE(q, ro[q]) for q in range(3)]
+    circuito = Circuito.desde_programa(prog)
+    _, p = distribucion_medida(circuito)
+    lectura = muestrear(circuito, 200000, rng=np.random.default_rng(5), barajar=barajar)["ro"]
+    frecuencias = np.bincount(lectura @ [1, 2, 4], minlength=8) / len(lectura)
+    assert np.abs(frecuencias - p).max() < 0.01
+
+
+def test_shots_independientes_en_orden_aleatorio():
+    prog = Program("DECLARE ro BIT[2]", H(0), CNOT(0, 1), MEASURE(0, ("ro", 0)),
+                   MEASURE(1, ("ro", 1))).wrap_in_numshots_loop(100000)
+    lectura = muestrear(Circuito.desde_programa(prog), rng=np.random.default_rng(1))["ro"]
+    assert (lectura[:, 0] == lectura[:, 1]).all()
+    # Con shots independientes, la mitad de los shots consecutivos cambian de valor
+    cambios = np.count_nonzero(np.diff(lectura[:, 0]))
+    assert abs(cambios / len(lectura) - 0.5) < 0.01
+
+
+def test_qvm_muestreo_con_la_interfaz_de_pyquil():
+    prog = Program("DECLARE ro BIT[2]", H(0), CNOT(0, 1), MEASURE(0, ("ro", 0)),
+                   MEASURE(1, ("ro", 1))).wrap_in_numshots_loop(1000)
+    qvm = QVMMuestreo(semilla=0)
+    resultado = qvm.run(qvm.compile(prog))
+    assert resultado.readout_data["ro"].shape == (1000, 2)
+    assert (resultado.get_register_map()["ro"].sum(axis=1) % 2 == 0).all()
+
+
+def test_medicion_intermedia():
+    prog = Program("DECLARE ro BIT[2]", H(0), MEASURE(0, ("ro", 0)), RY(0.3, 0),
+                   MEASURE(0, ("ro", 1)))
+    circuito = Circuito.desde_programa(prog)
+    assert not mediciones_terminales(circuito)
+    with pytest.raises(ValueError):
+        muestrear(circuito)
@@ -0,0 +1,64 @@
+"""
+MÓDULO: tests/test_observables.py - Valores esperados frente a ⟨ψ|P|ψ⟩ denso
+
+RESUMEN:
+Compara `valores_esperados` y `valor_esperado` con el producto ψ† P ψ
+calculado con la matriz de cada cadena, en estados aleatorios y en los
+circuitos de las sesiones.
+"""
+
+import numpy as np
+import pytest
+from pyquil import Program
+from pyquil.gates import CNOT, H
+
+from qnc import CadenasPauli, valor_esperado, valores_esperados
+
+
+def _estado_aleatorio(rng, num_qubits, lote=None):
+    forma = (2 ** num_qubits,) if lote is None else (lote, 2 ** num_qubits)
+    psi = rng.standard_normal(forma) + 1j * rng.standard_normal(forma)
+    return psi / np.linalg.norm(psi, axis=-1, keepdims=True)
+
+
+def _denso(psi, cadenas):
+    return np.array([np.vdot(psi, cadenas.matriz(i) @ psi) for i in range(len(cadenas))])
+
+
+@pytest.mark.parametrize("num_qubits", [1, 3, 6])
+def test_igual_a_producto_denso(rng, num_qubits):
+    psi = _estado_aleatorio(rng, num_qubits)
+    cadenas = CadenasPauli.aleatorias(60, num_qubits, rng)
+    valores = valores_esperados(psi, cadenas)
+    assert np.isrealobj(valores)
+    assert np.allclose(valores, _denso(psi, cadenas).real)
+
+
+def test_lote_bloques_y_walsh_hadamard(rng):
+    # 300 cadenas con pocas máscaras X distintas: los grupos grandes usan Walsh-Hadamard
+    psi = _estado_aleatorio(rng, 4, lote=3)
+    x = np.zeros((300, 4), dtype=np.uint8)
+    x[:, 0] = rng.integers(0, 2, size=300)
+    cadenas = CadenasPauli.desde_bits(x, rng.integers(0, 2, size=(300, 4)))
+    valores = valores_esperados(psi, cadenas, bloque=64)
+    assert valores.shape == (3, 300)
+    for b in range(3):
+        assert np.allclose(valores[b], _denso(psi[b], cadenas).real)
+
+
+def test_fases_complejas(rng):
+    psi = _estado_aleatorio(rng, 2)
+    cadenas = CadenasPauli.desde_texto(["iXY", "-ZZ", "-iYI", "XX"])
+    assert np.allclose(valores_esperados(psi, cadenas), _denso(psi, cadenas))
+
+
+def test_suma_ponderada_y_programa():
+    bell = Program(H(0), CNOT(0, 1))
+    assert np.isclose(valor_esperado(bell, {"ZZ": 1.0, "XX": 0.5, "YY": 2.0}), 1.0 + 0.5 - 2.0)
+    coeficientes = np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+    assert np.allclose(valor_esperado(bell, ["ZI", "XX"], coeficientes), [0.0, 1.0, 1.0])
+
+
+def test_cadena_mayor_que_el_estado(rng):
+    with pytest.raises(ValueError):
+        valores_esperados(_estado_aleatorio(rng, 2), "IIZ")
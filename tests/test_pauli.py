@@ -0,0 +1,63 @@
+"""
+MÓDULO: tests/test_pauli.py - Álgebra de CadenasPauli frente a matrices densas
+
+RESUMEN:
+Productos, fases, conmutación e igualdad de cadenas aleatorias comparados
+con los mismos cálculos sobre las matrices de Kronecker (`matriz`).
+"""
+
+import numpy as np
+import pytest
+
+from qnc import CadenasPauli
+
+
+def test_relaciones_de_s03():
+    z, x, y = CadenasPauli.desde_texto(["Z", "X", "Y"])
+    assert (z * x == CadenasPauli.desde_texto("iY")).all()
+    assert (x * z == CadenasPauli.desde_texto("-iY")).all()
+    assert not z.conmutan(x).any()
+
+
+@pytest.mark.parametrize("num_qubits", [1, 3, 5])
+def test_producto_igual_a_matrices(rng, num_qubits):
+    a = CadenasPauli.aleatorias(40, num_qubits, rng)
+    b = CadenasPauli.aleatorias(40, num_qubits, rng)
+    b.fase[:] = rng.integers(0, 4, size=len(b))
+    producto = a * b
+    for i in range(len(a)):
+        assert np.allclose(producto.matriz(i), a.matriz(i) @ b.matriz(i))
+
+
+@pytest.mark.parametrize("num_qubits", [2, 4, 70])
+def test_conmutacion_igual_a_matrices(rng, num_qubits):
+    a = CadenasPauli.aleatorias(30, num_qubits, rng)
+    b = CadenasPauli.aleatorias(25, num_qubits, rng)
+    # Conmutan si y solo si el producto en los dos órdenes es el mismo
+    esperada = np.array([[((a[i] * b[j]) == (b[j] * a[i]))[0] for j in range(len(b))]
+                         for i in range(len(a))])
+    assert (a.matriz_conmutacion(b) == esperada).all()
+    assert (a.matriz_conmutacion(b, bloque=7) == esperada).all()
+    assert (a[:25].conmutan(b) == np.diag(esperada[:25])).all()
+    if num_qubits <= 4:
+        for i in range(len(a)):
+            for j in range(len(b)):
+                ma, mb = a.matriz(i), b.matriz(j)
+                assert np.allclose(ma @ mb, mb @ ma) == esperada[i, j]
+
+
+def test_igualdad_y_texto(rng):
+    a = CadenasPauli.aleatorias(50, 6, rng)
+    a.fase[:] = rng.integers(0, 4, size=len(a))
+    copia = CadenasPauli.desde_texto(a.a_texto(), num_qubits=6)
+    assert (copia == a).all()
+    girada = CadenasPauli(a.x, a.z, a.fase + 1, a.num_qubits)
+    assert not (girada == a).any()
+    assert girada.iguales_salvo_fase(a).all()
+    pesos = [sum(c in "XYZ" for c in texto) for texto in a.a_texto()]
+    assert (a.peso() == pesos).all()
+
+
+def test_letra_no_valida():
+    with pytest.raises(ValueError):
+        CadenasPauli.desde_texto("XQ")
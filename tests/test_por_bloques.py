@@ -0,0 +1,85 @@
+"""
+MÓDULO: tests/test_por_bloques.py - Ejecución por bloques con memoria acotada
+
+RESUMEN:
+Los bloques que entrega `ejecutar_por_bloques` suman los shots pedidos y,
+mientras el programa que llama los recorre, nunca hay vivos más bloques de
+los que caben en `memoria_max`. También cuenta las monedas de S02P02A y el
+estado de Bell de S01P02 tomados del catálogo.
+"""
+
+import weakref
+
+import numpy as np
+import pytest
+
+from qnc import (QVMMuestreo, QVMProducto, ejecutar_por_bloques, histograma_por_bloques,
+                 recuento_por_bloques, shots_por_bloque)
+from qnc.demos.catalogo import programa_del_catalogo
+
+
+class _Resultado:
+    def __init__(self, datos):
+        self._datos = datos
+
+    def get_register_map(self):
+        return self._datos
+
+
+class _QCContador:
+    """Motor falso que anota cuántos bloques siguen vivos al crear cada uno."""
+
+    def __init__(self, bits):
+        self.bits = bits
+        self.vivos = []
+        self.max_vivos = 0
+        self.max_bytes = 0
+
+    def compile(self, programa):
+        return programa
+
+    def run(self, programa, memory_map=None):
+        lectura = np.zeros((programa.num_shots, self.bits), dtype=np.int64)
+        self.vivos = [r for r in self.vivos if r() is not None] + [weakref.ref(lectura)]
+        arrays = [r() for r in self.vivos]
+        self.max_vivos = max(self.max_vivos, len(arrays))
+        self.max_bytes = max(self.max_bytes, sum(a.nbytes for a in arrays))
+        del arrays
+        return _Resultado({"ro": lectura})
+
+
+@pytest.mark.parametrize("solapar, vivos", [(True, 3), (False, 2)])
+def test_memoria_acotada(solapar, vivos):
+    prog = programa_del_catalogo("S02P02A")
+    memoria = 64 * 1024
+    qc = _QCContador(bits=4)
+    tamanos = [len(bloque["ro"]) for bloque in
+               ejecutar_por_bloques(qc, prog, 10000, memoria_max=memoria, solapar=solapar)]
+    assert sum(tamanos) == 10000
+    assert qc.max_vivos <= vivos
+    assert qc.max_bytes <= memoria
+    # El peor caso (depende de cuándo corre el hilo) también cabe en el presupuesto
+    assert vivos * max(tamanos) * 8 * 4 <= memoria
+
+
+def test_tamano_de_bloque():
+    prog = programa_del_catalogo("S01P02")
+    assert shots_por_bloque(prog, 48 * 1024) == 48 * 1024 // (8 * 2 * 3)
+    assert shots_por_bloque(prog, 48 * 1024, bloques_en_vuelo=2) == 48 * 1024 // (8 * 2 * 2)
+    assert shots_por_bloque(prog, 1) == 1
+
+
+def test_recuento_por_bloques_monedas():
+    cara, cruz = recuento_por_bloques(QVMProducto(semilla=2), programa_del_catalogo("S02P02A"),
+                                      300000, memoria_max=256 * 1024)
+    assert cara + cruz == 4 * 300000
+    assert abs(cara / (cara + cruz) - 0.5) < 0.005
+
+
+def test_histograma_por_bloques_bell():
+    conteos = histograma_por_bloques(QVMMuestreo(semilla=3, barajar=False),
+                                     programa_del_catalogo("S01P02"), 200000,
+                                     memoria_max=128 * 1024)
+    assert conteos.sum() == 200000
+    assert conteos[1] == conteos[2] == 0
+    assert abs(conteos[0] / 200000 - 0.5) < 0.01
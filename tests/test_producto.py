@@ -0,0 +1,88 @@
+"""
+MÓDULO: tests/test_producto.py - Motor de estados producto frente al vector de estado
+
+RESUMEN:
+En circuitos sin puertas multiqubit, P(1) de cada qubit calculada por
+separado debe coincidir con la marginal del vector de estado completo, y
+las frecuencias de `muestrear_producto` con esas probabilidades. Los
+circuitos con entrelazamiento o mediciones intermedias se rechazan o se
+envían al respaldo.
+"""
+
+import numpy as np
+import pytest
+from pyquil import Program
+from pyquil.gates import CNOT, H, MEASURE, PHASE, RX, RY, RZ, S, T
+
+from qnc import Circuito, QVMMuestreo, QVMProducto, es_producto, muestrear_producto
+from qnc.muestreo import distribucion_medida
+from qnc.producto import estados_qubits
+
+PUERTAS = (H, S, T)
+ROTACIONES = (RX, RY, RZ, PHASE)
+
+
+def _producto_aleatorio(rng, num_qubits, puertas=20):
+    prog = Program()
+    ro = prog.declare("ro", "BIT", num_qubits)
+    for _ in range(puertas):
+        q = int(rng.integers(num_qubits))
+        if rng.random() < 0.5:
+            prog += PUERTAS[rng.integers(len(PUERTAS))](q)
+        else:
+            prog += ROTACIONES[rng.integers(len(ROTACIONES))](float(rng.uniform(-np.pi, np.pi)), q)
+    prog += [MEASURE(q, ro[q]) for q in range(num_qubits)]
+    return prog
+
+
+def test_marginales_igual_a_vector_de_estado(rng):
+    for _ in range(5):
+        circuito = Circuito.desde_programa(_producto_aleatorio(rng, 4))
+        assert es_producto(circuito)
+        _, p = distribucion_medida(circuito)
+        estados = estados_qubits(circuito)
+        for q in range(4):
+            marginal = sum(p[i] for i in range(16) if i >> q & 1)
+            p1 = abs(estados[q][1]) ** 2 if q in estados else 0.0
+            assert np.isclose(p1, marginal)
+
+
+def test_frecuencias(rng):
+    circuito = Circuito.desde_programa(_producto_aleatorio(rng, 3))
+    estados = estados_qubits(circuito)
+    lectura = muestrear_producto(circuito, 200000, rng=np.random.default_rng(7))["ro"]
+    assert lectura.shape == (200000, 3) and lectura.dtype == np.int64
+    for q in range(3):
+        p1 = abs(estados[q][1]) ** 2 if q in estados else 0.0
+        assert abs(lectura[:, q].mean() - p1) < 0.01
+
+
+def test_medir_dos_veces_da_el_mismo_bit():
+    prog = Program("DECLARE ro BIT[2]\nH 0\nMEASURE 0 ro[0]\nMEASURE 0 ro[1]").wrap_in_numshots_loop(500)
+    lectura = QVMProducto(semilla=0).run(prog).readout_data["ro"]
+    assert (lectura[:, 0] == lectura[:, 1]).all() and 0 < lectura.mean() < 1
+
+
+def test_circuitos_no_soportados():
+    bell = Program("DECLARE ro BIT[2]", H(0), CNOT(0, 1), MEASURE(0, ("ro", 0)),
+                   MEASURE(1, ("ro", 1))).wrap_in_numshots_loop(300)
+    intermedia = Program("DECLARE ro BIT[1]", H(0), MEASURE(0, ("ro", 0)), H(0))
+    for prog in (bell, intermedia):
+        assert not es_producto(Circuito.desde_programa(prog))
+        with pytest.raises(ValueError):
+            muestrear_producto(Circuito.desde_programa(prog))
+    with pytest.raises(ValueError):
+        QVMProducto().run(bell)
+
+    qvm = QVMProducto(respaldo=QVMMuestreo(semilla=0), semilla=0)
+    resultado = qvm.run(qvm.compile(bell))
+    assert resultado.motor != "producto"
+    assert (resultado.readout_data["ro"][:, 0] == resultado.readout_data["ro"][:, 1]).all()
+
+
+def test_semilla_reproducible():
+    prog = Program("DECLARE ro BIT[6]\n" + "".join(f"H {q}\nMEASURE {q} ro[{q}]\n" for q in range(6)))
+    prog.wrap_in_numshots_loop(100)
+    a = QVMProducto(semilla=3).run(prog).readout_data["ro"]
+    b = QVMProducto(semilla=3).run(prog).readout_data["ro"]
+    assert np.array_equal(a, b)
@@ -0,0 +1,57 @@
+"""
+MÓDULO: tests/test_propagacion.py - Propagación de muchos estados frente a la referencia
+
+RESUMEN:
+`propagar` aplica un circuito a muchas columnas a la vez (por bloques o con
+la unitaria completa). Cada columna debe coincidir con `qnc.estado.evolucionar`
+del mismo estado, y las mediciones intermedias deben rechazarse mientras que
+las terminales se ignoran.
+"""
+
+import numpy as np
+import pytest
+from pyquil import Program
+from pyquil.gates import CNOT, H, MEASURE
+
+from qnc import Circuito, estado_base, evolucionar, matriz_unitaria, propagar
+
+
+def _referencia(prog, num_qubits, psi=None):
+    psi = estado_base(num_qubits) if psi is None else np.atleast_2d(psi).astype(complex)
+    return evolucionar(psi, Circuito.desde_programa(prog))
+
+
+@pytest.mark.parametrize("metodo", ["columnas", "unitaria", None])
+def test_propagar_igual_a_cada_columna(rng, circuito_aleatorio, metodo):
+    prog = circuito_aleatorio(5, puertas=40)
+    estados = rng.standard_normal((32, 50)) + 1j * rng.standard_normal((32, 50))
+    finales = propagar(prog, estados, metodo=metodo, bloque=7)
+    assert finales.shape == estados.shape
+    assert np.allclose(finales, _referencia(prog, 5, estados.T).T)
+
+
+def test_propagar_indices_y_unitaria(circuito_aleatorio):
+    prog = circuito_aleatorio(4, puertas=30)
+    u = matriz_unitaria(prog)
+    assert np.allclose(u.conj().T @ u, np.eye(16))
+    assert np.allclose(u, _referencia(prog, 4, np.eye(16)).T)
+    assert np.allclose(propagar(prog, [0, 3, 9]), u[:, [0, 3, 9]])
+    assert np.allclose(propagar(prog, np.eye(16)[5]), u[:, 5])
+
+
+def test_propagar_errores(circuito_aleatorio):
+    prog = circuito_aleatorio(3)
+    with pytest.raises(ValueError):
+        propagar(prog, np.eye(4))
+    with pytest.raises(ValueError):
+        propagar(prog, np.eye(8), metodo="otro")
+
+
+def test_mediciones_intermedias_y_terminales():
+    prog = Program("DECLARE ro BIT[2]", H(0), MEASURE(0, ("ro", 0)), CNOT(0, 1),
+                   MEASURE(1, ("ro", 1)))
+    with pytest.raises(ValueError):
+        propagar(prog, [0])
+    terminal = Program("DECLARE ro BIT[2]", H(0), CNOT(0, 1), MEASURE(0, ("ro", 0)),
+                       MEASURE(1, ("ro", 1)))
+    assert np.allclose(propagar(terminal, [0])[:, 0], [2 ** -0.5, 0, 0, 2 ** -0.5])
@@ -0,0 +1,68 @@
+"""
+MÓDULO: tests/test_servidor_local.py - Peticiones wavefunction y expectation de ServidorLocal
+
+RESUMEN:
+Un `WavefunctionSimulator` de PyQuil conectado a `ServidorLocal` debe
+obtener los mismos estados que el catálogo de S03/S04 (también con
+parámetros, que PyQuil envía como instrucciones MOVE) y los valores
+esperados de las correlaciones del estado de Bell. Los fallos inyectados y
+los tipos de petición desconocidos se cuentan como errores.
+"""
+
+import numpy as np
+import pytest
+from pyquil import Program
+from pyquil.api import WavefunctionSimulator
+from pyquil.paulis import sX, sY, sZ
+
+from qnc import ServidorLocal
+from qnc.demos.catalogo import programa_del_catalogo
+
+BELL = Program("H 0\nCNOT 0 1")
+
+# `WavefunctionSimulator` devuelve un `Wavefunction`, obsoleto en PyQuil 4.22
+pytestmark = pytest.mark.filterwarnings("ignore:Call to deprecated class Wavefunction")
+
+
+@pytest.fixture
+def servidor():
+    with ServidorLocal(puerto_qvm=0, puerto_quilc=0, semilla=0) as servidor:
+        yield servidor
+
+
+def _simulador(servidor):
+    return WavefunctionSimulator(client_configuration=servidor.configuracion())
+
+
+@pytest.mark.parametrize("nombre, esperado", [
+    ("S03P01B", [-1j, 0]),
+    ("S04P03B", [-1j * 2 ** -0.5, 2 ** -0.5]),
+    ("S04P05B", [0, np.exp(1j * np.pi / 4)]),
+])
+def test_funcion_onda_del_catalogo(servidor, nombre, esperado):
+    amplitudes = _simulador(servidor).wavefunction(programa_del_catalogo(nombre)).amplitudes
+    assert np.allclose(amplitudes, esperado)
+
+
+def test_funcion_onda_con_parametros(servidor):
+    prog = Program("DECLARE theta REAL\nRX(theta) 0\nCNOT 0 1")
+    amplitudes = _simulador(servidor).wavefunction(prog, memory_map={"theta": [np.pi]}).amplitudes
+    assert np.allclose(amplitudes, [0, 0, 0, -1j])
+    assert servidor.estadisticas()["wavefunction"] == (1, 0)
+
+
+def test_esperanza_bell(servidor):
+    valores = _simulador(servidor).expectation(
+        BELL, [sZ(0) * sZ(1), sX(0) * sX(1), sY(0) * sY(1), sZ(0), sZ(2), 0.5 * sX(1)])
+    # ⟨ZZ⟩ = ⟨XX⟩ = 1, ⟨YY⟩ = -1; Z(0) y X(1) sueltos dan 0; el qubit 2 está en |0⟩
+    assert np.allclose(valores, [1, 1, -1, 0, 1, 0])
+    assert servidor.estadisticas()["expectation"] == (1, 0)
+
+
+def test_errores():
+    with ServidorLocal(puerto_qvm=0, puerto_quilc=0, semilla=0, error_qvm=1.0) as servidor:
+        with pytest.raises(Exception, match="inyectado"):
+            _simulador(servidor).wavefunction(BELL)
+        with pytest.raises(ValueError, match="desconocido"):
+            servidor.atender_qvm({"type": "otra"})
+        assert servidor.estadisticas()["wavefunction"][1] == 1
@@ -0,0 +1,134 @@
+"""
+MÓDULO: tests/test_trazas.py - Trazas de latencia de compile, run y construcción
+
+RESUMEN:
+`instrumentar` debe restaurar los métodos de PyQuil aunque el bloque lance
+una excepción, las construcciones de programas hechas dentro de otras
+llamadas trazadas no deben aparecer en `eventos`, `a_chrome` debe dar
+eventos "M" y "X" válidos y el trazador no debe guardar referencias a los
+programas trazados.
+"""
+
+import gc
+import json
+import threading
+import weakref
+
+import pytest
+from pyquil import Program
+from pyquil.api import QuantumComputer, WavefunctionSimulator
+from pyquil.api._qam import QAMExecutionResult
+from pyquil.gates import CNOT, MEASURE, H
+
+from qnc import QCTrazado, QVMAutomatica, Trazador, instrumentar
+
+
+def _bell(shots=20):
+    prog = Program()
+    ro = prog.declare("ro", "BIT", 2)
+    prog += H(0)
+    prog += CNOT(0, 1)
+    prog += MEASURE(0, ro[0])
+    prog += MEASURE(1, ro[1])
+    return prog.wrap_in_numshots_loop(shots)
+
+
+class QCQueFalla:
+    """Motor falso cuyo compile lanza una excepción."""
+
+    def compile(self, programa):
+        raise RuntimeError("quilc caído")
+
+
+def test_instrumentar_restaura_tras_una_excepcion():
+    sustituidos = [(Program, "__init__"), (Program, "inst"), (Program, "declare"),
+                   (Program, "measure"), (Program, "wrap_in_numshots_loop"),
+                   (QuantumComputer, "compile"), (QuantumComputer, "run"),
+                   (WavefunctionSimulator, "wavefunction"),
+                   (QAMExecutionResult, "get_register_map"), (QAMExecutionResult, "readout_data")]
+    originales = [clase.__dict__[nombre] for clase, nombre in sustituidos]
+    trazador = Trazador()
+    with pytest.raises(ValueError, match="dentro"):
+        with instrumentar(trazador, construccion=True):
+            assert QuantumComputer.__dict__["compile"] is not originales[5]
+            Program(H(0))
+            raise ValueError("dentro")
+    assert [clase.__dict__[nombre] for clase, nombre in sustituidos] == originales
+    Program(H(0))
+    assert [e[0] for e in trazador.eventos] == ["Program.__init__"]
+
+
+def test_tramos_anidados_se_descartan():
+    trazador = Trazador()
+    with instrumentar(trazador, construccion=True):
+        Program(H(0))                           # su `inst` interno se descarta
+        with trazador.tramo("compile", "quilc"):
+            Program(H(0))                       # construcción dentro de una llamada trazada
+        with trazador.tramo("script"):
+            Program(H(0))
+    nombres = [e[0] for e in trazador.eventos]
+    assert nombres == ["Program.__init__", "compile", "script", "Program.__init__"]
+    assert len(trazador._crudos) > len(nombres)
+    assert trazador.totales()["Program.__init__"][0] == 2
+
+
+def test_qc_trazado_atributos_y_errores():
+    trazador = Trazador()
+    motor = QCTrazado(QVMAutomatica(semilla=0), trazador)
+    bits = motor.run(motor.compile(_bell())).readout_data["ro"]
+    assert bits.shape == (20, 2)
+    compile_, run = trazador.eventos
+    assert compile_[:2] == ("compile", "quilc") and run[:2] == ("run", "qvm")
+    assert compile_[5] == run[5] == {"shots": 20, "qubits": 2, "instrucciones": 4}
+
+    with pytest.raises(RuntimeError, match="caído"):
+        QCTrazado(QCQueFalla(), trazador).compile(Program(H(0)))
+    assert trazador.eventos[-1][5] == {"shots": 1, "qubits": 1, "instrucciones": 1,
+                                      "error": "RuntimeError"}
+
+    trazador.activo = False
+    motor.run(motor.compile(_bell()))
+    assert len(trazador.eventos) == 3
+
+
+def test_no_guarda_referencias_a_los_programas():
+    trazador = Trazador()
+    motor = QCTrazado(QVMAutomatica(semilla=0), trazador)
+    prog = _bell()
+    resultado = motor.run(motor.compile(prog))
+    referencias = [weakref.ref(prog), weakref.ref(resultado)]
+    del prog, resultado
+    gc.collect()
+    assert all(ref() is None for ref in referencias)
+    assert trazador.eventos[1][5]["shots"] == 20
+
+
+def test_a_chrome():
+    trazador = Trazador()
+    motor = QCTrazado(QVMAutomatica(semilla=0), trazador)
+    with trazador.tramo("script", ruta="bell.py"):
+        motor.run(motor.compile(_bell()))
+
+    def en_otro_hilo():
+        with trazador.tramo("hilo"):
+            pass
+
+    hilo = threading.Thread(target=en_otro_hilo)
+    hilo.start()
+    hilo.join()
+
+    traza = json.loads(json.dumps(trazador.a_chrome()))
+    assert traza["displayTimeUnit"] == "ms"
+    metadatos = [e for e in traza["traceEvents"] if e["ph"] == "M"]
+    completos = [e for e in traza["traceEvents"] if e["ph"] == "X"]
+    assert [e["name"] for e in metadatos] == ["process_name", "thread_name", "thread_name"]
+    assert {e["args"]["name"] for e in metadatos[1:]} == {"principal", "hilo 1"}
+    assert [e["name"] for e in completos] == ["script", "compile", "run", "hilo"]
+    for evento in completos:
+        assert {"name", "cat", "ts", "dur", "pid", "tid", "args"} <= set(evento)
+        assert evento["ts"] >= 0 and evento["dur"] >= 0
+    script, compile_, run, otro = completos
+    assert script["args"] == {"ruta": "bell.py"} and otro["tid"] == 1
+    assert script["ts"] <= compile_["ts"] <= run["ts"]
+    assert run["ts"] + run["dur"] <= script["ts"] + script["dur"]
+    assert run["args"]["shots"] == 20
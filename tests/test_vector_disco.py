@@ -0,0 +1,63 @@
+"""
+MÓDULO: tests/test_vector_disco.py - VectorEstadoDisco frente a `qnc.estado.evolucionar`
+
+RESUMEN:
+El vector de estado en disco aplica las puertas bloque a bloque sobre un
+fichero mapeado en memoria. Se compara con el simulador de referencia en
+circuitos aleatorios, con bloques pequeños para que las puertas crucen los
+límites de bloque, y se comprueba que rechaza las mediciones intermedias.
+"""
+
+import numpy as np
+import pytest
+from pyquil import Program
+from pyquil.gates import CNOT, H, MEASURE
+
+from qnc import Circuito, VectorEstadoDisco, estado_base, evolucionar
+
+
+def _referencia(prog, num_qubits, psi=None):
+    psi = estado_base(num_qubits) if psi is None else np.atleast_2d(psi).astype(complex)
+    return evolucionar(psi, Circuito.desde_programa(prog))
+
+
+@pytest.mark.parametrize("indice", [0, 5])
+def test_vector_disco_igual_a_referencia(tmp_path, circuito_aleatorio, indice):
+    prog = circuito_aleatorio(8, puertas=50)
+    # 256 bytes = 32 amplitudes complex64 por bloque: los qubits 5-7 cruzan bloques
+    vector = VectorEstadoDisco.crear(str(tmp_path / "psi.bin"), 8, indice=indice,
+                                     bloque_bytes=256)
+    try:
+        vector.evolucionar(prog)
+        esperado = _referencia(prog, 8, estado_base(8, indice))[0]
+        assert np.allclose(vector.amplitudes, esperado, atol=1e-5)
+        assert np.isclose(vector.norma(), 1, atol=1e-5)
+        p = np.abs(esperado) ** 2
+        distribucion = p.reshape((2,) * 8).sum(axis=tuple(range(1, 7))).ravel()
+        assert np.allclose(vector.distribucion([0, 7]), distribucion, atol=1e-5)
+        assert np.isclose(vector.probabilidad_uno(6), p[(np.arange(256) >> 6) & 1 == 1].sum(),
+                          atol=1e-5)
+    finally:
+        vector.cerrar()
+
+
+def test_vector_disco_reabrir(tmp_path):
+    ruta = str(tmp_path / "bell.bin")
+    vector = VectorEstadoDisco.crear(ruta, 2, dtype=np.complex128)
+    vector.evolucionar(Program(H(0), CNOT(0, 1)))
+    vector.cerrar()
+    vector = VectorEstadoDisco.abrir(ruta, dtype=np.complex128)
+    assert vector.num_qubits == 2
+    assert np.allclose(vector.distribucion([0, 1]), [0.5, 0, 0, 0.5])
+    vector.cerrar()
+
+
+def test_medicion_intermedia_lanza_error(tmp_path):
+    prog = Program("DECLARE ro BIT[2]", H(0), MEASURE(0, ("ro", 0)), CNOT(0, 1),
+                   MEASURE(1, ("ro", 1)))
+    vector = VectorEstadoDisco.crear(str(tmp_path / "psi.bin"), 2)
+    try:
+        with pytest.raises(ValueError):
+            vector.evolucionar(prog)
+    finally:
+        vector.cerrar()